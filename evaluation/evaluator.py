@@ -24,7 +24,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from google import genai
 from starlette.testclient import TestClient
 
 from src.api.main import create_app
@@ -261,6 +260,8 @@ def _generate_ground_truth_answer(
         logger.warning("No Google API key found - using placeholder ground truth answer")
         return "Expected answer (API key not configured)"
 
+    from google import genai  # Imported on first use (slow SDK import)
+
     client = genai.Client(api_key=api_key)
 
     # Build prompt using SAME logic as ReAct agent (_build_combined_prompt)
@@ -36,7 +36,7 @@ TODO: Full integration with RAGAS 0.4.3+ API for answer quality metrics
 
 import logging
 from typing import Any
-from google import genai
+
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -61,6 +61,8 @@ def _llm_judge_chunk_relevance(question: str, chunk_text: str, chunk_index: int)
         return True  # Default to True if no API key
 
     try:
+        from google import genai  # Imported on first judgment (slow SDK import)
+
         client = genai.Client(api_key=api_key)
 
         prompt = f"""You are evaluating whether a retrieved document chunk is useful for answering a question.
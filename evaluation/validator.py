@@ -25,24 +25,24 @@ logger = logging.getLogger(__name__)
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from evaluation.test_data import ALL_TEST_CASES
+from src.repositories.sqlite_pool import get_read_only_pool
 
 DB_PATH = Path(__file__).parent.parent.parent / "data" / "sql" / "nba_stats.db"
 
 
 def query_db(sql: str) -> list[dict]:
     """Execute SQL and return results as list of dicts."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
     try:
-        cursor.execute(sql)
-        results = [dict(row) for row in cursor.fetchall()]
-        return results
+        # Row factory on the cursor only - the pooled connection is shared
+        cursor = get_read_only_pool(DB_PATH).connection().cursor()
+        cursor.row_factory = sqlite3.Row
+        try:
+            cursor.execute(sql)
+            return [dict(row) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
     except Exception as e:
         return [{"__error__": str(e)}]
-    finally:
-        conn.close()
 
 
 def normalize_value(val: Any) -> Any:
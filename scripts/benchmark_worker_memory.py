@@ -0,0 +1,114 @@
+"""
+FILE: benchmark_worker_memory.py
+STATUS: Active
+RESPONSIBILITY: Measure per-worker memory of the vector store with and without memory-mapped loading
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import argparse
+import logging
+import multiprocessing as mp
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from src.models.document import DocumentChunk
+from src.repositories.vector_store import VectorStoreRepository
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def memory_mb() -> dict[str, float]:
+    """RSS, PSS and private memory of this process in MB (Linux /proc/self/smaps_rollup)."""
+    fields: dict[str, float] = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "private": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def build_store(directory: Path, n_chunks: int, dimension: int) -> tuple[Path, Path]:
+    """Write a synthetic index and chunk file (about 1.5 KB of text per chunk)."""
+    rng = np.random.default_rng(0)
+    chunks = [
+        DocumentChunk(id=f"chunk_{i}", text=f"chunk {i} " + "x" * 1500, metadata={"source": f"doc_{i % 50}.pdf"})
+        for i in range(n_chunks)
+    ]
+    repository = VectorStoreRepository(
+        index_path=directory / "faiss_index.idx",
+        chunks_path=directory / "document_chunks.pkl",
+    )
+    repository.build_index(chunks, rng.random((n_chunks, dimension), dtype=np.float32))
+    repository.save()
+    return directory / "faiss_index.idx", directory / "document_chunks.pkl"
+
+
+def worker(index_path: Path, chunks_path: Path, mmap: bool, barrier, results) -> None:
+    """Load the store like an API worker, run searches, and report memory while all workers are alive."""
+    before = memory_mb()
+    repository = VectorStoreRepository(index_path=index_path, chunks_path=chunks_path, mmap=mmap)
+    repository.load()
+    rng = np.random.default_rng()
+    for _ in range(20):
+        repository.search(rng.random(repository._index.d, dtype=np.float32), k=5)
+
+    barrier.wait()
+    after = memory_mb()
+    results.put({key: after[key] - before[key] for key in after})
+    barrier.wait()
+
+
+def measure(index_path: Path, chunks_path: Path, workers: int, mmap: bool) -> dict[str, float]:
+    """Run N workers at once and average their memory growth from loading the store."""
+    context = mp.get_context("spawn")  # like uvicorn --workers
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker, args=(index_path, chunks_path, mmap, barrier, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    samples = [results.get() for _ in range(workers)]
+    for process in processes:
+        process.join()
+    return {key: sum(s[key] for s in samples) / workers for key in samples[0]}
+
+
+def main() -> None:
+    """Print per-worker memory for 1, 2 and 4 workers, mmap on and off."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=20_000, help="Synthetic chunks/vectors")
+    parser.add_argument("--dimension", type=int, default=1024, help="Embedding dimension")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        index_path, chunks_path = build_store(Path(directory), args.chunks, args.dimension)
+        logger.info(f"Store: {args.chunks} chunks x {args.dimension} dims")
+
+        print(f"\n{'mode':<10}{'workers':>8}{'RSS MB':>10}{'PSS MB':>10}{'private MB':>12}")
+        for mmap in (False, True):
+            for workers in args.workers:
+                m = measure(index_path, chunks_path, workers, mmap)
+                mode = "mmap" if mmap else "in-memory"
+                print(f"{mode:<10}{workers:>8}{m['rss']:>10.1f}{m['pss']:>10.1f}{m['private']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
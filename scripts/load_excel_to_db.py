@@ -2,7 +2,7 @@
 FILE: load_excel_to_db.py
 STATUS: Active
 RESPONSIBILITY: Excel to database ingestion pipeline with Pydantic validation
-LAST MAJOR UPDATE: 2026-02-11
+LAST MAJOR UPDATE: 2026-10-18
 MAINTAINER: Shahu
 """
 
@@ -367,6 +367,21 @@ def load_stats_to_db(db: NBADatabase, df: pd.DataFrame, player_ids: dict[str, in
     return success_count
 
 
+def refresh_aggregates_only(db_path: str | None = None) -> None:
+    """Rebuild the materialized aggregate tables and name index without re-reading Excel.
+
+    Args:
+        db_path: Path to SQLite database (optional)
+    """
+    db = NBADatabase(db_path)
+    try:
+        for table, count in db.refresh_aggregates().items():
+            logger.info(f"  - {table}: {count}")
+        logger.info(f"  - Indexed names: {db.build_name_index()}")
+    finally:
+        db.close()
+
+
 def main(excel_file: str, db_path: str | None = None, drop_existing: bool = False) -> None:
     """Main ingestion pipeline.
 
@@ -404,6 +419,12 @@ def main(excel_file: str, db_path: str | None = None, drop_existing: bool = Fals
         # Load statistics
         stats_count = load_stats_to_db(db, df, player_ids)
 
+        # Rebuild materialized aggregates (player_per_game, team_totals, team_averages)
+        aggregate_counts = db.refresh_aggregates()
+
+        # Rebuild trigram name index used to resolve player/team names
+        name_count = db.build_name_index()
+
         # Summary
         with db.get_session() as session:
             counts = db.count_records(session)
@@ -415,6 +436,9 @@ def main(excel_file: str, db_path: str | None = None, drop_existing: bool = Fals
         logger.info(f"  - Teams: {counts['teams']}")
         logger.info(f"  - Players: {counts['players']}")
         logger.info(f"  - Stats records: {counts['player_stats']}")
+        for table, count in aggregate_counts.items():
+            logger.info(f"  - {table}: {count}")
+        logger.info(f"  - Indexed names: {name_count}")
         logger.info("=" * 80)
 
     except Exception as e:
@@ -445,6 +469,15 @@ if __name__ == "__main__":
         help="Drop existing tables before loading (WARNING: deletes all data)",
     )
 
+    parser.add_argument(
+        "--refresh-aggregates",
+        action="store_true",
+        help="Only rebuild materialized aggregate tables and the name index from the existing database",
+    )
+
     args = parser.parse_args()
 
-    main(args.excel, args.db, args.drop)
+    if args.refresh_aggregates:
+        refresh_aggregates_only(args.db)
+    else:
+        main(args.excel, args.db, args.drop)
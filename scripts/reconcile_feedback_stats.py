@@ -0,0 +1,35 @@
+"""
+FILE: reconcile_feedback_stats.py
+STATUS: Active
+RESPONSIBILITY: Recompute the trigger-maintained feedback_stats row from the interaction/feedback tables
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.repositories.feedback import FeedbackRepository
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """Reconcile feedback_stats (safe to run while the API is serving, e.g. nightly from cron)."""
+    repository = FeedbackRepository()
+    try:
+        stats = repository.reconcile_stats()
+        logger.info(f"Feedback stats reconciled: {stats.model_dump()}")
+    finally:
+        repository.close()
+
+
+if __name__ == "__main__":
+    main()
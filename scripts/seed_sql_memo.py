@@ -0,0 +1,89 @@
+"""
+FILE: seed_sql_memo.py
+STATUS: Active
+RESPONSIBILITY: Seed the question→SQL memo cache from ground-truth evaluation SQL
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from evaluation.models import TestType
+from evaluation.test_data import ALL_TEST_CASES
+from src.services.embedding import EmbeddingService
+from src.tools.sql_memo import SQLMemoCache
+from src.tools.sql_tool import NBAGSQLTool
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def collect_ground_truth_pairs() -> list[tuple[str, str]]:
+    """Collect standalone SQL test cases with validated expected SQL.
+
+    Conversational follow-ups are skipped: their question only makes sense
+    together with the previous turns, so the SQL can't be reused on its own.
+
+    Returns:
+        List of (question, sql) tuples
+    """
+    pairs = []
+    for case in ALL_TEST_CASES:
+        if case.test_type != TestType.SQL or not case.expected_sql:
+            continue
+        if case.conversation_thread:
+            continue
+        try:
+            NBAGSQLTool._validate_sql_security(case.expected_sql)
+        except ValueError as e:
+            logger.warning(f"Skipping '{case.question[:60]}': {e}")
+            continue
+        pairs.append((case.question, case.expected_sql))
+    return pairs
+
+
+def main(reset: bool = False) -> None:
+    """Seed the SQL memo cache.
+
+    NOTE: Disable the memo (SQL_MEMO_ENABLED=false) when running the SQL
+    evaluation, otherwise seeded questions are answered from their own
+    ground truth.
+
+    Args:
+        reset: Replace the existing memo (including production pairs) with
+            the ground-truth pairs only. Stop the API first, or its workers
+            write their in-memory pairs back on their next save.
+    """
+    embedding_service = EmbeddingService()
+    memo = SQLMemoCache(embed_fn=embedding_service.embed_batch)
+    if not reset:
+        memo.load()
+
+    pairs = collect_ground_truth_pairs()
+    logger.info(f"Found {len(pairs)} ground-truth question/SQL pairs")
+
+    added = memo.seed(pairs, source="ground_truth")
+    if reset:
+        # seed() merges with the files on disk; rewrite them with only these pairs
+        memo.save(merge=False)
+    logger.info(f"Added {added} new pairs ({len(memo)} total in memo)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seed question→SQL memo from ground-truth SQL")
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Start from an empty memo (drops memoized production pairs)",
+    )
+    args = parser.parse_args()
+
+    main(args.reset)
@@ -1,16 +1,18 @@
 """
 File: src/agents/__init__.py
-Description: ReAct agent module exports
+Description: ReAct agent module exports (resolved on first access)
 Created: 2026-02-14
 """
 
-from src.agents.react_agent import ReActAgent, Tool, AgentStep
-from src.agents.tools import NBAToolkit, create_nba_tools
+from src.core.lazy import lazy_exports
 
-__all__ = [
-    "ReActAgent",
-    "Tool",
-    "AgentStep",
-    "NBAToolkit",
-    "create_nba_tools",
-]
+_EXPORTS = {
+    "ReActAgent": "src.agents.react_agent",
+    "Tool": "src.agents.react_agent",
+    "AgentStep": "src.agents.react_agent",
+    "NBAToolkit": "src.agents.tools",
+    "create_nba_tools": "src.agents.tools",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
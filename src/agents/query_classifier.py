@@ -7,9 +7,12 @@ Created: 2026-02-16
 
 import logging
 import re
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
-from google import genai
+from src.core.metrics import CLASSIFICATIONS
+
+if TYPE_CHECKING:
+    from google import genai
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +36,20 @@ CONFIDENCE_BOOST_PER_HYBRID_SIGNAL = 0.05  # +5% per matching signal
 CONFIDENCE_BOOST_PER_VECTOR_SIGNAL = 0.03  # +3% per vector-only signal
 CONFIDENCE_BOOST_PER_SQL_SIGNAL = 0.02  # +2% per SQL-only signal
 
+# System prompt for the LLM fallback classifier
+LLM_CLASSIFIER_PROMPT = """You are an NBA query classifier. Classify queries into exactly ONE type:
+
+**sql_only**: Statistical queries (numbers, stats, rankings, comparisons)
+- Examples: "Top 5 scorers", "Shai's PPG", "Compare Jokic vs Embiid stats"
+
+**vector_only**: Contextual queries (opinions, discussions, explanations, styles)
+- Examples: "Why is LeBron the GOAT?", "What do fans think about the Lakers?", "Explain Curry's playing style"
+
+**hybrid**: Biographical or queries needing BOTH stats AND context
+- Examples: "Who is Nikola Jokic?", "Tell me about Luka Doncic", "What makes Giannis valuable?"
+
+Output ONLY the classification: sql_only, vector_only, or hybrid"""
+
 
 class QueryClassifier:
     """Classifier for NBA statistics queries using hybrid approach.
@@ -47,7 +64,7 @@ class QueryClassifier:
 
     def __init__(
         self,
-        client: genai.Client,
+        client: "genai.Client",
         model: str = "gemini-2.0-flash",
     ):
         """Initialize query classifier.
@@ -80,11 +97,34 @@ class QueryClassifier:
         # If high confidence, use heuristic result
         if confidence >= HEURISTIC_CONFIDENCE_THRESHOLD:
             logger.debug(f"Heuristic classification (confidence={confidence:.2f}): {query_type}")
+            CLASSIFICATIONS.inc(path="heuristic", query_type=query_type)
             return query_type
 
         # Low confidence - use LLM for accurate classification
         logger.info(f"Heuristic uncertain (confidence={confidence:.2f}), using LLM classification")
-        return self._llm_classify(question)
+        query_type = self._llm_classify(question)
+        CLASSIFICATIONS.inc(path="llm", query_type=query_type)
+        return query_type
+
+    async def aclassify(self, question: str) -> str:
+        """Async variant of classify(): the LLM fallback is awaited.
+
+        Args:
+            question: User question
+
+        Returns:
+            "sql_only", "vector_only", or "hybrid"
+        """
+        confidence, query_type = self._heuristic_classify_with_confidence(question)
+        if confidence >= HEURISTIC_CONFIDENCE_THRESHOLD:
+            logger.debug(f"Heuristic classification (confidence={confidence:.2f}): {query_type}")
+            CLASSIFICATIONS.inc(path="heuristic", query_type=query_type)
+            return query_type
+
+        logger.info(f"Heuristic uncertain (confidence={confidence:.2f}), using LLM classification")
+        query_type = await self._allm_classify(question)
+        CLASSIFICATIONS.inc(path="llm", query_type=query_type)
+        return query_type
 
     def _heuristic_classify_with_confidence(self, question: str) -> tuple[float, str]:
         """Heuristic classification with confidence scoring.
@@ -293,20 +333,6 @@ class QueryClassifier:
         Returns:
             "sql_only", "vector_only", or "hybrid"
         """
-        # Classification prompt with caching
-        system_prompt = """You are an NBA query classifier. Classify queries into exactly ONE type:
-
-**sql_only**: Statistical queries (numbers, stats, rankings, comparisons)
-- Examples: "Top 5 scorers", "Shai's PPG", "Compare Jokic vs Embiid stats"
-
-**vector_only**: Contextual queries (opinions, discussions, explanations, styles)
-- Examples: "Why is LeBron the GOAT?", "What do fans think about the Lakers?", "Explain Curry's playing style"
-
-**hybrid**: Biographical or queries needing BOTH stats AND context
-- Examples: "Who is Nikola Jokic?", "Tell me about Luka Doncic", "What makes Giannis valuable?"
-
-Output ONLY the classification: sql_only, vector_only, or hybrid"""
-
         user_prompt = f"Classify this NBA query:\n\n{question}\n\nClassification:"
 
         try:
@@ -314,23 +340,54 @@ Output ONLY the classification: sql_only, vector_only, or hybrid"""
                 model=self._model,
                 contents=user_prompt,
                 config={
-                    "system_instruction": system_prompt,
+                    "system_instruction": LLM_CLASSIFIER_PROMPT,
                     "temperature": 0.0,  # Deterministic classification
                     "cached_content": None,  # TODO: Add prompt caching
                 },
             )
 
-            classification = response.text.strip().lower()
+            return self._parse_classification(response.text)
+
+        except Exception as e:
+            logger.error(f"LLM classification failed: {e}", exc_info=True)
+            return "sql_only"  # Safe default
 
-            # Validate classification
-            if classification in ["sql_only", "vector_only", "hybrid"]:
-                logger.debug(f"LLM classification: {classification}")
-                return classification
+    async def _allm_classify(self, question: str) -> str:
+        """Async variant of _llm_classify() using the genai async client.
 
-            # Invalid response - log and default to sql_only
-            logger.warning(f"Invalid LLM classification '{classification}', defaulting to sql_only")
-            return "sql_only"
+        Args:
+            question: User question
+
+        Returns:
+            "sql_only", "vector_only", or "hybrid"
+        """
+        user_prompt = f"Classify this NBA query:\n\n{question}\n\nClassification:"
+
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=self._model,
+                contents=user_prompt,
+                config={
+                    "system_instruction": LLM_CLASSIFIER_PROMPT,
+                    "temperature": 0.0,
+                },
+            )
+            return self._parse_classification(response.text)
 
         except Exception as e:
             logger.error(f"LLM classification failed: {e}", exc_info=True)
-            return "sql_only"  # Safe default
+            return "sql_only"
+
+    @staticmethod
+    def _parse_classification(response_text: str) -> str:
+        """Validate the LLM classification, defaulting to sql_only."""
+        classification = response_text.strip().lower()
+
+        # Validate classification
+        if classification in ["sql_only", "vector_only", "hybrid"]:
+            logger.debug(f"LLM classification: {classification}")
+            return classification
+
+        # Invalid response - log and default to sql_only
+        logger.warning(f"Invalid LLM classification '{classification}', defaulting to sql_only")
+        return "sql_only"
@@ -7,6 +7,7 @@ Created: 2026-02-14
 
 from dataclasses import dataclass, field
 from typing import Any, Callable
+import asyncio
 import json
 import logging
 import re
@@ -16,6 +17,7 @@ from google.genai import types
 
 from src.agents.query_classifier import QueryClassifier
 from src.agents.results_formatter import ResultsFormatter
+from src.core.metrics import AGENT_RUN_SECONDS, ANSWER_SECONDS, RERANKS, TOOL_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -93,12 +95,18 @@ class ReActAgent:
         # Tool results storage (structured access for direct extraction)
         self.tool_results: dict[str, Any] = {}
 
-    def _execute_tool(self, tool_name: str, tool_input: dict[str, Any]) -> dict[str, Any]:
+    def _execute_tool(
+        self,
+        tool_name: str,
+        tool_input: dict[str, Any],
+        results: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         """Execute a tool and store its result.
 
         Args:
             tool_name: Name of the tool to execute
             tool_input: Input parameters for the tool
+            results: Dict to store the result in (defaults to self.tool_results)
 
         Returns:
             Tool execution result dictionary
@@ -110,24 +118,30 @@ class ReActAgent:
             raise ValueError(f"Tool '{tool_name}' not found. Available: {list(self.tools.keys())}")
 
         tool = self.tools[tool_name]
+        if results is None:
+            results = self.tool_results
 
+        start = time.perf_counter()
         try:
-            logger.debug(f"Executing tool: {tool_name} with input: {tool_input}")
+            logger.debug("Executing tool: %s with input: %s", tool_name, tool_input)
 
             # Call the tool's function with the input parameters
             result = tool.function(**tool_input)
 
             # Store result for later access
-            self.tool_results[tool_name] = result
+            results[tool_name] = result
 
-            logger.debug(f"Tool {tool_name} executed successfully")
+            outcome = "error" if isinstance(result, dict) and result.get("error") else "ok"
+            TOOL_SECONDS.observe(time.perf_counter() - start, tool=tool_name, outcome=outcome)
+            logger.debug("Tool %s executed successfully", tool_name)
             return result
 
         except Exception as e:
+            TOOL_SECONDS.observe(time.perf_counter() - start, tool=tool_name, outcome="error")
             logger.exception(f"Tool {tool_name} execution failed: {e}")
             # Return error result
             error_result = {"error": str(e), "success": False}
-            self.tool_results[tool_name] = error_result
+            results[tool_name] = error_result
             return error_result
 
     def _extract_entities_from_sql(self, sql_result: dict) -> list[str]:
@@ -166,7 +180,7 @@ class ReActAgent:
                 seen.add(entity)
                 unique_entities.append(entity)
 
-        logger.debug(f"Extracted entities from SQL: {unique_entities}")
+        logger.debug("Extracted entities from SQL: %s", unique_entities)
         return unique_entities
 
     def _enrich_query_with_entities(self, question: str, entities: list[str]) -> str:
@@ -304,7 +318,7 @@ class ReActAgent:
         # Final fallback: Just entity + original question
         # This is better than nothing but not optimal
         optimized = f"{entity_str} {question}"
-        logger.debug(f"Query enrichment (fallback): '{question}' → '{optimized}'")
+        logger.debug("Query enrichment (fallback): '%s' → '%s'", question, optimized)
         return optimized.strip()
 
     def _determine_k(self, query: str, query_type: str) -> int:
@@ -370,9 +384,8 @@ class ReActAgent:
             k = 7   # Simple
 
         logger.debug(
-            f"Query complexity: score={complexity_score}, k={k} "
-            f"(words={word_count}, comparison={has_comparison}, "
-            f"multi_aspect={multi_aspect_count}, pronoun={has_pronoun})"
+            "Query complexity: score=%s, k=%s (words=%s, comparison=%s, multi_aspect=%s, pronoun=%s)",
+            complexity_score, k, word_count, has_comparison, multi_aspect_count, has_pronoun,
         )
         return k
 
@@ -405,9 +418,73 @@ class ReActAgent:
         logger.info(f"Re-ranking {len(chunks)} chunks using LLM (keeping top {top_n})")
 
         try:
-            # P0 ISSUE #1 FIX: Stricter re-ranking for context precision
-            # Build prompt for LLM to score each chunk with emphasis on precision
-            prompt = f"""You are a precision-focused relevance judge for NBA basketball queries.
+            prompt = self._build_rerank_prompt(query, chunks)
+
+            # Call LLM for scoring (use fast model with low temperature)
+            response = self.llm_client.models.generate_content(
+                model=self.model,
+                contents=prompt,
+                config=genai.types.GenerateContentConfig(
+                    temperature=0.1,  # Low temperature for consistent scoring
+                    max_output_tokens=200,
+                )
+            )
+            ranked = self._rank_chunks(chunks, response.text, top_n)
+            RERANKS.inc(outcome="ok")
+            return ranked
+
+        except Exception as e:
+            RERANKS.inc(outcome="failed")
+            logger.warning(f"LLM re-ranking failed ({e}), returning original chunks")
+            return chunks[:top_n]
+
+    async def _arerank_with_llm(
+        self,
+        query: str,
+        chunks: list[dict],
+        top_n: int = 5
+    ) -> list[dict]:
+        """Async variant of _rerank_with_llm() using the genai async client."""
+        if not chunks:
+            return []
+
+        if len(chunks) <= top_n:
+            return chunks
+
+        logger.info(f"Re-ranking {len(chunks)} chunks using LLM (keeping top {top_n})")
+
+        try:
+            prompt = self._build_rerank_prompt(query, chunks)
+            response = await self.llm_client.aio.models.generate_content(
+                model=self.model,
+                contents=prompt,
+                config=genai.types.GenerateContentConfig(
+                    temperature=0.1,
+                    max_output_tokens=200,
+                )
+            )
+            ranked = self._rank_chunks(chunks, response.text, top_n)
+            RERANKS.inc(outcome="ok")
+            return ranked
+
+        except Exception as e:
+            RERANKS.inc(outcome="failed")
+            logger.warning(f"LLM re-ranking failed ({e}), returning original chunks")
+            return chunks[:top_n]
+
+    def _build_rerank_prompt(self, query: str, chunks: list[dict]) -> str:
+        """Build the relevance-scoring prompt for re-ranking.
+
+        Args:
+            query: User query
+            chunks: Retrieved chunks to score
+
+        Returns:
+            Prompt asking for one 0-10 score per chunk
+        """
+        # P0 ISSUE #1 FIX: Stricter re-ranking for context precision
+        # Build prompt for LLM to score each chunk with emphasis on precision
+        prompt = f"""You are a precision-focused relevance judge for NBA basketball queries.
 
 TASK: Rate how relevant each document is for answering the user's SPECIFIC question.
 
@@ -426,83 +503,81 @@ For context precision, it's better to have fewer highly relevant documents than
 
 DOCUMENTS:
 """
-            for i, chunk in enumerate(chunks, 1):
-                # Extract text from chunk (handle different formats)
-                if isinstance(chunk, dict):
-                    text = chunk.get("text", chunk.get("content", str(chunk)))
-                else:
-                    text = str(chunk)
-
-                # Truncate long chunks for efficiency
-                text_preview = text[:300] + "..." if len(text) > 300 else text
-                prompt += f"\n{i}. {text_preview}\n"
-
-            prompt += f"""
+        for i, chunk in enumerate(chunks, 1):
+            # Extract text from chunk (handle different formats)
+            if isinstance(chunk, dict):
+                text = chunk.get("text", chunk.get("content", str(chunk)))
+            else:
+                text = str(chunk)
+
+            # Truncate long chunks for efficiency
+            text_preview = text[:300] + "..." if len(text) > 300 else text
+            prompt += f"\n{i}. {text_preview}\n"
+
+        prompt += f"""
 Return ONLY a JSON array of integer scores (0-10) in the same order as the documents above.
 
 Format: [score1, score2, score3, ...]
 Example: [8, 5, 9, 3, 7, 6]
 
 Your scores:"""
+        return prompt
 
-            # Call LLM for scoring (use fast model with low temperature)
-            response = self.llm_client.models.generate_content(
-                model=self.model,
-                contents=prompt,
-                config=genai.types.GenerateContentConfig(
-                    temperature=0.1,  # Low temperature for consistent scoring
-                    max_output_tokens=200,
-                )
-            )
+    def _rank_chunks(self, chunks: list[dict], response_text: str, top_n: int) -> list[dict]:
+        """Order chunks by the LLM's relevance scores.
 
-            # Parse scores from response
-            response_text = response.text.strip()
+        Args:
+            chunks: Chunks that were scored
+            response_text: Raw LLM response containing a JSON array of scores
+            top_n: Number of top chunks to return
 
-            # Extract JSON array from response
-            import json
-            # Try to find JSON array in response
-            json_match = re.search(r'\[[\d\s,\.]+\]', response_text)
-            if json_match:
-                scores_json = json_match.group(0)
-                scores = json.loads(scores_json)
-            else:
-                # Fallback: try parsing the entire response as JSON
-                scores = json.loads(response_text)
-
-            # Validate scores
-            if not isinstance(scores, list) or len(scores) != len(chunks):
-                logger.warning(
-                    f"LLM re-ranking failed: expected {len(chunks)} scores, "
-                    f"got {len(scores) if isinstance(scores, list) else 'invalid format'}"
-                )
-                return chunks[:top_n]
+        Returns:
+            Top_n chunks by score (first top_n unchanged if the scores are invalid)
 
-            # P0 ISSUE #1 FIX REVISED: Threshold removed after empirical analysis
-            # RATIONALE: LLM re-ranking scores 0-3 (not 0-10), making any threshold >1 too strict.
-            # Evidence shows LLM gracefully handles low-quality chunks (says "I don't have information").
-            # Re-ranking still improves ordering; threshold was filtering out useful chunks.
-            # See: evaluation_results/POST_FIX_COMPARISON.md and analyze_low_quality_chunks.py
+        Raises:
+            ValueError: If the response contains no parseable scores
+        """
+        response_text = response_text.strip()
+
+        # Extract JSON array from response
+        json_match = re.search(r'\[[\d\s,\.]+\]', response_text)
+        if json_match:
+            scores_json = json_match.group(0)
+            scores = json.loads(scores_json)
+        else:
+            # Fallback: try parsing the entire response as JSON
+            scores = json.loads(response_text)
+
+        # Validate scores
+        if not isinstance(scores, list) or len(scores) != len(chunks):
+            logger.warning(
+                f"LLM re-ranking failed: expected {len(chunks)} scores, "
+                f"got {len(scores) if isinstance(scores, list) else 'invalid format'}"
+            )
+            return chunks[:top_n]
 
-            # Keep all chunks but sort by relevance score (no threshold filtering)
-            relevant_chunks = list(zip(chunks, scores))
+        # P0 ISSUE #1 FIX REVISED: Threshold removed after empirical analysis
+        # RATIONALE: LLM re-ranking scores 0-3 (not 0-10), making any threshold >1 too strict.
+        # Evidence shows LLM gracefully handles low-quality chunks (says "I don't have information").
+        # Re-ranking still improves ordering; threshold was filtering out useful chunks.
+        # See: evaluation_results/POST_FIX_COMPARISON.md and analyze_low_quality_chunks.py
 
-            # Sort by score and take top_n
-            ranked = sorted(relevant_chunks, key=lambda x: x[1], reverse=True)
+        # Keep all chunks but sort by relevance score (no threshold filtering)
+        relevant_chunks = list(zip(chunks, scores))
 
-            # Extract top_n chunks (or fewer if threshold filtered many out)
-            top_chunks = [chunk for chunk, score in ranked[:top_n]]
+        # Sort by score and take top_n
+        ranked = sorted(relevant_chunks, key=lambda x: x[1], reverse=True)
 
-            logger.info(
-                f"Re-ranking complete. {len(relevant_chunks)}/{len(chunks)} passed threshold. "
-                f"Top {min(len(top_chunks), top_n)} scores: "
-                f"{[score for _, score in ranked[:min(len(ranked), top_n)]]}"
-            )
+        # Extract top_n chunks (or fewer if threshold filtered many out)
+        top_chunks = [chunk for chunk, score in ranked[:top_n]]
 
-            return top_chunks
+        logger.info(
+            f"Re-ranking complete. {len(relevant_chunks)}/{len(chunks)} passed threshold. "
+            f"Top {min(len(top_chunks), top_n)} scores: "
+            f"{[score for _, score in ranked[:min(len(ranked), top_n)]]}"
+        )
 
-        except Exception as e:
-            logger.warning(f"LLM re-ranking failed ({e}), returning original chunks")
-            return chunks[:top_n]
+        return top_chunks
 
     def _call_llm(self, prompt: str) -> str:
         """Call LLM with a prompt and return the response.
@@ -514,50 +589,58 @@ Your scores:"""
             LLM response text
         """
         try:
-            response = self.llm_client.models.generate_content(
-                model=self.model,
-                contents=prompt,
-                config=genai.types.GenerateContentConfig(
-                    temperature=self.temperature,
-                    max_output_tokens=2048,
+            with ANSWER_SECONDS.time():
+                response = self.llm_client.models.generate_content(
+                    model=self.model,
+                    contents=prompt,
+                    config=genai.types.GenerateContentConfig(
+                        temperature=self.temperature,
+                        max_output_tokens=2048,
+                    )
                 )
-            )
             return response.text.strip()
         except Exception as e:
             logger.exception(f"LLM call failed: {e}")
             raise
 
-    def _rewrite_question_with_context(
-        self, question: str, conversation_history: str
-    ) -> str:
-        """Rewrite question to resolve pronouns using conversation history.
-
-        Examples:
-        - "What team do they play for?" + history about "Shai" → "What team does Shai Gilgeous-Alexander play for?"
-        - "How many assists did he average?" + history about "LeBron" → "How many assists did LeBron James average?"
+    async def _acall_llm(self, prompt: str) -> str:
+        """Async variant of _call_llm() using the genai async client.
 
         Args:
-            question: Original question (may contain pronouns)
-            conversation_history: Previous conversation context
+            prompt: Prompt to send to the LLM
 
         Returns:
-            Rewritten question with pronouns resolved (or original if no pronouns)
+            LLM response text
         """
-        # Only rewrite if question contains pronouns
+        try:
+            with ANSWER_SECONDS.time():
+                response = await self.llm_client.aio.models.generate_content(
+                    model=self.model,
+                    contents=prompt,
+                    config=genai.types.GenerateContentConfig(
+                        temperature=self.temperature,
+                        max_output_tokens=2048,
+                    )
+                )
+            return response.text.strip()
+        except Exception as e:
+            logger.exception(f"LLM call failed: {e}")
+            raise
+
+    @staticmethod
+    def _has_pronoun(question: str) -> bool:
+        """Check whether a question contains a pronoun worth resolving."""
         pronouns = ["he", "she", "they", "them", "his", "her", "their", "it"]
         question_lower = question.lower()
 
-        has_pronoun = any(f" {pronoun} " in f" {question_lower} " or
-                         f" {pronoun}'" in f" {question_lower} "
-                         for pronoun in pronouns)
+        return any(f" {pronoun} " in f" {question_lower} " or
+                   f" {pronoun}'" in f" {question_lower} "
+                   for pronoun in pronouns)
 
-        if not has_pronoun:
-            logger.debug("No pronouns detected, skipping rewrite")
-            return question
-
-        try:
-            # Use LLM to resolve pronouns
-            prompt = f"""Rewrite the question to replace pronouns with specific entities from the conversation history.
+    @staticmethod
+    def _build_rewrite_prompt(question: str, conversation_history: str) -> str:
+        """Build the pronoun-resolution prompt."""
+        return f"""Rewrite the question to replace pronouns with specific entities from the conversation history.
 
 CONVERSATION HISTORY:
 {conversation_history}
@@ -574,24 +657,223 @@ INSTRUCTIONS:
 
 REWRITTEN QUESTION:"""
 
+    @staticmethod
+    def _accept_rewrite(question: str, rewritten: str) -> str:
+        """Return the rewritten question if it passes the sanity check, else the original."""
+        # Sanity check: rewritten should be similar length (not empty, not too long)
+        if 5 <= len(rewritten) <= len(question) * 3:
+            return rewritten
+        logger.warning(f"Rewriting produced suspicious result (len={len(rewritten)}), using original")
+        return question
+
+    def _rewrite_question_with_context(
+        self, question: str, conversation_history: str
+    ) -> str:
+        """Rewrite question to resolve pronouns using conversation history.
+
+        Examples:
+        - "What team do they play for?" + history about "Shai" → "What team does Shai Gilgeous-Alexander play for?"
+        - "How many assists did he average?" + history about "LeBron" → "How many assists did LeBron James average?"
+
+        Args:
+            question: Original question (may contain pronouns)
+            conversation_history: Previous conversation context
+
+        Returns:
+            Rewritten question with pronouns resolved (or original if no pronouns)
+        """
+        # Only rewrite if question contains pronouns
+        if not self._has_pronoun(question):
+            logger.debug("No pronouns detected, skipping rewrite")
+            return question
+
+        try:
+            # Use LLM to resolve pronouns
             response = self.llm_client.models.generate_content(
                 model=self.model,
-                contents=prompt,
+                contents=self._build_rewrite_prompt(question, conversation_history),
                 config={"temperature": 0.0},  # Deterministic rewriting
             )
+            return self._accept_rewrite(question, response.text.strip())
 
-            rewritten = response.text.strip()
+        except Exception as e:
+            logger.error(f"Question rewriting failed: {e}")
+            return question  # Fallback to original on error
 
-            # Sanity check: rewritten should be similar length (not empty, not too long)
-            if 5 <= len(rewritten) <= len(question) * 3:
-                return rewritten
-            else:
-                logger.warning(f"Rewriting produced suspicious result (len={len(rewritten)}), using original")
-                return question
+    async def _arewrite_question_with_context(
+        self, question: str, conversation_history: str
+    ) -> str:
+        """Async variant of _rewrite_question_with_context()."""
+        if not self._has_pronoun(question):
+            logger.debug("No pronouns detected, skipping rewrite")
+            return question
+
+        try:
+            response = await self.llm_client.aio.models.generate_content(
+                model=self.model,
+                contents=self._build_rewrite_prompt(question, conversation_history),
+                config={"temperature": 0.0},
+            )
+            return self._accept_rewrite(question, response.text.strip())
 
         except Exception as e:
             logger.error(f"Question rewriting failed: {e}")
-            return question  # Fallback to original on error
+            return question
+
+    def _vector_search_input(
+        self, question: str, query_type: str, tool_results: dict[str, Any]
+    ) -> tuple[str, int, int]:
+        """Build the vector search query and chunk counts.
+
+        For hybrid queries the search query is enriched with entities from the
+        SQL results. More chunks are retrieved than needed so that re-ranking
+        has something to choose from.
+
+        Args:
+            question: User question (pronouns already resolved)
+            query_type: Classification result
+            tool_results: Results of the tools executed so far
+
+        Returns:
+            (vector_query, k_initial, k_retrieve)
+        """
+        vector_query = question
+        if query_type == "hybrid" and tool_results.get("query_nba_database"):
+            # Extract entities (player/team names) from SQL results
+            entities = self._extract_entities_from_sql(tool_results["query_nba_database"])
+
+            # Enrich query with entities (replace pronouns, add context)
+            if entities:
+                vector_query = self._enrich_query_with_entities(question, entities)
+                logger.info(f"Dynamic query rewriting: '{question}' → '{vector_query}'")
+
+        # Determine optimal k based on query complexity
+        k_initial = self._determine_k(vector_query, query_type)
+        k_retrieve = int(k_initial * RERANKING_OVERFETCH_MULTIPLIER)  # Retrieve 50% more for re-ranking
+        return vector_query, k_initial, k_retrieve
+
+    def _should_rerank(self, chunks: list, k_initial: int) -> bool:
+        """Decide whether retrieval quality is poor enough to re-rank with the LLM.
+
+        Args:
+            chunks: Retrieved chunks, best first
+            k_initial: Number of chunks the answer will use
+
+        Returns:
+            True if the top-1 score is below the quality threshold and there
+            are more chunks than needed
+        """
+        if not chunks or not isinstance(chunks[0], dict):
+            return False
+
+        # Get top-1 score (in 0-100 range from vector store)
+        top_score_raw = chunks[0].get("score", SCORE_NORMALIZATION_FACTOR)
+
+        # Normalize to 0-1 range for threshold comparison
+        top_score_normalized = top_score_raw / SCORE_NORMALIZATION_FACTOR
+
+        # Only re-rank if top score is low (poor quality)
+        if top_score_normalized < RERANKING_QUALITY_THRESHOLD and len(chunks) > k_initial:
+            logger.info(f"Top-1 score {top_score_normalized:.3f} ({top_score_raw:.1f}%) < {RERANKING_QUALITY_THRESHOLD}, re-ranking {len(chunks)} chunks")
+            return True
+
+        logger.info(f"Top-1 score {top_score_normalized:.3f} ({top_score_raw:.1f}%) ≥ {RERANKING_QUALITY_THRESHOLD}, skipping re-ranking (good quality)")
+        return False
+
+    def _visualization_input(self, question: str, tool_results: dict[str, Any]) -> dict[str, Any] | None:
+        """Build create_visualization input if the SQL results are worth charting.
+
+        Args:
+            question: User question
+            tool_results: Results of the tools executed so far
+
+        Returns:
+            Tool input dict, or None if no chart should be generated
+        """
+        sql_data = tool_results.get("query_nba_database", {})
+        sql_results_list = sql_data.get("results", [])
+        sql_query = sql_data.get("sql", "")
+
+        if not sql_results_list or not ResultsFormatter.should_visualize(sql_results_list):
+            return None
+
+        # Convert tuples to dicts if needed
+        formatted_results = ResultsFormatter.format_sql_results(sql_results_list, sql_query)
+        return {"query": question, "sql_results": formatted_results}
+
+    @staticmethod
+    def _tool_error_result(
+        error: Exception, query_type: str, tool_results: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Build the run() result for a failed tool phase."""
+        # Build tools_used from what we attempted
+        attempted_tools = []
+        if query_type in ["sql_only", "hybrid"]:
+            attempted_tools.append("query_nba_database")
+        if query_type in ["vector_only", "hybrid"]:
+            attempted_tools.append("search_knowledge_base")
+
+        return {
+            "answer": f"I encountered an error retrieving information: {str(error)}",
+            "tools_used": attempted_tools,
+            "tool_results": tool_results,
+            "query_type": query_type,
+            "error": str(error),
+        }
+
+    @staticmethod
+    def _answer_prompt(
+        question: str,
+        conversation_history: str,
+        query_type: str,
+        tool_results: dict[str, Any],
+        sql_ran: bool,
+        vector_ran: bool,
+    ) -> str:
+        """Build the answer-generation prompt from the executed tool results."""
+        # Get actual dicts from tool_results (not string observations)
+        return ResultsFormatter.build_combined_prompt(
+            question=question,
+            conversation_history=conversation_history,
+            sql_result=tool_results.get("query_nba_database") if sql_ran else None,
+            vector_result=tool_results.get("search_knowledge_base") if vector_ran else None,
+            query_type=query_type,
+        )
+
+    @staticmethod
+    def _build_result(
+        answer: str,
+        query_type: str,
+        tool_results: dict[str, Any],
+        sql_ran: bool,
+        vector_ran: bool,
+    ) -> dict[str, Any]:
+        """Build the run() result from the generated answer."""
+        logger.info(f"LLM generated final answer (length: {len(answer)} chars)")
+
+        # Build tools_used list from what was actually executed
+        tools_used = []
+        if sql_ran:
+            tools_used.append("query_nba_database")
+        if vector_ran:
+            tools_used.append("search_knowledge_base")
+        if "create_visualization" in tool_results:
+            tools_used.append("create_visualization")
+
+        # Ensure citations are present for faithfulness
+        answer_with_citations = ResultsFormatter.ensure_citations(
+            answer=answer,
+            sql_result=tool_results.get("query_nba_database") if sql_ran else None,
+            vector_result=tool_results.get("search_knowledge_base") if vector_ran else None,
+        )
+
+        return {
+            "answer": answer_with_citations,
+            "tools_used": tools_used,
+            "tool_results": tool_results,
+            "query_type": query_type,
+            "is_hybrid": query_type == "hybrid",
+        }
 
     def run(
         self, question: str, conversation_history: str = ""
@@ -615,6 +897,19 @@ REWRITTEN QUESTION:"""
                 - tool_results: Structured results from executed tools
                 - query_type: Classification result
         """
+        start = time.perf_counter()
+        query_type = "error"
+        try:
+            result = self._run(question, conversation_history)
+            query_type = result.get("query_type", "unknown")
+            return result
+        finally:
+            AGENT_RUN_SECONDS.observe(time.perf_counter() - start, query_type=query_type)
+
+    def _run(
+        self, question: str, conversation_history: str
+    ) -> dict[str, Any]:
+        """Untimed body of run()."""
         # Rewrite question to resolve pronouns using conversation history (if available)
         original_question = question
         if conversation_history:
@@ -644,24 +939,11 @@ REWRITTEN QUESTION:"""
 
             # Execute vector search if needed (with dynamic query enrichment for hybrid)
             if query_type in ["vector_only", "hybrid"]:
-                # For hybrid queries, enrich the vector search query using SQL results
-                vector_query = question
-                if query_type == "hybrid" and sql_result:
-                    # Extract entities (player/team names) from SQL results
-                    sql_data = self.tool_results.get("query_nba_database", {})
-                    entities = self._extract_entities_from_sql(sql_data)
-
-                    # Enrich query with entities (replace pronouns, add context)
-                    if entities:
-                        vector_query = self._enrich_query_with_entities(question, entities)
-                        logger.info(f"Dynamic query rewriting: '{question}' → '{vector_query}'")
-
-                # Determine optimal k based on query complexity
-                # Retrieve more chunks initially for re-ranking
-                k_initial = self._determine_k(vector_query, query_type)
-                k_retrieve = int(k_initial * RERANKING_OVERFETCH_MULTIPLIER)  # Retrieve 50% more for re-ranking
-
-                logger.debug(f"Executing search_knowledge_base with query: '{vector_query}', k={k_retrieve}")
+                vector_query, k_initial, k_retrieve = self._vector_search_input(
+                    question, query_type, self.tool_results
+                )
+
+                logger.debug("Executing search_knowledge_base with query: '%s', k=%s", vector_query, k_retrieve)
                 vector_result = self._execute_tool(
                     tool_name="search_knowledge_base",
                     tool_input={"query": vector_query, "k": k_retrieve}
@@ -673,23 +955,7 @@ REWRITTEN QUESTION:"""
                 if vector_data and "results" in vector_data:
                     chunks = vector_data.get("results", [])  # Safe access with default
 
-                    # Check top-1 score to decide if re-ranking is needed
-                    should_rerank = False
-                    if chunks and len(chunks) > 0 and isinstance(chunks[0], dict):
-                        # Get top-1 score (in 0-100 range from vector store)
-                        top_score_raw = chunks[0].get("score", SCORE_NORMALIZATION_FACTOR)
-
-                        # Normalize to 0-1 range for threshold comparison
-                        top_score_normalized = top_score_raw / SCORE_NORMALIZATION_FACTOR
-
-                        # Only re-rank if top score is low (poor quality)
-                        if top_score_normalized < RERANKING_QUALITY_THRESHOLD and len(chunks) > k_initial:
-                            should_rerank = True
-                            logger.info(f"Top-1 score {top_score_normalized:.3f} ({top_score_raw:.1f}%) < {RERANKING_QUALITY_THRESHOLD}, re-ranking {len(chunks)} chunks")
-                        else:
-                            logger.info(f"Top-1 score {top_score_normalized:.3f} ({top_score_raw:.1f}%) ≥ {RERANKING_QUALITY_THRESHOLD}, skipping re-ranking (good quality)")
-
-                    if should_rerank:
+                    if self._should_rerank(chunks, k_initial):
                         # Retrieval quality is poor - use LLM to re-rank
                         reranked_chunks = self._rerank_with_llm(
                             query=vector_query,
@@ -697,35 +963,22 @@ REWRITTEN QUESTION:"""
                             top_n=k_initial
                         )
                         # Update tool results with re-ranked chunks
-                        self.tool_results["search_knowledge_base"]["results"] = reranked_chunks
-                        self.tool_results["search_knowledge_base"]["reranked"] = True
+                        vector_data["results"] = reranked_chunks
+                        vector_data["reranked"] = True
                         logger.info(f"Re-ranking complete: {len(reranked_chunks)} chunks retained")
                     elif len(chunks) > k_initial:
                         # Good quality but too many chunks - just truncate to k_initial
-                        self.tool_results["search_knowledge_base"]["results"] = chunks[:k_initial]
+                        vector_data["results"] = chunks[:k_initial]
                         logger.info(f"Good retrieval quality, using top {k_initial} chunks without re-ranking")
 
             logger.info(f"Tools executed successfully for {query_type} query")
 
             # AUTO-GENERATE VISUALIZATION if SQL has suitable data
-            sql_data = self.tool_results.get("query_nba_database", {})
-            sql_results_list = sql_data.get("results", [])
-            sql_query = sql_data.get("sql", "")
-
-            if sql_results_list and ResultsFormatter.should_visualize(sql_results_list):
+            viz_input = self._visualization_input(question, self.tool_results)
+            if viz_input is not None:
                 logger.info("Auto-generating visualization for SQL results")
                 try:
-                    # Convert tuples to dicts if needed
-                    formatted_results = ResultsFormatter.format_sql_results(sql_results_list, sql_query)
-
-                    viz_observation = self._execute_tool(
-                        tool_name="create_visualization",
-                        tool_input={
-                            "query": question,
-                            "sql_results": formatted_results
-                        }
-                    )
-                    # _execute_tool returns string observation, not dict
+                    self._execute_tool(tool_name="create_visualization", tool_input=viz_input)
                     # Actual result is in self.tool_results
                     viz_result_dict = self.tool_results.get("create_visualization", {})
                     chart_type = viz_result_dict.get('chart_type', 'unknown') if isinstance(viz_result_dict, dict) else 'unknown'
@@ -735,66 +988,138 @@ REWRITTEN QUESTION:"""
 
         except Exception as e:
             logger.error(f"Tool execution failed: {e}")
-            # Build tools_used from what we attempted
-            attempted_tools = []
-            if query_type in ["sql_only", "hybrid"]:
-                attempted_tools.append("query_nba_database")
-            if query_type in ["vector_only", "hybrid"]:
-                attempted_tools.append("search_knowledge_base")
-
-            return {
-                "answer": f"I encountered an error retrieving information: {str(e)}",
-                "tools_used": attempted_tools,
-                "tool_results": self.tool_results,
-                "query_type": query_type,
-                "error": str(e),
-            }
+            return self._tool_error_result(e, query_type, self.tool_results)
 
         # Build prompt with executed tool results
-        # Get actual dicts from tool_results (not string observations)
-        sql_data = self.tool_results.get("query_nba_database") if sql_result else None
-        vector_data = self.tool_results.get("search_knowledge_base") if vector_result else None
-
-        prompt = ResultsFormatter.build_combined_prompt(
-            question=question,
-            conversation_history=conversation_history,
-            sql_result=sql_data,
-            vector_result=vector_data,
-            query_type=query_type,
+        prompt = self._answer_prompt(
+            question, conversation_history, query_type, self.tool_results,
+            sql_ran=sql_result is not None, vector_ran=vector_result is not None,
         )
 
         # Single LLM call to generate answer
         try:
             answer = self._call_llm(prompt)
-            logger.info(f"LLM generated final answer (length: {len(answer)} chars)")
-
-            # Build tools_used list from what was actually executed
-            tools_used = []
-            if sql_result is not None:
-                tools_used.append("query_nba_database")
-            if vector_result is not None:
-                tools_used.append("search_knowledge_base")
-            if "create_visualization" in self.tool_results:
-                tools_used.append("create_visualization")
-
-            # Ensure citations are present for faithfulness
-            # Get actual dicts from tool_results (not string observations)
-            sql_data = self.tool_results.get("query_nba_database") if sql_result else None
-            vector_data = self.tool_results.get("search_knowledge_base") if vector_result else None
-
-            answer_with_citations = ResultsFormatter.ensure_citations(
-                answer=answer,
-                sql_result=sql_data,
-                vector_result=vector_data
+            return self._build_result(
+                answer, query_type, self.tool_results,
+                sql_ran=sql_result is not None, vector_ran=vector_result is not None,
             )
 
-            return {
-                "answer": answer_with_citations,
-                "tools_used": tools_used,
-                "tool_results": self.tool_results,
-                "query_type": query_type,
-                "is_hybrid": query_type == "hybrid",
-            }
+        except Exception as e:
+            logger.error(f"LLM call failed: {e}")
+            raise Exception(f"LLM call failed: {str(e)}") from e
+
+    async def arun(
+        self, question: str, conversation_history: str = ""
+    ) -> dict[str, Any]:
+        """Async variant of run() for the event-loop chat endpoint.
+
+        LLM calls (pronoun rewrite, classification fallback, re-ranking and the
+        answer) are awaited on the genai async client. The blocking tools (SQL
+        agent, vector search, chart rendering) run in worker threads via
+        asyncio.to_thread. Tool results are kept per call instead of on
+        self.tool_results, so concurrent calls on the shared agent don't
+        overwrite each other.
+
+        Args:
+            question: User question
+            conversation_history: Previous conversation context
+
+        Returns:
+            Same dict as run()
+        """
+        start = time.perf_counter()
+        query_type = "error"
+        try:
+            result = await self._arun(question, conversation_history)
+            query_type = result.get("query_type", "unknown")
+            return result
+        finally:
+            AGENT_RUN_SECONDS.observe(time.perf_counter() - start, query_type=query_type)
+
+    async def _arun(
+        self, question: str, conversation_history: str
+    ) -> dict[str, Any]:
+        """Untimed body of arun()."""
+        original_question = question
+        if conversation_history:
+            question = await self._arewrite_question_with_context(question, conversation_history)
+            if question != original_question:
+                logger.info(f"Question rewritten: '{original_question}' → '{question}'")
+
+        query_type = await self.classifier.aclassify(question)
+        logger.info(f"Query classified as: {query_type} - '{question[:100]}'")
+
+        tool_results: dict[str, Any] = {}
+        sql_result = None
+        vector_result = None
+
+        try:
+            if query_type in ["sql_only", "hybrid"]:
+                logger.debug("Executing query_nba_database...")
+                sql_result = await asyncio.to_thread(
+                    self._execute_tool, "query_nba_database", {"question": question}, tool_results
+                )
+
+            if query_type in ["vector_only", "hybrid"]:
+                vector_query, k_initial, k_retrieve = self._vector_search_input(
+                    question, query_type, tool_results
+                )
+
+                logger.debug("Executing search_knowledge_base with query: '%s', k=%s", vector_query, k_retrieve)
+                vector_result = await asyncio.to_thread(
+                    self._execute_tool,
+                    "search_knowledge_base",
+                    {"query": vector_query, "k": k_retrieve},
+                    tool_results,
+                )
+
+                vector_data = tool_results.get("search_knowledge_base", {})
+                if vector_data and "results" in vector_data:
+                    chunks = vector_data.get("results", [])
+
+                    if self._should_rerank(chunks, k_initial):
+                        reranked_chunks = await self._arerank_with_llm(
+                            query=vector_query,
+                            chunks=chunks,
+                            top_n=k_initial
+                        )
+                        vector_data["results"] = reranked_chunks
+                        vector_data["reranked"] = True
+                        logger.info(f"Re-ranking complete: {len(reranked_chunks)} chunks retained")
+                    elif len(chunks) > k_initial:
+                        vector_data["results"] = chunks[:k_initial]
+                        logger.info(f"Good retrieval quality, using top {k_initial} chunks without re-ranking")
+
+            logger.info(f"Tools executed successfully for {query_type} query")
+
+            viz_input = self._visualization_input(question, tool_results)
+            if viz_input is not None:
+                logger.info("Auto-generating visualization for SQL results")
+                try:
+                    await asyncio.to_thread(
+                        self._execute_tool, "create_visualization", viz_input, tool_results
+                    )
+                    viz_result_dict = tool_results.get("create_visualization", {})
+                    chart_type = viz_result_dict.get('chart_type', 'unknown') if isinstance(viz_result_dict, dict) else 'unknown'
+                    logger.info(f"Visualization generated: {chart_type}")
+                except Exception as viz_error:
+                    logger.warning(f"Visualization generation failed: {viz_error}")
+
+        except Exception as e:
+            logger.error(f"Tool execution failed: {e}")
+            return self._tool_error_result(e, query_type, tool_results)
+
+        prompt = self._answer_prompt(
+            question, conversation_history, query_type, tool_results,
+            sql_ran=sql_result is not None, vector_ran=vector_result is not None,
+        )
+
+        try:
+            answer = await self._acall_llm(prompt)
+            return self._build_result(
+                answer, query_type, tool_results,
+                sql_ran=sql_result is not None, vector_ran=vector_result is not None,
+            )
 
         except Exception as e:
             logger.error(f"LLM call failed: {e}")
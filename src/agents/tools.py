@@ -198,7 +198,7 @@ class NBAToolkit:
             if viz_result and viz_result.get("plotly_json"):
                 return {
                     "plotly_json": viz_result["plotly_json"],
-                    "plotly_html": viz_result.get("plotly_html"),
+                    "figure_id": viz_result.get("figure_id"),
                     "chart_type": viz_result.get("chart_type", chart_type),
                     "error": None,
                 }
@@ -1,5 +1,15 @@
-"""FastAPI application and routes."""
+"""FastAPI application and routes.
 
-from src.api.main import app, create_app
+``app`` and ``create_app`` are resolved on first access, so importing a route
+module doesn't build the application.
+"""
 
-__all__ = ["app", "create_app"]
+from src.core.lazy import lazy_exports
+
+_EXPORTS = {
+    "app": "src.api.main",
+    "create_app": "src.api.main",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
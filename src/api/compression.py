@@ -0,0 +1,58 @@
+"""
+FILE: compression.py
+STATUS: Active
+RESPONSIBILITY: Response compression that leaves streamed (NDJSON) responses uncompressed
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+from collections.abc import Iterable
+
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Optional: brotli compression (falls back to gzip)
+try:
+    from brotli_asgi import BrotliMiddleware
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Routes streaming NDJSON: each line must reach the client as soon as it is sent
+STREAMING_PATHS = ("/api/v1/chat/batch",)
+
+
+class CompressionMiddleware:
+    """Brotli (when brotli-asgi is installed, else gzip) for everything but streams.
+
+    Neither compressor flushes per chunk, so an NDJSON stream would sit in the
+    compression buffer until enough bytes pile up; requests to
+    ``streaming_paths`` go straight to the app instead.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1000,
+        streaming_paths: Iterable[str] = STREAMING_PATHS,
+    ):
+        """Initialize middleware.
+
+        Args:
+            app: ASGI application
+            minimum_size: Only compress responses at least this many bytes
+            streaming_paths: Path prefixes served uncompressed
+        """
+        self.app = app
+        self.streaming_paths = tuple(streaming_paths)
+        if BROTLI_AVAILABLE:
+            self.compressed = BrotliMiddleware(app, minimum_size=minimum_size, gzip_fallback=True)
+        else:
+            self.compressed = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=6)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.streaming_paths):
+            await self.app(scope, receive, send)
+        else:
+            await self.compressed(scope, receive, send)
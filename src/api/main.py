@@ -19,8 +19,10 @@ from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from src.api.compression import CompressionMiddleware
 from src.api.dependencies import get_chat_service, set_chat_service
-from src.api.routes import chat, conversation, feedback, health
+from src.api.rate_limit import RateLimitMiddleware
+from src.api.routes import chat, conversation, feedback, health, metrics, visualization
 from src.core.config import settings
 from src.core.exceptions import (
     AppException,
@@ -29,6 +31,8 @@ from src.core.exceptions import (
     ValidationError,
 )
 from src.core.logging_config import configure_local_logging
+from src.core.metrics import HTTP_REQUEST_SECONDS
+from src.repositories.database import dispose_all_engines
 from src.services.chat import ChatService
 
 # Configure local structured logging (JSON files with rotation)
@@ -56,11 +60,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except IndexNotFoundError:
         logger.warning("Vector index not found - run indexer first")
 
+    # Build the agent and warm each stage off the event loop; /ready reports
+    # false until this finishes
+    if settings.warm_up_enabled:
+        service.start_warm_up()
+
     yield
 
     # Cleanup
     logger.info("Shutting down application...")
+    # Write interactions still queued before the process exits
+    service.close()
     set_chat_service(None)
+    dispose_all_engines()
 
 
 def create_app() -> FastAPI:
@@ -79,6 +91,9 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Per-client token buckets (added first so CORS headers wrap 429s too)
+    app.add_middleware(RateLimitMiddleware)
+
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
@@ -88,13 +103,20 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Add request timing middleware
+    # Response compression (brotli for clients that accept it, else gzip; not for NDJSON streams)
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.api_compression_min_size)
+
+    # Add request timing middleware (header + latency histogram per route template)
     @app.middleware("http")
     async def add_timing_header(request: Request, call_next):
         start_time = time.time()
         response = await call_next(request)
         process_time = time.time() - start_time
         response.headers["X-Process-Time"] = f"{process_time:.3f}"
+        route = getattr(request.scope.get("route"), "path", "unmatched")
+        HTTP_REQUEST_SECONDS.observe(
+            process_time, method=request.method, route=route, status=response.status_code
+        )
         return response
 
     # Exception handlers
@@ -142,9 +164,11 @@ def create_app() -> FastAPI:
 
     # Include routers
     app.include_router(health.router, tags=["Health"])
+    app.include_router(metrics.router, tags=["Metrics"])
     app.include_router(chat.router, prefix="/api/v1", tags=["Chat"])
     app.include_router(conversation.router, prefix="/api/v1", tags=["Conversations"])
     app.include_router(feedback.router, prefix="/api/v1", tags=["Feedback"])
+    app.include_router(visualization.router, prefix="/api/v1", tags=["Visualizations"])
 
     return app
 
@@ -0,0 +1,360 @@
+"""
+FILE: rate_limit.py
+STATUS: Active
+RESPONSIBILITY: Per-client token-bucket rate limiting middleware (in-process or SQLite store)
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import asyncio
+import hashlib
+import ipaddress
+import logging
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.exceptions import RateLimitError, ValidationError
+
+logger = logging.getLogger(__name__)
+
+API_KEY_HEADER = b"x-api-key"
+# Identify the real client, honoured only from trusted proxies (see client_key)
+CLIENT_ID_HEADER = b"x-client-id"
+FORWARDED_FOR_HEADER = b"x-forwarded-for"
+
+# Idle buckets beyond this are evicted (an evicted bucket simply starts full again)
+MAX_MEMORY_BUCKETS = 100_000
+
+
+@dataclass(frozen=True)
+class RouteLimit:
+    """Token bucket shape: ``requests`` tokens, refilled over ``window`` seconds."""
+
+    requests: int
+    window: float
+
+    @property
+    def refill_rate(self) -> float:
+        """Tokens added per second."""
+        return self.requests / self.window
+
+
+def _refill(tokens: float, updated_at: float, now: float, limit: RouteLimit) -> float:
+    """Tokens in a bucket after refilling since its last update."""
+    return min(float(limit.requests), tokens + (now - updated_at) * limit.refill_rate)
+
+
+def _retry_after(tokens: float, limit: RouteLimit, cost: float = 1.0) -> int:
+    """Whole seconds until ``cost`` tokens are available."""
+    return max(1, math.ceil((cost - tokens) / limit.refill_rate))
+
+
+class MemoryBucketStore:
+    """In-process token buckets (one worker; state is lost on restart)."""
+
+    # consume() never blocks, so it runs on the event loop
+    blocking = False
+
+    def __init__(self, max_buckets: int = MAX_MEMORY_BUCKETS):
+        """Initialize store.
+
+        Args:
+            max_buckets: Maximum buckets kept (least recently used evicted first)
+        """
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._max_buckets = max_buckets
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, limit: RouteLimit, cost: float = 1.0) -> tuple[bool, int]:
+        """Take tokens from a bucket (all or none).
+
+        Args:
+            key: Bucket key (client + route)
+            limit: Bucket shape
+            cost: Tokens to take
+
+        Returns:
+            (allowed, retry_after seconds; 0 when allowed)
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (float(limit.requests), now))
+            tokens = _refill(tokens, updated_at, now, limit)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            if len(self._buckets) > self._max_buckets:
+                self._buckets.popitem(last=False)
+        return allowed, 0 if allowed else _retry_after(tokens, limit, cost)
+
+
+class SQLiteBucketStore:
+    """Token buckets in a SQLite file shared by every worker on the host.
+
+    Each consume is one short ``BEGIN IMMEDIATE`` transaction, so concurrent
+    workers serialize on the bucket row instead of each keeping its own limit.
+    """
+
+    # consume() may wait on the database lock: run it off the event loop
+    blocking = True
+
+    def __init__(self, db_path: str | Path):
+        """Initialize store.
+
+        Args:
+            db_path: Path to the bucket database (created if missing)
+        """
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=1000")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+            "bucket TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, limit: RouteLimit, cost: float = 1.0) -> tuple[bool, int]:
+        """Take tokens from a bucket (all or none).
+
+        Args:
+            key: Bucket key (client + route)
+            limit: Bucket shape
+            cost: Tokens to take
+
+        Returns:
+            (allowed, retry_after seconds; 0 when allowed)
+        """
+        # Wall clock: monotonic time isn't comparable across processes
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT tokens, updated_at FROM rate_limit_buckets WHERE bucket = ?", (key,)
+                ).fetchone()
+                tokens, updated_at = row if row else (float(limit.requests), now)
+                tokens = _refill(tokens, updated_at, now, limit)
+                allowed = tokens >= cost
+                if allowed:
+                    tokens -= cost
+                self._conn.execute(
+                    "INSERT INTO rate_limit_buckets (bucket, tokens, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(bucket) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at",
+                    (key, tokens, now),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return allowed, 0 if allowed else _retry_after(tokens, limit, cost)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+def create_bucket_store() -> MemoryBucketStore | SQLiteBucketStore:
+    """Create the bucket store selected by settings.rate_limit_backend."""
+    if settings.rate_limit_backend == "sqlite":
+        logger.info(f"Rate limit buckets shared via SQLite: {settings.rate_limit_db_path}")
+        return SQLiteBucketStore(settings.rate_limit_db_path)
+    return MemoryBucketStore()
+
+
+def _is_trusted(host: str, trusted_proxies: Sequence[str]) -> bool:
+    """Whether a peer address is one of the trusted proxies (IPs or CIDR ranges)."""
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    for proxy in trusted_proxies:
+        try:
+            if address in ipaddress.ip_network(proxy, strict=False):
+                return True
+        except ValueError:
+            continue
+    return False
+
+
+def _digest(value: bytes) -> str:
+    """Short hash of a header value (raw keys and ids never reach the bucket store)."""
+    return hashlib.sha256(value).hexdigest()[:16]
+
+
+def client_key(
+    scope: Scope, trusted_proxies: Sequence[str] = (), api_keys: Collection[str] = ()
+) -> str:
+    """Identify the caller.
+
+    In order: the X-API-Key header, when it is one of ``api_keys``; then,
+    when the direct peer is a trusted proxy, its X-Client-Id (the Streamlit
+    UI sends one per browser session) or the nearest untrusted
+    X-Forwarded-For address; else the peer IP. Unknown API keys are ignored,
+    so rotating made-up keys can't mint fresh buckets.
+
+    Args:
+        scope: ASGI HTTP scope
+        trusted_proxies: Peer IPs/CIDR ranges allowed to name the real client
+        api_keys: Digests (_digest) of the accepted API keys
+    """
+    headers = dict(scope.get("headers", []))
+    api_key = headers.get(API_KEY_HEADER)
+    if api_key and api_keys:
+        digest = _digest(api_key)
+        if digest in api_keys:
+            return "key:" + digest
+
+    client = scope.get("client")
+    host = client[0] if client else "unknown"
+    if trusted_proxies and _is_trusted(host, trusted_proxies):
+        client_id = headers.get(CLIENT_ID_HEADER)
+        if client_id:
+            return "client:" + _digest(client_id)
+        forwarded = headers.get(FORWARDED_FOR_HEADER, b"").decode("latin-1")
+        # Rightmost address not added by one of our own proxies
+        for address in reversed([a.strip() for a in forwarded.split(",") if a.strip()]):
+            if not _is_trusted(address, trusted_proxies):
+                return f"ip:{address}"
+    return f"ip:{host}"
+
+
+class RateLimitMiddleware:
+    """ASGI middleware enforcing per-client token buckets.
+
+    Every client gets one bucket per configured route prefix (longest prefix
+    wins; paths matching none share the default bucket). Over-limit requests
+    get a 429 with Retry-After before any route code runs. Probe and metrics
+    paths (rate_limit_exempt_paths) and CORS preflights are never limited.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: MemoryBucketStore | SQLiteBucketStore | None = None,
+        default_limit: RouteLimit | None = None,
+        route_limits: dict[str, int] | None = None,
+        enabled: bool | None = None,
+        exempt_paths: Sequence[str] | None = None,
+        trusted_proxies: Sequence[str] | None = None,
+        api_keys: Sequence[str] | None = None,
+    ):
+        """Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI app
+            store: Bucket store (default from settings.rate_limit_backend)
+            default_limit: Limit for paths without a route limit
+                (default rate_limit_requests per rate_limit_window)
+            route_limits: Path prefix -> requests per window
+                (default settings.rate_limit_routes)
+            enabled: Enforce limits (default settings.rate_limit_enabled)
+            exempt_paths: Path prefixes never limited (default settings.rate_limit_exempt_paths)
+            trusted_proxies: Peers whose client headers are honoured
+                (default settings.rate_limit_trusted_proxies)
+            api_keys: X-API-Key values given their own bucket
+                (default settings.rate_limit_api_keys)
+        """
+        self.app = app
+        self.enabled = settings.rate_limit_enabled if enabled is None else enabled
+        self.store = store if store is not None else create_bucket_store()
+        self.default_limit = default_limit or RouteLimit(
+            settings.rate_limit_requests, settings.rate_limit_window
+        )
+        self.exempt_paths = tuple(
+            settings.rate_limit_exempt_paths if exempt_paths is None else exempt_paths
+        )
+        self.trusted_proxies = tuple(
+            settings.rate_limit_trusted_proxies if trusted_proxies is None else trusted_proxies
+        )
+        self.api_keys = frozenset(
+            _digest(key.encode())
+            for key in (settings.rate_limit_api_keys if api_keys is None else api_keys)
+        )
+        routes = settings.rate_limit_routes if route_limits is None else route_limits
+        self.route_limits = sorted(
+            ((prefix, RouteLimit(requests, self.default_limit.window)) for prefix, requests in routes.items()),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+
+    async def _consume(self, key: str, limit: RouteLimit, cost: float = 1.0) -> tuple[bool, int]:
+        if self.store.blocking:
+            return await asyncio.to_thread(self.store.consume, key, limit, cost)
+        return self.store.consume(key, limit, cost)
+
+    async def charge(self, scope: Scope, path: str, cost: int) -> None:
+        """Charge ``cost`` requests to the caller's bucket for another path.
+
+        Used by routes doing the work of many requests in one call, so a
+        batch of N chat requests costs N /chat requests.
+
+        Args:
+            scope: ASGI scope of the current request (identifies the caller)
+            path: Path whose bucket is charged
+            cost: Requests to charge
+
+        Raises:
+            ValidationError: If cost exceeds the bucket size (could never succeed)
+            RateLimitError: If the bucket doesn't hold enough tokens
+        """
+        prefix, limit = self.limit_for(path)
+        if cost > limit.requests:
+            raise ValidationError(
+                f"Request counts as {cost} {path} requests; the limit is {limit.requests} "
+                f"per {limit.window:g}s",
+                details={"cost": cost, "limit": limit.requests},
+            )
+        client = client_key(scope, self.trusted_proxies, self.api_keys)
+        allowed, retry_after = await self._consume(f"{client}|{prefix}", limit, cost)
+        if not allowed:
+            logger.warning(f"Rate limit exceeded for {client} on {prefix} (cost {cost}, retry after {retry_after}s)")
+            raise RateLimitError(retry_after=retry_after)
+
+    def limit_for(self, path: str) -> tuple[str, RouteLimit]:
+        """Find the (prefix, limit) governing a path."""
+        for prefix, limit in self.route_limits:
+            if path.startswith(prefix):
+                return prefix, limit
+        return "*", self.default_limit
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not self.enabled
+            or scope["method"] == "OPTIONS"
+            or scope["path"].startswith(self.exempt_paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        prefix, limit = self.limit_for(scope["path"])
+        client = client_key(scope, self.trusted_proxies, self.api_keys)
+        allowed, retry_after = await self._consume(f"{client}|{prefix}", limit)
+        if allowed:
+            # Routes that fan out (e.g. /chat/batch) charge extra tokens via request.state
+            scope.setdefault("state", {})["rate_limiter"] = self
+            await self.app(scope, receive, send)
+            return
+
+        logger.warning(f"Rate limit exceeded for {client} on {prefix} (retry after {retry_after}s)")
+        exc = RateLimitError(retry_after=retry_after)
+        response = JSONResponse(
+            status_code=429,
+            content=exc.to_dict(),
+            headers={"Retry-After": str(retry_after)},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,61 @@
+"""
+FILE: responses.py
+STATUS: Active
+RESPONSIBILITY: Response shaping (field projection) and fast JSON serialization for API routes
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from src.models.chat import ChatRequest, ChatResponse
+
+# Optional: orjson serializes several times faster than the stdlib
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_dumps(content: Any) -> bytes:
+    """Serialize JSON-native content (orjson when installed, else stdlib json)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with json_dumps."""
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
+
+def shape_chat_response(response: ChatResponse, request: ChatRequest) -> dict[str, Any]:
+    """Project a ChatResponse down to what the request asked for.
+
+    - ``fields``: only these top-level fields are returned
+    - ``include_sources=False``: source chunks are dropped
+    - ``include_visualization_html=False`` (default): visualization.plot_html
+      is dropped (plot_json carries the same figure)
+
+    Args:
+        response: Full chat response
+        request: Request carrying the shaping options
+
+    Returns:
+        JSON-native dict ready for serialization
+    """
+    exclude: dict[str, Any] = {}
+    if not request.include_sources:
+        exclude["sources"] = True
+    if not request.include_visualization_html:
+        exclude["visualization"] = {"plot_html"}
+
+    include = set(request.fields) if request.fields else None
+    return response.model_dump(mode="json", include=include, exclude=exclude or None)
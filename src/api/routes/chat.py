@@ -2,46 +2,149 @@
 FILE: chat.py
 STATUS: Active
 RESPONSIBILITY: Chat API endpoints (chat, search, ask)
-LAST MAJOR UPDATE: 2026-02-06
+LAST MAJOR UPDATE: 2026-10-18
 MAINTAINER: Shahu
 """
 
+import asyncio
 import logging
 import re
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 
 from src.api.dependencies import get_chat_service
-from src.models.chat import ChatRequest, ChatResponse, SearchResult, Visualization
+from src.api.responses import FastJSONResponse, json_dumps, shape_chat_response
+from src.core.config import settings
+from src.core.exceptions import AppException, RateLimitError, ValidationError
+from src.core.metrics import QUEUE_DEPTH
+from src.models.chat import (
+    ChatBatchItem,
+    ChatBatchRequest,
+    ChatRequest,
+    ChatResponse,
+    SearchResult,
+    Visualization,
+)
 from src.services.chat import ChatService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Retrieval-only requests get their own concurrency limit (created lazily
+# inside the running event loop)
+_search_semaphore: asyncio.Semaphore | None = None
+
+
+def _get_search_semaphore() -> asyncio.Semaphore:
+    """Get the /search concurrency limiter."""
+    global _search_semaphore
+    if _search_semaphore is None:
+        _search_semaphore = asyncio.Semaphore(settings.search_max_concurrency)
+    return _search_semaphore
+
+
+class ChatAdmission:
+    """Bounded concurrency with a bounded wait queue for /chat.
+
+    At most ``max_concurrency`` agent pipelines run at once and at most
+    ``max_queue`` requests wait for a slot. Anything beyond that is rejected
+    immediately with RateLimitError (429 + Retry-After) instead of piling up.
+    """
+
+    def __init__(self, max_concurrency: int, max_queue: int, retry_after: int):
+        """Initialize limiter.
+
+        Args:
+            max_concurrency: Concurrent pipelines
+            max_queue: Requests allowed to wait for a slot
+            retry_after: Retry-After seconds for rejected requests
+        """
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_queue = max_queue
+        self._retry_after = retry_after
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests currently queued for a slot."""
+        return self._waiting
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a pipeline slot for the duration of the block.
+
+        Raises:
+            RateLimitError: If every slot is busy and the wait queue is full
+        """
+        if self._semaphore.locked() and self._waiting >= self._max_queue:
+            raise RateLimitError("Too many concurrent chat requests", retry_after=self._retry_after)
+
+        self._waiting += 1
+        QUEUE_DEPTH.set(self._waiting, queue="chat_admission")
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+            QUEUE_DEPTH.set(self._waiting, queue="chat_admission")
+
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+
+_chat_admission: ChatAdmission | None = None
+
+
+def _get_chat_admission() -> ChatAdmission:
+    """Get the /chat admission limiter (created lazily inside the running event loop)."""
+    global _chat_admission
+    if _chat_admission is None:
+        _chat_admission = ChatAdmission(
+            max_concurrency=settings.chat_max_concurrency,
+            max_queue=settings.chat_max_queue,
+            retry_after=settings.chat_retry_after,
+        )
+    return _chat_admission
+
 
 @router.post(
     "/chat",
     summary="Chat with RAG",
     description="Send a question and get an AI-powered answer based on the knowledge base. "
     "Supports conversation context by optionally providing conversation_id and turn_number "
-    "to enable pronoun resolution and follow-up questions.",
+    "to enable pronoun resolution and follow-up questions. Use fields / include_sources / "
+    "include_visualization_html to return only what the client needs.",
+    response_model=ChatResponse,
+    response_class=FastJSONResponse,
     responses={
         200: {"description": "Successful response with answer and sources"},
         422: {"description": "Validation error in request"},
+        429: {"description": "Too many concurrent chat requests (see Retry-After)"},
         503: {"description": "Vector index not available"},
     },
 )
-def chat(request: ChatRequest) -> ChatResponse:
+async def chat(request: ChatRequest) -> FastJSONResponse:
     """Process a chat request through the RAG pipeline.
 
+    Runs on the event loop (no threadpool thread held while waiting on the
+    LLM), behind the ChatAdmission concurrency/queue limit.
+
     Args:
         request: Chat request containing the query and parameters
 
     Returns:
-        ChatResponse with AI-generated answer and source documents
+        ChatResponse with AI-generated answer and source documents, projected
+        per the request's shaping options
+
+    Raises:
+        RateLimitError: If all pipeline slots are busy and the wait queue is full
     """
     start_time = time.time()
     logger.info("Chat request received: %s", request.query[:50])
@@ -49,10 +152,12 @@ def chat(request: ChatRequest) -> ChatResponse:
     # Process through normal RAG pipeline
     # Note: Service layer has PHASE 15 greeting detection that handles simple greetings
     try:
-        service = get_chat_service()
-        logger.debug(f"Service obtained: {type(service)}")
-        response = service.chat(request)
+        async with _get_chat_admission().slot():
+            service = get_chat_service()
+            logger.debug(f"Service obtained: {type(service)}")
+            response = await service.achat(request)
         logger.debug(f"Response type: {type(response)}")
+        response = await _with_visualization_html(response, request, service)
 
         logger.info(
             "Chat response generated in %.2fms with %d sources",
@@ -61,20 +166,122 @@ def chat(request: ChatRequest) -> ChatResponse:
         )
 
         logger.debug(f"Response query_type: {response.query_type}")
-        logger.debug(f"Response dict keys: {list(response.model_dump().keys())}")
-        logger.debug(f"query_type in response: {'query_type' in response.model_dump()}")
 
-        return response
+        return FastJSONResponse(shape_chat_response(response, request))
+    except RateLimitError:
+        logger.warning("Chat request rejected: queue full (%d waiting)", _get_chat_admission().waiting)
+        raise
     except Exception as e:
         logger.exception(f"Chat error for query '{request.query[:50]}': {type(e).__name__}: {e}")
         raise
 
 
+async def _with_visualization_html(
+    response: ChatResponse, request: ChatRequest, service: ChatService
+) -> ChatResponse:
+    """Render the visualization HTML if the request asked for it.
+
+    Returns a copy: the service's response may be shared with coalesced
+    identical requests that didn't ask for HTML.
+    """
+    visualization = response.visualization
+    if (
+        not request.include_visualization_html
+        or visualization is None
+        or visualization.plot_html is not None
+        or visualization.figure_id is None
+    ):
+        return response
+
+    html = await asyncio.to_thread(service.visualization_service.render_html, visualization.figure_id)
+    if html is None:
+        return response
+    return response.model_copy(
+        update={"visualization": visualization.model_copy(update={"plot_html": html})}
+    )
+
+
+def _batch_line(index: int, outcome: ChatResponse | Exception, request: ChatRequest) -> bytes:
+    """Serialize one batch result as an NDJSON line."""
+    if isinstance(outcome, ChatResponse):
+        item = ChatBatchItem(index=index, response=shape_chat_response(outcome, request))
+    elif isinstance(outcome, AppException):
+        item = ChatBatchItem(index=index, error=outcome.to_dict()["error"])
+    else:
+        logger.error(f"Batch request {index} failed: {type(outcome).__name__}: {outcome}")
+        item = ChatBatchItem(
+            index=index,
+            error={"code": "INTERNAL_ERROR", "message": "An unexpected error occurred"},
+        )
+    return json_dumps(item.model_dump(mode="json", exclude_unset=True)) + b"\n"
+
+
+@router.post(
+    "/chat/batch",
+    summary="Batch Chat",
+    description="Run many chat requests server-side with bounded parallelism. "
+    "Results stream back as NDJSON (one ChatBatchItem per line, in completion order). "
+    "Requests sharing a conversation_id run in order as one thread.",
+    response_class=StreamingResponse,
+    responses={
+        200: {"description": "NDJSON stream of ChatBatchItem", "content": {"application/x-ndjson": {}}},
+        422: {"description": "Validation error in request"},
+        429: {"description": "Batch exceeds the caller's /chat rate limit"},
+    },
+)
+async def chat_batch(batch: ChatBatchRequest, http_request: Request) -> StreamingResponse:
+    """Run a batch of chat requests and stream the results.
+
+    Each request costs one /chat request against the caller's rate limit and
+    runs inside a /chat admission slot, so batches get no more throughput
+    than the same requests sent to /chat one by one.
+
+    Args:
+        batch: Requests and optional concurrency
+        http_request: Incoming HTTP request (identifies the caller for rate limiting)
+
+    Returns:
+        NDJSON stream; each line has the request index and its response or error
+
+    Raises:
+        RateLimitError: If the caller's /chat bucket can't cover the batch
+        ValidationError: If the batch has more than settings.chat_batch_max_requests requests
+    """
+    concurrency = min(batch.max_concurrency or settings.chat_batch_concurrency, settings.chat_batch_concurrency)
+    logger.info("Batch chat request received: %d requests", len(batch.requests))
+    max_requests = settings.chat_batch_max_requests
+    if len(batch.requests) > max_requests:
+        raise ValidationError(
+            f"Batch has {len(batch.requests)} requests; the maximum is {max_requests} "
+            "(the /chat rate limit bucket size)",
+            details={"requests": len(batch.requests), "max_requests": max_requests},
+        )
+    limiter = getattr(http_request.state, "rate_limiter", None)
+    if limiter is not None:
+        await limiter.charge(http_request.scope, "/api/v1/chat", len(batch.requests))
+    service = get_chat_service()
+
+    async def lines():
+        results = service.achat_batch(batch.requests, concurrency, slot=_get_chat_admission().slot)
+        async for index, outcome in results:
+            if isinstance(outcome, ChatResponse):
+                outcome = await _with_visualization_html(outcome, batch.requests[index], service)
+            yield _batch_line(index, outcome, batch.requests[index])
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/search",
     response_model=list[SearchResult],
+    response_class=FastJSONResponse,
     summary="Search Knowledge Base",
-    description="Search for relevant documents without generating an answer.",
+    description="Search for relevant documents without generating an answer. "
+    "Retrieval only (cached embedding + hybrid vector search): no SQL agent or LLM call.",
+    responses={
+        429: {"description": "Too many concurrent search requests"},
+        503: {"description": "Vector index not available"},
+    },
 )
 async def search(
     query: str = Query(
@@ -106,11 +313,23 @@ async def search(
 
     Returns:
         List of matching documents with scores
+
+    Raises:
+        RateLimitError: If no search slot frees up within the queue timeout
     """
     logger.info("Search request: %s (k=%d)", query[:50], k)
 
-    service = get_chat_service()
-    results = service.search(query=query, k=k, min_score=min_score)
+    semaphore = _get_search_semaphore()
+    try:
+        await asyncio.wait_for(semaphore.acquire(), timeout=settings.search_queue_timeout)
+    except asyncio.TimeoutError:
+        raise RateLimitError("Too many concurrent search requests", retry_after=1) from None
+
+    try:
+        service = get_chat_service()
+        results = await service.asearch(query=query, k=k, min_score=min_score)
+    finally:
+        semaphore.release()
 
     logger.info("Found %d search results", len(results))
 
@@ -8,8 +8,9 @@ MAINTAINER: Shahu
 
 import logging
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
 
+from src.api.dependencies import get_chat_service
 from src.models.conversation import (
     ConversationCreate,
     ConversationResponse,
@@ -18,6 +19,7 @@ from src.models.conversation import (
     ConversationWithMessages,
 )
 from src.repositories.conversation import ConversationRepository
+from src.repositories.pagination import NEXT_CURSOR_HEADER, encode_cursor
 from src.services.conversation import ConversationService
 
 logger = logging.getLogger(__name__)
@@ -25,10 +27,24 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/conversations", tags=["conversations"])
 
 
+# Built on first use and reused: the repository shares the process-wide engine
+_conversation_service: ConversationService | None = None
+
+
 def get_conversation_service() -> ConversationService:
-    """Get conversation service instance."""
-    repository = ConversationRepository()
-    return ConversationService(repository=repository)
+    """Get the shared conversation service instance."""
+    global _conversation_service
+    if _conversation_service is None:
+        _conversation_service = ConversationService(repository=ConversationRepository())
+    return _conversation_service
+
+
+def _forget_history(conversation_id: str) -> None:
+    """Drop a closed conversation's turns from the chat service's history buffer."""
+    try:
+        get_chat_service().forget_conversation(conversation_id)
+    except RuntimeError:
+        pass  # Chat service not started: nothing buffered
 
 
 @router.post(
@@ -49,9 +65,11 @@ async def create_conversation(conversation: ConversationCreate) -> ConversationR
     response_model=list[ConversationResponse],
     summary="List conversations",
     description="List conversations with pagination and optional status filtering. "
-    "Returns conversations ordered by updated_at (most recent first).",
+    "Returns conversations ordered by updated_at (most recent first). "
+    f"When more may follow, the {NEXT_CURSOR_HEADER} header holds the cursor for the next page.",
 )
 async def list_conversations(
+    response: Response,
     status_filter: ConversationStatus | None = Query(
         None,
         alias="status",
@@ -66,12 +84,22 @@ async def list_conversations(
     offset: int = Query(
         0,
         ge=0,
-        description="Number of conversations to skip",
+        description="Number of conversations to skip (prefer cursor for deep pages)",
+    ),
+    cursor: str | None = Query(
+        None,
+        description=f"Opaque cursor from the previous page's {NEXT_CURSOR_HEADER} header",
     ),
 ) -> list[ConversationResponse]:
-    """List conversations with pagination."""
+    """List conversations with offset or keyset (cursor) pagination."""
     service = get_conversation_service()
-    return service.list_conversations(status=status_filter, limit=limit, offset=offset)
+    conversations = service.list_conversations(
+        status=status_filter, limit=limit, offset=offset, cursor=cursor
+    )
+    if len(conversations) == limit:
+        last = conversations[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.updated_at, last.id)
+    return conversations
 
 
 @router.get(
@@ -136,6 +164,8 @@ async def update_conversation(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Conversation {conversation_id} not found",
         )
+    if update.status in (ConversationStatus.ARCHIVED, ConversationStatus.DELETED):
+        _forget_history(conversation_id)
     return conversation
 
 
@@ -155,4 +185,5 @@ async def delete_conversation(conversation_id: str) -> ConversationResponse:
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Conversation {conversation_id} not found",
         )
+    _forget_history(conversation_id)
     return conversation
@@ -8,7 +8,7 @@ MAINTAINER: Shahu
 
 import logging
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
 from pydantic import BaseModel
 
 from src.models.feedback import (
@@ -18,6 +18,7 @@ from src.models.feedback import (
     FeedbackResponse,
     FeedbackStats,
 )
+from src.repositories.pagination import NEXT_CURSOR_HEADER, encode_cursor
 from src.services.feedback import get_feedback_service
 
 logger = logging.getLogger(__name__)
@@ -105,15 +106,24 @@ async def get_negative_feedback() -> list[ChatInteractionResponse]:
     "/interactions",
     response_model=list[ChatInteractionResponse],
     summary="Get recent interactions",
-    description="Get recent chat interactions with optional pagination.",
+    description="Get recent chat interactions (newest first) with optional pagination. "
+    f"When more may follow, the {NEXT_CURSOR_HEADER} header holds the cursor for the next page.",
 )
 async def get_interactions(
+    response: Response,
     limit: int = Query(default=50, ge=1, le=100, description="Max results"),
-    offset: int = Query(default=0, ge=0, description="Results to skip"),
+    offset: int = Query(default=0, ge=0, description="Results to skip (prefer cursor for deep pages)"),
+    cursor: str | None = Query(
+        default=None, description=f"Opaque cursor from the previous page's {NEXT_CURSOR_HEADER} header"
+    ),
 ) -> list[ChatInteractionResponse]:
     """Get recent chat interactions."""
     service = get_feedback_service()
-    return service.get_recent_interactions(limit=limit, offset=offset)
+    interactions = service.get_recent_interactions(limit=limit, offset=offset, cursor=cursor)
+    if len(interactions) == limit:
+        last = interactions[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+    return interactions
 
 
 @router.get(
@@ -8,7 +8,7 @@ MAINTAINER: Shahu
 
 import logging
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response, status as http_status
 
 from src.api.dependencies import get_chat_service
 from src.models.chat import HealthResponse
@@ -60,22 +60,48 @@ async def health_check() -> HealthResponse:
 @router.get(
     "/ready",
     summary="Readiness Check",
-    description="Check if the API is ready to serve requests.",
+    description="Check if the API is ready to serve requests: index loaded and startup warm-up "
+    "finished with the agent and SQL database working. Returns 503 until then (and when warm-up "
+    "left the worker degraded) so load balancers skip cold or broken workers.",
+    responses={503: {"description": "Not ready (index missing, warm-up running, or degraded)"}},
 )
-async def readiness_check() -> dict:
+async def readiness_check(response: Response) -> dict:
     """Check if API is ready to serve requests.
 
+    Args:
+        response: Response whose status is set to 503 when not ready
+
     Returns:
-        Simple ready status
+        Ready status, whether warm-up failed an essential step, and per-step warm-up report
     """
+    warm_up: dict[str, str] = {}
+    degraded = False
     try:
         service = get_chat_service()
-        ready = service.is_ready
+        degraded = bool(service.is_degraded)
+        ready = bool(service.is_ready and service.is_warm) and not degraded
+        warm_up = dict(service.warm_up_report)
     except Exception as e:
         logger.exception("Readiness check failed")
         ready = False
 
-    return {"ready": ready}
+    if not ready:
+        response.status_code = http_status.HTTP_503_SERVICE_UNAVAILABLE
+    return {"ready": ready, "degraded": degraded, "warm_up": warm_up}
+
+
+@router.get(
+    "/health/interactions",
+    summary="Interaction Writer Stats",
+    description="Queue depth and write counters of the background interaction writer.",
+)
+async def interaction_writer_stats() -> dict:
+    """Report the interaction write-behind queue.
+
+    Returns:
+        queue_depth, max_queue, pending, written, failed, dropped and batches
+    """
+    return get_chat_service().interaction_writer.stats()
 
 
 @router.get(
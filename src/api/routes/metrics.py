@@ -0,0 +1,42 @@
+"""
+FILE: metrics.py
+STATUS: Active
+RESPONSIBILITY: Prometheus scrape endpoint for pipeline latency, cache and queue metrics
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import logging
+
+from fastapi import APIRouter, Response
+
+from src.api.dependencies import get_chat_service
+from src.core.metrics import CONTENT_TYPE, QUEUE_DEPTH, REGISTRY
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get(
+    "/metrics",
+    response_class=Response,
+    summary="Metrics",
+    description="Counters and latency histograms of this worker in Prometheus text format: "
+    "classification path, SQL agent, embeddings, vector search, re-ranking, answer "
+    "generation, cache hits and queue depths.",
+)
+def metrics() -> Response:
+    """Render the metrics registry.
+
+    Returns:
+        Prometheus text exposition
+    """
+    # Sampled at scrape time; the writer thread updates its queue continuously
+    try:
+        writer_stats = get_chat_service().interaction_writer.stats()
+        QUEUE_DEPTH.set(writer_stats["queue_depth"], queue="interaction_writer")
+    except RuntimeError:
+        logger.debug("Chat service not initialized, interaction writer depth not sampled")
+
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,69 @@
+"""
+FILE: visualization.py
+STATUS: Active
+RESPONSIBILITY: Visualization endpoints (lazily rendered chart HTML)
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import logging
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import HTMLResponse
+
+from src.api.dependencies import get_chat_service
+from src.models.chat import VisualizationRenderRequest
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/visualizations")
+
+
+@router.get(
+    "/{figure_id}",
+    response_class=HTMLResponse,
+    summary="Get Visualization HTML",
+    description="Embeddable Plotly HTML of a chart returned by /chat (visualization.figure_id). "
+    "Rendered on first request, then cached with the figure. The cache is per worker: "
+    "with several workers, POST /visualizations with the plot_json instead.",
+    responses={404: {"description": "Figure not found (unknown or evicted from the cache)"}},
+)
+def get_visualization_html(figure_id: str) -> HTMLResponse:
+    """Render a cached figure as HTML.
+
+    Args:
+        figure_id: Figure ID from ChatResponse.visualization
+
+    Returns:
+        HTML page embedding the chart
+
+    Raises:
+        HTTPException: If the figure is not in the cache
+    """
+    html = get_chat_service().visualization_service.render_html(figure_id)
+    if html is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Visualization {figure_id} not found",
+        )
+    return HTMLResponse(html)
+
+
+@router.post(
+    "",
+    response_class=HTMLResponse,
+    summary="Render Visualization HTML",
+    description="Embeddable Plotly HTML of a figure spec (visualization.plot_json from /chat). "
+    "Stateless, so it works on any worker.",
+    responses={422: {"description": "Invalid figure spec"}},
+)
+def render_visualization_html(request: VisualizationRenderRequest) -> HTMLResponse:
+    """Render a figure spec as HTML.
+
+    Args:
+        request: Figure spec from ChatResponse.visualization.plot_json
+
+    Returns:
+        HTML page embedding the chart
+    """
+    return HTMLResponse(get_chat_service().visualization_service.render_spec_html(request.plot_json))
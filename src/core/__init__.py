@@ -1,19 +1,19 @@
-"""Core module containing configuration, security, and exceptions."""
+"""Core module containing configuration, security, and exceptions.
 
-from src.core.config import settings
-from src.core.exceptions import (
-    AppException,
-    ConfigurationError,
-    EmbeddingError,
-    SearchError,
-    ValidationError,
-)
+Exports are resolved on first access, so importing a core helper (e.g.
+src.core.lazy) doesn't load the settings.
+"""
 
-__all__ = [
-    "settings",
-    "AppException",
-    "ConfigurationError",
-    "EmbeddingError",
-    "SearchError",
-    "ValidationError",
-]
+from src.core.lazy import lazy_exports
+
+_EXPORTS = {
+    "settings": "src.core.config",
+    "AppException": "src.core.exceptions",
+    "ConfigurationError": "src.core.exceptions",
+    "EmbeddingError": "src.core.exceptions",
+    "SearchError": "src.core.exceptions",
+    "ValidationError": "src.core.exceptions",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
@@ -75,6 +75,11 @@ class Settings(BaseSettings):
         le=100,
         description="Batch size for embedding API calls",
     )
+    embedding_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Query embeddings kept in the in-process LRU cache (0 disables)",
+    )
 
     # Search Configuration
     search_k: int = Field(
@@ -89,6 +94,40 @@ class Settings(BaseSettings):
         le=1.0,
         description="Minimum similarity score (0-1) for results",
     )
+    search_max_concurrency: int = Field(
+        default=32,
+        ge=1,
+        description="Concurrent retrieval-only /search requests",
+    )
+    search_queue_timeout: float = Field(
+        default=2.0,
+        ge=0.0,
+        description="Seconds a /search request waits for a slot before 429",
+    )
+    chat_max_concurrency: int = Field(
+        default=16,
+        ge=1,
+        description="Concurrent /chat agent pipelines",
+    )
+    chat_max_queue: int = Field(
+        default=64,
+        ge=0,
+        description="/chat requests allowed to wait for a slot before 429",
+    )
+    chat_retry_after: int = Field(
+        default=5,
+        ge=1,
+        description="Retry-After seconds sent when the /chat queue is full",
+    )
+    chat_single_flight: bool = Field(
+        default=True,
+        description="Identical concurrent /chat requests share one agent run",
+    )
+    chat_batch_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Requests of one /chat/batch call running at once",
+    )
 
     # Paths (relative to project root, consolidated under data/)
     input_dir: str = Field(default="data/inputs")
@@ -99,15 +138,50 @@ class Settings(BaseSettings):
     app_title: str = Field(default="NBA Analyst AI")
     app_name: str = Field(default="NBA", alias="NAME")
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(default="INFO")
+    log_queue_size: int = Field(
+        default=10000,
+        ge=1,
+        description="Log records buffered for the background log writer; beyond that records are dropped",
+    )
+    log_debug_sampling: dict[str, float] = Field(
+        default={},
+        description='Fraction of DEBUG records kept per logger prefix, e.g. {"src.agents": 0.1}',
+    )
 
     # API Configuration
     api_host: str = Field(default="0.0.0.0")
     api_port: int = Field(default=8000, ge=1, le=65535)
     api_cors_origins: list[str] = Field(default=["*"])
+    api_compression_min_size: int = Field(
+        default=1000,
+        ge=0,
+        description="Compress (brotli if installed, else gzip) responses at least this many bytes",
+    )
 
-    # Rate Limiting
+    # Rate Limiting (per-client token buckets, keyed by a known X-API-Key or IP)
+    rate_limit_enabled: bool = Field(default=True, description="Enforce per-client rate limits")
     rate_limit_requests: int = Field(default=100, ge=1)
     rate_limit_window: int = Field(default=60, ge=1, description="Window in seconds")
+    rate_limit_routes: dict[str, int] = Field(
+        default={"/api/v1/chat": 20, "/api/v1/chat/batch": 5, "/api/v1/search": 300, "/health": 600},
+        description="Path prefix -> requests per window (overrides rate_limit_requests)",
+    )
+    rate_limit_exempt_paths: list[str] = Field(
+        default=["/ready", "/live", "/metrics"],
+        description="Path prefixes never rate limited (load balancer probes, Prometheus scrapes)",
+    )
+    rate_limit_trusted_proxies: list[str] = Field(
+        default=["127.0.0.1", "::1"],
+        description="Peer IPs/CIDRs whose X-Client-Id / X-Forwarded-For name the real client (UI, reverse proxy)",
+    )
+    rate_limit_api_keys: list[str] = Field(
+        default=[],
+        description="X-API-Key values that get their own bucket (others are keyed by IP)",
+    )
+    rate_limit_backend: Literal["memory", "sqlite"] = Field(
+        default="memory",
+        description="Bucket store: in-process, or a SQLite file shared by all workers",
+    )
 
     # Security
     max_query_length: int = Field(
@@ -117,6 +191,106 @@ class Settings(BaseSettings):
         description="Maximum allowed query length",
     )
 
+    # NBA stats database (read-only connection tuning)
+    sqlite_mmap_size: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        description="Bytes of nba_stats.db to memory-map (PRAGMA mmap_size)",
+    )
+    sqlite_cache_size_kb: int = Field(
+        default=64 * 1024,
+        ge=0,
+        description="Page cache per connection in KiB (PRAGMA cache_size)",
+    )
+    sqlite_cached_statements: int = Field(
+        default=256,
+        ge=0,
+        description="Prepared statements cached per connection",
+    )
+
+    # SQL execution budget (per generated query)
+    sql_max_query_seconds: float = Field(
+        default=2.0,
+        gt=0.0,
+        le=60.0,
+        description="Abort a generated SQL query after this many seconds",
+    )
+    sql_max_vm_steps: int = Field(
+        default=50_000_000,
+        ge=0,
+        description="Abort a generated SQL query after this many SQLite VM steps (0 = no limit)",
+    )
+    sql_max_rows: int = Field(
+        default=1000,
+        ge=1,
+        description="Reject generated SQL returning more rows than this",
+    )
+
+    # SQL Memo (question→SQL cache)
+    sql_memo_enabled: bool = Field(
+        default=True,
+        description="Reuse memoized SQL for near-duplicate questions (skips SQL generation)",
+    )
+    sql_memo_threshold: float = Field(
+        default=0.95,
+        ge=0.5,
+        le=1.0,
+        description="Minimum cosine similarity between questions for a memo hit",
+    )
+
+    # Interactions database (conversations, interactions, feedback)
+    database_pool_size: int = Field(
+        default=5,
+        ge=1,
+        description="Pooled connections to the interactions database",
+    )
+    database_max_overflow: int = Field(
+        default=10,
+        ge=0,
+        description="Extra connections allowed beyond the pool under load",
+    )
+    database_busy_timeout_ms: int = Field(
+        default=5000,
+        ge=0,
+        description="Milliseconds a connection waits on a locked database (PRAGMA busy_timeout)",
+    )
+
+    # Interaction persistence (single background writer, batched inserts)
+    interaction_batch_size: int = Field(
+        default=50,
+        ge=1,
+        description="Interactions inserted per transaction",
+    )
+    interaction_flush_interval: float = Field(
+        default=0.5,
+        gt=0.0,
+        description="Seconds a partial batch waits for more interactions before it is written",
+    )
+    interaction_queue_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Interactions waiting to be written before new ones are dropped",
+    )
+
+    # Startup
+    warm_up_enabled: bool = Field(
+        default=True,
+        description="Build the agent and exercise each pipeline stage at startup; /ready is false until done",
+    )
+
+    # Vector store
+    vector_store_mmap: bool = Field(
+        default=True,
+        description="Memory-map the FAISS index and chunk columns so API workers share one copy",
+    )
+
+    # Visualizations
+    visualization_cache_size: int = Field(
+        default=256,
+        ge=1,
+        description="Generated figures kept in memory (chart reuse and /visualizations/{id} HTML)",
+    )
+
     # Observability
     logfire_token: str | None = Field(default=None, description="Logfire API token (requires project:write scope)")
     logfire_enabled: bool = Field(default=True, description="Enable Logfire tracing (auto-disabled if token missing)")
@@ -145,6 +319,32 @@ class Settings(BaseSettings):
         """Path to SQLite database."""
         return Path(self.database_dir) / "interactions.db"
 
+    @property
+    def rate_limit_db_path(self) -> Path:
+        """Path to shared rate limit buckets (rate_limit_backend=sqlite)."""
+        return Path(self.database_dir) / "rate_limits.db"
+
+    @property
+    def chat_batch_max_requests(self) -> int:
+        """Largest /chat/batch: each request costs one /chat token, so at most the /chat bucket size."""
+        schema_max = 200  # ChatBatchRequest.requests max_length
+        if not self.rate_limit_enabled:
+            return schema_max
+        path = "/api/v1/chat"
+        prefixes = [prefix for prefix in self.rate_limit_routes if path.startswith(prefix)]
+        bucket = self.rate_limit_routes[max(prefixes, key=len)] if prefixes else self.rate_limit_requests
+        return min(schema_max, bucket)
+
+    @property
+    def sql_memo_index_path(self) -> Path:
+        """Path to FAISS index of memoized questions."""
+        return Path(self.database_dir) / "sql_memo.idx"
+
+    @property
+    def sql_memo_pairs_path(self) -> Path:
+        """Path to memoized question→SQL pairs (JSON)."""
+        return Path(self.database_dir) / "sql_memo.json"
+
 
 @lru_cache
 def get_settings() -> Settings:
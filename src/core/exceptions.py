@@ -94,6 +94,19 @@ class RateLimitError(AppException):
         self.retry_after = retry_after
 
 
+class QueryBudgetExceededError(AppException):
+    """Raised when a generated SQL query exceeds its time, VM-step or row budget."""
+
+    def __init__(self, message: str, budget: str, limit: float | int):
+        super().__init__(
+            message,
+            code="QUERY_BUDGET_EXCEEDED",
+            details={"budget": budget, "limit": limit},
+        )
+        self.budget = budget
+        self.limit = limit
+
+
 class IndexNotFoundError(AppException):
     """Raised when vector index is not found or not loaded."""
 
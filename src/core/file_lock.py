@@ -0,0 +1,39 @@
+"""
+FILE: file_lock.py
+STATUS: Active
+RESPONSIBILITY: Exclusive lock file shared by the API worker processes
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+# Optional: cross-process file lock (POSIX only; elsewhere callers are only
+# serialized within the process)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``path`` (shared by every worker process).
+
+    flock locks belong to the open file, so don't nest two file_lock() calls
+    on the same path: the inner one waits for the outer forever.
+
+    Args:
+        path: Lock file (created if missing)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
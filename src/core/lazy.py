@@ -0,0 +1,45 @@
+"""
+FILE: lazy.py
+STATUS: Active
+RESPONSIBILITY: Lazily resolved package exports (module-level __getattr__)
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import sys
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> Callable[[str], Any]:
+    """Build a package ``__getattr__`` that imports each export on first access.
+
+    Importing the package then costs nothing; ``from package import Name``
+    imports only the module defining Name. Resolved names are stored in the
+    package namespace, so later lookups skip ``__getattr__``.
+
+    Usage in ``__init__.py``::
+
+        _EXPORTS = {"ChatService": "src.services.chat"}
+        __all__ = list(_EXPORTS)
+        __getattr__ = lazy_exports(__name__, _EXPORTS)
+
+    Args:
+        package: The package's ``__name__``
+        exports: Exported name -> module defining it
+
+    Returns:
+        Module-level ``__getattr__`` for the package
+    """
+    namespace = vars(sys.modules[package])
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module), name)
+        namespace[name] = value
+        return value
+
+    return __getattr__
@@ -1,20 +1,36 @@
 """
 FILE: logging_config.py
 STATUS: Active
-RESPONSIBILITY: Local structured logging with rotation and JSON formatting
-LAST MAJOR UPDATE: 2026-02-16
+RESPONSIBILITY: Local structured logging with rotation and JSON formatting (written off the request thread)
+LAST MAJOR UPDATE: 2026-10-18
 MAINTAINER: Shahu
 """
 
+import atexit
 import json
 import logging
 import logging.handlers
+import os
+import queue
+import random
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from src.core.config import settings
+from src.core.metrics import Counter
+
+LOG_RECORDS_DROPPED = Counter(
+    "nba_log_records_dropped_total",
+    "Log records dropped because the background log writer fell behind",
+)
+
+# Record args safe to format later on the writer thread (can't change meanwhile)
+_IMMUTABLE_ARGS = (str, int, float, bool, type(None))
+
+# Background writer started by configure_local_logging
+_listener: logging.handlers.QueueListener | None = None
 
 
 class StructuredFormatter(logging.Formatter):
@@ -99,6 +115,83 @@ class ColoredConsoleFormatter(logging.Formatter):
         return formatted
 
 
+class DebugSampler(logging.Filter):
+    """Keep only a fraction of DEBUG records, per logger prefix.
+
+    The longest matching prefix wins; loggers matching none keep every
+    record. Records at INFO and above always pass.
+    """
+
+    def __init__(self, rates: dict[str, float]):
+        """Initialize sampler.
+
+        Args:
+            rates: Logger name prefix -> fraction of DEBUG records kept (0-1)
+        """
+        super().__init__()
+        self._rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or not self._rates:
+            return True
+        for prefix, rate in self._rates:
+            if record.name == prefix or record.name.startswith(prefix + "."):
+                return random.random() < rate
+        return True
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for the request path: enqueue and return.
+
+    Unlike the stdlib QueueHandler, the message is not formatted here when
+    its args are immutable (the writer thread calls getMessage), and a full
+    queue drops the record (counted in nba_log_records_dropped_total)
+    instead of raising.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Snapshot only what could change before the writer formats the record."""
+        args = record.args
+        if args and not (
+            isinstance(args, tuple) and all(isinstance(arg, _IMMUTABLE_ARGS) for arg in args)
+        ):
+            # Mutable args (dicts, lists, objects) are rendered now
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc()
+
+
+class DrainingQueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() waits for room for its stop marker.
+
+    The stdlib version enqueues the marker with put_nowait, which raises
+    queue.Full at exit when the bounded queue is full. Blocking is safe: the
+    writer thread keeps draining until it reaches the marker.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+def stop_local_logging() -> None:
+    """Write the records still queued and stop the background log writer."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_local_logging)
+
+
 def configure_local_logging(
     log_dir: str | Path = "logs",
     max_bytes: int = 10 * 1024 * 1024,  # 10MB per file
@@ -109,14 +202,22 @@ def configure_local_logging(
     Creates separate log files for different components:
     - app.log: All application logs (JSON format)
     - api.log: API-specific logs (JSON format)
+    - agent.log: Agent reasoning traces (JSON format)
     - errors.log: Error and critical logs only (JSON format)
     - console: Human-readable colored output
 
+    Loggers only get a NonBlockingQueueHandler on the root: formatting and
+    file I/O happen on one QueueListener thread, off the request path.
+    DEBUG records are sampled per settings.log_debug_sampling before they
+    are queued.
+
     Args:
         log_dir: Directory to store log files
         max_bytes: Maximum size per log file before rotation
         backup_count: Number of backup files to keep
     """
+    global _listener
+
     # Create logs directory
     log_dir = Path(log_dir)
     log_dir.mkdir(exist_ok=True, parents=True)
@@ -125,7 +226,8 @@ def configure_local_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, settings.log_level))
 
-    # Clear existing handlers
+    # Clear existing handlers (and the writer of a previous configuration)
+    stop_local_logging()
     root_logger.handlers.clear()
 
     # 1. CONSOLE HANDLER - Colored human-readable output
@@ -136,7 +238,6 @@ def configure_local_logging(
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
 
     # 2. MAIN APP LOG - All logs in JSON format
     app_handler = logging.handlers.RotatingFileHandler(
@@ -147,7 +248,6 @@ def configure_local_logging(
     )
     app_handler.setLevel(logging.DEBUG)
     app_handler.setFormatter(StructuredFormatter())
-    root_logger.addHandler(app_handler)
 
     # 3. ERROR LOG - Errors and critical only
     error_handler = logging.handlers.RotatingFileHandler(
@@ -158,10 +258,8 @@ def configure_local_logging(
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(StructuredFormatter())
-    root_logger.addHandler(error_handler)
 
     # 4. API LOG - API-specific logs
-    api_logger = logging.getLogger("src.api")
     api_handler = logging.handlers.RotatingFileHandler(
         log_dir / "api.log",
         maxBytes=max_bytes,
@@ -170,10 +268,9 @@ def configure_local_logging(
     )
     api_handler.setLevel(logging.DEBUG)
     api_handler.setFormatter(StructuredFormatter())
-    api_logger.addHandler(api_handler)
+    api_handler.addFilter(logging.Filter("src.api"))
 
     # 5. AGENT LOG - ReAct agent reasoning traces
-    agent_logger = logging.getLogger("src.agents")
     agent_handler = logging.handlers.RotatingFileHandler(
         log_dir / "agent.log",
         maxBytes=max_bytes,
@@ -182,12 +279,80 @@ def configure_local_logging(
     )
     agent_handler.setLevel(logging.DEBUG)
     agent_handler.setFormatter(StructuredFormatter())
-    agent_logger.addHandler(agent_handler)
+    agent_handler.addFilter(logging.Filter("src.agents"))
+
+    # Request threads only enqueue; the listener thread formats and writes
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.log_queue_size)
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(DebugSampler(settings.log_debug_sampling))
+    root_logger.addHandler(queue_handler)
+
+    _listener = DrainingQueueListener(
+        log_queue,
+        console_handler,
+        app_handler,
+        error_handler,
+        api_handler,
+        agent_handler,
+        respect_handler_level=True,
+    )
+    _listener.start()
 
     logging.info("✓ Local structured logging configured successfully")
     logging.info(f"✓ Log files: {log_dir.absolute()}")
 
 
+def tail_lines(log_file: str | Path, lines: int, block_size: int = 64 * 1024) -> list[str]:
+    """Read the last lines of a file by seeking backwards from the end.
+
+    Only the blocks holding those lines are read, however large the file is.
+
+    Args:
+        log_file: Path to the file
+        lines: Number of lines wanted
+        block_size: Bytes read per backwards step
+
+    Returns:
+        Up to ``lines`` lines, oldest first (without line endings)
+    """
+    if lines <= 0:
+        return []
+
+    with open(log_file, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        data = b""
+        # One newline more than needed guarantees the first kept line is whole
+        while position > 0 and data.count(b"\n") <= lines:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+
+    return [line.decode("utf-8", errors="replace") for line in data.splitlines()[-lines:]]
+
+
+def _parse_log_lines(
+    lines: list[str], level: str | None = None, search: str | None = None
+) -> list[dict[str, Any]]:
+    """Parse JSON log lines, keeping those matching the level/text filters."""
+    logs = []
+    for line in lines:
+        try:
+            log_entry = json.loads(line.strip())
+        except json.JSONDecodeError:
+            # Skip malformed JSON lines (and a line still being written)
+            continue
+
+        # Apply filters
+        if level and log_entry.get("level") != level:
+            continue
+        if search and search.lower() not in log_entry.get("message", "").lower():
+            continue
+
+        logs.append(log_entry)
+    return logs
+
+
 def get_recent_logs(
     log_file: str | Path = "logs/app.log",
     lines: int = 100,
@@ -210,32 +375,62 @@ def get_recent_logs(
         return []
 
     try:
-        with open(log_file, "r", encoding="utf-8") as f:
-            # Read last N lines efficiently
-            all_lines = f.readlines()
-            recent_lines = all_lines[-lines:]
+        return _parse_log_lines(tail_lines(log_file, lines), level=level, search=search)
+    except Exception as e:
+        logging.error(f"Failed to read logs: {e}")
+        return []
 
-        logs = []
-        for line in recent_lines:
-            try:
-                log_entry = json.loads(line.strip())
 
-                # Apply filters
-                if level and log_entry.get("level") != level:
-                    continue
-                if search and search.lower() not in log_entry.get("message", "").lower():
-                    continue
+class LogFollower:
+    """Follow a log file: each read() returns only the entries appended since the last one.
 
-                logs.append(log_entry)
-            except json.JSONDecodeError:
-                # Skip malformed JSON lines
-                continue
+    Remembers the file's inode and byte offset, so a refresh reads just the
+    new bytes. When the file is rotated (new inode) or truncated, following
+    restarts at the beginning of the new file.
+    """
 
-        return logs
+    def __init__(self, log_file: str | Path, initial_lines: int = 100):
+        """Initialize follower.
 
-    except Exception as e:
-        logging.error(f"Failed to read logs: {e}")
-        return []
+        Args:
+            log_file: Path to the log file
+            initial_lines: Lines returned by the first read (tail of the file)
+        """
+        self._path = Path(log_file)
+        self._initial_lines = initial_lines
+        self._inode: int | None = None
+        self._offset = 0
+        self._partial = b""
+
+    def read(self) -> list[dict[str, Any]]:
+        """Entries written since the previous call (the file's tail on the first call).
+
+        Returns:
+            New log entries, oldest first
+        """
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            return []
+
+        if self._inode is None:
+            self._inode, self._offset = stat.st_ino, stat.st_size
+            return _parse_log_lines(tail_lines(self._path, self._initial_lines))
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            # Rotated or truncated
+            self._inode, self._offset, self._partial = stat.st_ino, 0, b""
+        if stat.st_size == self._offset:
+            return []
+
+        with open(self._path, "rb") as f:
+            f.seek(self._offset)
+            data = self._partial + f.read()
+            self._offset = f.tell()
+
+        # Keep an unterminated last line for the next read
+        complete, _, self._partial = data.rpartition(b"\n")
+        return _parse_log_lines(complete.decode("utf-8", errors="replace").splitlines())
 
 
 def log_query_event(
@@ -0,0 +1,315 @@
+"""
+FILE: metrics.py
+STATUS: Active
+RESPONSIBILITY: In-process counters, gauges and histograms exposed in Prometheus text format
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+
+# Prometheus text exposition format served by GET /metrics
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds, from a cache hit to a slow LLM call
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class MetricsRegistry:
+    """Set of metrics rendered together.
+
+    Values live in this process: with several API workers each one serves
+    its own /metrics, and Prometheus sums them per instance.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, "_Metric"] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: "_Metric") -> None:
+        """Add a metric.
+
+        Raises:
+            ValueError: If a metric with the same name is registered
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> "_Metric | None":
+        """Registered metric by name."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """All metrics in Prometheus text format."""
+        lines: list[str] = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Zero every metric (used in tests)."""
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+
+REGISTRY = MetricsRegistry()
+
+
+class _Metric(ABC):
+    """Base class: a named metric with a fixed set of label names."""
+
+    type_name = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: MetricsRegistry | None = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        (registry or REGISTRY).register(self)
+
+    def _key(self, labels: dict[str, object]) -> tuple[str, ...]:
+        """Label values in labelnames order.
+
+        Raises:
+            ValueError: If the labels don't match labelnames
+        """
+        if len(labels) != len(self.labelnames) or set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple[str, ...]) -> list[tuple[str, str]]:
+        return list(zip(self.labelnames, key))
+
+    @abstractmethod
+    def samples(self) -> Iterator[tuple[str, list[tuple[str, str]], float]]:
+        """(name suffix, labels, value) for each exposed sample."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Drop every recorded value."""
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        """Increase the count.
+
+        Raises:
+            ValueError: If amount is negative
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        """Current count for a label set (0 if never incremented)."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[tuple[str, list[tuple[str, str]], float]]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield "", self._labels(key), value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(_Metric):
+    """Value that goes up and down (set at the time it is observed)."""
+
+    type_name = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: object) -> None:
+        """Set the current value."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def value(self, **labels: object) -> float:
+        """Current value for a label set (0 if never set)."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[tuple[str, list[tuple[str, str]], float]]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield "", self._labels(key), value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets, plus their sum and count."""
+
+    type_name = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts..., +Inf count], sum
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        """Record one observation."""
+        key = self._key(labels)
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    @contextmanager
+    def time(self, **labels: object) -> Iterator[None]:
+        """Observe the duration of the block in seconds (also when it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: object) -> int:
+        """Observations recorded for a label set."""
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def sum(self, **labels: object) -> float:
+        """Sum of the observations for a label set."""
+        return self._sums.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[tuple[str, list[tuple[str, str]], float]]:
+        with self._lock:
+            series = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+        for key, counts, total in series:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                yield "_bucket", [*labels, ("le", _format_value(bound))], cumulative
+            yield "_sum", labels, total
+            yield "_count", labels, cumulative
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._sums.clear()
+
+
+def _format_value(value: float) -> str:
+    """Sample value as Prometheus expects it."""
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return f"{value:.1f}"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value (backslash, double quote, newline)."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: list[tuple[str, str]]) -> str:
+    """{name="value",...}, or "" without labels."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+# ----------------------------------------------------------------------------
+# Application metrics
+# ----------------------------------------------------------------------------
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "nba_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+AGENT_RUN_SECONDS = Histogram(
+    "nba_agent_run_duration_seconds",
+    "End-to-end ReActAgent run latency",
+    ("query_type",),
+)
+CLASSIFICATIONS = Counter(
+    "nba_query_classifications_total",
+    "Query classifications by path (heuristic or LLM fallback)",
+    ("path", "query_type"),
+)
+TOOL_SECONDS = Histogram(
+    "nba_agent_tool_duration_seconds",
+    "Agent tool execution latency",
+    ("tool", "outcome"),
+)
+RERANKS = Counter(
+    "nba_rerank_invocations_total",
+    "LLM re-ranking calls (outcome=failed kept the original order)",
+    ("outcome",),
+)
+ANSWER_SECONDS = Histogram(
+    "nba_answer_generation_duration_seconds",
+    "Final answer LLM call latency",
+)
+SQL_QUERY_SECONDS = Histogram(
+    "nba_sql_query_duration_seconds",
+    "NBAGSQLTool.query latency (source=memo skipped the SQL agent)",
+    ("source", "outcome"),
+)
+SQL_AGENT_STEPS = Histogram(
+    "nba_sql_agent_steps",
+    "Intermediate steps taken by the SQL agent per question",
+    buckets=(1, 2, 3, 4, 5, 6, 8, 10, 15, 20),
+)
+EMBEDDING_SECONDS = Histogram(
+    "nba_embedding_duration_seconds",
+    "Embedding API latency (cache hits excluded)",
+    ("operation",),
+)
+VECTOR_SEARCH_SECONDS = Histogram(
+    "nba_vector_search_duration_seconds",
+    "VectorStoreRepository.search latency (FAISS search and scoring)",
+    ("filtered",),
+)
+CACHE_REQUESTS = Counter(
+    "nba_cache_requests_total",
+    "Cache lookups by cache and result (hit or miss)",
+    ("cache", "result"),
+)
+QUEUE_DEPTH = Gauge(
+    "nba_queue_depth",
+    "Items waiting in a queue (chat admission, interaction writer)",
+    ("queue",),
+)
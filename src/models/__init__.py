@@ -1,6 +1,8 @@
 """Pydantic models for request/response validation."""
 
 from src.models.chat import (
+    ChatBatchItem,
+    ChatBatchRequest,
     ChatMessage,
     ChatRequest,
     ChatResponse,
@@ -29,6 +31,8 @@ from src.models.feedback import (
 )
 
 __all__ = [
+    "ChatBatchItem",
+    "ChatBatchRequest",
     "ChatMessage",
     "ChatRequest",
     "ChatResponse",
@@ -70,6 +70,8 @@ class ChatRequest(BaseModel):
         include_sources: Whether to include source references
         conversation_id: Optional conversation ID for context
         turn_number: Turn number in conversation
+        fields: Optional projection of ChatResponse fields to return
+        include_visualization_html: Whether to include visualization.plot_html
     """
 
     query: str = Field(
@@ -103,6 +105,15 @@ class ChatRequest(BaseModel):
         ge=1,
         description="Turn number in conversation",
     )
+    fields: list[str] | None = Field(
+        default=None,
+        description="Return only these ChatResponse fields (default: all)",
+        examples=[["answer", "conversation_id"]],
+    )
+    include_visualization_html: bool = Field(
+        default=False,
+        description="Include visualization.plot_html (plot_json always carries the figure)",
+    )
 
     @field_validator("query")
     @classmethod
@@ -113,6 +124,17 @@ class ChatRequest(BaseModel):
             raise ValueError("Query cannot be empty")
         return v
 
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, v: list[str] | None) -> list[str] | None:
+        """Reject projections naming fields ChatResponse doesn't have."""
+        if v is None:
+            return v
+        unknown = sorted(set(v) - set(ChatResponse.model_fields))
+        if unknown:
+            raise ValueError(f"Unknown response fields: {', '.join(unknown)}")
+        return v
+
 
 class Visualization(BaseModel):
     """Visualization data for statistical queries.
@@ -120,14 +142,26 @@ class Visualization(BaseModel):
     Attributes:
         pattern: Detected visualization pattern (top_n, comparison, etc.)
         viz_type: Type of visualization (horizontal_bar, radar, scatter, etc.)
-        plot_json: Plotly figure as JSON string (for programmatic use)
-        plot_html: Plotly figure as HTML (for direct embedding)
+        plot_json: Compact Plotly figure spec (template referenced by name)
+        figure_id: Cached figure ID (HTML at GET /visualizations/{figure_id})
+        plot_html: Plotly figure as HTML (only with include_visualization_html)
     """
 
     pattern: str = Field(description="Detected query pattern")
     viz_type: str = Field(description="Type of visualization")
-    plot_json: str = Field(description="Plotly figure as JSON")
-    plot_html: str = Field(description="Plotly figure as HTML")
+    plot_json: str = Field(description="Compact Plotly figure spec (loads with plotly.io.from_json)")
+    figure_id: str | None = Field(default=None, description="Cached figure ID for GET /visualizations/{figure_id}")
+    plot_html: str | None = Field(default=None, description="Plotly figure as HTML (rendered on demand)")
+
+
+class VisualizationRenderRequest(BaseModel):
+    """Figure spec to render as HTML (works on any API worker).
+
+    Attributes:
+        plot_json: Compact Plotly figure spec, as returned in Visualization.plot_json
+    """
+
+    plot_json: str = Field(min_length=2, description="Compact Plotly figure spec (Visualization.plot_json)")
 
 
 class ChatResponse(BaseModel):
@@ -211,6 +245,47 @@ class ChatResponse(BaseModel):
     }}}
 
 
+class ChatBatchRequest(BaseModel):
+    """Request to the batch chat endpoint.
+
+    Requests sharing a conversation_id form a thread and run in the order
+    given; everything else runs concurrently.
+
+    Attributes:
+        requests: Chat requests to run
+        max_concurrency: Optional server-side parallelism (capped by settings)
+    """
+
+    requests: list[ChatRequest] = Field(
+        min_length=1,
+        max_length=200,
+        description="Chat requests to run (threads run in order); the server caps the count at "
+        "its /chat rate limit bucket size (20 by default)",
+    )
+    max_concurrency: int | None = Field(
+        default=None,
+        ge=1,
+        description="Concurrent requests (capped by the server setting)",
+    )
+
+
+class ChatBatchItem(BaseModel):
+    """One NDJSON line of a batch chat response.
+
+    Attributes:
+        index: Position of the request in the batch
+        response: Chat response (on success)
+        error: Error code and message (on failure)
+    """
+
+    index: int = Field(ge=0, description="Position of the request in the batch")
+    response: dict[str, Any] | None = Field(
+        default=None,
+        description="ChatResponse on success, shaped by the request's include_sources/fields",
+    )
+    error: dict[str, Any] | None = Field(default=None, description="Error code/message on failure")
+
+
 class HealthResponse(BaseModel):
     """Health check response.
 
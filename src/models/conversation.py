@@ -11,7 +11,7 @@ from enum import Enum
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
-from sqlalchemy import Column, DateTime, Enum as SQLEnum, String
+from sqlalchemy import Column, DateTime, Enum as SQLEnum, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from src.models.feedback import Base, ChatInteractionResponse
@@ -36,10 +36,18 @@ class ConversationDB(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     status = Column(SQLEnum(ConversationStatus), default=ConversationStatus.ACTIVE, nullable=False, index=True)
+    # Maintained by triggers on chat_interactions (see src/repositories/database.py)
+    message_count = Column(Integer, default=0, server_default="0", nullable=False)
 
     # Relationship to messages
     messages = relationship("ChatInteractionDB", back_populates="conversation", cascade="all, delete-orphan", order_by="ChatInteractionDB.turn_number")
 
+    # Listing: filter by status, newest first (id breaks ties for keyset cursors)
+    __table_args__ = (
+        Index("ix_conversations_status_updated_at", "status", "updated_at", "id"),
+        Index("ix_conversations_updated_at", "updated_at", "id"),
+    )
+
 
 # Pydantic Models for API
 class ConversationCreate(BaseModel):
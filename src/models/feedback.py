@@ -12,7 +12,7 @@ from typing import Optional
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
-from sqlalchemy import Column, DateTime, Enum as SQLEnum, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, Enum as SQLEnum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import DeclarativeBase, relationship
 
 
@@ -50,6 +50,12 @@ class ChatInteractionDB(Base):
     feedback = relationship("FeedbackDB", back_populates="interaction", uselist=False)
     conversation = relationship("ConversationDB", back_populates="messages")
 
+    # Recent-turn lookups for conversation context; newest-first keyset pages
+    __table_args__ = (
+        Index("ix_chat_interactions_conversation_turn", "conversation_id", "turn_number"),
+        Index("ix_chat_interactions_created_at", "created_at", "id"),
+    )
+
 
 class FeedbackDB(Base):
     """SQLAlchemy model for feedback."""
@@ -57,8 +63,8 @@ class FeedbackDB(Base):
     __tablename__ = "feedback"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    interaction_id = Column(String(36), ForeignKey("chat_interactions.id"), nullable=False)
-    rating = Column(SQLEnum(FeedbackRating), nullable=False)
+    interaction_id = Column(String(36), ForeignKey("chat_interactions.id"), nullable=False, index=True)
+    rating = Column(SQLEnum(FeedbackRating), nullable=False, index=True)
     comment = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
@@ -66,6 +72,24 @@ class FeedbackDB(Base):
     interaction = relationship("ChatInteractionDB", back_populates="feedback")
 
 
+class FeedbackStatsDB(Base):
+    """Single-row running totals behind /feedback/stats.
+
+    Kept current by triggers on chat_interactions and feedback (see
+    src/repositories/database.py); FeedbackRepository.reconcile_stats()
+    recomputes it from the tables.
+    """
+
+    __tablename__ = "feedback_stats"
+
+    id = Column(Integer, primary_key=True, default=1)
+    total_interactions = Column(Integer, default=0, nullable=False)
+    total_feedback = Column(Integer, default=0, nullable=False)
+    positive_count = Column(Integer, default=0, nullable=False)
+    negative_count = Column(Integer, default=0, nullable=False)
+    reconciled_at = Column(DateTime, nullable=True)
+
+
 # Pydantic Models for API
 class ChatInteractionCreate(BaseModel):
     """Schema for creating a chat interaction."""
@@ -1,5 +1,10 @@
-"""Pipeline package for validated data preparation."""
+"""Pipeline package for validated data preparation (exports resolved on first access)."""
 
-from src.pipeline.data_pipeline import DataPipeline
+from src.core.lazy import lazy_exports
 
-__all__ = ["DataPipeline"]
+_EXPORTS = {
+    "DataPipeline": "src.pipeline.data_pipeline",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
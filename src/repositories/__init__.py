@@ -1,14 +1,21 @@
 """
 FILE: __init__.py
 STATUS: Active
-RESPONSIBILITY: Repository layer package initialization
-LAST MAJOR UPDATE: 2026-02-09
+RESPONSIBILITY: Repository layer package initialization (exports resolved on first access)
+LAST MAJOR UPDATE: 2026-10-18
 MAINTAINER: Shahu
 """
 
-from src.repositories.conversation import ConversationRepository
-from src.repositories.feedback import FeedbackRepository
-from src.repositories.nba_database import NBADatabase
-from src.repositories.vector_store import VectorStoreRepository
+from src.core.lazy import lazy_exports
 
-__all__ = ["ConversationRepository", "FeedbackRepository", "NBADatabase", "VectorStoreRepository"]
+_EXPORTS = {
+    "ChunkStore": "src.repositories.chunk_store",
+    "ConversationRepository": "src.repositories.conversation",
+    "FeedbackRepository": "src.repositories.feedback",
+    "LogSearchIndex": "src.repositories.log_index",
+    "NBADatabase": "src.repositories.nba_database",
+    "VectorStoreRepository": "src.repositories.vector_store",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
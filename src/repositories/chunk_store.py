@@ -0,0 +1,171 @@
+"""
+FILE: chunk_store.py
+STATUS: Active
+RESPONSIBILITY: Memory-mapped columnar storage for document chunks (shared across worker processes)
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import errno
+import json
+import logging
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import overload
+
+import numpy as np
+
+from src.core.file_lock import file_lock
+from src.models.document import DocumentChunk
+
+logger = logging.getLogger(__name__)
+
+# Each column is a UTF-8 blob plus an int64 offsets array (row i = blob[off[i]:off[i+1]])
+COLUMNS = ("id", "text", "metadata")
+MANIFEST_FILE = "manifest.json"
+FORMAT_VERSION = 1
+
+
+class ChunkStore(Sequence[DocumentChunk]):
+    """Read-only, memory-mapped view of document chunks.
+
+    The columns are numpy arrays opened with ``mmap_mode="r"``: pages come
+    from the OS page cache, so every worker process serving the same files
+    shares one physical copy, and nothing is deserialized until a row is
+    read. Rows are decoded into DocumentChunk on access.
+    """
+
+    def __init__(self, directory: Path):
+        """Open a store written by ChunkStore.write.
+
+        Args:
+            directory: Store directory
+
+        Raises:
+            FileNotFoundError: If a column file is missing
+        """
+        self._directory = directory
+        self._blobs = {c: np.load(directory / f"{c}.npy", mmap_mode="r") for c in COLUMNS}
+        self._offsets = {c: np.load(directory / f"{c}_offsets.npy", mmap_mode="r") for c in COLUMNS}
+        self._size = len(self._offsets["id"]) - 1
+
+    @classmethod
+    def open_current(
+        cls,
+        directory: Path,
+        source: Path,
+        read_chunks: Callable[[], Iterable[DocumentChunk]],
+    ) -> "ChunkStore":
+        """Open the store of ``source``, (re)writing it first if missing or stale.
+
+        Workers starting together take turns on a lock file next to the
+        store: the first writes it, the others find it current and open it.
+
+        Args:
+            directory: Store directory
+            source: File the chunks come from
+            read_chunks: Reads the chunks from ``source`` (only called to write)
+
+        Returns:
+            Opened store
+        """
+        with file_lock(directory.with_name(f".{directory.name}.lock")):
+            if not cls.is_current(directory, source):
+                logger.info(f"Building chunk columns at {directory}")
+                cls.write(directory, read_chunks(), source=source)
+            return cls(directory)
+
+    @staticmethod
+    def write(directory: Path, chunks: Iterable[DocumentChunk], source: Path | None = None) -> None:
+        """Write chunks as a store (atomically replaces an existing one).
+
+        Args:
+            directory: Store directory
+            chunks: Chunks to store
+            source: File the chunks came from (recorded so stale stores are detected)
+        """
+        values: dict[str, list[bytes]] = {c: [] for c in COLUMNS}
+        for chunk in chunks:
+            values["id"].append(chunk.id.encode("utf-8"))
+            values["text"].append(chunk.text.encode("utf-8"))
+            values["metadata"].append(json.dumps(chunk.metadata, separators=(",", ":")).encode("utf-8"))
+
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{directory.name}.", dir=directory.parent))
+        try:
+            for column, rows in values.items():
+                offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+                np.cumsum([len(row) for row in rows], out=offsets[1:])
+                np.save(staging / f"{column}.npy", np.frombuffer(b"".join(rows), dtype=np.uint8))
+                np.save(staging / f"{column}_offsets.npy", offsets)
+            manifest = {"version": FORMAT_VERSION, "rows": len(values["id"]), "source": _fingerprint(source)}
+            (staging / MANIFEST_FILE).write_text(json.dumps(manifest))
+
+            shutil.rmtree(directory, ignore_errors=True)
+            try:
+                os.replace(staging, directory)
+            except OSError as e:
+                # Another process put its store in place between rmtree and replace
+                if e.errno not in (errno.ENOTEMPTY, errno.EEXIST) or source is None:
+                    raise
+                if not ChunkStore.is_current(directory, source):
+                    raise
+                shutil.rmtree(staging, ignore_errors=True)
+                logger.info(f"Chunk store at {directory} was written by another process")
+                return
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        logger.info(f"Wrote {len(values['id'])} chunks to {directory}")
+
+    @staticmethod
+    def is_current(directory: Path, source: Path) -> bool:
+        """Whether a store exists and was written from the current version of ``source``."""
+        try:
+            manifest = json.loads((directory / MANIFEST_FILE).read_text())
+        except (OSError, ValueError):
+            return False
+        return manifest.get("version") == FORMAT_VERSION and manifest.get("source") == _fingerprint(source)
+
+    def _value(self, column: str, index: int) -> str:
+        """Decode one cell."""
+        offsets = self._offsets[column]
+        return bytes(self._blobs[column][offsets[index] : offsets[index + 1]]).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> DocumentChunk: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[DocumentChunk]: ...
+
+    def __getitem__(self, index: int | slice) -> DocumentChunk | list[DocumentChunk]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f"chunk index {index} out of range")
+        # Rows were validated when the store was written
+        return DocumentChunk.model_construct(
+            id=self._value("id", index),
+            text=self._value("text", index),
+            metadata=json.loads(self._value("metadata", index)),
+        )
+
+    def __iter__(self) -> Iterator[DocumentChunk]:
+        for index in range(self._size):
+            yield self[index]
+
+
+def _fingerprint(source: Path | None) -> list[int] | None:
+    """(mtime_ns, size) of a file, or None."""
+    if source is None or not source.exists():
+        return None
+    stat = source.stat()
+    return [stat.st_mtime_ns, stat.st_size]
@@ -12,7 +12,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Generator
 
-from sqlalchemy import create_engine, func
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.core.config import settings
@@ -24,7 +23,9 @@ from src.models.conversation import (
     ConversationUpdate,
     ConversationWithMessages,
 )
-from src.models.feedback import Base, ChatInteractionDB, ChatInteractionResponse
+from src.models.feedback import ChatInteractionDB, ChatInteractionResponse
+from src.repositories.database import get_engine
+from src.repositories.pagination import after_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -48,17 +49,10 @@ class ConversationRepository:
             db_path: Path to database file (default: from settings)
         """
         self.db_path = db_path or settings.database_path
-        self.engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
+        # Shared with FeedbackRepository; schema is created with the engine
+        self.engine = get_engine(self.db_path)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
-        # Create tables if they don't exist
-        self._init_db()
-
-    def _init_db(self) -> None:
-        """Create database tables if they don't exist."""
-        Base.metadata.create_all(self.engine)
-        logger.info(f"Initialized conversation database at {self.db_path}")
-
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
         """Context manager for database sessions.
@@ -95,19 +89,7 @@ class ConversationRepository:
             session.add(db_conversation)
             session.flush()  # Generate ID and timestamps
 
-            # Query message count (should be 0 for new conversation)
-            message_count = session.query(func.count(ChatInteractionDB.id)).filter(
-                ChatInteractionDB.conversation_id == db_conversation.id
-            ).scalar() or 0
-
-            return ConversationResponse(
-                id=db_conversation.id,
-                title=db_conversation.title,
-                created_at=db_conversation.created_at,
-                updated_at=db_conversation.updated_at,
-                status=db_conversation.status,
-                message_count=message_count,
-            )
+            return ConversationResponse.model_validate(db_conversation)
 
     def get_conversation(self, conversation_id: str) -> ConversationResponse | None:
         """Get a conversation by ID.
@@ -126,35 +108,28 @@ class ConversationRepository:
             if not db_conversation:
                 return None
 
-            # Count messages
-            message_count = session.query(func.count(ChatInteractionDB.id)).filter(
-                ChatInteractionDB.conversation_id == conversation_id
-            ).scalar() or 0
-
-            return ConversationResponse(
-                id=db_conversation.id,
-                title=db_conversation.title,
-                created_at=db_conversation.created_at,
-                updated_at=db_conversation.updated_at,
-                status=db_conversation.status,
-                message_count=message_count,
-            )
+            return ConversationResponse.model_validate(db_conversation)
 
     def list_conversations(
         self,
         status: ConversationStatus | None = None,
         limit: int = 20,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> list[ConversationResponse]:
         """List conversations with pagination and filtering.
 
         Args:
             status: Filter by status (None = all statuses)
             limit: Maximum number of conversations to return
-            offset: Number of conversations to skip
+            offset: Number of conversations to skip (ignored with a cursor)
+            cursor: Keyset cursor of the previous page's last conversation
 
         Returns:
             List of conversations ordered by updated_at (most recent first)
+
+        One query: message_count is stored on the row, and the order is
+        served by the (status, updated_at, id) / (updated_at, id) indexes.
         """
         with self.get_session() as session:
             query = session.query(ConversationDB)
@@ -163,29 +138,17 @@ class ConversationRepository:
             if status:
                 query = query.filter(ConversationDB.status == status)
 
-            # Order by most recently updated
-            query = query.order_by(ConversationDB.updated_at.desc())
-
-            # Apply pagination
-            conversations = query.limit(limit).offset(offset).all()
-
-            # Build responses with message counts
-            results = []
-            for conv in conversations:
-                message_count = session.query(func.count(ChatInteractionDB.id)).filter(
-                    ChatInteractionDB.conversation_id == conv.id
-                ).scalar() or 0
-
-                results.append(ConversationResponse(
-                    id=conv.id,
-                    title=conv.title,
-                    created_at=conv.created_at,
-                    updated_at=conv.updated_at,
-                    status=conv.status,
-                    message_count=message_count,
-                ))
+            # Order by most recently updated (id breaks ties)
+            query = query.order_by(ConversationDB.updated_at.desc(), ConversationDB.id.desc())
 
-            return results
+            # Apply pagination: keyset seek when a cursor is given, else offset
+            if cursor:
+                query = query.filter(after_cursor(ConversationDB.updated_at, ConversationDB.id, cursor))
+            elif offset:
+                query = query.offset(offset)
+            conversations = query.limit(limit).all()
+
+            return [ConversationResponse.model_validate(conv) for conv in conversations]
 
     def get_conversation_with_messages(self, conversation_id: str) -> ConversationWithMessages | None:
         """Get a conversation with all its messages.
@@ -269,19 +232,7 @@ class ConversationRepository:
 
             session.flush()
 
-            # Count messages
-            message_count = session.query(func.count(ChatInteractionDB.id)).filter(
-                ChatInteractionDB.conversation_id == conversation_id
-            ).scalar() or 0
-
-            return ConversationResponse(
-                id=db_conversation.id,
-                title=db_conversation.title,
-                created_at=db_conversation.created_at,
-                updated_at=db_conversation.updated_at,
-                status=db_conversation.status,
-                message_count=message_count,
-            )
+            return ConversationResponse.model_validate(db_conversation)
 
     def archive_conversation(self, conversation_id: str) -> ConversationResponse | None:
         """Archive a conversation (soft delete).
@@ -312,6 +263,9 @@ class ConversationRepository:
         )
 
     def close(self) -> None:
-        """Close database engine and dispose of connections."""
-        self.engine.dispose()
+        """Release the repository.
+
+        The engine is shared with every repository on the same database file,
+        so it stays open; dispose_all_engines() closes it at shutdown.
+        """
         logger.info("Closed conversation repository")
@@ -0,0 +1,205 @@
+"""
+FILE: database.py
+STATUS: Active
+RESPONSIBILITY: Process-wide SQLAlchemy engine (WAL, pooled) for the interactions database
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import logging
+import threading
+from pathlib import Path
+
+from sqlalchemy import Engine, create_engine, event, inspect, text
+
+from src.core.config import settings
+from src.models.conversation import ConversationDB  # noqa: F401 - registers the table on Base
+from src.models.feedback import Base
+
+logger = logging.getLogger(__name__)
+
+# conversations.message_count follows inserts, deletes and moves of
+# chat_interactions rows, whichever code path writes them
+MESSAGE_COUNT_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_chat_interactions_count_insert
+    AFTER INSERT ON chat_interactions WHEN NEW.conversation_id IS NOT NULL
+    BEGIN
+        UPDATE conversations SET message_count = message_count + 1 WHERE id = NEW.conversation_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_chat_interactions_count_delete
+    AFTER DELETE ON chat_interactions WHEN OLD.conversation_id IS NOT NULL
+    BEGIN
+        UPDATE conversations SET message_count = message_count - 1 WHERE id = OLD.conversation_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_chat_interactions_count_move
+    AFTER UPDATE OF conversation_id ON chat_interactions
+    WHEN OLD.conversation_id IS NOT NEW.conversation_id
+    BEGIN
+        UPDATE conversations SET message_count = message_count - 1 WHERE id = OLD.conversation_id;
+        UPDATE conversations SET message_count = message_count + 1 WHERE id = NEW.conversation_id;
+    END
+    """,
+)
+
+# feedback_stats (one row, id = 1) follows every interaction and feedback
+# write, so /feedback/stats is a single-row read. Ratings are stored by enum
+# name.
+FEEDBACK_STATS_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_feedback_stats_interaction_insert
+    AFTER INSERT ON chat_interactions
+    BEGIN
+        UPDATE feedback_stats SET total_interactions = total_interactions + 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_feedback_stats_interaction_delete
+    AFTER DELETE ON chat_interactions
+    BEGIN
+        UPDATE feedback_stats SET total_interactions = total_interactions - 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_feedback_stats_feedback_insert
+    AFTER INSERT ON feedback
+    BEGIN
+        UPDATE feedback_stats SET
+            total_feedback = total_feedback + 1,
+            positive_count = positive_count + (NEW.rating = 'POSITIVE'),
+            negative_count = negative_count + (NEW.rating = 'NEGATIVE')
+        WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_feedback_stats_feedback_delete
+    AFTER DELETE ON feedback
+    BEGIN
+        UPDATE feedback_stats SET
+            total_feedback = total_feedback - 1,
+            positive_count = positive_count - (OLD.rating = 'POSITIVE'),
+            negative_count = negative_count - (OLD.rating = 'NEGATIVE')
+        WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_feedback_stats_feedback_rating
+    AFTER UPDATE OF rating ON feedback WHEN OLD.rating IS NOT NEW.rating
+    BEGIN
+        UPDATE feedback_stats SET
+            positive_count = positive_count + (NEW.rating = 'POSITIVE') - (OLD.rating = 'POSITIVE'),
+            negative_count = negative_count + (NEW.rating = 'NEGATIVE') - (OLD.rating = 'NEGATIVE')
+        WHERE id = 1;
+    END
+    """,
+)
+
+# Recompute feedback_stats from the tables (seeding and reconciliation)
+RECONCILE_FEEDBACK_STATS = """
+    INSERT OR REPLACE INTO feedback_stats
+        (id, total_interactions, total_feedback, positive_count, negative_count, reconciled_at)
+    SELECT 1,
+        (SELECT COUNT(*) FROM chat_interactions),
+        (SELECT COUNT(*) FROM feedback),
+        (SELECT COUNT(*) FROM feedback WHERE rating = 'POSITIVE'),
+        (SELECT COUNT(*) FROM feedback WHERE rating = 'NEGATIVE'),
+        CURRENT_TIMESTAMP
+"""
+
+_engines: dict[Path, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def _create_engine(db_path: Path) -> Engine:
+    """Create a pooled engine whose connections run in WAL mode."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        echo=False,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(engine, "connect")
+    def _configure_connection(dbapi_connection, connection_record):
+        """Readers don't block the writer (WAL); commits skip the per-transaction fsync."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={settings.database_busy_timeout_ms}")
+        cursor.close()
+
+    # Schema is created once, when the engine is first built
+    Base.metadata.create_all(engine)
+    _ensure_message_counts(engine)
+    _ensure_feedback_stats(engine)
+    # create_all skips indexes of tables that already exist
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+    logger.info(f"Database engine created for {db_path}")
+    return engine
+
+
+def _ensure_message_counts(engine: Engine) -> None:
+    """Add and backfill conversations.message_count on older databases, then install the triggers."""
+    columns = {column["name"] for column in inspect(engine).get_columns("conversations")}
+    with engine.begin() as conn:
+        if "message_count" not in columns:
+            logger.info("Adding conversations.message_count")
+            conn.execute(
+                text("ALTER TABLE conversations ADD COLUMN message_count INTEGER NOT NULL DEFAULT 0")
+            )
+            conn.execute(
+                text(
+                    "UPDATE conversations SET message_count = "
+                    "(SELECT COUNT(*) FROM chat_interactions WHERE conversation_id = conversations.id)"
+                )
+            )
+        for trigger in MESSAGE_COUNT_TRIGGERS:
+            conn.execute(text(trigger))
+
+
+def _ensure_feedback_stats(engine: Engine) -> None:
+    """Seed the feedback_stats row if missing, then install the triggers."""
+    with engine.begin() as conn:
+        if conn.execute(text("SELECT 1 FROM feedback_stats WHERE id = 1")).first() is None:
+            logger.info("Seeding feedback_stats")
+            conn.execute(text(RECONCILE_FEEDBACK_STATS))
+        for trigger in FEEDBACK_STATS_TRIGGERS:
+            conn.execute(text(trigger))
+
+
+def get_engine(db_path: str | Path | None = None) -> Engine:
+    """Get the shared engine for a database file (schema created on first use).
+
+    Args:
+        db_path: Path to SQLite database (default settings.database_path)
+
+    Returns:
+        Process-wide Engine for that path
+    """
+    key = Path(db_path or settings.database_path).resolve()
+    engine = _engines.get(key)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(key)
+            if engine is None:
+                engine = _create_engine(key)
+                _engines[key] = engine
+    return engine
+
+
+def dispose_all_engines() -> None:
+    """Dispose every registered engine (used on shutdown and in tests)."""
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        engine.dispose()
@@ -12,12 +12,11 @@ from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
 
-from sqlalchemy import create_engine, func
+from sqlalchemy import text
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.core.config import settings
 from src.models.feedback import (
-    Base,
     ChatInteractionCreate,
     ChatInteractionDB,
     ChatInteractionResponse,
@@ -26,7 +25,10 @@ from src.models.feedback import (
     FeedbackRating,
     FeedbackResponse,
     FeedbackStats,
+    FeedbackStatsDB,
 )
+from src.repositories.database import RECONCILE_FEEDBACK_STATS, get_engine
+from src.repositories.pagination import after_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -42,22 +44,20 @@ class FeedbackRepository:
         """
         self.db_path = db_path or settings.database_path
         self._ensure_directory()
-        self.engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
+        # Shared with ConversationRepository; schema is created with the engine
+        self.engine = get_engine(self.db_path)
         self.SessionLocal = sessionmaker(bind=self.engine)
-        self._init_db()
 
     def _ensure_directory(self) -> None:
         """Ensure the database directory exists."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    def _init_db(self) -> None:
-        """Initialize database tables."""
-        Base.metadata.create_all(self.engine)
-        logger.info("Database initialized at %s", self.db_path)
-
     def close(self) -> None:
-        """Close database connections and dispose engine."""
-        self.engine.dispose()
+        """Release the repository.
+
+        The engine is shared with every repository on the same database file,
+        so it stays open; dispose_all_engines() closes it at shutdown.
+        """
 
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
@@ -129,6 +129,29 @@ class FeedbackRepository:
 
             return self._to_interaction_response(db_interaction)
 
+    def save_interactions(self, interactions: list[ChatInteractionCreate]) -> int:
+        """Save several chat interactions in one transaction.
+
+        Args:
+            interactions: Chat interaction data
+
+        Returns:
+            Number of interactions saved
+        """
+        with self.get_session() as session:
+            session.add_all(
+                ChatInteractionDB(
+                    query=interaction.query,
+                    response=interaction.response,
+                    sources=json.dumps(interaction.sources),
+                    processing_time_ms=interaction.processing_time_ms,
+                    conversation_id=interaction.conversation_id,
+                    turn_number=interaction.turn_number,
+                )
+                for interaction in interactions
+            )
+        return len(interactions)
+
     def get_interaction(self, interaction_id: str) -> ChatInteractionResponse | None:
         """Get a chat interaction by ID.
 
@@ -213,25 +236,29 @@ class FeedbackRepository:
             return self._to_feedback_response(db_feedback)
 
     def get_recent_interactions(
-        self, limit: int = 50, offset: int = 0
+        self, limit: int = 50, offset: int = 0, cursor: str | None = None
     ) -> list[ChatInteractionResponse]:
         """Get recent chat interactions.
 
         Args:
             limit: Maximum number of interactions to return
-            offset: Number of interactions to skip
+            offset: Number of interactions to skip (ignored with a cursor)
+            cursor: Keyset cursor of the previous page's last interaction
 
         Returns:
-            List of chat interactions
+            List of chat interactions, newest first
         """
         with self.get_session() as session:
-            db_interactions = (
-                session.query(ChatInteractionDB)
-                .order_by(ChatInteractionDB.created_at.desc())
-                .offset(offset)
-                .limit(limit)
-                .all()
+            query = session.query(ChatInteractionDB).order_by(
+                ChatInteractionDB.created_at.desc(), ChatInteractionDB.id.desc()
             )
+            if cursor:
+                query = query.filter(
+                    after_cursor(ChatInteractionDB.created_at, ChatInteractionDB.id, cursor)
+                )
+            elif offset:
+                query = query.offset(offset)
+            db_interactions = query.limit(limit).all()
 
             results = []
             for db_int in db_interactions:
@@ -245,36 +272,49 @@ class FeedbackRepository:
     def get_stats(self) -> FeedbackStats:
         """Get feedback statistics.
 
+        Reads the trigger-maintained feedback_stats row (no table scans).
+
         Returns:
             Feedback statistics
         """
         with self.get_session() as session:
-            total_interactions = session.query(func.count(ChatInteractionDB.id)).scalar() or 0
-            total_feedback = session.query(func.count(FeedbackDB.id)).scalar() or 0
-            positive_count = (
-                session.query(func.count(FeedbackDB.id))
-                .filter(FeedbackDB.rating == FeedbackRating.POSITIVE)
-                .scalar()
-                or 0
-            )
-            negative_count = (
-                session.query(func.count(FeedbackDB.id))
-                .filter(FeedbackDB.rating == FeedbackRating.NEGATIVE)
-                .scalar()
-                or 0
+            row = session.get(FeedbackStatsDB, 1)
+            if row is None:
+                return self._to_stats(0, 0, 0, 0)
+            return self._to_stats(
+                row.total_interactions, row.total_feedback, row.positive_count, row.negative_count
             )
 
-            feedback_rate = (total_feedback / total_interactions * 100) if total_interactions else 0
-            positive_rate = (positive_count / total_feedback * 100) if total_feedback else 0
+    def reconcile_stats(self) -> FeedbackStats:
+        """Recompute feedback_stats from the tables and report any drift.
 
-            return FeedbackStats(
-                total_interactions=total_interactions,
-                total_feedback=total_feedback,
-                positive_count=positive_count,
-                negative_count=negative_count,
-                feedback_rate=round(feedback_rate, 2),
-                positive_rate=round(positive_rate, 2),
-            )
+        Returns:
+            Feedback statistics after reconciliation
+        """
+        before = self.get_stats()
+        with self.get_session() as session:
+            session.execute(text(RECONCILE_FEEDBACK_STATS))
+        after = self.get_stats()
+        if after != before:
+            logger.warning(f"Feedback stats drifted: {before.model_dump()} -> {after.model_dump()}")
+        return after
+
+    @staticmethod
+    def _to_stats(
+        total_interactions: int, total_feedback: int, positive_count: int, negative_count: int
+    ) -> FeedbackStats:
+        """Build FeedbackStats (with rates) from raw counts."""
+        feedback_rate = (total_feedback / total_interactions * 100) if total_interactions else 0
+        positive_rate = (positive_count / total_feedback * 100) if total_feedback else 0
+
+        return FeedbackStats(
+            total_interactions=total_interactions,
+            total_feedback=total_feedback,
+            positive_count=positive_count,
+            negative_count=negative_count,
+            feedback_rate=round(feedback_rate, 2),
+            positive_rate=round(positive_rate, 2),
+        )
 
     def get_negative_feedback_with_comments(self) -> list[ChatInteractionResponse]:
         """Get all interactions with negative feedback that have comments.
@@ -326,3 +366,36 @@ class FeedbackRepository:
                 results.append(self._to_interaction_response(db_int, feedback))
 
             return results
+
+    def get_recent_turns(
+        self, conversation_id: str, before_turn: int, limit: int = 5
+    ) -> list[tuple[int, str, str]]:
+        """Get the last turns of a conversation before a given turn.
+
+        Reads only the needed columns through the (conversation_id,
+        turn_number) index, so cost doesn't grow with conversation length.
+
+        Args:
+            conversation_id: Conversation ID
+            before_turn: Only turns with a lower turn_number are returned
+            limit: Maximum number of turns
+
+        Returns:
+            (turn_number, query, response) tuples, oldest first
+        """
+        with self.get_session() as session:
+            rows = (
+                session.query(
+                    ChatInteractionDB.turn_number,
+                    ChatInteractionDB.query,
+                    ChatInteractionDB.response,
+                )
+                .filter(
+                    ChatInteractionDB.conversation_id == conversation_id,
+                    ChatInteractionDB.turn_number < before_turn,
+                )
+                .order_by(ChatInteractionDB.turn_number.desc())
+                .limit(limit)
+                .all()
+            )
+            return [(row.turn_number, row.query, row.response) for row in reversed(rows)]
@@ -0,0 +1,203 @@
+"""
+FILE: log_index.py
+STATUS: Active
+RESPONSIBILITY: SQLite FTS5 index over JSON log files and their rotated backups
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# log_files rows of one log file and its numbered backups
+_FAMILY = "(path = ? OR path GLOB ?)"
+
+
+def _family_params(log_file: Path) -> tuple[str, str]:
+    """Parameters for _FAMILY: the file itself and ``<file>.<n>``."""
+    return str(log_file), f"{log_file}.[0-9]*"
+
+
+class LogSearchIndex:
+    """Level and full-text search across a log file and all its rotated backups.
+
+    Files are tracked by (device, inode) with the byte offset already indexed,
+    so update() only reads lines appended since the previous call, and a
+    rotation (app.log -> app.log.1 keeps the inode) re-reads nothing. Entries
+    of backups deleted by rotation are dropped.
+
+    Requires SQLite built with FTS5 (the default in CPython builds);
+    otherwise the constructor raises sqlite3.OperationalError.
+    """
+
+    def __init__(self, db_path: str | Path):
+        """Initialize index.
+
+        Args:
+            db_path: Path to the index database (created if missing)
+        """
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS log_files (
+                file_id TEXT PRIMARY KEY, path TEXT NOT NULL, offset INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS log_entries (
+                id INTEGER PRIMARY KEY, file_id TEXT NOT NULL, timestamp TEXT,
+                level TEXT, logger TEXT, message TEXT, raw TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ix_log_entries_timestamp ON log_entries (timestamp);
+            CREATE INDEX IF NOT EXISTS ix_log_entries_level ON log_entries (level, timestamp);
+            CREATE INDEX IF NOT EXISTS ix_log_entries_file ON log_entries (file_id);
+            CREATE VIRTUAL TABLE IF NOT EXISTS log_fts USING fts5(
+                message, content='log_entries', content_rowid='id'
+            );
+            CREATE TRIGGER IF NOT EXISTS log_entries_ai AFTER INSERT ON log_entries BEGIN
+                INSERT INTO log_fts (rowid, message) VALUES (new.id, new.message);
+            END;
+            CREATE TRIGGER IF NOT EXISTS log_entries_ad AFTER DELETE ON log_entries BEGIN
+                INSERT INTO log_fts (log_fts, rowid, message)
+                VALUES ('delete', old.id, old.message);
+            END;
+            """
+        )
+        self._lock = threading.Lock()
+
+    def update(self, log_file: str | Path) -> int:
+        """Index lines appended to a log file and its backups since the last update.
+
+        Args:
+            log_file: Active log file; backups are ``<log_file>.1``, ``.2``, ...
+
+        Returns:
+            Number of entries added
+        """
+        log_file = Path(log_file)
+        paths = [log_file] if log_file.exists() else []
+        paths += sorted(
+            (p for p in log_file.parent.glob(f"{log_file.name}.*") if p.suffix[1:].isdigit()),
+            key=lambda p: int(p.suffix[1:]),
+        )
+
+        added = 0
+        with self._lock, self._conn:
+            known = dict(
+                self._conn.execute(
+                    f"SELECT file_id, offset FROM log_files WHERE {_FAMILY}",
+                    _family_params(log_file),
+                ).fetchall()
+            )
+            seen: set[str] = set()
+            for path in paths:
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue  # rotated away between glob and stat
+                file_id = f"{stat.st_dev}:{stat.st_ino}"
+                seen.add(file_id)
+                offset = known.get(file_id, 0)
+                if stat.st_size < offset:
+                    # Truncated in place: index it again from the start
+                    self._conn.execute("DELETE FROM log_entries WHERE file_id = ?", (file_id,))
+                    offset = 0
+                if stat.st_size > offset:
+                    offset, count = self._ingest(path, file_id, offset)
+                    added += count
+                self._conn.execute(
+                    "INSERT INTO log_files (file_id, path, offset) VALUES (?, ?, ?) "
+                    "ON CONFLICT(file_id) DO UPDATE SET "
+                    "path = excluded.path, offset = excluded.offset",
+                    (file_id, str(path), offset),
+                )
+
+            for file_id in set(known) - seen:
+                self._conn.execute("DELETE FROM log_entries WHERE file_id = ?", (file_id,))
+                self._conn.execute("DELETE FROM log_files WHERE file_id = ?", (file_id,))
+
+        if added:
+            logger.debug("Indexed %d log entries from %s", added, log_file)
+        return added
+
+    def _ingest(self, path: Path, file_id: str, offset: int) -> tuple[int, int]:
+        """Insert the complete lines after offset; returns (new offset, entries added)."""
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+        # An unterminated last line is still being written: leave it for the next update
+        complete = data[: data.rfind(b"\n") + 1]
+
+        rows = []
+        for line in complete.decode("utf-8", errors="replace").splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+            rows.append(
+                (
+                    file_id,
+                    entry.get("timestamp"),
+                    entry.get("level"),
+                    entry.get("logger"),
+                    str(entry.get("message", "")),
+                    line,
+                )
+            )
+        self._conn.executemany(
+            "INSERT INTO log_entries (file_id, timestamp, level, logger, message, raw) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        return offset + len(complete), len(rows)
+
+    def search(
+        self,
+        text: str | None = None,
+        level: str | None = None,
+        log_file: str | Path | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Most recent entries matching the filters.
+
+        Args:
+            text: Words that must appear, in order, in the message (FTS phrase match)
+            level: Log level (DEBUG, INFO, WARNING, ERROR)
+            log_file: Only entries of this log file and its backups (default: all indexed files)
+            limit: Maximum entries returned
+
+        Returns:
+            Log entries as dictionaries, newest first
+        """
+        where, params = [], []
+        if text and text.strip():
+            where.append("id IN (SELECT rowid FROM log_fts WHERE log_fts MATCH ?)")
+            params.append('"' + text.replace('"', '""') + '"')
+        if level:
+            where.append("level = ?")
+            params.append(level)
+        if log_file is not None:
+            where.append(f"file_id IN (SELECT file_id FROM log_files WHERE {_FAMILY})")
+            params.extend(_family_params(Path(log_file)))
+        sql = "SELECT raw FROM log_entries"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY timestamp DESC, id DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(raw) for (raw,) in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
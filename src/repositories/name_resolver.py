@@ -0,0 +1,261 @@
+"""
+FILE: name_resolver.py
+STATUS: Active
+RESPONSIBILITY: FTS5 trigram name index lookups and LIKE-to-id SQL rewriting
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import logging
+import re
+import sqlite3
+import unicodedata
+from pathlib import Path
+
+from src.repositories.sqlite_pool import get_read_only_pool
+
+logger = logging.getLogger(__name__)
+
+NAME_INDEX_TABLE = "name_index"
+
+# Trigram tokenizer needs at least 3 characters to use the index
+MIN_QUERY_LENGTH = 3
+
+# Never rewrite a predicate into a huge IN list (the LIKE is vague anyway)
+MAX_REWRITE_MATCHES = 10
+
+# Tables with a name column the rewriter knows how to map to a key column:
+# table -> (name column, key column, entity type in the index)
+_NAME_COLUMNS = {
+    "players": ("name", "id", "player"),
+    "player_per_game": ("name", "player_id", "player"),
+    "teams": ("name", "abbreviation", "team"),
+    "team_totals": ("team_name", "team_abbr", "team"),
+    "team_averages": ("team_name", "team_abbr", "team"),
+}
+
+# Function words skipped when scanning a question for names
+_FUNCTION_WORDS = {
+    "who", "what", "which", "whose", "when", "where", "how", "the", "and", "for",
+    "with", "has", "have", "had", "did", "does", "are", "was", "were", "this",
+    "that", "than", "from", "all", "any", "its", "his", "their", "many", "much",
+}
+
+_SQL_KEYWORDS = {
+    "on", "where", "join", "inner", "left", "right", "cross", "natural", "group",
+    "order", "limit", "having", "union", "using", "outer", "full",
+}
+
+_TABLE_ALIAS_RE = re.compile(
+    r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?",
+    re.IGNORECASE,
+)
+
+# [alias.]column LIKE '%text%' (no other wildcards, no escaped quotes)
+_LIKE_RE = re.compile(
+    r"(?<![\w.])(?:(\w+)\.)?(\w+)\s+LIKE\s+'%([^%_']+)%'",
+    re.IGNORECASE,
+)
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a name for indexing and lookup.
+
+    Strips accents/diacritics, lowercases, and collapses punctuation and
+    whitespace so "Nikola Jokić", "nikola jokic" and "JOKIC" share trigrams.
+
+    Args:
+        name: Player or team name
+
+    Returns:
+        Normalized ASCII-folded name
+
+    Example:
+        >>> normalize_name("Shai Gilgeous-Alexander")
+        "shai gilgeous alexander"
+    """
+    stripped = "".join(
+        c for c in unicodedata.normalize("NFD", name)
+        if unicodedata.category(c) != "Mn"
+    )
+    return " ".join(re.sub(r"[^\w]+", " ", stripped.lower()).split())
+
+
+class NameResolver:
+    """Resolve free-text player/team names through the FTS5 trigram name index.
+
+    The index (built by NBADatabase.build_name_index) stores normalized names,
+    so one indexed MATCH replaces an unindexed ``LIKE '%name%'`` scan and
+    ignores accents and case.
+    """
+
+    def __init__(self, db_path: str | Path):
+        """Initialize resolver.
+
+        Args:
+            db_path: Path to SQLite database
+        """
+        self._pool = get_read_only_pool(db_path)
+        self._available: bool | None = None
+
+    @property
+    def available(self) -> bool:
+        """Whether the name index exists in the database (checked once)."""
+        if self._available is None:
+            try:
+                self._available = bool(self._pool.execute(f"SELECT 1 FROM {NAME_INDEX_TABLE} LIMIT 1"))
+            except sqlite3.OperationalError:
+                self._available = False
+            if not self._available:
+                logger.info("Name index not built, name predicates are left as LIKE scans")
+        return self._available
+
+    def index_tables(self) -> list[str]:
+        """List the index's virtual and FTS5 shadow tables (hidden from the SQL agent).
+
+        Returns:
+            Table names starting with the index name (empty if not built)
+        """
+        try:
+            rows = self._pool.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND (name = ? OR name GLOB ?)",
+                (NAME_INDEX_TABLE, f"{NAME_INDEX_TABLE}_*"),
+            )
+        except sqlite3.OperationalError:
+            return []
+        return [r[0] for r in rows]
+
+    def _lookup(self, name: str, entity: str, limit: int) -> list[str]:
+        """Look up entity keys whose normalized name contains the normalized query."""
+        query = normalize_name(name)
+        if len(query) < MIN_QUERY_LENGTH or not self.available:
+            return []
+        rows = self._pool.execute(
+            f"SELECT entity_key FROM {NAME_INDEX_TABLE} "
+            f"WHERE {NAME_INDEX_TABLE} MATCH ? AND entity = ? ORDER BY rank LIMIT ?",
+            ('normalized:"' + query.replace('"', '""') + '"', entity, limit),
+        )
+        return [r[0] for r in rows]
+
+    def resolve_player(self, name: str, limit: int = MAX_REWRITE_MATCHES) -> list[int]:
+        """Map a free-text player name to players.id values.
+
+        Args:
+            name: Full or partial player name (accents and case ignored)
+            limit: Maximum number of ids to return
+
+        Returns:
+            Matching player ids, best match first (empty if none)
+        """
+        return [int(key) for key in self._lookup(name, "player", limit)]
+
+    def resolve_team(self, name: str, limit: int = MAX_REWRITE_MATCHES) -> list[str]:
+        """Map a free-text team name to team abbreviations.
+
+        Args:
+            name: Full or partial team name (e.g. "Lakers")
+            limit: Maximum number of abbreviations to return
+
+        Returns:
+            Matching team abbreviations, best match first (empty if none)
+        """
+        return self._lookup(name, "team", limit)
+
+    def entities_in(self, text: str) -> frozenset[str]:
+        """Find the players and teams a free-text question mentions.
+
+        Each word is looked up in the index; a word matching
+        1..MAX_REWRITE_MATCHES entities adds them as ``player:<id>`` or
+        ``team:<abbr>`` (vaguer words match more and are ignored). Without the
+        index every content word is returned as ``word:<w>`` instead, so two
+        questions only compare equal when they use the same words.
+
+        Args:
+            text: Question or other free text
+
+        Returns:
+            Entity keys mentioned in the text
+        """
+        words = [
+            w for w in normalize_name(text).split()
+            if len(w) >= MIN_QUERY_LENGTH and w not in _FUNCTION_WORDS
+        ]
+        if not self.available:
+            return frozenset(f"word:{w}" for w in words)
+
+        entities: set[str] = set()
+        for word in words:
+            for entity in ("player", "team"):
+                keys = self._lookup(word, entity, MAX_REWRITE_MATCHES + 1)
+                if len(keys) <= MAX_REWRITE_MATCHES:
+                    entities.update(f"{entity}:{key}" for key in keys)
+        return frozenset(entities)
+
+    def rewrite_sql(self, sql: str) -> str:
+        """Rewrite ``name LIKE '%text%'`` predicates into key equality.
+
+        Only rewrites predicates on a known name column whose table can be
+        determined from the FROM/JOIN clauses and whose text resolves to
+        1..MAX_REWRITE_MATCHES entities. Anything else is left untouched, so
+        the original LIKE still runs.
+
+        Args:
+            sql: Validated SELECT statement
+
+        Returns:
+            SQL with resolvable name predicates replaced
+        """
+        if "like" not in sql.lower() or not self.available:
+            return sql
+
+        aliases: dict[str, str] = {}
+        tables: list[str] = []
+        for table, alias in _TABLE_ALIAS_RE.findall(sql):
+            table = table.lower()
+            tables.append(table)
+            aliases[table] = table
+            if alias and alias.lower() not in _SQL_KEYWORDS:
+                aliases[alias.lower()] = table
+
+        def replace(match: re.Match) -> str:
+            qualifier, column, text = match.group(1), match.group(2), match.group(3)
+            if qualifier:
+                table = aliases.get(qualifier.lower())
+            else:
+                # Unqualified column is only unambiguous with a single table
+                table = tables[0] if len(tables) == 1 else None
+            mapping = _NAME_COLUMNS.get(table or "")
+            if mapping is None or column.lower() != mapping[0]:
+                return match.group(0)
+
+            _, key_column, entity = mapping
+            keys = self._lookup(text, entity, MAX_REWRITE_MATCHES + 1)
+            if not keys or len(keys) > MAX_REWRITE_MATCHES:
+                return match.group(0)
+
+            target = f"{qualifier}.{key_column}" if qualifier else key_column
+            values = ", ".join(k if entity == "player" else f"'{k}'" for k in keys)
+            rewritten = f"{target} = {values}" if len(keys) == 1 else f"{target} IN ({values})"
+            logger.debug(f"Name predicate rewritten: {match.group(0)} -> {rewritten}")
+            return rewritten
+
+        return _LIKE_RE.sub(replace, sql)
+
+
+_resolvers: dict[Path, NameResolver] = {}
+
+
+def get_name_resolver(db_path: str | Path) -> NameResolver:
+    """Get the shared resolver for a database file.
+
+    Args:
+        db_path: Path to SQLite database
+
+    Returns:
+        Process-wide NameResolver for that path
+    """
+    key = Path(db_path).resolve()
+    resolver = _resolvers.get(key)
+    if resolver is None:
+        resolver = _resolvers.setdefault(key, NameResolver(key))
+    return resolver
@@ -2,7 +2,7 @@
 FILE: nba_database.py
 STATUS: Active
 RESPONSIBILITY: SQLAlchemy models and repository for NBA statistics database
-LAST MAJOR UPDATE: 2026-02-10
+LAST MAJOR UPDATE: 2026-10-18
 MAINTAINER: Shahu
 """
 
@@ -13,10 +13,12 @@ from typing import Any
 from sqlalchemy import (
     DECIMAL,
     Column,
+    Float,
     ForeignKey,
     Integer,
     String,
     create_engine,
+    text,
 )
 from sqlalchemy.orm import (
     DeclarativeBase,
@@ -26,6 +28,7 @@ from sqlalchemy.orm import (
 )
 
 from src.core.config import settings
+from src.repositories.name_resolver import NAME_INDEX_TABLE, normalize_name
 
 logger = logging.getLogger(__name__)
 
@@ -166,6 +169,180 @@ class PlayerStatsModel(Base):
         return f"<PlayerStats(player_id={self.player_id}, pts={self.pts}, gp={self.gp})>"
 
 
+# ============================================================================
+# Materialized aggregates (rebuilt by NBADatabase.refresh_aggregates)
+# ============================================================================
+
+# Per-game column -> season total column in player_stats
+PER_GAME_COLUMNS = {
+    "ppg": "pts",
+    "rpg": "reb",
+    "orpg": "oreb",
+    "drpg": "dreb",
+    "apg": "ast",
+    "spg": "stl",
+    "bpg": "blk",
+    "topg": "tov",
+    "fgm_pg": "fgm",
+    "fga_pg": "fga",
+    "three_pm_pg": "three_pm",
+    "three_pa_pg": "three_pa",
+    "ftm_pg": "ftm",
+    "fta_pg": "fta",
+}
+
+# Season totals summed per team
+TEAM_TOTAL_COLUMNS = (
+    "pts", "reb", "oreb", "dreb", "ast", "stl", "blk", "tov", "pf",
+    "fgm", "fga", "three_pm", "three_pa", "ftm", "fta", "dd2", "td3",
+)
+
+# Player-level columns averaged per team (NULLs ignored, as AVG() does)
+TEAM_AVERAGE_COLUMNS = (
+    "pts", "reb", "ast", "stl", "blk", "fg_pct", "three_pct", "ft_pct",
+    "ts_pct", "efg_pct", "usg_pct", "off_rtg", "def_rtg", "net_rtg", "pie",
+)
+
+
+class PlayerPerGameModel(Base):
+    """Materialized per-game averages (one row per player, denormalized with name/team).
+
+    Values are unrounded ``CAST(total AS FLOAT) / gp`` so that
+    ``ROUND(ppg, 1)`` equals ``ROUND(CAST(ps.pts AS FLOAT) / ps.gp, 1)`` exactly.
+    """
+
+    __tablename__ = "player_per_game"
+
+    player_id = Column(Integer, ForeignKey("players.id"), primary_key=True)
+    name = Column(String(100), nullable=False, index=True)
+    team_abbr = Column(String(5), nullable=False, index=True)
+    gp = Column(Integer, nullable=False, comment="Games played")
+
+    ppg = Column(Float, index=True, comment="Points per game")
+    rpg = Column(Float, index=True, comment="Rebounds per game")
+    orpg = Column(Float, comment="Offensive rebounds per game")
+    drpg = Column(Float, comment="Defensive rebounds per game")
+    apg = Column(Float, index=True, comment="Assists per game")
+    spg = Column(Float, index=True, comment="Steals per game")
+    bpg = Column(Float, index=True, comment="Blocks per game")
+    topg = Column(Float, comment="Turnovers per game")
+    fgm_pg = Column(Float, comment="Field goals made per game")
+    fga_pg = Column(Float, comment="Field goals attempted per game")
+    three_pm_pg = Column(Float, comment="3-pointers made per game")
+    three_pa_pg = Column(Float, comment="3-pointers attempted per game")
+    ftm_pg = Column(Float, comment="Free throws made per game")
+    fta_pg = Column(Float, comment="Free throws attempted per game")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<PlayerPerGame(name='{self.name}', ppg={self.ppg})>"
+
+
+class TeamTotalsModel(Base):
+    """Materialized team season totals (sum over the team's players)."""
+
+    __tablename__ = "team_totals"
+
+    team_abbr = Column(String(5), ForeignKey("teams.abbreviation"), primary_key=True)
+    team_name = Column(String(100), nullable=False, index=True)
+    player_count = Column(Integer, nullable=False, comment="Players on roster")
+
+    pts = Column(Integer, index=True, comment="Total points")
+    reb = Column(Integer, index=True, comment="Total rebounds")
+    oreb = Column(Integer, comment="Total offensive rebounds")
+    dreb = Column(Integer, comment="Total defensive rebounds")
+    ast = Column(Integer, index=True, comment="Total assists")
+    stl = Column(Integer, comment="Total steals")
+    blk = Column(Integer, comment="Total blocks")
+    tov = Column(Integer, comment="Total turnovers")
+    pf = Column(Integer, comment="Total personal fouls")
+    fgm = Column(Integer, comment="Total field goals made")
+    fga = Column(Integer, comment="Total field goals attempted")
+    three_pm = Column(Integer, comment="Total 3-pointers made")
+    three_pa = Column(Integer, comment="Total 3-pointers attempted")
+    ftm = Column(Integer, comment="Total free throws made")
+    fta = Column(Integer, comment="Total free throws attempted")
+    dd2 = Column(Integer, comment="Total double-doubles")
+    td3 = Column(Integer, comment="Total triple-doubles")
+
+    # Team shooting percentages from the summed makes/attempts (0-100 scale)
+    fg_pct = Column(Float, comment="Team field goal %")
+    three_pct = Column(Float, comment="Team 3-point %")
+    ft_pct = Column(Float, comment="Team free throw %")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<TeamTotals(team='{self.team_abbr}', pts={self.pts})>"
+
+
+class TeamAveragesModel(Base):
+    """Materialized per-player averages for each team (AVG over the team's players)."""
+
+    __tablename__ = "team_averages"
+
+    team_abbr = Column(String(5), ForeignKey("teams.abbreviation"), primary_key=True)
+    team_name = Column(String(100), nullable=False, index=True)
+    player_count = Column(Integer, nullable=False, comment="Players on roster")
+
+    avg_age = Column(Float, comment="Average player age")
+    avg_pts = Column(Float, comment="Average season points per player")
+    avg_reb = Column(Float, comment="Average season rebounds per player")
+    avg_ast = Column(Float, comment="Average season assists per player")
+    avg_stl = Column(Float, comment="Average season steals per player")
+    avg_blk = Column(Float, comment="Average season blocks per player")
+    avg_fg_pct = Column(Float, comment="Average field goal %")
+    avg_three_pct = Column(Float, comment="Average 3-point %")
+    avg_ft_pct = Column(Float, comment="Average free throw %")
+    avg_ts_pct = Column(Float, comment="Average true shooting %")
+    avg_efg_pct = Column(Float, comment="Average effective FG %")
+    avg_usg_pct = Column(Float, comment="Average usage %")
+    avg_off_rtg = Column(Float, comment="Average offensive rating")
+    avg_def_rtg = Column(Float, comment="Average defensive rating")
+    avg_net_rtg = Column(Float, comment="Average net rating")
+    avg_pie = Column(Float, comment="Average player impact estimate")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<TeamAverages(team='{self.team_abbr}', avg_pts={self.avg_pts})>"
+
+
+MATERIALIZED_TABLES = (
+    PlayerPerGameModel.__tablename__,
+    TeamTotalsModel.__tablename__,
+    TeamAveragesModel.__tablename__,
+)
+
+
+def _materialized_aggregate_sql() -> list[str]:
+    """Build the INSERT ... SELECT statements that populate the aggregate tables."""
+    per_game = ", ".join(
+        f"CASE WHEN ps.gp > 0 THEN CAST(ps.{total} AS FLOAT) / ps.gp END"
+        for total in PER_GAME_COLUMNS.values()
+    )
+    totals = ", ".join(f"SUM(ps.{c})" for c in TEAM_TOTAL_COLUMNS)
+    averages = ", ".join(f"AVG(ps.{c})" for c in TEAM_AVERAGE_COLUMNS)
+    team_join = (
+        "FROM teams t JOIN players p ON t.abbreviation = p.team_abbr "
+        "JOIN player_stats ps ON p.id = ps.player_id GROUP BY t.abbreviation, t.name"
+    )
+
+    def pct(made: str, attempted: str) -> str:
+        return f"CASE WHEN SUM(ps.{attempted}) > 0 THEN 100.0 * SUM(ps.{made}) / SUM(ps.{attempted}) END"
+
+    return [
+        f"INSERT INTO player_per_game (player_id, name, team_abbr, gp, {', '.join(PER_GAME_COLUMNS)}) "
+        f"SELECT p.id, p.name, p.team_abbr, ps.gp, {per_game} "
+        "FROM players p JOIN player_stats ps ON p.id = ps.player_id",
+        f"INSERT INTO team_totals (team_abbr, team_name, player_count, {', '.join(TEAM_TOTAL_COLUMNS)}, "
+        "fg_pct, three_pct, ft_pct) "
+        f"SELECT t.abbreviation, t.name, COUNT(*), {totals}, "
+        f"{pct('fgm', 'fga')}, {pct('three_pm', 'three_pa')}, {pct('ftm', 'fta')} {team_join}",
+        f"INSERT INTO team_averages (team_abbr, team_name, player_count, avg_age, "
+        f"{', '.join(f'avg_{c}' for c in TEAM_AVERAGE_COLUMNS)}) "
+        f"SELECT t.abbreviation, t.name, COUNT(*), AVG(p.age), {averages} {team_join}",
+    ]
+
+
 class NBADatabase:
     """Repository for NBA statistics database operations."""
 
@@ -198,6 +375,72 @@ class NBADatabase:
         Base.metadata.drop_all(self.engine)
         logger.info("NBA database tables dropped")
 
+    def refresh_aggregates(self) -> dict[str, int]:
+        """Rebuild the materialized aggregate tables from player_stats.
+
+        Replaces the contents of player_per_game, team_totals and
+        team_averages in a single transaction, then runs ANALYZE so the
+        planner picks up the new indexes. Call after every load.
+
+        Returns:
+            Row count per materialized table
+        """
+        Base.metadata.create_all(
+            self.engine,
+            tables=[Base.metadata.tables[name] for name in MATERIALIZED_TABLES],
+        )
+        with self.engine.begin() as conn:
+            for table in MATERIALIZED_TABLES:
+                conn.execute(text(f"DELETE FROM {table}"))
+            for statement in _materialized_aggregate_sql():
+                conn.execute(text(statement))
+            counts = {
+                table: conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar_one()
+                for table in MATERIALIZED_TABLES
+            }
+            conn.execute(text("ANALYZE"))
+
+        logger.info(f"Materialized aggregates refreshed: {counts}")
+        return counts
+
+    def build_name_index(self) -> int:
+        """Rebuild the FTS5 trigram index over normalized player and team names.
+
+        Used by NameResolver to map free-text names to players.id /
+        teams.abbreviation in one indexed lookup (accent and case
+        insensitive). Requires SQLite 3.34+ for the trigram tokenizer.
+
+        Returns:
+            Number of indexed names
+        """
+        with self.engine.begin() as conn:
+            players = conn.execute(text("SELECT id, name FROM players")).all()
+            teams = conn.execute(text("SELECT abbreviation, name FROM teams")).all()
+            rows = [
+                {"normalized": normalize_name(name), "entity": "player", "entity_key": str(pid)}
+                for pid, name in players
+            ] + [
+                {"normalized": normalize_name(name), "entity": "team", "entity_key": abbr}
+                for abbr, name in teams
+            ]
+
+            conn.execute(text(f"DROP TABLE IF EXISTS {NAME_INDEX_TABLE}"))
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE {NAME_INDEX_TABLE} USING fts5("
+                "normalized, entity UNINDEXED, entity_key UNINDEXED, tokenize='trigram')"
+            ))
+            if rows:
+                conn.execute(
+                    text(
+                        f"INSERT INTO {NAME_INDEX_TABLE} (normalized, entity, entity_key) "
+                        "VALUES (:normalized, :entity, :entity_key)"
+                    ),
+                    rows,
+                )
+
+        logger.info(f"Name index built: {len(players)} players, {len(teams)} teams")
+        return len(rows)
+
     def get_session(self) -> Session:
         """Get a new database session.
 
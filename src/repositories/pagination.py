@@ -0,0 +1,74 @@
+"""
+FILE: pagination.py
+STATUS: Active
+RESPONSIBILITY: Opaque keyset cursors for (timestamp, id) ordered listings
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import and_, or_
+
+from src.core.exceptions import ValidationError
+
+# Response header carrying the cursor of the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: datetime, row_id: str) -> str:
+    """Encode the position after a row as an opaque cursor.
+
+    Args:
+        sort_value: The row's sort timestamp
+        row_id: The row's ID (tie-breaker for equal timestamps)
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps([sort_value.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        (sort timestamp, row ID)
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(sort_value), str(row_id)
+    except (ValueError, TypeError) as e:
+        raise ValidationError("Invalid pagination cursor", details={"cursor": cursor}) from e
+
+
+def after_cursor(sort_column: Any, id_column: Any, cursor: str) -> Any:
+    """Filter for rows after a cursor in (sort_column DESC, id_column DESC) order.
+
+    With an index on (sort_column, id_column) this is a range seek, so every
+    page costs the same however deep it is.
+
+    Args:
+        sort_column: Timestamp column
+        id_column: ID column
+        cursor: Cursor of the last row of the previous page
+
+    Returns:
+        SQLAlchemy filter expression
+    """
+    sort_value, row_id = decode_cursor(cursor)
+    return or_(
+        sort_column < sort_value,
+        and_(sort_column == sort_value, id_column < row_id),
+    )
@@ -0,0 +1,176 @@
+"""
+FILE: sqlite_pool.py
+STATUS: Active
+RESPONSIBILITY: Tuned read-only SQLite connection pool for the static NBA stats database
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import logging
+import sqlite3
+import threading
+import weakref
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy.pool import SingletonThreadPool
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledConnection(sqlite3.Connection):
+    """sqlite3 connection that can be weakly referenced (the base class can't)."""
+
+
+class ReadOnlySQLitePool:
+    """Per-thread pool of read-only, immutable SQLite connections.
+
+    nba_stats.db is only written by the ingestion scripts, never at runtime,
+    so connections are opened with ``mode=ro&immutable=1`` (no file locking
+    or change detection), memory-mapped, with a large page cache and
+    ``query_only`` as a second guard against writes. Each thread reuses one
+    connection, and sqlite3's per-connection statement cache keeps prepared
+    statements across queries.
+
+    NOTE: Because of ``immutable=1``, restart the API after re-running
+    scripts/load_excel_to_db.py.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        mmap_size: int | None = None,
+        cache_size_kb: int | None = None,
+        cached_statements: int | None = None,
+    ):
+        """Initialize pool (connections are opened lazily per thread).
+
+        Args:
+            db_path: Path to SQLite database
+            mmap_size: Bytes to memory-map (default from settings)
+            cache_size_kb: Page cache size in KiB (default from settings)
+            cached_statements: Prepared statements cached per connection (default from settings)
+        """
+        self.db_path = Path(db_path)
+        self._mmap_size = mmap_size if mmap_size is not None else settings.sqlite_mmap_size
+        self._cache_size_kb = cache_size_kb if cache_size_kb is not None else settings.sqlite_cache_size_kb
+        self._cached_statements = (
+            cached_statements if cached_statements is not None else settings.sqlite_cached_statements
+        )
+        self._local = threading.local()
+        # Weak: connections SingletonThreadPool discards (more threads than its
+        # pool_size) drop out once unreferenced instead of accumulating here
+        self._connections: weakref.WeakSet[sqlite3.Connection] = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    @property
+    def uri(self) -> str:
+        """SQLite URI opening the database read-only and immutable."""
+        return f"{self.db_path.resolve().as_uri()}?mode=ro&immutable=1"
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a new tuned read-only connection.
+
+        Also used as the SQLAlchemy ``creator`` so the LangChain engine gets
+        the same tuning.
+
+        Returns:
+            Configured sqlite3 connection
+
+        Raises:
+            sqlite3.OperationalError: If the database file doesn't exist
+        """
+        conn = sqlite3.connect(
+            self.uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=self._cached_statements,
+            factory=_PooledConnection,
+        )
+        conn.execute(f"PRAGMA mmap_size = {int(self._mmap_size)}")
+        # Negative cache_size is in KiB rather than pages
+        conn.execute(f"PRAGMA cache_size = {-int(self._cache_size_kb)}")
+        conn.execute("PRAGMA query_only = ON")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        with self._lock:
+            self._connections.add(conn)
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """Get this thread's pooled connection (opened on first use).
+
+        Returns:
+            Thread-local sqlite3 connection
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self.connect()
+            self._local.conn = conn
+        return conn
+
+    def execute(self, sql: str, params: tuple[Any, ...] = ()) -> list[tuple]:
+        """Execute a read query on this thread's connection.
+
+        Args:
+            sql: SQL query
+            params: Query parameters
+
+        Returns:
+            All result rows as tuples
+        """
+        cursor = self.connection().execute(sql, params)
+        try:
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    @property
+    def engine_args(self) -> dict[str, Any]:
+        """Engine arguments for ``SQLDatabase.from_uri(..., engine_args=...)``."""
+        return {"creator": self.connect, "poolclass": SingletonThreadPool}
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        with self._lock:
+            connections, self._connections = list(self._connections), weakref.WeakSet()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+
+_pools: dict[Path, ReadOnlySQLitePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_read_only_pool(db_path: str | Path) -> ReadOnlySQLitePool:
+    """Get the shared read-only pool for a database file.
+
+    Args:
+        db_path: Path to SQLite database
+
+    Returns:
+        Process-wide ReadOnlySQLitePool for that path
+    """
+    key = Path(db_path).resolve()
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = ReadOnlySQLitePool(key)
+                _pools[key] = pool
+    return pool
+
+
+def close_all_pools() -> None:
+    """Close every registered pool (used on shutdown and in tests)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -2,12 +2,15 @@
 FILE: vector_store.py
 STATUS: Active
 RESPONSIBILITY: FAISS vector store data access layer for index CRUD operations
-LAST MAJOR UPDATE: 2026-02-10
+LAST MAJOR UPDATE: 2026-10-18
 MAINTAINER: Shahu
 """
 
 import logging
 import pickle
+import shutil
+import time
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -16,7 +19,9 @@ import numpy as np
 
 from src.core.config import settings
 from src.core.exceptions import IndexNotFoundError, SearchError
+from src.core.metrics import VECTOR_SEARCH_SECONDS
 from src.models.document import DocumentChunk
+from src.repositories.chunk_store import ChunkStore
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +40,11 @@ class VectorStoreRepository:
     Handles FAISS index and document chunk storage with proper
     separation from business logic.
 
+    With ``mmap`` (settings.vector_store_mmap) the index is memory-mapped
+    read-only and chunks are served from a columnar ChunkStore next to the
+    pickle, so API worker processes share the data through the page cache
+    instead of each holding a private copy.
+
     Attributes:
         index: FAISS index for similarity search
         chunks: List of document chunks with metadata
@@ -44,17 +54,21 @@ class VectorStoreRepository:
         self,
         index_path: Path | None = None,
         chunks_path: Path | None = None,
+        mmap: bool | None = None,
     ):
         """Initialize repository.
 
         Args:
             index_path: Path to FAISS index file (default from settings)
             chunks_path: Path to chunks pickle file (default from settings)
+            mmap: Memory-map index and chunks on load (default settings.vector_store_mmap)
         """
         self._index_path = index_path or settings.faiss_index_path
         self._chunks_path = chunks_path or settings.document_chunks_path
+        self._columns_path = self._chunks_path.with_suffix(".columns")
+        self._mmap = settings.vector_store_mmap if mmap is None else mmap
         self._index: faiss.Index | None = None
-        self._chunks: list[DocumentChunk] = []
+        self._chunks: Sequence[DocumentChunk] = []
         self._is_loaded = False
 
     @property
@@ -72,7 +86,7 @@ class VectorStoreRepository:
     @property
     def chunks(self) -> list[DocumentChunk]:
         """Get document chunks (read-only copy)."""
-        return self._chunks.copy()
+        return list(self._chunks)
 
     def load(self) -> bool:
         """Load index and chunks from disk.
@@ -90,21 +104,16 @@ class VectorStoreRepository:
 
         try:
             logger.info("Loading FAISS index from %s", self._index_path)
-            self._index = faiss.read_index(str(self._index_path))
-
-            logger.info("Loading chunks from %s", self._chunks_path)
-            with open(self._chunks_path, "rb") as f:
-                raw_chunks = pickle.load(f)
-
-            # Convert to DocumentChunk models
-            self._chunks = [
-                DocumentChunk(
-                    id=chunk.get("id", f"chunk_{i}"),
-                    text=chunk.get("text", ""),
-                    metadata=chunk.get("metadata", {}),
+            self._index = self._read_index()
+
+            if self._mmap:
+                logger.info("Mapping chunks from %s", self._columns_path)
+                self._chunks = ChunkStore.open_current(
+                    self._columns_path, self._chunks_path, self._read_chunks
                 )
-                for i, chunk in enumerate(raw_chunks)
-            ]
+            else:
+                logger.info("Loading chunks from %s", self._chunks_path)
+                self._chunks = self._read_chunks()
 
             self._is_loaded = True
             logger.info(
@@ -121,6 +130,33 @@ class VectorStoreRepository:
             self._is_loaded = False
             return False
 
+    def _read_index(self) -> faiss.Index:
+        """Read the FAISS index, memory-mapped read-only when enabled."""
+        if self._mmap:
+            try:
+                return faiss.read_index(
+                    str(self._index_path), faiss.IO_FLAG_MMAP_IFC | faiss.IO_FLAG_READ_ONLY
+                )
+            except (AttributeError, RuntimeError) as e:
+                # Older faiss builds, or index types that can't be mapped
+                logger.warning("Memory-mapped index load failed (%s), reading into memory", e)
+        return faiss.read_index(str(self._index_path))
+
+    def _read_chunks(self) -> list[DocumentChunk]:
+        """Read chunks from the pickle file."""
+        with open(self._chunks_path, "rb") as f:
+            raw_chunks = pickle.load(f)
+
+        # Convert to DocumentChunk models
+        return [
+            DocumentChunk(
+                id=chunk.get("id", f"chunk_{i}"),
+                text=chunk.get("text", ""),
+                metadata=chunk.get("metadata", {}),
+            )
+            for i, chunk in enumerate(raw_chunks)
+        ]
+
     def save(self) -> None:
         """Save index and chunks to disk.
 
@@ -142,6 +178,7 @@ class VectorStoreRepository:
         raw_chunks = [{"id": c.id, "text": c.text, "metadata": c.metadata} for c in self._chunks]
         with open(self._chunks_path, "wb") as f:
             pickle.dump(raw_chunks, f)
+        ChunkStore.write(self._columns_path, self._chunks, source=self._chunks_path)
 
         logger.info("Index and chunks saved successfully")
 
@@ -286,6 +323,7 @@ class VectorStoreRepository:
         if not self.is_loaded:
             raise IndexNotFoundError()
 
+        start = time.perf_counter()
         try:
             # Normalize query
             query_embedding = query_embedding.astype("float32")
@@ -450,6 +488,10 @@ class VectorStoreRepository:
         except Exception as e:
             logger.error("Search failed: %s", e)
             raise SearchError(f"Search failed: {e}") from e
+        finally:
+            VECTOR_SEARCH_SECONDS.observe(
+                time.perf_counter() - start, filtered="true" if metadata_filters else "false"
+            )
 
     def clear(self) -> None:
         """Clear index and chunks from memory."""
@@ -468,4 +510,8 @@ class VectorStoreRepository:
             self._chunks_path.unlink()
             logger.info("Deleted %s", self._chunks_path)
 
+        if self._columns_path.exists():
+            shutil.rmtree(self._columns_path)
+            logger.info("Deleted %s", self._columns_path)
+
         self.clear()
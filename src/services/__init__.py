@@ -1,7 +1,17 @@
-"""Service layer containing business logic."""
+"""Service layer containing business logic.
 
-from src.services.chat import ChatService
-from src.services.embedding import EmbeddingService
-from src.services.feedback import FeedbackService, get_feedback_service
+Exports are resolved on first access, so importing one service module doesn't
+import the others (or their SDKs).
+"""
 
-__all__ = ["ChatService", "EmbeddingService", "FeedbackService", "get_feedback_service"]
+from src.core.lazy import lazy_exports
+
+_EXPORTS = {
+    "ChatService": "src.services.chat",
+    "EmbeddingService": "src.services.embedding",
+    "FeedbackService": "src.services.feedback",
+    "get_feedback_service": "src.services.feedback",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
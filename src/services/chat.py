@@ -6,9 +6,12 @@ LAST MAJOR UPDATE: 2026-02-14 (Migrated to ReAct architecture)
 MAINTAINER: Shahu
 """
 
+import asyncio
 import logging
 import threading
 import time
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, nullcontext
 from typing import Any, Callable, Optional, TypeVar
 
 # LAZY IMPORTS: Heavy modules are imported on-demand
@@ -18,6 +21,7 @@ ClientError = None
 EmbeddingService = None
 VisualizationService = None
 NBAGSQLTool = None
+SQLMemoCache = None
 ReActAgent = None
 NBAToolkit = None
 create_nba_tools = None
@@ -26,7 +30,7 @@ create_nba_tools = None
 def _initialize_lazy_imports():
     """Initialize all heavy imports on first use."""
     global _lazy_imports_initialized, genai, ClientError, EmbeddingService
-    global VisualizationService, NBAGSQLTool, ReActAgent, NBAToolkit, create_nba_tools
+    global VisualizationService, NBAGSQLTool, SQLMemoCache, ReActAgent, NBAToolkit, create_nba_tools
 
     if _lazy_imports_initialized:
         return
@@ -38,6 +42,7 @@ def _initialize_lazy_imports():
     from src.services.visualization import (
         VisualizationService as VisualizationServiceModule,
     )
+    from src.tools.sql_memo import SQLMemoCache as SQLMemoCacheModule
     from src.tools.sql_tool import NBAGSQLTool as NBAGSQLToolModule
     from src.agents.react_agent import ReActAgent as ReActAgentModule
     from src.agents.tools import NBAToolkit as NBAToolkitModule
@@ -48,6 +53,7 @@ def _initialize_lazy_imports():
     EmbeddingService = EmbeddingServiceModule
     VisualizationService = VisualizationServiceModule
     NBAGSQLTool = NBAGSQLToolModule
+    SQLMemoCache = SQLMemoCacheModule
     ReActAgent = ReActAgentModule
     NBAToolkit = NBAToolkitModule
     create_nba_tools = create_nba_tools_module
@@ -63,11 +69,20 @@ from src.models.chat import ChatRequest, ChatResponse, SearchResult, Visualizati
 from src.models.feedback import ChatInteractionCreate
 from src.repositories.feedback import FeedbackRepository
 from src.repositories.vector_store import VectorStoreRepository
+from src.services.history_buffer import ConversationHistoryBuffer
+from src.services.interaction_writer import InteractionWriter
+from src.services.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Synthetic question used by warm_up() (classified by heuristics, no LLM call)
+WARM_UP_QUERY = "Who scored the most points this season?"
+
+# Warm-up steps a worker can't answer without: if one fails the worker is degraded
+ESSENTIAL_WARM_UP_STEPS = ("agent", "sql")
+
 
 def retry_with_exponential_backoff(
     func: Callable[[], T],
@@ -170,6 +185,20 @@ class ChatService:
         # ReAct agent (lazy)
         self._agent: Optional[Any] = None
 
+        # Lazy components are built at most once, even by concurrent first requests
+        self._init_lock = threading.RLock()
+        self._warm = threading.Event()
+        self.warm_up_report: dict[str, str] = {}
+
+        # Identical in-flight requests share one agent run
+        self._single_flight = SingleFlight()
+
+        # Recent turns per conversation (context without a DB round trip)
+        self._history = ConversationHistoryBuffer()
+
+        # Interactions are persisted by one background writer in batches
+        self.interaction_writer = InteractionWriter(self.feedback_repo)
+
         logger.info(f"ChatService initialized (ReAct mode, SQL={enable_sql})")
 
     def ensure_ready(self) -> None:
@@ -185,7 +214,9 @@ class ChatService:
     def client(self) -> Any:
         """Lazy initialize Google Generative AI client."""
         if self._client is None:
-            self._client = genai.Client(api_key=self._api_key)
+            with self._init_lock:
+                if self._client is None:
+                    self._client = genai.Client(api_key=self._api_key)
         return self._client
 
     @property
@@ -197,85 +228,289 @@ class ChatService:
         """
         return self.vector_store.is_loaded
 
+    @property
+    def is_warm(self) -> bool:
+        """Whether warm-up has finished (always True when warm-up is disabled)."""
+        return self._warm.is_set() or not settings.warm_up_enabled
+
+    @property
+    def is_degraded(self) -> bool:
+        """Whether warm-up failed an essential step (agent or SQL database)."""
+        return any(
+            self.warm_up_report.get(step, "").startswith("failed")
+            for step in ESSENTIAL_WARM_UP_STEPS
+        )
+
     @property
     def embedding_service(self) -> Any:
         """Lazy initialize embedding service."""
         if self._embedding_service is None:
-            self._embedding_service = EmbeddingService()
+            with self._init_lock:
+                if self._embedding_service is None:
+                    self._embedding_service = EmbeddingService()
         return self._embedding_service
 
     @property
     def sql_tool(self) -> Any:
         """Lazy initialize SQL tool."""
         if self._sql_tool is None:
-            self._sql_tool = NBAGSQLTool()
+            with self._init_lock:
+                if self._sql_tool is None:
+                    sql_memo = None
+                    if settings.sql_memo_enabled:
+                        # Resolve embedding service at call time so building the memo stays cheap
+                        sql_memo = SQLMemoCache(
+                            embed_fn=lambda texts: self.embedding_service.embed_batch(texts)
+                        )
+                        sql_memo.load()
+                    self._sql_tool = NBAGSQLTool(sql_memo=sql_memo)
         return self._sql_tool
 
     @property
     def visualization_service(self) -> Any:
         """Lazy initialize visualization service."""
         if self._visualization_service is None:
-            self._visualization_service = VisualizationService()
+            with self._init_lock:
+                if self._visualization_service is None:
+                    self._visualization_service = VisualizationService()
         return self._visualization_service
 
     @property
     def agent(self) -> Any:
         """Lazy initialize ReAct agent with tools (cached)."""
         if self._agent is None:
-            # Create toolkit with service dependencies
-            toolkit = NBAToolkit(
-                sql_tool=self.sql_tool,
-                vector_store=self.vector_store,
-                embedding_service=self.embedding_service,
-                visualization_service=self.visualization_service,
-            )
+            with self._init_lock:
+                if self._agent is None:
+                    # Create toolkit with service dependencies
+                    toolkit = NBAToolkit(
+                        sql_tool=self.sql_tool,
+                        vector_store=self.vector_store,
+                        embedding_service=self.embedding_service,
+                        visualization_service=self.visualization_service,
+                    )
 
-            # Create tools
-            tools = create_nba_tools(toolkit)
+                    # Create tools
+                    tools = create_nba_tools(toolkit)
 
-            # Initialize agent (simplified - always calls both tools)
-            self._agent = ReActAgent(
-                tools=tools,
-                llm_client=self.client,
-                model=self.model,
-                temperature=self._temperature,
-            )
+                    # Initialize agent (simplified - always calls both tools)
+                    self._agent = ReActAgent(
+                        tools=tools,
+                        llm_client=self.client,
+                        model=self.model,
+                        temperature=self._temperature,
+                    )
 
-            logger.info("ReAct agent initialized with 3 tools (cached)")
+                    logger.info("ReAct agent initialized with 3 tools (cached)")
 
         return self._agent
 
-    def _build_conversation_context(
-        self, conversation_id: str, turn_number: int
-    ) -> str:
-        """Build conversation history for context."""
-        if turn_number <= 1:
-            return ""
+    def warm_up(self) -> dict[str, str]:
+        """Build every lazy component and exercise each pipeline stage once.
 
+        Steps: agent (SQL tool, embeddings, visualization, classifier),
+        a heuristic classification, a one-result search (embedding client and
+        FAISS/BM25), an SQL dry run and a chart build. A failing step is logged
+        and reported but doesn't stop the others; is_warm is set when all have
+        run, whatever their outcome. A failed agent or SQL step leaves the
+        service degraded (is_degraded), which /ready reports as not ready.
+
+        Returns:
+            Step name -> "ok (<ms>)", "skipped: <reason>" or "failed: <error>"
+        """
+        steps: list[tuple[str, Callable[[], Any]]] = [
+            ("agent", lambda: self.agent),
+            ("classification", lambda: self.agent.classifier.classify(WARM_UP_QUERY)),
+            ("search", lambda: self.search(WARM_UP_QUERY, k=1)),
+            # run(), not run_no_throw(): a broken stats DB must fail the step
+            ("sql", lambda: self.sql_tool.db.run("SELECT COUNT(*) FROM sqlite_master")),
+            (
+                "visualization",
+                lambda: self.visualization_service.generate_chart(
+                    "horizontal_bar", [{"name": "Warm-up", "pts": 1}], "Warm-up"
+                ),
+            ),
+        ]
+
+        report: dict[str, str] = {}
+        started = time.perf_counter()
         try:
-            # Get all messages in conversation
-            interactions = self.feedback_repo.get_messages_by_conversation(
-                conversation_id
+            for name, step in steps:
+                if name == "search" and not self.vector_store.is_loaded:
+                    report[name] = "skipped: vector index not loaded"
+                    continue
+                step_start = time.perf_counter()
+                try:
+                    step()
+                    report[name] = f"ok ({(time.perf_counter() - step_start) * 1000:.0f}ms)"
+                except Exception as e:
+                    logger.warning(f"Warm-up step '{name}' failed: {type(e).__name__}: {e}")
+                    report[name] = f"failed: {type(e).__name__}: {e}"
+        finally:
+            self.warm_up_report = report
+            self._warm.set()
+
+        logger.info(f"Warm-up finished in {(time.perf_counter() - started) * 1000:.0f}ms: {report}")
+        return report
+
+    def start_warm_up(self) -> threading.Thread:
+        """Run warm_up() in a background daemon thread.
+
+        Returns:
+            The started thread
+        """
+        thread = threading.Thread(target=self.warm_up, name="chat-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def _to_search_results(hits: list[tuple[Any, float]]) -> list[SearchResult]:
+        """Format vector store hits as SearchResult models.
+
+        Args:
+            hits: (chunk, score) tuples from VectorStoreRepository.search()
+
+        Returns:
+            SearchResult list
+        """
+        return [
+            SearchResult(
+                text=chunk.text,
+                score=min(float(score), 100.0),
+                source=chunk.source,
+                metadata=dict(chunk.metadata),
             )
+            for chunk, score in hits
+        ]
+
+    def _prepare_search(self, query: str, k: int, min_score: float | None) -> str:
+        """Validate a retrieval-only request and return the sanitized query."""
+        validate_search_params(k=k, min_score=min_score)
+        self.ensure_ready()
+        return sanitize_query(query)
+
+    def search(self, query: str, k: int = 5, min_score: float | None = None) -> list[SearchResult]:
+        """Retrieval-only search: cached embedding + hybrid vector search.
+
+        No classifier, SQL agent or LLM answer step is involved.
+
+        Args:
+            query: Search query
+            k: Number of results to return
+            min_score: Minimum similarity score (0-1)
+
+        Returns:
+            Matching chunks with scores, best first
+
+        Raises:
+            ValidationError: If k or min_score is invalid
+            IndexNotFoundError: If vector store is not loaded
+            EmbeddingError: If query embedding fails
+        """
+        query = self._prepare_search(query, k, min_score)
+        embedding = self.embedding_service.embed_query(query)
+        hits = self.vector_store.search(
+            query_embedding=embedding, k=k, min_score=min_score, query_text=query
+        )
+        return self._to_search_results(hits)
+
+    async def asearch(self, query: str, k: int = 5, min_score: float | None = None) -> list[SearchResult]:
+        """Async variant of search() for the /search endpoint.
 
-            if not interactions:
-                return ""
+        The embedding call is awaited (or served from the LRU cache); the
+        FAISS/BM25 search is CPU-bound and runs in a worker thread so it
+        doesn't block the event loop.
 
-            # Get last 5 turns (or turn_number-1, whichever is smaller)
-            history_turns = min(5, turn_number - 1)
-            recent_interactions = interactions[-history_turns:] if len(interactions) > history_turns else interactions
+        Args:
+            query: Search query
+            k: Number of results to return
+            min_score: Minimum similarity score (0-1)
+
+        Returns:
+            Matching chunks with scores, best first
 
-            # Format as Q&A pairs
-            history_lines = []
-            for interaction in recent_interactions:
-                history_lines.append(f"User: {interaction.query}")
-                history_lines.append(f"Assistant: {interaction.response}")
+        Raises:
+            ValidationError: If k or min_score is invalid
+            IndexNotFoundError: If vector store is not loaded
+            EmbeddingError: If query embedding fails
+        """
+        query = self._prepare_search(query, k, min_score)
+        embedding = await self.embedding_service.aembed_query(query)
+        hits = await asyncio.to_thread(
+            self.vector_store.search,
+            query_embedding=embedding,
+            k=k,
+            min_score=min_score,
+            query_text=query,
+        )
+        return self._to_search_results(hits)
+
+    def _recent_turns(self, conversation_id: str, turn_number: int) -> list[tuple[str, str]]:
+        """Get the (query, response) pairs preceding a turn.
+
+        Reads the in-memory history buffer first; on a miss, loads only the
+        needed turns from the database (LIMITed, indexed query) and seeds
+        the buffer with them.
+
+        Args:
+            conversation_id: Conversation ID
+            turn_number: Turn being answered
 
-            return "\n".join(history_lines)
+        Returns:
+            Up to 5 previous turns, oldest first (empty on error)
+        """
+        # Get last 5 turns (or turn_number-1, whichever is smaller)
+        count = min(5, turn_number - 1)
+        cached = self._history.recent(conversation_id, turn_number, count)
+        if cached is not None:
+            return cached
 
+        try:
+            rows = self.feedback_repo.get_recent_turns(conversation_id, turn_number, count)
         except Exception as e:
             logger.error(f"Error building conversation context: {e}")
+            return []
+        self._history.seed(conversation_id, rows)
+        return [(query, response) for _, query, response in rows]
+
+    @staticmethod
+    def _format_history(turns: list[tuple[str, str]]) -> str:
+        """Format (query, response) pairs as a User/Assistant transcript."""
+        history_lines = []
+        for query, response in turns:
+            history_lines.append(f"User: {query}")
+            history_lines.append(f"Assistant: {response}")
+
+        return "\n".join(history_lines)
+
+    def _build_conversation_context(
+        self, conversation_id: str, turn_number: int
+    ) -> str:
+        """Build conversation history for context."""
+        if turn_number <= 1:
             return ""
+        return self._format_history(self._recent_turns(conversation_id, turn_number))
+
+    @staticmethod
+    def _to_interaction(
+        query: str,
+        response: str,
+        conversation_id: Optional[str],
+        turn_number: int,
+        processing_time_ms: float,
+        sources: list[SearchResult],
+    ) -> ChatInteractionCreate:
+        """Build the interaction record stored for a chat response."""
+        # Convert sources to list of strings for storage
+        source_strings = [s.source if hasattr(s, 'source') else str(s) for s in sources]
+
+        return ChatInteractionCreate(
+            query=query,
+            response=response,
+            sources=source_strings,
+            processing_time_ms=int(processing_time_ms),
+            conversation_id=conversation_id,
+            turn_number=turn_number,
+        )
 
     def _save_interaction(
         self,
@@ -294,19 +529,10 @@ class ChatService:
             return
 
         try:
-            # Convert sources to list of strings for storage
-            source_strings = [s.source if hasattr(s, 'source') else str(s) for s in sources]
-
-            interaction = ChatInteractionCreate(
-                query=query,  # Fixed: was user_query
-                response=response,  # Fixed: was assistant_response
-                sources=source_strings,  # Fixed: was sources_used (and now list of strings)
-                processing_time_ms=int(processing_time_ms),
-                conversation_id=conversation_id,
-                turn_number=turn_number,
+            interaction = self._to_interaction(
+                query, response, conversation_id, turn_number, processing_time_ms, sources
             )
-
-            self.feedback_repo.save_interaction(interaction)  # Fixed: was create_interaction
+            self.feedback_repo.save_interaction(interaction)
             logger.debug(f"Interaction saved for conversation {conversation_id}, turn {turn_number}")
 
         except Exception as e:
@@ -325,45 +551,40 @@ class ChatService:
         sources: list[SearchResult],
         generated_sql: Optional[str] = None,
     ):
-        """Schedule async DB save (non-blocking, fire-and-forget)."""
-        def _save_in_thread():
-            """Background thread for DB save."""
-            try:
-                self._save_interaction(
-                    query=query,
-                    response=response,
-                    conversation_id=conversation_id,
-                    turn_number=turn_number,
-                    processing_time_ms=processing_time_ms,
-                    query_type=query_type,
-                    sources=sources,
-                    generated_sql=generated_sql,
-                )
-            except Exception as e:
-                # Use logger.exception to get full traceback for debugging
-                # Note: Background threads are fire-and-forget by design
-                logger.exception(f"Background DB save failed: {e}")
+        """Queue the interaction for the background writer (non-blocking)."""
+        if not conversation_id:
+            logger.debug("No conversation_id provided, skipping interaction save")
+            return
 
-        # Start background thread (don't wait for completion)
-        thread = threading.Thread(target=_save_in_thread, daemon=True)
-        thread.start()
+        self.interaction_writer.submit(
+            self._to_interaction(
+                query, response, conversation_id, turn_number, processing_time_ms, sources
+            )
+        )
 
-    def chat(self, request: ChatRequest) -> ChatResponse:
-        """Process chat request with ReAct agent.
+    def forget_conversation(self, conversation_id: str) -> None:
+        """Drop a conversation's buffered turns (after it is archived or deleted).
 
         Args:
-            request: Chat request with query and parameters
+            conversation_id: Conversation ID
+        """
+        self._history.forget(conversation_id)
 
-        Returns:
-            Chat response with answer, reasoning trace, and tools used
+    def close(self) -> None:
+        """Flush queued interactions and unsaved SQL memo entries, and stop the background writer."""
+        self.interaction_writer.close()
+        if self._sql_tool is not None and self._sql_tool.sql_memo is not None:
+            self._sql_tool.sql_memo.close()
 
-        Raises:
-            ValidationError: If request is invalid
-            IndexNotFoundError: If index not loaded
-            LLMError: If LLM call fails
-        """
-        start_time = time.time()
+    def _prepare_chat(self, request: ChatRequest) -> tuple[str, str]:
+        """Sanitize the query and build the conversation history for a chat request.
 
+        Args:
+            request: Chat request
+
+        Returns:
+            (sanitized query, conversation history)
+        """
         # Sanitize query (security: XSS, injection prevention)
         query = sanitize_query(request.query)
 
@@ -377,6 +598,142 @@ class ChatService:
                 logger.info(
                     f"Including conversation history ({request.turn_number - 1} previous turns)"
                 )
+        return query, conversation_history
+
+    def _build_chat_response(
+        self, request: ChatRequest, query: str, result: dict[str, Any], start_time: float
+    ) -> ChatResponse:
+        """Build the ChatResponse from an agent result and schedule the interaction save.
+
+        Args:
+            request: Original chat request
+            query: Sanitized query
+            result: ReActAgent.run()/arun() result
+            start_time: time.time() when the request started
+
+        Returns:
+            Chat response with answer, sources, SQL and visualization
+        """
+        # Calculate processing time
+        processing_time_ms = (time.time() - start_time) * 1000
+
+        # Extract results directly from structured tool_results (no string parsing!)
+        tool_results = result.get("tool_results", {})
+
+        # Extract SQL results (both query and data)
+        sql_result = tool_results.get("query_nba_database", {})
+        generated_sql = sql_result.get("sql", "")
+        sql_results = sql_result.get("results")  # Actual SQL data rows
+
+        # Extract vector search results
+        vector_result = tool_results.get("search_knowledge_base", {})
+        vector_sources = vector_result.get("results", [])
+
+        # Convert vector sources to SearchResult objects
+        sources = []
+        if vector_sources:
+            for src in vector_sources:
+                sources.append(SearchResult(
+                    text=src.get("text", ""),
+                    score=src.get("score", 0.0),
+                    source=src.get("source", "unknown"),
+                    metadata=src.get("metadata", {})
+                ))
+
+        # Extract visualization directly
+        viz_result = tool_results.get("create_visualization", {})
+        visualization = None
+        if viz_result and viz_result.get("plotly_json"):
+            visualization = Visualization(
+                pattern="agent_generated",
+                viz_type=viz_result.get("chart_type", "unknown"),
+                plot_json=viz_result["plotly_json"],
+                figure_id=viz_result.get("figure_id"),
+            )
+
+        # Build response
+        response = ChatResponse(
+            answer=result["answer"],
+            query=query,
+            sources=sources,  # Vector search sources from agent
+            processing_time_ms=processing_time_ms,
+            model=self.model,
+            conversation_id=request.conversation_id,
+            turn_number=request.turn_number,
+            generated_sql=generated_sql,
+            sql_results=sql_results,  # SQL data rows from agent
+            visualization=visualization,
+            query_type="agent",
+            reasoning_trace=result.get("reasoning_trace", []),
+            tools_used=result.get("tools_used", []),
+        )
+
+        # Save interaction asynchronously (non-blocking); the history buffer
+        # has the turn immediately, so the next turn doesn't race the save
+        if request.conversation_id:
+            self._history.record(
+                request.conversation_id, request.turn_number, query, result["answer"]
+            )
+            self._save_interaction_async(
+                query=query,
+                response=result["answer"],
+                conversation_id=request.conversation_id,
+                turn_number=request.turn_number,
+                processing_time_ms=processing_time_ms,
+                query_type="agent",
+                sources=sources,  # Actual vector sources
+                generated_sql=generated_sql,
+            )
+
+        logger.info(
+            f"Agent completed in {processing_time_ms:.0f}ms "
+            f"({result.get('total_steps', 0)} steps, "
+            f"tools: {', '.join(result.get('tools_used', []))})"
+        )
+
+        return response
+
+    @staticmethod
+    def _flight_key(request: ChatRequest) -> tuple:
+        """Single-flight key for a chat request.
+
+        Context-free requests with the same normalized question coalesce.
+        Conversation requests are keyed by conversation and turn too, so only
+        duplicates of the same turn (e.g. client retries) share a run.
+        """
+        question = " ".join(request.query.lower().split())
+        return (
+            question,
+            request.k,
+            request.min_score,
+            request.conversation_id,
+            request.turn_number if request.conversation_id else None,
+        )
+
+    def chat(self, request: ChatRequest) -> ChatResponse:
+        """Process chat request with ReAct agent.
+
+        Concurrent identical requests (see _flight_key) share one agent run.
+
+        Args:
+            request: Chat request with query and parameters
+
+        Returns:
+            Chat response with answer, reasoning trace, and tools used
+
+        Raises:
+            ValidationError: If request is invalid
+            IndexNotFoundError: If index not loaded
+            LLMError: If LLM call fails
+        """
+        if not settings.chat_single_flight:
+            return self._run_chat(request)
+        return self._single_flight.do(self._flight_key(request), lambda: self._run_chat(request))
+
+    def _run_chat(self, request: ChatRequest) -> ChatResponse:
+        """Run the agent pipeline for one chat request (no coalescing)."""
+        start_time = time.time()
+        query, conversation_history = self._prepare_chat(request)
 
         # Run ReAct agent (cached instance)
         logger.info(f"Running ReAct agent for query: '{query[:100]}'")
@@ -386,82 +743,107 @@ class ChatService:
             result = agent.run(
                 question=query, conversation_history=conversation_history
             )
+            return self._build_chat_response(request, query, result, start_time)
 
-            # Calculate processing time
-            processing_time_ms = (time.time() - start_time) * 1000
-
-            # Extract results directly from structured tool_results (no string parsing!)
-            tool_results = result.get("tool_results", {})
-
-            # Extract SQL results (both query and data)
-            sql_result = tool_results.get("query_nba_database", {})
-            generated_sql = sql_result.get("sql", "")
-            sql_results = sql_result.get("results")  # Actual SQL data rows
-
-            # Extract vector search results
-            vector_result = tool_results.get("search_knowledge_base", {})
-            vector_sources = vector_result.get("results", [])
-
-            # Convert vector sources to SearchResult objects
-            sources = []
-            if vector_sources:
-                for src in vector_sources:
-                    sources.append(SearchResult(
-                        text=src.get("text", ""),
-                        score=src.get("score", 0.0),
-                        source=src.get("source", "unknown"),
-                        metadata=src.get("metadata", {})
-                    ))
-
-            # Extract visualization directly
-            viz_result = tool_results.get("create_visualization", {})
-            visualization = None
-            if viz_result and viz_result.get("plotly_json"):
-                visualization = Visualization(
-                    pattern="agent_generated",
-                    viz_type=viz_result.get("chart_type", "unknown"),
-                    plot_json=viz_result["plotly_json"],
-                    plot_html=viz_result.get("plotly_html", ""),
-                )
+        except Exception as e:
+            logger.error(f"Agent execution failed: {e}", exc_info=True)
+            raise LLMError(f"Agent failed: {str(e)}") from e
 
-            # Build response
-            response = ChatResponse(
-                answer=result["answer"],
-                query=query,
-                sources=sources,  # Vector search sources from agent
-                processing_time_ms=processing_time_ms,
-                model=self.model,
-                conversation_id=request.conversation_id,
-                turn_number=request.turn_number,
-                generated_sql=generated_sql,
-                sql_results=sql_results,  # SQL data rows from agent
-                visualization=visualization,
-                query_type="agent",
-                reasoning_trace=result.get("reasoning_trace", []),
-                tools_used=result.get("tools_used", []),
-            )
+    async def achat(self, request: ChatRequest) -> ChatResponse:
+        """Async variant of chat() for the /chat endpoint.
 
-            # Save interaction asynchronously (non-blocking)
-            if request.conversation_id:
-                self._save_interaction_async(
-                    query=query,
-                    response=result["answer"],
-                    conversation_id=request.conversation_id,
-                    turn_number=request.turn_number,
-                    processing_time_ms=processing_time_ms,
-                    query_type="agent",
-                    sources=sources,  # Actual vector sources
-                    generated_sql=generated_sql,
-                )
+        Runs ReActAgent.arun() on the event loop (LLM calls awaited, blocking
+        tools in worker threads). Conversation history is read in a worker
+        thread since it is a database query. Concurrent identical requests
+        share one agent run.
 
-            logger.info(
-                f"Agent completed in {processing_time_ms:.0f}ms "
-                f"({result.get('total_steps', 0)} steps, "
-                f"tools: {', '.join(result.get('tools_used', []))})"
-            )
+        Args:
+            request: Chat request with query and parameters
 
-            return response
+        Returns:
+            Chat response with answer, reasoning trace, and tools used
+
+        Raises:
+            ValidationError: If request is invalid
+            IndexNotFoundError: If index not loaded
+            LLMError: If LLM call fails
+        """
+        if not settings.chat_single_flight:
+            return await self._arun_chat(request)
+        return await self._single_flight.ado(
+            self._flight_key(request), lambda: self._arun_chat(request)
+        )
+
+    async def _arun_chat(self, request: ChatRequest) -> ChatResponse:
+        """Run the async agent pipeline for one chat request (no coalescing)."""
+        start_time = time.time()
+        query, conversation_history = await asyncio.to_thread(self._prepare_chat, request)
+
+        logger.info(f"Running ReAct agent for query: '{query[:100]}'")
+        agent = self._agent
+        if agent is None:
+            # Building it takes the init lock, which warm-up may hold for seconds
+            agent = await asyncio.to_thread(lambda: self.agent)
+
+        try:
+            result = await agent.arun(
+                question=query, conversation_history=conversation_history
+            )
+            return self._build_chat_response(request, query, result, start_time)
 
         except Exception as e:
             logger.error(f"Agent execution failed: {e}", exc_info=True)
             raise LLMError(f"Agent failed: {str(e)}") from e
+
+    async def achat_batch(
+        self,
+        requests: list[ChatRequest],
+        max_concurrency: int,
+        slot: Callable[[], AbstractAsyncContextManager[Any]] | None = None,
+    ) -> AsyncIterator[tuple[int, ChatResponse | Exception]]:
+        """Run a batch of chat requests concurrently, yielding each as it finishes.
+
+        Requests sharing a conversation_id form a thread and run one after
+        another in batch order; each turn sees the previous turns' answers
+        through the history buffer (the interaction save is fire-and-forget,
+        so the database may not have them yet). All requests share this
+        service's agent, embedding LRU and SQL memo.
+
+        Args:
+            requests: Chat requests
+            max_concurrency: Requests running at once
+            slot: Admission slot held around each request (the same global
+                limit single /chat requests go through); its exception (e.g.
+                RateLimitError when the queue is full) becomes that request's outcome
+
+        Yields:
+            (index in requests, ChatResponse or the exception it raised)
+        """
+        threads: dict[str, list[int]] = {}
+        for index, request in enumerate(requests):
+            threads.setdefault(request.conversation_id or f"#{index}", []).append(index)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        finished: asyncio.Queue[tuple[int, ChatResponse | Exception]] = asyncio.Queue()
+
+        async def run_thread(indices: list[int]) -> None:
+            for index in indices:
+                outcome: ChatResponse | Exception
+                async with semaphore:
+                    try:
+                        async with slot() if slot is not None else nullcontext():
+                            outcome = await self.achat(requests[index])
+                    except Exception as e:
+                        outcome = e
+                await finished.put((index, outcome))
+
+        tasks = [asyncio.create_task(run_thread(indices)) for indices in threads.values()]
+        logger.info(
+            f"Batch of {len(requests)} requests ({len(threads)} threads, concurrency {max_concurrency})"
+        )
+        try:
+            for _ in range(len(requests)):
+                yield await finished.get()
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -68,6 +68,7 @@ class ConversationService:
         status: ConversationStatus | None = None,
         limit: int = 20,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> list[ConversationResponse]:
         """List conversations with pagination and filtering.
 
@@ -75,11 +76,14 @@ class ConversationService:
             status: Filter by status (None = all statuses)
             limit: Maximum number of conversations to return (default: 20)
             offset: Number of conversations to skip (default: 0)
+            cursor: Keyset cursor from the previous page (replaces offset)
 
         Returns:
             List of conversations ordered by updated_at (most recent first)
         """
-        return self.repository.list_conversations(status=status, limit=limit, offset=offset)
+        return self.repository.list_conversations(
+            status=status, limit=limit, offset=offset, cursor=cursor
+        )
 
     def get_conversation_history(self, conversation_id: str) -> ConversationWithMessages | None:
         """Get full conversation history with all messages.
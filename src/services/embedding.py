@@ -2,11 +2,13 @@
 FILE: embedding.py
 STATUS: Active
 RESPONSIBILITY: Mistral AI embedding service for vector generation
-LAST MAJOR UPDATE: 2026-02-06
+LAST MAJOR UPDATE: 2026-10-18
 MAINTAINER: Shahu
 """
 
 import logging
+import threading
+from collections import OrderedDict
 from collections.abc import Sequence
 
 import numpy as np
@@ -15,6 +17,7 @@ from mistralai.models import SDKError
 
 from src.core.config import settings
 from src.core.exceptions import EmbeddingError
+from src.core.metrics import CACHE_REQUESTS, EMBEDDING_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +26,8 @@ class EmbeddingService:
     """Service for generating embeddings via Mistral API.
 
     Handles batching, error recovery, and provides a clean interface
-    for embedding generation.
+    for embedding generation. Query embeddings are kept in an in-process
+    LRU cache so repeated searches skip the API call.
 
     Attributes:
         model: Embedding model name
@@ -35,6 +39,7 @@ class EmbeddingService:
         api_key: str | None = None,
         model: str | None = None,
         batch_size: int | None = None,
+        cache_size: int | None = None,
     ):
         """Initialize embedding service.
 
@@ -42,11 +47,15 @@ class EmbeddingService:
             api_key: Mistral API key (default from settings)
             model: Embedding model name (default from settings)
             batch_size: Batch size for API calls (default from settings)
+            cache_size: Query embeddings kept in the LRU cache, 0 disables (default from settings)
         """
         self._api_key = api_key or settings.mistral_api_key
         self._model = model or settings.embedding_model
         self._batch_size = batch_size or settings.embedding_batch_size
         self._client: Mistral | None = None
+        self._cache_size = cache_size if cache_size is not None else settings.embedding_cache_size
+        self._query_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     @property
     def client(self) -> Mistral:
@@ -86,6 +95,21 @@ class EmbeddingService:
         Returns:
             Embeddings array (n_texts x embedding_dim)
 
+        Raises:
+            EmbeddingError: If embedding generation fails
+        """
+        return self._embed(texts, operation="batch")
+
+    def _embed(self, texts: Sequence[str], operation: str) -> np.ndarray:
+        """Embed texts in API-sized batches.
+
+        Args:
+            texts: Sequence of texts to embed
+            operation: Metrics label for the API calls ("batch" or "query")
+
+        Returns:
+            Embeddings array (n_texts x embedding_dim)
+
         Raises:
             EmbeddingError: If embedding generation fails
         """
@@ -114,10 +138,11 @@ class EmbeddingService:
                     len(batch),
                 )
 
-                response = self.client.embeddings.create(
-                    model=self._model,
-                    inputs=batch,
-                )
+                with EMBEDDING_SECONDS.time(operation=operation):
+                    response = self.client.embeddings.create(
+                        model=self._model,
+                        inputs=batch,
+                    )
 
                 batch_embeddings = [data.embedding for data in response.data]
                 all_embeddings.extend(batch_embeddings)
@@ -148,10 +173,56 @@ class EmbeddingService:
 
         return embeddings_array
 
+    @staticmethod
+    def _cache_key(query: str) -> str:
+        """Cache key for a query (whitespace-normalized)."""
+        return " ".join(query.split())
+
+    def _cache_get(self, key: str) -> np.ndarray | None:
+        """Get a cached query embedding (marks it most recently used)."""
+        with self._cache_lock:
+            embedding = self._query_cache.get(key)
+            if embedding is not None:
+                self._query_cache.move_to_end(key)
+        if self._cache_size > 0:
+            CACHE_REQUESTS.inc(cache="embedding", result="miss" if embedding is None else "hit")
+        return None if embedding is None else embedding.copy()
+
+    def _cache_put(self, key: str, embedding: np.ndarray) -> None:
+        """Store a query embedding, evicting the least recently used."""
+        if self._cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._query_cache[key] = embedding.copy()
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > self._cache_size:
+                self._query_cache.popitem(last=False)
+
     def embed_query(self, query: str) -> np.ndarray:
-        """Generate embedding for a search query.
+        """Generate embedding for a search query (LRU cached).
 
-        This is an alias for embed_single, provided for semantic clarity.
+        Args:
+            query: Search query text
+
+        Returns:
+            Query embedding vector
+
+        Raises:
+            EmbeddingError: If embedding generation fails
+        """
+        key = self._cache_key(query)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        embedding = self._embed([query], operation="query")[0]
+        self._cache_put(key, embedding)
+        return embedding
+
+    async def aembed_query(self, query: str) -> np.ndarray:
+        """Generate embedding for a search query without blocking the event loop.
+
+        Shares the LRU cache with embed_query().
 
         Args:
             query: Search query text
@@ -162,4 +233,24 @@ class EmbeddingService:
         Raises:
             EmbeddingError: If embedding generation fails
         """
-        return self.embed_single(query)
+        key = self._cache_key(query)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            with EMBEDDING_SECONDS.time(operation="query"):
+                response = await self.client.embeddings.create_async(
+                    model=self._model,
+                    inputs=[query],
+                )
+        except SDKError as e:
+            logger.error("Mistral API error embedding query: %s", e)
+            raise EmbeddingError(f"Embedding API error: {e}") from e
+        except Exception as e:
+            logger.error("Unexpected error embedding query: %s", e)
+            raise EmbeddingError(f"Embedding failed: {e}") from e
+
+        embedding = np.array(response.data[0].embedding, dtype=np.float32)
+        self._cache_put(key, embedding)
+        return embedding
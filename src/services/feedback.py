@@ -123,18 +123,19 @@ class FeedbackService:
         return self.repository.get_interaction(interaction_id)
 
     def get_recent_interactions(
-        self, limit: int = 50, offset: int = 0
+        self, limit: int = 50, offset: int = 0, cursor: str | None = None
     ) -> list[ChatInteractionResponse]:
         """Get recent chat interactions.
 
         Args:
             limit: Maximum number to return
             offset: Number to skip
+            cursor: Keyset cursor from the previous page (replaces offset)
 
         Returns:
             List of recent interactions
         """
-        return self.repository.get_recent_interactions(limit, offset)
+        return self.repository.get_recent_interactions(limit, offset, cursor)
 
     def get_stats(self) -> FeedbackStats:
         """Get feedback statistics.
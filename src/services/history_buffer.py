@@ -0,0 +1,96 @@
+"""
+FILE: history_buffer.py
+STATUS: Active
+RESPONSIBILITY: Per-conversation in-memory ring buffer of recent chat turns
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import threading
+from collections import OrderedDict, deque
+
+
+class ConversationHistoryBuffer:
+    """Last few (turn_number, query, response) turns of recently active conversations.
+
+    Turns are recorded as soon as an answer is produced, so the next turn can
+    build its context without a database round trip (and without waiting for
+    the background interaction save). Each conversation keeps at most
+    ``max_turns`` turns; the least recently used conversations are evicted
+    beyond ``max_conversations``.
+    """
+
+    def __init__(self, max_turns: int = 5, max_conversations: int = 1024):
+        """Initialize buffer.
+
+        Args:
+            max_turns: Turns kept per conversation
+            max_conversations: Conversations kept in memory
+        """
+        self._max_turns = max_turns
+        self._max_conversations = max_conversations
+        self._turns: OrderedDict[str, deque[tuple[int, str, str]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, conversation_id: str, turn_number: int, query: str, response: str) -> None:
+        """Record a finished turn.
+
+        Args:
+            conversation_id: Conversation ID
+            turn_number: Turn number of the answered question
+            query: User question
+            response: Assistant answer
+        """
+        with self._lock:
+            turns = self._turns.get(conversation_id)
+            if turns is None:
+                turns = self._turns[conversation_id] = deque(maxlen=self._max_turns)
+            self._turns.move_to_end(conversation_id)
+
+            # Replace a regenerated turn, keep turns ordered by turn_number
+            entries = [t for t in turns if t[0] != turn_number]
+            entries.append((turn_number, query, response))
+            entries.sort(key=lambda t: t[0])
+            turns.clear()
+            turns.extend(entries)
+
+            while len(self._turns) > self._max_conversations:
+                self._turns.popitem(last=False)
+
+    def seed(self, conversation_id: str, turns: list[tuple[int, str, str]]) -> None:
+        """Fill a conversation's buffer from stored turns (oldest first).
+
+        Args:
+            conversation_id: Conversation ID
+            turns: (turn_number, query, response) tuples
+        """
+        for turn_number, query, response in turns:
+            self.record(conversation_id, turn_number, query, response)
+
+    def recent(self, conversation_id: str, before_turn: int, count: int) -> list[tuple[str, str]] | None:
+        """Get the ``count`` turns immediately preceding ``before_turn``.
+
+        Args:
+            conversation_id: Conversation ID
+            before_turn: Turn being answered
+            count: Number of preceding turns wanted
+
+        Returns:
+            (query, response) pairs oldest first, or None if the buffer doesn't
+            hold every one of those turns (caller should read the database)
+        """
+        wanted = range(max(1, before_turn - count), before_turn)
+        with self._lock:
+            turns = self._turns.get(conversation_id)
+            if turns is None:
+                return None
+            by_turn = {t[0]: (t[1], t[2]) for t in turns}
+            if any(n not in by_turn for n in wanted):
+                return None
+            self._turns.move_to_end(conversation_id)
+            return [by_turn[n] for n in wanted]
+
+    def forget(self, conversation_id: str) -> None:
+        """Drop a conversation (e.g. after it is deleted)."""
+        with self._lock:
+            self._turns.pop(conversation_id, None)
@@ -0,0 +1,202 @@
+"""
+FILE: interaction_writer.py
+STATUS: Active
+RESPONSIBILITY: Single background writer persisting chat interactions in batched transactions
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any
+
+from src.core.config import settings
+from src.models.feedback import ChatInteractionCreate
+from src.repositories.feedback import FeedbackRepository
+
+logger = logging.getLogger(__name__)
+
+# Queued after the last interaction to stop the writer thread
+_STOP = object()
+
+
+class InteractionWriter:
+    """Write-behind queue for chat interactions.
+
+    submit() only enqueues; one daemon thread takes interactions off the
+    queue and inserts them ``batch_size`` at a time (or whatever arrived
+    within ``flush_interval`` of the first one) in a single transaction.
+    The queue is bounded: when the database falls that far behind, new
+    interactions are dropped (and counted) instead of blocking requests.
+    """
+
+    def __init__(
+        self,
+        repository: FeedbackRepository,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+        max_queue: int | None = None,
+    ):
+        """Initialize writer (the thread starts on the first submit).
+
+        Args:
+            repository: Repository the batches are written to
+            batch_size: Interactions per transaction (default settings.interaction_batch_size)
+            flush_interval: Seconds a partial batch waits for more
+                (default settings.interaction_flush_interval)
+            max_queue: Queue bound (default settings.interaction_queue_size)
+        """
+        self._repository = repository
+        self._batch_size = batch_size or settings.interaction_batch_size
+        self._flush_interval = (
+            settings.interaction_flush_interval if flush_interval is None else flush_interval
+        )
+        self._max_queue = max_queue or settings.interaction_queue_size
+        self._queue: queue.Queue = queue.Queue(maxsize=self._max_queue)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._closed = False
+        self._stopping = threading.Event()
+
+        # Counters (read by stats())
+        self._pending = 0
+        self._written = 0
+        self._failed = 0
+        self._dropped = 0
+        self._batches = 0
+
+    def submit(self, interaction: ChatInteractionCreate) -> bool:
+        """Queue an interaction for writing (never blocks).
+
+        Args:
+            interaction: Interaction to persist
+
+        Returns:
+            True if queued, False if dropped (queue full or writer closed)
+        """
+        with self._lock:
+            if not self._closed:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="interaction-writer", daemon=True
+                    )
+                    self._thread.start()
+                try:
+                    self._queue.put_nowait(interaction)
+                    self._pending += 1
+                    return True
+                except queue.Full:
+                    pass
+            self._dropped += 1
+
+        logger.warning(
+            f"Interaction for conversation {interaction.conversation_id} dropped "
+            f"({'writer closed' if self._closed else f'queue full at {self._max_queue}'})"
+        )
+        return False
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every queued interaction has been written (or failed).
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the queue drained in time
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write what is still queued, then stop the writer thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the queue to drain
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+
+        if thread is not None:
+            self._stopping.set()
+            try:
+                # Wakes the thread if it is waiting for work
+                self._queue.put_nowait(_STOP)
+            except queue.Full:
+                pass  # Busy draining: it stops once the queue is empty
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                logger.error("Interaction writer did not drain before shutdown")
+        logger.info(f"Interaction writer closed: {self.stats()}")
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth and write counters."""
+        with self._lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "max_queue": self._max_queue,
+                "pending": self._pending,
+                "written": self._written,
+                "failed": self._failed,
+                "dropped": self._dropped,
+                "batches": self._batches,
+            }
+
+    def _run(self) -> None:
+        """Writer thread: collect batches and write them until stopped."""
+        while True:
+            if self._stopping.is_set() and self._queue.empty():
+                return
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self._flush_interval
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._write(batch)
+            if stop:
+                return
+
+    def _write(self, batch: list[ChatInteractionCreate]) -> None:
+        """Write one batch; on failure retry row by row so one bad row doesn't lose the rest."""
+        written = 0
+        try:
+            written = self._repository.save_interactions(batch)
+        except Exception as e:
+            logger.warning(f"Batch insert of {len(batch)} interactions failed ({e}), retrying individually")
+            for interaction in batch:
+                try:
+                    self._repository.save_interaction(interaction)
+                    written += 1
+                except Exception:
+                    logger.exception(
+                        f"Failed to save interaction for conversation {interaction.conversation_id}"
+                    )
+
+        with self._idle:
+            self._written += written
+            self._failed += len(batch) - written
+            self._batches += 1
+            self._pending -= len(batch)
+            if self._pending == 0:
+                self._idle.notify_all()
+        logger.debug(f"Wrote {written}/{len(batch)} interactions")
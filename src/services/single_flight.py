@@ -0,0 +1,109 @@
+"""
+FILE: single_flight.py
+STATUS: Active
+RESPONSIBILITY: Coalesce identical in-flight calls so one execution serves every caller
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Duplicate-call suppression keyed by an arbitrary hashable key.
+
+    While a call for a key is running, further calls with the same key wait
+    for it and receive the same result (or exception) instead of running
+    again. Once it finishes the key is forgotten, so this only deduplicates
+    concurrent work, it never caches.
+
+    Sync callers (threads) and async callers (event loop) are tracked
+    separately: do() for threads, ado() for coroutines.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+        self._tasks: dict[Hashable, asyncio.Future] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls that were served by another caller's execution."""
+        return self._coalesced
+
+    def in_flight(self) -> int:
+        """Number of keys currently executing."""
+        return len(self._calls) + len(self._tasks)
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run fn, or wait for the identical call already running in another thread.
+
+        Args:
+            key: Identity of the call
+            fn: Work to run if no call with this key is in flight
+
+        Returns:
+            fn's result (shared with every concurrent caller of this key)
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            logger.debug(f"Single-flight: joined in-flight call {key!r}")
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._forget(self._calls, key)
+            future.set_exception(e)
+            raise
+        self._forget(self._calls, key)
+        future.set_result(result)
+        return result
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn(), or the identical call already running on the event loop.
+
+        The shared task is shielded, so one caller disconnecting doesn't
+        cancel the work the others are waiting on.
+
+        Args:
+            key: Identity of the call
+            fn: Coroutine factory run if no call with this key is in flight
+
+        Returns:
+            The coroutine's result (shared with every concurrent caller of this key)
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(self._tasks, key, done))
+        else:
+            self._coalesced += 1
+            logger.debug(f"Single-flight: joined in-flight call {key!r}")
+        return await asyncio.shield(task)
+
+    def _forget(self, calls: dict[Hashable, Any], key: Hashable, call: Any = None) -> None:
+        """Drop a finished call (only if it's still the one registered for the key)."""
+        with self._lock:
+            if call is None or calls.get(key) is call:
+                calls.pop(key, None)
@@ -3,24 +3,38 @@ FILE: visualization.py
 STATUS: Active
 RESPONSIBILITY: LLM-driven visualization generation for NBA statistics
 CREATED: 2026-02-14 (Consolidated from visualization_service.py + stat_labels.py)
+LAST MAJOR UPDATE: 2026-10-18
 MAINTAINER: Shahu
 
 This module provides:
 1. Stat label mappings (from stat_labels.py)
-2. Plotly chart generation functions
+2. Plotly chart generation functions (cached, compact specs, lazy HTML)
 3. LLM suggestion parser for visualization
 
 Architecture: LLM suggests → Script generates (Option B1)
 """
 
+import hashlib
+import json
 import logging
+import threading
+from collections import OrderedDict
 from typing import Any
 
 import plotly.graph_objects as go
 import plotly.express as px
+from plotly.utils import PlotlyJSONEncoder
+
+from src.core.config import settings
+from src.core.exceptions import ValidationError
+from src.core.metrics import CACHE_REQUESTS
 
 logger = logging.getLogger(__name__)
 
+# Every chart uses this template; specs reference it by name instead of
+# embedding the expanded template (~6 KB per figure)
+CHART_TEMPLATE = "plotly_white"
+
 # ============================================================================
 # STAT LABELS (from stat_labels.py)
 # ============================================================================
@@ -124,11 +138,30 @@ class VisualizationService:
 
     LLM suggests: "[VISUALIZATION: bar_chart | name,pts | Top 5 Scorers]"
     Service generates: Plotly bar chart with proper formatting
+
+    Charts are returned as compact specs (Plotly figure JSON with the template
+    referenced by name) and cached by (chart_type, data, title), so a repeated
+    chart is never rebuilt. HTML is only rendered when asked for, via
+    render_html(figure_id).
     """
 
-    def __init__(self):
-        """Initialize visualization service."""
+    def __init__(self, cache_size: int | None = None):
+        """Initialize visualization service.
+
+        Args:
+            cache_size: Figures kept in memory (default settings.visualization_cache_size)
+        """
         self.color_scheme = px.colors.qualitative.Plotly
+        self._cache_size = cache_size or settings.visualization_cache_size
+        # figure_id -> {"chart_type", "spec", "html", "error"}
+        self._figures: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def figure_id(chart_type: str, data: list[dict[str, Any]], title: str) -> str:
+        """Stable ID of a chart (hash of its type, data and title)."""
+        raw = json.dumps([chart_type, title, data], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()[:16]
 
     def generate_chart(
         self,
@@ -146,18 +179,87 @@ class VisualizationService:
         Returns:
             Dict with:
                 - chart_type: Type of chart generated
-                - plotly_json: Plotly figure as JSON
-                - plotly_html: Plotly figure as HTML (for UI)
+                - figure_id: Cache ID (HTML via render_html / GET /visualizations/{id})
+                - plotly_json: Compact Plotly figure spec (loads with plotly.io.from_json)
                 - error: Error message if generation failed
         """
         if not data:
             return {
                 "chart_type": "none",
+                "figure_id": None,
                 "plotly_json": None,
-                "plotly_html": None,
                 "error": "No data to visualize",
             }
 
+        figure_id = self.figure_id(chart_type, data, title)
+        with self._lock:
+            entry = self._figures.get(figure_id)
+            if entry is not None:
+                self._figures.move_to_end(figure_id)
+        CACHE_REQUESTS.inc(cache="visualization", result="miss" if entry is None else "hit")
+        if entry is None:
+            entry = self._build(chart_type, data, title)
+            if entry["spec"] is None:
+                return {
+                    "chart_type": entry["chart_type"],
+                    "figure_id": None,
+                    "plotly_json": None,
+                    "error": entry["error"],
+                }
+            with self._lock:
+                self._figures[figure_id] = entry
+                while len(self._figures) > self._cache_size:
+                    self._figures.popitem(last=False)
+        else:
+            logger.debug(f"Figure cache hit: {figure_id}")
+
+        return {
+            "chart_type": entry["chart_type"],
+            "figure_id": figure_id,
+            "plotly_json": entry["spec"],
+            "error": entry["error"],
+        }
+
+    def render_html(self, figure_id: str) -> str | None:
+        """Render (once) the embeddable HTML of a cached figure.
+
+        Args:
+            figure_id: ID returned by generate_chart
+
+        Returns:
+            HTML div, or None if the figure is not (or no longer) cached
+        """
+        with self._lock:
+            entry = self._figures.get(figure_id)
+        if entry is None:
+            return None
+        if entry["html"] is None:
+            entry["html"] = self.render_spec_html(entry["spec"])
+        return entry["html"]
+
+    @staticmethod
+    def render_spec_html(spec: str) -> str:
+        """Render a figure spec (generate_chart's plotly_json) as embeddable HTML.
+
+        Needs no cache entry, so it works on whichever worker receives the spec.
+
+        Args:
+            spec: Compact Plotly figure JSON
+
+        Returns:
+            HTML div
+
+        Raises:
+            ValidationError: If the spec is not a valid Plotly figure
+        """
+        try:
+            fig = go.Figure(json.loads(spec))
+        except ValueError as e:  # JSONDecodeError and Plotly's invalid-property errors
+            raise ValidationError(f"Invalid figure spec: {e}") from e
+        return fig.to_html(include_plotlyjs="cdn", div_id="viz")
+
+    def _build(self, chart_type: str, data: list[dict[str, Any]], title: str) -> dict[str, Any]:
+        """Build a chart's cache entry (table fallback on failure)."""
         try:
             # Route to appropriate generator
             generators = {
@@ -173,12 +275,7 @@ class VisualizationService:
             generator = generators.get(chart_type, self._generate_table)
             fig = generator(data, title)
 
-            return {
-                "chart_type": chart_type,
-                "plotly_json": fig.to_json(),
-                "plotly_html": fig.to_html(include_plotlyjs="cdn", div_id="viz"),
-                "error": None,
-            }
+            return {"chart_type": chart_type, "spec": self._compact_spec(fig), "html": None, "error": None}
 
         except Exception as e:
             logger.error(f"Chart generation failed for type '{chart_type}': {e}")
@@ -189,19 +286,26 @@ class VisualizationService:
                 fig = self._generate_table(data, title)
                 return {
                     "chart_type": "table",  # Changed to table (fallback)
-                    "plotly_json": fig.to_json(),
-                    "plotly_html": fig.to_html(include_plotlyjs="cdn", div_id="viz"),
+                    "spec": self._compact_spec(fig),
+                    "html": None,
                     "error": f"Chart type '{chart_type}' failed, showing table instead",
                 }
             except Exception as table_error:
                 logger.error(f"Table fallback also failed: {table_error}")
                 return {
                     "chart_type": "error",
-                    "plotly_json": None,
-                    "plotly_html": None,
+                    "spec": None,
+                    "html": None,
                     "error": f"All visualization attempts failed: {str(e)}",
                 }
 
+    @staticmethod
+    def _compact_spec(fig: go.Figure) -> str:
+        """Serialize a figure with its template referenced by name."""
+        spec = fig.to_plotly_json()
+        spec["layout"]["template"] = CHART_TEMPLATE
+        return json.dumps(spec, cls=PlotlyJSONEncoder)
+
     # ========================================================================
     # CHART GENERATORS
     # ========================================================================
@@ -239,7 +343,7 @@ class VisualizationService:
             yaxis_title=stat_label,
             xaxis_tickangle=-45 if len(data) > 5 else 0,
             height=500,
-            template="plotly_white",
+            template=CHART_TEMPLATE,
         )
 
         return fig
@@ -277,7 +381,7 @@ class VisualizationService:
             xaxis_title=stat_label,
             yaxis_title=get_stat_label(name_col),
             height=max(400, len(data) * 40),
-            template="plotly_white",
+            template=CHART_TEMPLATE,
         )
 
         return fig
@@ -309,7 +413,7 @@ class VisualizationService:
             xaxis_title=get_stat_label(x_col),
             yaxis_title=get_stat_label(y_col),
             height=500,
-            template="plotly_white",
+            template=CHART_TEMPLATE,
         )
 
         return fig
@@ -354,7 +458,7 @@ class VisualizationService:
             title=title,
             showlegend=True,
             height=600,
-            template="plotly_white",
+            template=CHART_TEMPLATE,
         )
 
         return fig
@@ -384,7 +488,7 @@ class VisualizationService:
         fig.update_layout(
             title=title,
             height=500,
-            template="plotly_white",
+            template=CHART_TEMPLATE,
         )
 
         return fig
@@ -419,7 +523,7 @@ class VisualizationService:
             xaxis_title=get_stat_label(x_col),
             yaxis_title=get_stat_label(y_col),
             height=500,
-            template="plotly_white",
+            template=CHART_TEMPLATE,
         )
 
         return fig
@@ -455,7 +559,7 @@ class VisualizationService:
         fig.update_layout(
             title=title,
             height=max(300, min(800, len(data) * 30 + 100)),
-            template="plotly_white",
+            template=CHART_TEMPLATE,
         )
 
         return fig
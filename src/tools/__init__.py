@@ -1,11 +1,16 @@
 """
 FILE: __init__.py
 STATUS: Active
-RESPONSIBILITY: Tools package initialization
-LAST MAJOR UPDATE: 2026-02-07
+RESPONSIBILITY: Tools package initialization (exports resolved on first access)
+LAST MAJOR UPDATE: 2026-10-18
 MAINTAINER: Shahu
 """
 
-from .sql_tool import NBAGSQLTool
+from src.core.lazy import lazy_exports
 
-__all__ = ["NBAGSQLTool"]
+_EXPORTS = {
+    "NBAGSQLTool": "src.tools.sql_tool",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,386 @@
+"""
+FILE: sql_memo.py
+STATUS: Active
+RESPONSIBILITY: Question→SQL memo cache with embedding-similarity lookup (FAISS)
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import faiss
+import numpy as np
+
+from src.core.config import settings
+from src.core.file_lock import file_lock
+
+logger = logging.getLogger(__name__)
+
+# Seconds after an add() before new entries are written to disk (batches
+# bursts of adds into one write, off the request path)
+SAVE_DELAY_SECONDS = 2.0
+
+# Entity sets cached for memo entries and recent questions
+_MAX_CACHED_ENTITY_SETS = 10_000
+
+# Spelled-out numbers that change the meaning of a query ("top five" vs "top 5")
+_NUMBER_WORDS = {
+    "one": "1", "two": "2", "three": "3", "four": "4", "five": "5",
+    "six": "6", "seven": "7", "eight": "8", "nine": "9", "ten": "10",
+    "fifteen": "15", "twenty": "20", "fifty": "50", "hundred": "100",
+}
+
+
+def _normalize_question(question: str) -> str:
+    """Lowercase and collapse whitespace for exact-duplicate detection."""
+    return " ".join(question.lower().split())
+
+
+def _numeric_signature(question: str) -> tuple[str, ...]:
+    """Extract the numbers mentioned in a question.
+
+    Embeddings barely move between "top 3 scorers" and "top 5 scorers",
+    so a memo hit additionally requires the numeric tokens to match.
+
+    Args:
+        question: Natural language question
+
+    Returns:
+        Sorted tuple of numeric tokens (digits and spelled-out numbers)
+    """
+    tokens = re.findall(r"\d+(?:\.\d+)?|[a-z]+", question.lower())
+    numbers = [
+        _NUMBER_WORDS.get(token, token)
+        for token in tokens
+        if token[0].isdigit() or token in _NUMBER_WORDS
+    ]
+    return tuple(sorted(numbers))
+
+
+@dataclass
+class MemoEntry:
+    """A memoized question→SQL pair."""
+
+    question: str
+    sql: str
+    source: str = "production"  # "ground_truth" or "production"
+
+
+@dataclass
+class MemoHit:
+    """Result of a successful memo lookup."""
+
+    entry: MemoEntry
+    similarity: float
+
+
+class SQLMemoCache:
+    """Embedding-indexed cache of validated question→SQL pairs.
+
+    Questions are embedded, L2-normalized and stored in a FAISS inner-product
+    index (cosine similarity). A new question whose nearest neighbour is above
+    the similarity threshold, and which mentions the same numbers and the same
+    entities (players/teams), reuses the memoized SQL instead of going through
+    the SQL agent.
+
+    New entries are written to disk in the background a few seconds after
+    add(). Each save holds a file lock and merges with what other worker
+    processes already saved, so concurrent workers never overwrite each
+    other's entries.
+
+    Attributes:
+        threshold: Minimum cosine similarity (0-1) for a hit
+        entity_fn: Maps a question to the entities it mentions; a hit requires
+            equal sets ("LeBron's points" must not reuse "Curry's points" SQL)
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[Sequence[str]], np.ndarray],
+        index_path: Path | None = None,
+        pairs_path: Path | None = None,
+        threshold: float | None = None,
+        entity_fn: Callable[[str], frozenset[str]] | None = None,
+    ):
+        """Initialize memo cache.
+
+        Args:
+            embed_fn: Batch embedding function (texts → n x dim array)
+            index_path: Path to FAISS index file (default from settings)
+            pairs_path: Path to JSON question/SQL pairs (default from settings)
+            threshold: Cosine similarity threshold (default from settings)
+            entity_fn: Question → mentioned entities (None skips the entity check)
+        """
+        self._embed_fn = embed_fn
+        self._index_path = index_path or settings.sql_memo_index_path
+        self._pairs_path = pairs_path or settings.sql_memo_pairs_path
+        self.threshold = threshold if threshold is not None else settings.sql_memo_threshold
+        self._index: faiss.Index | None = None
+        self._entries: list[MemoEntry] = []
+        self._seen: set[str] = set()
+        self._lock = threading.Lock()
+        self.entity_fn = entity_fn
+        self._entities: dict[str, frozenset[str]] = {}
+        self._dirty = False
+        self._save_timer: threading.Timer | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed and L2-normalize texts for cosine similarity."""
+        embeddings = np.asarray(self._embed_fn(list(texts)), dtype=np.float32)
+        if embeddings.ndim == 1:
+            embeddings = embeddings.reshape(1, -1)
+        embeddings = np.ascontiguousarray(embeddings)
+        faiss.normalize_L2(embeddings)
+        return embeddings
+
+    def load(self) -> bool:
+        """Load memo index and pairs from disk.
+
+        Returns:
+            True if a memo was loaded, False if none exists or it is corrupt
+        """
+        if not self._index_path.exists() or not self._pairs_path.exists():
+            logger.info("No SQL memo found at %s", self._pairs_path)
+            return False
+
+        with file_lock(self._lock_path):
+            loaded = self._read_files()
+        if loaded is None:
+            return False
+        index, entries = loaded
+
+        with self._lock:
+            self._index = index
+            self._entries = entries
+            self._seen = {_normalize_question(e.question) for e in entries}
+
+        logger.info("Loaded SQL memo with %d entries", len(entries))
+        return True
+
+    @property
+    def _lock_path(self) -> Path:
+        return self._pairs_path.with_name(self._pairs_path.name + ".lock")
+
+    def _read_files(self) -> tuple[faiss.Index, list[MemoEntry]] | None:
+        """Read index and pairs from disk (caller holds the file lock).
+
+        Returns:
+            (index, entries), or None if missing, corrupt or inconsistent
+        """
+        if not self._index_path.exists() or not self._pairs_path.exists():
+            return None
+        try:
+            index = faiss.read_index(str(self._index_path))
+            with open(self._pairs_path, encoding="utf-8") as f:
+                entries = [MemoEntry(**item) for item in json.load(f)]
+        except Exception as e:
+            logger.warning("Failed to load SQL memo, starting empty: %s", e)
+            return None
+
+        if index.ntotal != len(entries):
+            logger.warning(
+                "SQL memo index/pairs mismatch (%d vs %d), starting empty",
+                index.ntotal,
+                len(entries),
+            )
+            return None
+        return index, entries
+
+    def save(self, merge: bool = True) -> None:
+        """Persist memo index and pairs to disk.
+
+        Args:
+            merge: Keep entries saved by other workers. False replaces the files
+                with exactly the in-memory entries (removing them if there are
+                none), which is how stale or bad pairs are purged.
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._index is None and merge:
+                return
+            entries = list(self._entries)
+            vectors = (
+                self._index.reconstruct_n(0, self._index.ntotal) if self._index is not None else None
+            )
+            self._dirty = False
+
+        with file_lock(self._lock_path):
+            if vectors is None:
+                self._index_path.unlink(missing_ok=True)
+                self._pairs_path.unlink(missing_ok=True)
+                return
+            on_disk = self._read_files() if merge else None
+            if on_disk is None:
+                index = faiss.IndexFlatIP(vectors.shape[1])
+                merged: list[MemoEntry] = []
+            else:
+                index, merged = on_disk
+            saved = {_normalize_question(e.question) for e in merged}
+            new = [
+                i for i, e in enumerate(entries)
+                if _normalize_question(e.question) not in saved
+            ]
+            if new:
+                index.add(vectors[new])
+                merged.extend(entries[i] for i in new)
+
+            # Write to temporary files and rename, so readers never see a partial file
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            index_tmp = self._index_path.with_name(self._index_path.name + ".tmp")
+            pairs_tmp = self._pairs_path.with_name(self._pairs_path.name + ".tmp")
+            faiss.write_index(index, str(index_tmp))
+            with open(pairs_tmp, "w", encoding="utf-8") as f:
+                json.dump([asdict(e) for e in merged], f, indent=2, ensure_ascii=False)
+            os.replace(index_tmp, self._index_path)
+            os.replace(pairs_tmp, self._pairs_path)
+
+    def _schedule_save(self) -> None:
+        """Save in the background shortly (caller holds self._lock)."""
+        self._dirty = True
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(SAVE_DELAY_SECONDS, self._background_save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _background_save(self) -> None:
+        try:
+            self.save()
+        except Exception as e:
+            logger.warning("Failed to save SQL memo: %s", e)
+
+    def close(self) -> None:
+        """Write entries added since the last save (called on shutdown)."""
+        if self._dirty:
+            self.save()
+        elif self._save_timer is not None:
+            self._save_timer.cancel()
+
+    def _entities_of(self, question: str) -> frozenset[str]:
+        """Entities mentioned in a question (cached per normalized question)."""
+        key = _normalize_question(question)
+        entities = self._entities.get(key)
+        if entities is None:
+            if len(self._entities) >= _MAX_CACHED_ENTITY_SETS:
+                self._entities.clear()
+            entities = self._entities[key] = self.entity_fn(question)
+        return entities
+
+    def _add_locked(self, entries: list[MemoEntry], embeddings: np.ndarray) -> None:
+        if self._index is None:
+            self._index = faiss.IndexFlatIP(embeddings.shape[1])
+        self._index.add(embeddings)
+        self._entries.extend(entries)
+        self._seen.update(_normalize_question(e.question) for e in entries)
+
+    def lookup(self, question: str) -> MemoHit | None:
+        """Find memoized SQL for a near-duplicate question.
+
+        Args:
+            question: Natural language question
+
+        Returns:
+            MemoHit if a similar enough question with matching numbers exists
+        """
+        if not self._entries:
+            # Nothing memoized yet - don't pay for an embedding call
+            return None
+
+        query_embedding = self._embed([question])
+
+        with self._lock:
+            k = min(3, self._index.ntotal)
+            scores, indices = self._index.search(query_embedding, k)
+            candidates = [
+                (self._entries[idx], float(score))
+                for score, idx in zip(scores[0], indices[0])
+                if idx >= 0
+            ]
+
+        signature = _numeric_signature(question)
+        for entry, similarity in candidates:
+            if similarity < self.threshold:
+                break
+            if _numeric_signature(entry.question) != signature:
+                continue
+            if self.entity_fn is not None and (
+                self._entities_of(entry.question) != self._entities_of(question)
+            ):
+                continue
+            logger.info(
+                "SQL memo hit (similarity=%.3f): '%s' ~ '%s'",
+                similarity,
+                question[:80],
+                entry.question[:80],
+            )
+            return MemoHit(entry=entry, similarity=similarity)
+
+        return None
+
+    def add(self, question: str, sql: str, source: str = "production") -> bool:
+        """Memoize a validated question→SQL pair (saved to disk in the background).
+
+        Args:
+            question: Natural language question
+            sql: SQL that answered it successfully
+            source: Origin of the pair ("ground_truth" or "production")
+
+        Returns:
+            True if added, False if the question was already memoized
+        """
+        if _normalize_question(question) in self._seen:
+            return False
+
+        embedding = self._embed([question])
+
+        with self._lock:
+            # Re-check under lock: a concurrent request may have added it
+            if _normalize_question(question) in self._seen:
+                return False
+            self._add_locked([MemoEntry(question=question, sql=sql, source=source)], embedding)
+            self._schedule_save()
+
+        logger.info("Memoized SQL for '%s' (%d entries)", question[:80], len(self._entries))
+        return True
+
+    def seed(self, pairs: Iterable[tuple[str, str]], source: str = "ground_truth") -> int:
+        """Bulk-load question→SQL pairs (single batched embedding call).
+
+        Args:
+            pairs: Iterable of (question, sql) tuples
+            source: Origin of the pairs
+
+        Returns:
+            Number of new entries added
+        """
+        new_entries: list[MemoEntry] = []
+        batch_seen: set[str] = set()
+        for question, sql in pairs:
+            key = _normalize_question(question)
+            if key in self._seen or key in batch_seen:
+                continue
+            batch_seen.add(key)
+            new_entries.append(MemoEntry(question=question, sql=sql, source=source))
+
+        if not new_entries:
+            return 0
+
+        embeddings = self._embed([e.question for e in new_entries])
+
+        with self._lock:
+            self._add_locked(new_entries, embeddings)
+        self.save()
+
+        logger.info("Seeded SQL memo with %d %s pairs", len(new_entries), source)
+        return len(new_entries)
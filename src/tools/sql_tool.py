@@ -12,17 +12,39 @@ import time
 from pathlib import Path
 from typing import Any
 
-from langchain import hub
-from langchain.agents import AgentExecutor, create_react_agent
-from langchain_community.agent_toolkits import create_sql_agent
-from langchain_community.utilities import SQLDatabase
-from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
-from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_community.utilities.sql_database import SQLDatabase
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 
 from src.core.config import settings
+from src.core.exceptions import QueryBudgetExceededError
+from src.core.metrics import CACHE_REQUESTS, SQL_AGENT_STEPS, SQL_QUERY_SECONDS
+from src.repositories.name_resolver import NameResolver, get_name_resolver
+from src.repositories.nba_database import MATERIALIZED_TABLES
+from src.repositories.sqlite_pool import get_read_only_pool
+from src.tools.sql_memo import SQLMemoCache
 
 logger = logging.getLogger(__name__)
 
+# LAZY IMPORTS: the LLM client and agent factory pull in most of LangChain and
+# the Google SDK; they are imported when the first NBAGSQLTool is built
+ChatGoogleGenerativeAI = None
+create_sql_agent = None
+
+
+def _initialize_lazy_imports() -> None:
+    """Import the LangChain agent stack on first use (names already set, e.g. by tests, are kept)."""
+    global ChatGoogleGenerativeAI, create_sql_agent
+
+    if ChatGoogleGenerativeAI is None:
+        from langchain_google_genai import ChatGoogleGenerativeAI as ChatGoogleGenerativeAIModule
+
+        ChatGoogleGenerativeAI = ChatGoogleGenerativeAIModule
+    if create_sql_agent is None:
+        from langchain_community.agent_toolkits import create_sql_agent as create_sql_agent_module
+
+        create_sql_agent = create_sql_agent_module
+
 
 def _retry_on_rate_limit(func, max_retries: int = 3, initial_delay: float = 2.0):
     """Retry a function with exponential backoff on rate limit errors.
@@ -70,7 +92,8 @@ def _retry_on_rate_limit(func, max_retries: int = 3, initial_delay: float = 2.0)
 def _load_dictionary_from_db(db_path: str) -> list[dict[str, str | None]]:
     """Load data dictionary entries from the database.
 
-    Uses raw sqlite3 to avoid SQLAlchemy session overhead at init time.
+    Uses the shared read-only sqlite3 pool to avoid SQLAlchemy session
+    overhead at init time.
 
     Args:
         db_path: Path to SQLite database
@@ -80,15 +103,11 @@ def _load_dictionary_from_db(db_path: str) -> list[dict[str, str | None]]:
         Returns empty list if table doesn't exist.
     """
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute(
+        rows = get_read_only_pool(db_path).execute(
             "SELECT abbreviation, full_name, column_name, table_name "
             "FROM data_dictionary WHERE column_name IS NOT NULL "
             "ORDER BY abbreviation"
         )
-        rows = cursor.fetchall()
-        conn.close()
         return [
             {
                 "abbreviation": r[0],
@@ -140,15 +159,87 @@ def _build_abbreviations_block(entries: list[dict[str, str | None]]) -> str:
     return "\n".join(lines)
 
 
-def _build_sql_agent_prefix(abbreviations_block: str) -> str:
+def _materialized_tables_available(db_path: str) -> bool:
+    """Check whether the materialized aggregate tables are built and populated.
+
+    Args:
+        db_path: Path to SQLite database
+
+    Returns:
+        True if player_per_game, team_totals and team_averages all have rows
+    """
+    try:
+        pool = get_read_only_pool(db_path)
+        return all(pool.execute(f"SELECT 1 FROM {table} LIMIT 1") for table in MATERIALIZED_TABLES)
+    except sqlite3.OperationalError:
+        return False
+
+
+_MATERIALIZED_SCHEMA = """
+PRECOMPUTED TABLES (built at load time - PREFER THESE, no joins needed):
+
+TABLE: player_per_game (1 row per player, unrounded per-game averages = total / gp)
+  - player_id INTEGER PRIMARY KEY → players.id
+  - name VARCHAR(100), team_abbr VARCHAR(5), gp INTEGER
+  - ppg, rpg, orpg, drpg, apg, spg, bpg, topg FLOAT (points/rebounds/off reb/def reb/assists/steals/blocks/turnovers per game)
+  - fgm_pg, fga_pg, three_pm_pg, three_pa_pg, ftm_pg, fta_pg FLOAT (shots made/attempted per game)
+
+TABLE: team_totals (1 row per team, SUM over the team's players)
+  - team_abbr VARCHAR(5) PRIMARY KEY, team_name VARCHAR(100), player_count INTEGER
+  - pts, reb, oreb, dreb, ast, stl, blk, tov, pf, fgm, fga, three_pm, three_pa, ftm, fta, dd2, td3 INTEGER (season totals)
+  - fg_pct, three_pct, ft_pct FLOAT (team shooting % from summed makes/attempts, 0-100 scale)
+
+TABLE: team_averages (1 row per team, AVG over the team's players)
+  - team_abbr VARCHAR(5) PRIMARY KEY, team_name VARCHAR(100), player_count INTEGER
+  - avg_age, avg_pts, avg_reb, avg_ast, avg_stl, avg_blk FLOAT
+  - avg_fg_pct, avg_three_pct, avg_ft_pct, avg_ts_pct, avg_efg_pct, avg_usg_pct FLOAT (0-100 scale)
+  - avg_off_rtg, avg_def_rtg, avg_net_rtg, avg_pie FLOAT
+"""
+
+_TEAM_RULE_JOIN = """1. TEAM STATISTICS REQUIRE AGGREGATION:
+   - Teams table has NO stats columns - you MUST aggregate from player_stats
+   - Pattern: SELECT t.name, SUM(ps.stat) FROM teams t JOIN players p ON t.abbreviation = p.team_abbr JOIN player_stats ps ON p.id = ps.player_id WHERE t.abbreviation = 'ABBR' GROUP BY t.name"""
+
+_TEAM_RULE_MATERIALIZED = """1. TEAM STATISTICS - USE team_totals / team_averages:
+   - Team sums: SELECT team_name, pts, reb FROM team_totals WHERE team_abbr = 'ABBR'
+   - Per-player team averages: SELECT team_name, avg_pts FROM team_averages ORDER BY avg_pts DESC
+   - Only aggregate player_stats yourself for filtered subsets (e.g. "players over 1000 points per team")"""
+
+_PER_GAME_RULE_JOIN = """5. PER-GAME STATS:
+   - For PPG, RPG, APG, ALWAYS divide by gp: ROUND(CAST(ps.column AS FLOAT) / ps.gp, 1)"""
+
+_PER_GAME_RULE_MATERIALIZED = """5. PER-GAME STATS - USE player_per_game:
+   - SELECT name, ROUND(ppg, 1) AS ppg FROM player_per_game ORDER BY ppg DESC LIMIT 5
+   - ROUND(ppg, 1) is identical to ROUND(CAST(ps.pts AS FLOAT) / ps.gp, 1)"""
+
+_EXAMPLES_JOIN = """3. "LeBron's PPG"
+   SELECT p.name, ROUND(CAST(ps.pts AS FLOAT) / ps.gp, 1) AS ppg FROM players p JOIN player_stats ps ON p.id = ps.player_id WHERE p.name LIKE '%LeBron%';
+
+4. "Lakers team stats"
+   SELECT t.name, SUM(ps.pts) as total_pts, SUM(ps.reb) as total_reb FROM teams t JOIN players p ON t.abbreviation = p.team_abbr JOIN player_stats ps ON p.id = ps.player_id WHERE t.abbreviation = 'LAL' GROUP BY t.name;"""
+
+_EXAMPLES_MATERIALIZED = """3. "LeBron's PPG"
+   SELECT name, ROUND(ppg, 1) AS ppg FROM player_per_game WHERE name LIKE '%LeBron%';
+
+4. "Lakers team stats"
+   SELECT team_name, pts AS total_pts, reb AS total_reb FROM team_totals WHERE team_abbr = 'LAL';"""
+
+
+def _build_sql_agent_prefix(abbreviations_block: str, materialized: bool = False) -> str:
     """Build the system prompt for LangChain SQL agent.
 
     Args:
         abbreviations_block: Formatted abbreviations from data dictionary
+        materialized: Document the precomputed player_per_game/team_totals/
+            team_averages tables and steer per-game and team questions to them
 
     Returns:
         Prompt prefix for SQL agent
     """
+    materialized_schema = _MATERIALIZED_SCHEMA if materialized else ""
+    team_rule = _TEAM_RULE_MATERIALIZED if materialized else _TEAM_RULE_JOIN
+    per_game_rule = _PER_GAME_RULE_MATERIALIZED if materialized else _PER_GAME_RULE_JOIN
+    examples = _EXAMPLES_MATERIALIZED if materialized else _EXAMPLES_JOIN
     return f"""You are an NBA statistics SQL expert using SQLite. Your job is to answer questions about NBA statistics by writing and executing SQL queries.
 
 DATABASE SCHEMA (STATIC - NO NEED TO EXPLORE):
@@ -187,14 +278,12 @@ TABLE: player_stats (1:1 with players, all season totals unless noted)
   - [plus 20+ other advanced stats]
 
 CRITICAL: Teams table has NO stats - aggregate from player_stats via players join.
-
+{materialized_schema}
 {abbreviations_block}
 
 CRITICAL RULES:
 
-1. TEAM STATISTICS REQUIRE AGGREGATION:
-   - Teams table has NO stats columns - you MUST aggregate from player_stats
-   - Pattern: SELECT t.name, SUM(ps.stat) FROM teams t JOIN players p ON t.abbreviation = p.team_abbr JOIN player_stats ps ON p.id = ps.player_id WHERE t.abbreviation = 'ABBR' GROUP BY t.name
+{team_rule}
 
 2. JOINS:
    - Each player has EXACTLY ONE stats record (1:1 relationship)
@@ -211,8 +300,7 @@ CRITICAL RULES:
    - Example: ts_pct = 45.2 means 45.2%, NOT 0.452
    - Use thresholds like ts_pct > 60 (not 0.6)
 
-5. PER-GAME STATS:
-   - For PPG, RPG, APG, ALWAYS divide by gp: ROUND(CAST(ps.column AS FLOAT) / ps.gp, 1)
+{per_game_rule}
 
 6. LIMITS:
    - Superlatives ("most", "highest", "best") without plural → LIMIT 1
@@ -240,11 +328,7 @@ EXAMPLE QUERIES:
 2. "Top 3 rebounders"
    SELECT p.name, ps.reb FROM players p JOIN player_stats ps ON p.id = ps.player_id ORDER BY ps.reb DESC LIMIT 3;
 
-3. "LeBron's PPG"
-   SELECT p.name, ROUND(CAST(ps.pts AS FLOAT) / ps.gp, 1) AS ppg FROM players p JOIN player_stats ps ON p.id = ps.player_id WHERE p.name LIKE '%LeBron%';
-
-4. "Lakers team stats"
-   SELECT t.name, SUM(ps.pts) as total_pts, SUM(ps.reb) as total_reb FROM teams t JOIN players p ON t.abbreviation = p.team_abbr JOIN player_stats ps ON p.id = ps.player_id WHERE t.abbreviation = 'LAL' GROUP BY t.name;
+{examples}
 
 5. "Compare Jokić and Embiid"
    SELECT p.name, ps.pts, ps.reb, ps.ast FROM players p JOIN player_stats ps ON p.id = ps.player_id WHERE p.name IN ('Nikola Jokić', 'Joel Embiid');
@@ -259,6 +343,68 @@ When you get a question:
 Begin!"""
 
 
+# SQLite VM instructions between progress handler calls
+_PROGRESS_INTERVAL = 1000
+
+# Rows spelled out in the answer of a memo hit (the full rows are in "results")
+_SUMMARY_MAX_ROWS = 10
+
+
+def _summarize_results(results: Any) -> str:
+    """Plain-text answer for results obtained without the SQL agent (memo hits).
+
+    Args:
+        results: Parsed rows (a dict for a single row, else a list)
+
+    Returns:
+        One "column: value" line per row, e.g. "name: Shai Gilgeous-Alexander, pts: 2485"
+    """
+    rows = results if isinstance(results, list) else [results]
+    lines = [
+        ", ".join(f"{k}: {v}" for k, v in row.items()) if isinstance(row, dict) else str(row)
+        for row in rows[:_SUMMARY_MAX_ROWS]
+    ]
+    if len(rows) > _SUMMARY_MAX_ROWS:
+        lines.append(f"... ({len(rows) - _SUMMARY_MAX_ROWS} more rows)")
+    return "\n".join(lines)
+
+
+class _QueryGuard:
+    """SQLite progress handler enforcing a wall-clock and VM-step budget for one query."""
+
+    def __init__(self, max_seconds: float, max_vm_steps: int):
+        self.max_seconds = max_seconds
+        self.max_vm_steps = max_vm_steps
+        self.deadline = time.monotonic() + max_seconds
+        self.steps = 0
+        self.exceeded: str | None = None
+
+    def __call__(self) -> int:
+        """Progress callback: a non-zero return interrupts the running statement."""
+        self.steps += _PROGRESS_INTERVAL
+        if self.max_vm_steps and self.steps > self.max_vm_steps:
+            self.exceeded = "vm_steps"
+            return 1
+        if time.monotonic() > self.deadline:
+            self.exceeded = "time"
+            return 1
+        return 0
+
+    def error(self) -> QueryBudgetExceededError:
+        """Build the structured error for the budget that was exceeded."""
+        if self.exceeded == "vm_steps":
+            return QueryBudgetExceededError(
+                f"Query too expensive: aborted after {self.max_vm_steps:,} SQLite VM steps",
+                budget="vm_steps",
+                limit=self.max_vm_steps,
+            )
+        return QueryBudgetExceededError(
+            f"Query too expensive: aborted after {self.max_seconds:g}s",
+            budget="time",
+            limit=self.max_seconds,
+        )
+
+
 class SecureSQLDatabase(SQLDatabase):
     """Wrapper around SQLDatabase that validates SQL before execution.
 
@@ -266,15 +412,42 @@ class SecureSQLDatabase(SQLDatabase):
     preventing malicious SQL from executing even if generated by the LLM.
     """
 
-    def __init__(self, *args, validator_func=None, **kwargs):
+    def __init__(
+        self,
+        *args,
+        validator_func=None,
+        name_resolver: NameResolver | None = None,
+        max_query_seconds: float | None = None,
+        max_vm_steps: int | None = None,
+        max_rows: int | None = None,
+        **kwargs,
+    ):
         """Initialize with optional validator function.
 
         Args:
             validator_func: Function that takes SQL string and raises ValueError if invalid
+            name_resolver: Optional resolver rewriting name LIKE scans to id equality
+            max_query_seconds: Per-query time budget (default from settings)
+            max_vm_steps: Per-query SQLite VM-step budget, 0 = none (default from settings)
+            max_rows: Maximum rows a query may return (default from settings)
             *args, **kwargs: Passed to parent SQLDatabase
         """
         super().__init__(*args, **kwargs)
         self._validator = validator_func
+        self._name_resolver = name_resolver
+        self._max_query_seconds = (
+            max_query_seconds if max_query_seconds is not None else settings.sql_max_query_seconds
+        )
+        self._max_vm_steps = max_vm_steps if max_vm_steps is not None else settings.sql_max_vm_steps
+        self._max_rows = max_rows if max_rows is not None else settings.sql_max_rows
+
+    def _row_budget_error(self) -> QueryBudgetExceededError:
+        """Build the structured error for a result over the row cap."""
+        return QueryBudgetExceededError(
+            f"Query too expensive: returns more than {self._max_rows} rows",
+            budget="rows",
+            limit=self._max_rows,
+        )
 
     def run(self, command: str, fetch: str = "all", **kwargs):
         """Execute SQL command with pre-validation.
@@ -294,42 +467,129 @@ class SecureSQLDatabase(SQLDatabase):
         if self._validator:
             try:
                 self._validator(command)
-                logger.debug(f"SQL validation passed: {command[:100]}...")
+                logger.debug("SQL validation passed: %.100s...", command)
             except ValueError as e:
                 logger.error(f"SQL BLOCKED before execution: {e}")
                 logger.error(f"Blocked query: {command}")
                 raise  # Stop execution immediately
 
         # Only execute if validation passed
+        if self._name_resolver is not None:
+            command = self._name_resolver.rewrite_sql(command)
+
         return super().run(command, fetch, **kwargs)
 
+    def _execute(self, command, fetch="all", *, parameters=None, execution_options=None):
+        """Execute on SQLite with the per-query time, VM-step and row budget enforced.
+
+        A progress handler interrupts runaway statements (accidental cross
+        joins, unbounded scans) and at most ``max_rows + 1`` rows are
+        fetched, so one bad query can't hold a worker.
+
+        Raises:
+            QueryBudgetExceededError: If any budget is exceeded
+        """
+        if fetch not in ("all", "one"):
+            return super()._execute(
+                command, fetch, parameters=parameters, execution_options=execution_options
+            )
+
+        guard = _QueryGuard(self._max_query_seconds, self._max_vm_steps)
+        with self._engine.begin() as connection:
+            driver_connection = connection.connection.driver_connection
+            driver_connection.set_progress_handler(guard, _PROGRESS_INTERVAL)
+            try:
+                cursor = connection.execute(
+                    text(command) if isinstance(command, str) else command,
+                    parameters or {},
+                    execution_options=execution_options or {},
+                )
+                if not cursor.returns_rows:
+                    return []
+                rows = cursor.fetchmany(self._max_rows + 1 if fetch == "all" else 1)
+                cursor.close()
+            except SQLAlchemyError as e:
+                if guard.exceeded:
+                    logger.warning(f"SQL aborted ({guard.exceeded} budget): {str(command)[:200]}")
+                    raise guard.error() from e
+                raise
+            finally:
+                driver_connection.set_progress_handler(None, _PROGRESS_INTERVAL)
+
+        if len(rows) > self._max_rows:
+            logger.warning(f"SQL rejected (row budget): {str(command)[:200]}")
+            raise self._row_budget_error()
+        return [row._asdict() for row in rows]
+
+    def run_no_throw(self, command: str, fetch: str = "all", include_columns: bool = False, **kwargs):
+        """Execute SQL for the agent, returning budget violations as an error string.
+
+        Args:
+            command: SQL query to execute
+            fetch: Fetch strategy ("all" or "one")
+            include_columns: Include column names in the result
+            **kwargs: Additional arguments for execution
+
+        Returns:
+            Query results, or an "Error: ..." string the agent can react to
+        """
+        try:
+            return super().run_no_throw(command, fetch, include_columns, **kwargs)
+        except QueryBudgetExceededError as e:
+            return (
+                f"Error: [{e.code}] {e.message}. Rewrite the query to be cheaper: "
+                "join only on the documented keys, add WHERE filters, aggregate, or add a LIMIT."
+            )
+
 
 class NBAGSQLTool:
     """SQL query tool for NBA statistics database using LangChain SQL Agent."""
 
-    def __init__(self, db_path: str | None = None, google_api_key: str | None = None):
+    def __init__(
+        self,
+        db_path: str | None = None,
+        google_api_key: str | None = None,
+        sql_memo: SQLMemoCache | None = None,
+    ):
         """Initialize SQL tool with LangChain SQL agent.
 
         Args:
             db_path: Path to SQLite database (default: data/sql/nba_stats.db)
             google_api_key: Google API key (default from settings)
+            sql_memo: Optional question→SQL memo (near-duplicates skip the agent)
         """
+        _initialize_lazy_imports()
+
         if db_path is None:
             db_path = str(Path(settings.database_dir) / "nba_stats.db")
 
         self.db_path = db_path
         self._api_key = google_api_key or settings.google_api_key
+        self.sql_memo = sql_memo
 
         # Initialize SecureSQLDatabase with validator (NOT plain SQLDatabase)
+        # Connections come from the shared read-only pool (mmap, query_only,
+        # one connection per thread) so concurrent queries skip connection setup
+        self._pool = get_read_only_pool(db_path)
+        # Player/team name LIKE scans are rewritten to key equality via the
+        # trigram name index; its FTS5 tables are hidden from the agent
+        self._name_resolver = get_name_resolver(db_path)
+        if sql_memo is not None and sql_memo.entity_fn is None:
+            # Memo hits must mention the same players/teams as the memoized question
+            sql_memo.entity_fn = self._name_resolver.entities_in
         self.db = SecureSQLDatabase.from_uri(
             f"sqlite:///{db_path}",
-            validator_func=self._validate_sql_security  # Inject validator
+            engine_args=self._pool.engine_args,
+            ignore_tables=self._name_resolver.index_tables() or None,
+            validator_func=self._validate_sql_security,  # Inject validator
+            name_resolver=self._name_resolver,
         )
 
         # Load data dictionary for dynamic prompt
         dict_entries = _load_dictionary_from_db(db_path)
         abbreviations_block = _build_abbreviations_block(dict_entries)
         self._dict_entry_count = len(dict_entries)
+        self._materialized = _materialized_tables_available(db_path)
 
         # Initialize LLM (Gemini for SQL generation)
         self.llm = ChatGoogleGenerativeAI(
@@ -339,7 +599,7 @@ class NBAGSQLTool:
         )
 
         # Build SQL agent prefix with domain knowledge
-        agent_prefix = _build_sql_agent_prefix(abbreviations_block)
+        agent_prefix = _build_sql_agent_prefix(abbreviations_block, materialized=self._materialized)
 
         # OPTIMIZATION: Add suffix to skip unnecessary schema exploration
         # Since database is STATIC, we pre-load all schema info in prefix
@@ -441,6 +701,12 @@ Thought: I should write a SQL query to answer this question.
             >>> print(result['results'])
             [{'name': 'Player1', 'pts': 2500}, ...]
         """
+        start = time.perf_counter()
+        memoized = self._query_from_memo(question)
+        if memoized is not None:
+            SQL_QUERY_SECONDS.observe(time.perf_counter() - start, source="memo", outcome="ok")
+            return memoized
+
         try:
             logger.info(f"Agent processing question: {question}")
 
@@ -480,41 +746,16 @@ Thought: I should write a SQL query to answer this question.
             # Try to extract structured data from agent observations
             for action, observation in intermediate_steps:
                 if isinstance(observation, str) and ("[" in observation):
-                    # Observation contains structured data (list of tuples or dicts)
-                    try:
-                        import ast
-                        parsed = ast.literal_eval(observation)
-
-                        # Convert to list if single item
-                        if not isinstance(parsed, list):
-                            parsed = [parsed]
-
-                        # Convert tuples to dictionaries if needed
-                        if parsed and isinstance(parsed[0], tuple):
-                            # Extract column names from SQL query
-                            column_names = self._extract_column_names_from_sql(sql_query) if sql_query else []
-
-                            if column_names and len(column_names) == len(parsed[0]):
-                                # Convert tuples to dicts using extracted column names
-                                results = [dict(zip(column_names, row)) for row in parsed]
-                                # If single result, unwrap list to dict for consistency
-                                if len(results) == 1 and sql_query and "LIMIT 1" in sql_query.upper():
-                                    results = results[0]
-                            else:
-                                # Can't determine columns reliably, store as tuples
-                                # This will be caught by validation
-                                results = parsed
-                        elif parsed and isinstance(parsed[0], dict):
-                            results = parsed
-                            # If single result, unwrap list to dict for consistency
-                            if len(results) == 1 and sql_query and "LIMIT 1" in sql_query.upper():
-                                results = results[0]
-                        else:
-                            results = parsed
-                    except:
-                        # If parsing fails, observation might be a formatted string
-                        pass
+                    parsed = self._parse_observation(observation, sql_query)
+                    if parsed is not None:
+                        results = parsed
 
+            # Observed before memoizing, which embeds the question and would inflate the latency
+            SQL_QUERY_SECONDS.observe(time.perf_counter() - start, source="agent", outcome="ok")
+            SQL_AGENT_STEPS.observe(len(intermediate_steps))
+
+            if self.sql_memo is not None and sql_query and results:
+                self._remember(question, sql_query)
             return {
                 "question": question,
                 "sql": sql_query,
@@ -525,6 +766,7 @@ Thought: I should write a SQL query to answer this question.
             }
 
         except Exception as e:
+            SQL_QUERY_SECONDS.observe(time.perf_counter() - start, source="agent", outcome="error")
             logger.error(f"Agent query failed: {e}", exc_info=True)
             return {
                 "question": question,
@@ -535,6 +777,111 @@ Thought: I should write a SQL query to answer this question.
                 "agent_steps": 0,
             }
 
+    def _query_from_memo(self, question: str) -> dict[str, Any] | None:
+        """Answer a near-duplicate question with memoized SQL, skipping the agent.
+
+        Args:
+            question: Natural language question
+
+        Returns:
+            Result dict in the same shape as query(), or None on a miss or
+            if the memoized SQL no longer executes cleanly
+        """
+        if self.sql_memo is None:
+            return None
+
+        try:
+            hit = self.sql_memo.lookup(question)
+        except Exception as e:
+            logger.warning(f"SQL memo lookup failed, falling back to agent: {e}")
+            return None
+
+        CACHE_REQUESTS.inc(cache="sql_memo", result="miss" if hit is None else "hit")
+        if hit is None:
+            return None
+
+        sql_query = hit.entry.sql
+        try:
+            # SecureSQLDatabase.run() re-validates before execution
+            observation = self.db.run(sql_query)
+        except Exception as e:
+            logger.warning(f"Memoized SQL failed, falling back to agent: {e}")
+            return None
+
+        results = []
+        if isinstance(observation, str) and ("[" in observation):
+            parsed = self._parse_observation(observation, sql_query)
+            if parsed is not None:
+                results = parsed
+
+        if not results:
+            return None
+
+        return {
+            "question": question,
+            "sql": sql_query,
+            "results": results,
+            "answer": _summarize_results(results),
+            "error": None,
+            "agent_steps": 0,
+            "memo_similarity": round(hit.similarity, 4),
+        }
+
+    def _remember(self, question: str, sql_query: str) -> None:
+        """Memoize a successful question→SQL pair (never fails the query)."""
+        if not sql_query.strip().upper().startswith(("SELECT", "WITH")):
+            # Last SQL-tool input was schema exploration, not the answering query
+            return
+        try:
+            self._validate_sql_security(sql_query)
+            self.sql_memo.add(question, sql_query, source="production")
+        except Exception as e:
+            logger.warning(f"Failed to memoize SQL: {e}")
+
+    def _parse_observation(self, observation: str, sql_query: str | None) -> Any:
+        """Parse a SQL tool observation into structured results.
+
+        Args:
+            observation: Raw observation string (repr of list of tuples/dicts)
+            sql_query: SQL that produced it (used for column names)
+
+        Returns:
+            List of dicts (or a single dict for LIMIT 1), raw parsed data if
+            columns can't be determined, or None if the observation isn't parseable
+        """
+        try:
+            import ast
+            parsed = ast.literal_eval(observation)
+        except Exception:
+            # If parsing fails, observation might be a formatted string
+            return None
+
+        # Convert to list if single item
+        if not isinstance(parsed, list):
+            parsed = [parsed]
+
+        # Convert tuples to dictionaries if needed
+        if parsed and isinstance(parsed[0], tuple):
+            # Extract column names from SQL query
+            column_names = self._extract_column_names_from_sql(sql_query) if sql_query else []
+
+            if column_names and len(column_names) == len(parsed[0]):
+                # Convert tuples to dicts using extracted column names
+                results = [dict(zip(column_names, row)) for row in parsed]
+                # If single result, unwrap list to dict for consistency
+                if len(results) == 1 and sql_query and "LIMIT 1" in sql_query.upper():
+                    return results[0]
+                return results
+            # Can't determine columns reliably, store as tuples
+            # This will be caught by validation
+            return parsed
+        if parsed and isinstance(parsed[0], dict):
+            # If single result, unwrap list to dict for consistency
+            if len(parsed) == 1 and sql_query and "LIMIT 1" in sql_query.upper():
+                return parsed[0]
+            return parsed
+        return parsed
+
     @staticmethod
     def _extract_column_names_from_sql(sql: str) -> list[str]:
         """Extract column names from SELECT statement.
@@ -8,13 +8,21 @@ MAINTAINER: Shahu
 
 import logging
 import requests
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from dataclasses import dataclass, asdict
 
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Must match src.repositories.pagination.NEXT_CURSOR_HEADER (not imported:
+# the UI only talks to the API over HTTP)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Per-session client id; the API rate-limits each UI session separately
+# (honoured because the UI calls the API from a trusted proxy address)
+CLIENT_ID_HEADER = "X-Client-Id"
+
 
 @dataclass
 class ChatRequest:
@@ -25,6 +33,8 @@ class ChatRequest:
     include_sources: bool = True
     conversation_id: Optional[str] = None
     turn_number: Optional[int] = None
+    fields: Optional[list[str]] = None
+    include_visualization_html: bool = False
 
 
 class APIClient:
@@ -34,13 +44,20 @@ class APIClient:
     All processing happens on the API server, not in Streamlit.
     """
 
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        client_id_fn: Optional[Callable[[], Optional[str]]] = None,
+    ):
         """Initialize API client.
 
         Args:
             base_url: Base URL of the API server (default: localhost:8000, set to 8000 for standard port)
+            client_id_fn: Returns the current user session's id, sent as X-Client-Id
+                (the client is shared by all sessions, so the id is looked up per request)
         """
         self.base_url = base_url
+        self._client_id_fn = client_id_fn
         self.timeout = 60  # 60 second timeout for long queries
         logger.info(f"APIClient initialized with base_url: {base_url}")
 
@@ -55,17 +72,49 @@ class APIClient:
         Returns:
             Parsed JSON response
 
+        Raises:
+            requests.exceptions.RequestException: If request fails
+        """
+        return self._send(method, endpoint, **kwargs).json()
+
+    def _get_page(self, endpoint: str, params: dict) -> tuple[list[dict], Optional[str]]:
+        """GET one page of a cursor-paginated listing.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters (including cursor, if any)
+
+        Returns:
+            (items, cursor for the next page or None on the last page)
+        """
+        response = self._send("GET", endpoint, params=params)
+        return response.json(), response.headers.get(NEXT_CURSOR_HEADER)
+
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Send HTTP request to API and raise on error status.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path (e.g., "/api/v1/chat")
+            **kwargs: Additional arguments to pass to requests
+
+        Returns:
+            HTTP response
+
         Raises:
             requests.exceptions.RequestException: If request fails
         """
         url = f"{self.base_url}{endpoint}"
         kwargs.setdefault("timeout", self.timeout)
+        client_id = self._client_id_fn() if self._client_id_fn else None
+        if client_id:
+            kwargs["headers"] = {CLIENT_ID_HEADER: client_id, **kwargs.get("headers", {})}
 
         try:
             logger.info(f"{method} {endpoint}")
             response = requests.request(method, url, **kwargs)
             response.raise_for_status()
-            return response.json()
+            return response
         except requests.exceptions.Timeout:
             logger.error(f"Request timeout for {endpoint}")
             raise
@@ -185,6 +234,32 @@ class APIClient:
             params=params,
         )
 
+    def list_conversations_page(
+        self,
+        status: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[dict], Optional[str]]:
+        """List one page of conversations using keyset (cursor) pagination.
+
+        Every page costs the same, however deep, unlike offset paging.
+
+        Args:
+            status: Filter by conversation status
+            limit: Page size
+            cursor: Cursor returned with the previous page (None for the first page)
+
+        Returns:
+            (ConversationResponse dicts, cursor for the next page or None)
+        """
+        logger.info(f"Listing conversations page (limit={limit})")
+        params = {"limit": limit}
+        if status:
+            params["status"] = status
+        if cursor:
+            params["cursor"] = cursor
+        return self._get_page("/api/v1/conversations", params)
+
     def get_conversation_history(self, conversation_id: str) -> dict:
         """Get conversation with all messages.
 
@@ -386,6 +461,26 @@ class APIClient:
             params={"limit": limit, "offset": offset},
         )
 
+    def get_recent_interactions_page(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[dict], Optional[str]]:
+        """Get one page of recent interactions using keyset (cursor) pagination.
+
+        Args:
+            limit: Page size
+            cursor: Cursor returned with the previous page (None for the first page)
+
+        Returns:
+            (ChatInteractionResponse dicts, cursor for the next page or None)
+        """
+        logger.info(f"Getting recent interactions page (limit={limit})")
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        return self._get_page("/api/v1/feedback/interactions", params)
+
     def get_interaction(self, interaction_id: str) -> dict:
         """Get specific interaction by ID.
 
@@ -419,13 +514,18 @@ class APIClient:
         """Check if API is ready to serve requests.
 
         Returns:
-            Dict with ready boolean
+            Dict with ready boolean (the API answers 503 while not ready)
         """
         logger.info("Readiness check...")
-        return self._make_request(
-            "GET",
-            "/ready",
-        )
+        try:
+            return self._make_request(
+                "GET",
+                "/ready",
+            )
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 503:
+                return e.response.json()
+            raise
 
     def liveness_check(self) -> dict:
         """Check if API is alive.
@@ -8,6 +8,7 @@ MAINTAINER: Shahu
 
 import logging
 import sys
+import uuid
 from pathlib import Path
 
 import streamlit as st
@@ -56,6 +57,13 @@ def get_cached_health_status(_client: APIClient) -> dict:
     return _client.health_check()
 
 
+def get_session_client_id() -> str:
+    """Random id of the current browser session (rate-limit identity at the API)."""
+    if "client_id" not in st.session_state:
+        st.session_state.client_id = uuid.uuid4().hex
+    return st.session_state.client_id
+
+
 @st.cache_resource
 def get_api_client() -> APIClient:
     """Get cached API client for HTTP communication with backend.
@@ -64,7 +72,7 @@ def get_api_client() -> APIClient:
         Initialized APIClient
     """
     logger.info("Initializing API client...")
-    return APIClient()
+    return APIClient(client_id_fn=get_session_client_id)
 
 
 def render_message(role: str, content: str) -> None:
@@ -2,12 +2,14 @@
 FILE: 1_📊_Logs.py
 STATUS: Active
 RESPONSIBILITY: Streamlit page for viewing and filtering application logs
-LAST MAJOR UPDATE: 2026-02-16
+LAST MAJOR UPDATE: 2026-10-18
 MAINTAINER: Shahu
 """
 
-import json
+import sqlite3
 import sys
+import time
+from collections import deque
 from pathlib import Path
 
 import streamlit as st
@@ -17,7 +19,11 @@ project_root = Path(__file__).parent.parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from src.core.logging_config import get_recent_logs
+from src.core.logging_config import LogFollower, get_recent_logs
+from src.repositories.log_index import LogSearchIndex
+
+# Most entries the slider can show (and the follow buffer keeps)
+MAX_LINES = 500
 
 st.set_page_config(
     page_title="Application Logs",
@@ -48,11 +54,18 @@ level_filter = st.sidebar.selectbox(
 )
 
 # Number of lines
-num_lines = st.sidebar.slider("Number of lines", 10, 500, 100)
+num_lines = st.sidebar.slider("Number of lines", 10, MAX_LINES, 100)
 
 # Search filter
 search_query = st.sidebar.text_input("Search in messages", "")
 
+# Search the rotated backups too, through the SQLite full-text index
+use_index = st.sidebar.checkbox(
+    "Search all rotated files (indexed)",
+    value=False,
+    help="Indexes new lines of the file and its backups (.1, .2, ...) on each refresh",
+)
+
 # Auto-refresh
 auto_refresh = st.sidebar.checkbox("Auto-refresh (every 5s)", value=False)
 
@@ -60,23 +73,56 @@ auto_refresh = st.sidebar.checkbox("Auto-refresh (every 5s)", value=False)
 if st.sidebar.button("🔄 Refresh Now"):
     st.rerun()
 
-# Auto-refresh logic
-if auto_refresh:
-    st.empty()  # Clear previous content
-    import time
-    time.sleep(5)
-    st.rerun()
+
+@st.cache_resource
+def get_log_index() -> LogSearchIndex | None:
+    """Shared log index (None when SQLite lacks FTS5)."""
+    try:
+        return LogSearchIndex(Path("logs") / "log_index.db")
+    except sqlite3.OperationalError:
+        return None
+
+
+def follow_logs(path: str) -> list[dict]:
+    """Entries of the followed file: only bytes appended since the last rerun are read."""
+    state = st.session_state.get("log_follow")
+    if state is None or state["file"] != path:
+        state = {
+            "file": path,
+            "follower": LogFollower(path, initial_lines=MAX_LINES),
+            "buffer": deque(maxlen=MAX_LINES),
+        }
+        st.session_state["log_follow"] = state
+    state["buffer"].extend(state["follower"].read())
+    return list(state["buffer"])
+
 
 # Fetch logs
 level = None if level_filter == "All" else level_filter
 search = search_query if search_query else None
 
-logs = get_recent_logs(
-    log_file=log_file,
-    lines=num_lines,
-    level=level,
-    search=search,
-)
+log_index = get_log_index() if use_index else None
+if use_index and log_index is None:
+    st.sidebar.warning("SQLite FTS5 is unavailable; searching the current file only.")
+
+if log_index is not None:
+    log_index.update(log_file)
+    # Oldest first, like get_recent_logs
+    logs = log_index.search(text=search, level=level, log_file=log_file, limit=num_lines)[::-1]
+elif auto_refresh:
+    logs = [
+        log
+        for log in follow_logs(log_file)
+        if (not level or log.get("level") == level)
+        and (not search or search.lower() in log.get("message", "").lower())
+    ][-num_lines:]
+else:
+    logs = get_recent_logs(
+        log_file=log_file,
+        lines=num_lines,
+        level=level,
+        search=search,
+    )
 
 # Display summary
 col1, col2, col3, col4 = st.columns(4)
@@ -156,3 +202,8 @@ st.caption(
     f"Viewing {len(logs)} logs from `{log_file}` | "
     f"Auto-refresh: {'ON' if auto_refresh else 'OFF'}"
 )
+
+# Auto-refresh after rendering (the next run follows on from the stored offsets)
+if auto_refresh:
+    time.sleep(5)
+    st.rerun()
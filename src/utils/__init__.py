@@ -3,24 +3,21 @@
 This module contains document loading utilities.
 Configuration has moved to src.core.config.
 Vector store has moved to src.repositories.vector_store.
+
+Exports are resolved on first access (the loaders pull in pandas and OCR).
 """
 
-from src.utils.data_loader import (
-    download_and_extract_zip,
-    extract_text_from_csv,
-    extract_text_from_docx,
-    extract_text_from_excel,
-    extract_text_from_pdf,
-    extract_text_from_txt,
-    load_and_parse_files,
-)
+from src.core.lazy import lazy_exports
+
+_EXPORTS = {
+    "download_and_extract_zip": "src.utils.data_loader",
+    "extract_text_from_csv": "src.utils.data_loader",
+    "extract_text_from_docx": "src.utils.data_loader",
+    "extract_text_from_excel": "src.utils.data_loader",
+    "extract_text_from_pdf": "src.utils.data_loader",
+    "extract_text_from_txt": "src.utils.data_loader",
+    "load_and_parse_files": "src.utils.data_loader",
+}
 
-__all__ = [
-    "download_and_extract_zip",
-    "extract_text_from_csv",
-    "extract_text_from_docx",
-    "extract_text_from_excel",
-    "extract_text_from_pdf",
-    "extract_text_from_txt",
-    "load_and_parse_files",
-]
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(__name__, _EXPORTS)
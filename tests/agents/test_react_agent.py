@@ -3,8 +3,10 @@ Unit tests for ReAct agent (refactored version)
 Tests the classification-based, single-pass agent architecture.
 """
 
+import asyncio
+
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 from src.agents.react_agent import ReActAgent, Tool
 
 
@@ -190,3 +192,76 @@ class TestReActAgent:
 
         assert hasattr(agent, 'tool_results')
         assert isinstance(agent.tool_results, dict)
+
+
+class TestReActAgentAsync:
+    """Test the async pipeline (arun)."""
+
+    @staticmethod
+    def _async_client(answer: str) -> MagicMock:
+        client = MagicMock()
+        response = Mock()
+        response.text = answer
+        client.aio.models.generate_content = AsyncMock(return_value=response)
+        return client
+
+    async def test_arun_uses_async_client(self):
+        """Test arun awaits the async genai client and runs tools off the loop."""
+        client = self._async_client("Jokic scored 2071 points.")
+        sql_tool = Tool(
+            name="query_nba_database",
+            description="Query NBA database",
+            function=lambda question: {"sql": "SELECT 1", "results": [{"name": "Nikola Jokic"}]},
+            parameters={"question": "str"},
+        )
+        agent = ReActAgent(tools=[sql_tool], llm_client=client)
+        agent.classifier.aclassify = AsyncMock(return_value="sql_only")
+
+        result = await agent.arun("How many points did Jokic score?")
+
+        assert result["answer"].startswith("Jokic scored 2071 points.")
+        assert result["tools_used"] == ["query_nba_database"]
+        assert result["tool_results"]["query_nba_database"]["sql"] == "SELECT 1"
+        client.aio.models.generate_content.assert_awaited_once()
+        client.models.generate_content.assert_not_called()
+
+    async def test_arun_keeps_tool_results_per_call(self):
+        """Test concurrent arun calls on one agent don't share tool results."""
+        client = self._async_client("answer")
+        sql_tool = Tool(
+            name="query_nba_database",
+            description="Query NBA database",
+            function=lambda question: {"sql": question, "results": []},
+            parameters={"question": "str"},
+        )
+        agent = ReActAgent(tools=[sql_tool], llm_client=client)
+        agent.classifier.aclassify = AsyncMock(return_value="sql_only")
+
+        first, second = await asyncio.gather(agent.arun("first"), agent.arun("second"))
+
+        assert first["tool_results"]["query_nba_database"]["sql"] == "first"
+        assert second["tool_results"]["query_nba_database"]["sql"] == "second"
+        assert agent.tool_results == {}
+
+    async def test_arun_records_stage_metrics(self):
+        """Test arun feeds the run, tool and answer latency histograms."""
+        from src.core.metrics import AGENT_RUN_SECONDS, ANSWER_SECONDS, TOOL_SECONDS
+
+        client = self._async_client("answer")
+        sql_tool = Tool(
+            name="query_nba_database",
+            description="Query NBA database",
+            function=lambda question: {"sql": "SELECT 1", "results": [], "error": None},
+            parameters={"question": "str"},
+        )
+        agent = ReActAgent(tools=[sql_tool], llm_client=client)
+        agent.classifier.aclassify = AsyncMock(return_value="sql_only")
+        runs = AGENT_RUN_SECONDS.count(query_type="sql_only")
+        tools = TOOL_SECONDS.count(tool="query_nba_database", outcome="ok")
+        answers = ANSWER_SECONDS.count()
+
+        await agent.arun("How many points did Jokic score?")
+
+        assert AGENT_RUN_SECONDS.count(query_type="sql_only") == runs + 1
+        assert TOOL_SECONDS.count(tool="query_nba_database", outcome="ok") == tools + 1
+        assert ANSWER_SECONDS.count() == answers + 1
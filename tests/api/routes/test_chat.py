@@ -2,18 +2,21 @@
 FILE: test_chat.py
 STATUS: Active
 RESPONSIBILITY: Tests for chat API routes (POST /chat, GET /search)
-LAST MAJOR UPDATE: 2026-02-13
+LAST MAJOR UPDATE: 2026-10-18
 MAINTAINER: Shahu
 """
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from src.api.routes.chat import router
-from src.models.chat import ChatResponse, SearchResult
+from src.core.config import settings
+from src.core.exceptions import ValidationError
+from src.models.chat import ChatResponse, SearchResult, Visualization
 
 
 @pytest.fixture
@@ -34,7 +37,7 @@ def client(app):
 def mock_service():
     """Create a mock ChatService with default return values."""
     service = MagicMock()
-    service.chat.return_value = ChatResponse(
+    service.achat = AsyncMock(return_value=ChatResponse(
         answer="The Denver Nuggets won.",
         sources=[
             SearchResult(text="Nuggets defeated Heat", score=92.5, source="nba.pdf")
@@ -42,10 +45,10 @@ def mock_service():
         query="Who won the NBA?",
         processing_time_ms=150.0,
         model="test-model",
-    )
-    service.search.return_value = [
+    ))
+    service.asearch = AsyncMock(return_value=[
         SearchResult(text="Relevant chunk", score=85.0, source="doc.pdf")
-    ]
+    ])
     return service
 
 
@@ -62,7 +65,7 @@ class TestChatEndpoint:
         assert "answer" in data
         assert "sources" in data
         assert data["query"] == "Who won the NBA?"
-        mock_service.chat.assert_called_once()
+        mock_service.achat.assert_awaited_once()
 
     def test_chat_empty_query_rejected(self, client, mock_service):
         """POST /chat with empty query returns 422 validation error."""
@@ -78,6 +81,227 @@ class TestChatEndpoint:
 
         assert response.status_code == 422
 
+    def test_chat_queue_full_returns_429(self, client, mock_service):
+        """POST /chat is rejected immediately when every slot and queue place is taken."""
+        from src.api.routes.chat import ChatAdmission
+        from src.core.exceptions import RateLimitError
+
+        admission = ChatAdmission(max_concurrency=1, max_queue=0, retry_after=7)
+        admission._semaphore = asyncio.Semaphore(0)
+        with patch("src.api.routes.chat.get_chat_service", return_value=mock_service), \
+             patch("src.api.routes.chat._get_chat_admission", return_value=admission):
+            with pytest.raises(RateLimitError) as exc_info:
+                client.post("/chat", json={"query": "Who won the NBA?"})
+
+        assert exc_info.value.retry_after == 7
+        mock_service.achat.assert_not_called()
+
+
+class TestChatResponseShaping:
+    """Tests for include_sources / fields / include_visualization_html on POST /chat."""
+
+    @pytest.fixture
+    def viz_service(self, mock_service):
+        """Service whose response carries a visualization."""
+        mock_service.achat.return_value = mock_service.achat.return_value.model_copy(
+            update={
+                "visualization": Visualization(
+                    pattern="top_n", viz_type="horizontal_bar", plot_json="{}", plot_html="<div></div>"
+                )
+            }
+        )
+        return mock_service
+
+    def test_include_sources_false_drops_sources(self, client, mock_service):
+        """include_sources=False omits the source chunks."""
+        with patch("src.api.routes.chat.get_chat_service", return_value=mock_service):
+            response = client.post("/chat", json={"query": "Who won?", "include_sources": False})
+
+        assert response.status_code == 200
+        assert "sources" not in response.json()
+        assert response.json()["answer"] == "The Denver Nuggets won."
+
+    def test_fields_projection(self, client, mock_service):
+        """fields returns only the requested top-level keys."""
+        with patch("src.api.routes.chat.get_chat_service", return_value=mock_service):
+            response = client.post("/chat", json={"query": "Who won?", "fields": ["answer", "query"]})
+
+        assert response.json() == {"answer": "The Denver Nuggets won.", "query": "Who won the NBA?"}
+
+    def test_unknown_field_rejected(self, client, mock_service):
+        """fields naming something ChatResponse doesn't have returns 422."""
+        with patch("src.api.routes.chat.get_chat_service", return_value=mock_service):
+            response = client.post("/chat", json={"query": "Who won?", "fields": ["answer", "bogus"]})
+
+        assert response.status_code == 422
+        mock_service.achat.assert_not_called()
+
+    def test_plot_html_only_on_demand(self, client, viz_service):
+        """visualization.plot_html is omitted unless include_visualization_html is set."""
+        with patch("src.api.routes.chat.get_chat_service", return_value=viz_service):
+            default = client.post("/chat", json={"query": "Top scorers?"}).json()
+            with_html = client.post(
+                "/chat", json={"query": "Top scorers?", "include_visualization_html": True}
+            ).json()
+
+        assert "plot_html" not in default["visualization"]
+        assert default["visualization"]["plot_json"] == "{}"
+        assert with_html["visualization"]["plot_html"] == "<div></div>"
+
+    def test_plot_html_rendered_lazily_from_figure_cache(self, client, mock_service):
+        """include_visualization_html renders the cached figure without mutating the shared response."""
+        shared = mock_service.achat.return_value.model_copy(
+            update={
+                "visualization": Visualization(
+                    pattern="top_n", viz_type="horizontal_bar", plot_json="{}", figure_id="abc123"
+                )
+            }
+        )
+        mock_service.achat.return_value = shared
+        mock_service.visualization_service.render_html.return_value = "<div id=\"viz\"></div>"
+        with patch("src.api.routes.chat.get_chat_service", return_value=mock_service):
+            default = client.post("/chat", json={"query": "Top scorers?"}).json()
+            with_html = client.post(
+                "/chat", json={"query": "Top scorers?", "include_visualization_html": True}
+            ).json()
+
+        assert default["visualization"]["figure_id"] == "abc123"
+        assert "plot_html" not in default["visualization"]
+        assert with_html["visualization"]["plot_html"] == "<div id=\"viz\"></div>"
+        mock_service.visualization_service.render_html.assert_called_once_with("abc123")
+        assert shared.visualization.plot_html is None
+
+    def test_batch_lines_are_shaped_per_request(self, client, mock_service):
+        """Each batch line follows the shaping options of its own request."""
+        import json
+
+        async def achat_batch(requests, max_concurrency, slot=None):
+            yield 0, mock_service.achat.return_value
+            yield 1, mock_service.achat.return_value
+
+        mock_service.achat_batch = achat_batch
+        with patch("src.api.routes.chat.get_chat_service", return_value=mock_service):
+            response = client.post(
+                "/chat/batch",
+                json={"requests": [{"query": "Who won?", "fields": ["answer"]}, {"query": "Who won?"}]},
+            )
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0]["response"] == {"answer": "The Denver Nuggets won."}
+        assert "sources" in lines[1]["response"]
+
+    def test_fast_json_response_matches_stdlib(self):
+        """json_dumps produces the same document as the stdlib encoder."""
+        import json
+
+        from src.api.responses import json_dumps
+
+        content = {"answer": "Jokić – 30 pts", "score": 92.5, "items": [1, None, True]}
+        assert json.loads(json_dumps(content)) == content
+
+
+class TestChatBatchEndpoint:
+    """Tests for POST /chat/batch endpoint."""
+
+    def test_batch_streams_ndjson(self, client, mock_service):
+        """POST /chat/batch streams one line per request, errors included."""
+        import json
+
+        from src.core.exceptions import LLMError
+
+        async def achat_batch(requests, max_concurrency, slot=None):
+            yield 1, LLMError("Agent failed: boom")
+            yield 0, mock_service.achat.return_value
+
+        mock_service.achat_batch = achat_batch
+        with patch("src.api.routes.chat.get_chat_service", return_value=mock_service):
+            response = client.post(
+                "/chat/batch",
+                json={"requests": [{"query": "Who won?"}, {"query": "Who lost?"}]},
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0] == {"index": 1, "error": {"code": "LLM_ERROR", "message": "Agent failed: boom", "details": {}}}
+        assert lines[1]["index"] == 0
+        assert lines[1]["response"]["answer"] == "The Denver Nuggets won."
+
+    def test_batch_requests_use_chat_admission(self, client, mock_service):
+        """Each batch request is admitted through the /chat admission limiter."""
+        seen = {}
+
+        async def achat_batch(requests, max_concurrency, slot=None):
+            seen["slot"] = slot
+            yield 0, mock_service.achat.return_value
+
+        mock_service.achat_batch = achat_batch
+        with patch("src.api.routes.chat.get_chat_service", return_value=mock_service):
+            client.post("/chat/batch", json={"requests": [{"query": "Who won?"}]})
+
+        from src.api.routes.chat import _get_chat_admission
+
+        assert seen["slot"] == _get_chat_admission().slot
+
+    def test_batch_size_capped_at_chat_bucket(self, client, mock_service):
+        """A batch may hold as many requests as the /chat bucket, not one more."""
+        async def achat_batch(requests, max_concurrency, slot=None):
+            for index in range(len(requests)):
+                yield index, mock_service.achat.return_value
+
+        mock_service.achat_batch = achat_batch
+        limit = settings.chat_batch_max_requests
+        with patch("src.api.routes.chat.get_chat_service", return_value=mock_service):
+            at_limit = client.post("/chat/batch", json={"requests": [{"query": "Who won?"}] * limit})
+            assert at_limit.status_code == 200
+            assert len(at_limit.text.splitlines()) == limit
+
+            with pytest.raises(ValidationError, match=f"the maximum is {limit}"):
+                client.post("/chat/batch", json={"requests": [{"query": "Who won?"}] * (limit + 1)})
+
+    def test_batch_empty_rejected(self, client, mock_service):
+        """POST /chat/batch with no requests returns 422."""
+        with patch("src.api.routes.chat.get_chat_service", return_value=mock_service):
+            response = client.post("/chat/batch", json={"requests": []})
+
+        assert response.status_code == 422
+
+
+class TestChatAdmission:
+    """Tests for the /chat concurrency and wait-queue limiter."""
+
+    async def test_bounds_concurrency_and_queue(self):
+        """Requests beyond max_concurrency queue; beyond max_queue they are rejected."""
+        from src.api.routes.chat import ChatAdmission
+        from src.core.exceptions import RateLimitError
+
+        admission = ChatAdmission(max_concurrency=1, max_queue=1, retry_after=1)
+        release = asyncio.Event()
+        running = 0
+        peak = 0
+
+        async def request():
+            nonlocal running, peak
+            async with admission.slot():
+                running += 1
+                peak = max(peak, running)
+                await release.wait()
+                running -= 1
+
+        first = asyncio.create_task(request())
+        second = asyncio.create_task(request())
+        await asyncio.sleep(0)
+        assert admission.waiting == 1
+
+        with pytest.raises(RateLimitError):
+            async with admission.slot():
+                pass
+
+        release.set()
+        await asyncio.gather(first, second)
+        assert peak == 1
+        assert admission.waiting == 0
+
 
 class TestSearchEndpoint:
     """Tests for GET /search endpoint."""
@@ -92,7 +316,7 @@ class TestSearchEndpoint:
         assert isinstance(data, list)
         assert len(data) == 1
         assert data[0]["source"] == "doc.pdf"
-        mock_service.search.assert_called_once()
+        mock_service.asearch.assert_awaited_once()
 
     def test_search_custom_k_parameter(self, client, mock_service):
         """GET /search respects custom k parameter."""
@@ -100,6 +324,20 @@ class TestSearchEndpoint:
             response = client.get("/search", params={"query": "test", "k": 10})
 
         assert response.status_code == 200
-        mock_service.search.assert_called_once_with(query="test", k=10, min_score=None)
+        mock_service.asearch.assert_awaited_once_with(query="test", k=10, min_score=None)
+
+    def test_search_saturated_returns_429(self, client, mock_service):
+        """GET /search returns 429 when no concurrency slot frees up in time."""
+        from src.core.exceptions import RateLimitError
+
+        semaphore = asyncio.Semaphore(0)
+        with patch("src.api.routes.chat.get_chat_service", return_value=mock_service), \
+             patch("src.api.routes.chat._get_search_semaphore", return_value=semaphore), \
+             patch("src.api.routes.chat.settings") as mock_settings:
+            mock_settings.search_queue_timeout = 0.01
+            with pytest.raises(RateLimitError):
+                client.get("/search", params={"query": "test"})
+
+        mock_service.asearch.assert_not_called()
 
 
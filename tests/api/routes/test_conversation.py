@@ -14,6 +14,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from pydantic import ValidationError
 
+from src.api.routes import conversation as conversation_routes
 from src.api.routes.conversation import router
 from src.models.conversation import (
     ConversationCreate,
@@ -186,3 +187,97 @@ class TestConversationRoutes:
             response = client.delete("/conversations/nonexistent-id")
 
         assert response.status_code == 404
+
+    def test_delete_forgets_buffered_history(self, client, mock_conv_response):
+        """DELETE /conversations/{id} drops the conversation from the chat history buffer."""
+        mock_service = MagicMock()
+        mock_service.delete.return_value = mock_conv_response
+        chat_service = MagicMock()
+
+        with patch(
+            "src.api.routes.conversation.get_conversation_service",
+            return_value=mock_service,
+        ), patch("src.api.routes.conversation.get_chat_service", return_value=chat_service):
+            response = client.delete("/conversations/conv-001")
+
+        assert response.status_code == 200
+        chat_service.forget_conversation.assert_called_once_with("conv-001")
+
+    def test_archive_forgets_buffered_history(self, client, mock_conv_response):
+        """Archiving via PUT drops the conversation from the chat history buffer."""
+        mock_service = MagicMock()
+        mock_service.repository.update_conversation.return_value = mock_conv_response
+        chat_service = MagicMock()
+
+        with patch(
+            "src.api.routes.conversation.get_conversation_service",
+            return_value=mock_service,
+        ), patch("src.api.routes.conversation.get_chat_service", return_value=chat_service):
+            client.put("/conversations/conv-001", json={"title": "Renamed"})
+            chat_service.forget_conversation.assert_not_called()
+            response = client.put("/conversations/conv-001", json={"status": "archived"})
+
+        assert response.status_code == 200
+        chat_service.forget_conversation.assert_called_once_with("conv-001")
+
+    def test_delete_without_chat_service(self, client, mock_conv_response):
+        """Deleting works before the chat service is started (nothing is buffered)."""
+        mock_service = MagicMock()
+        mock_service.delete.return_value = mock_conv_response
+
+        with patch(
+            "src.api.routes.conversation.get_conversation_service",
+            return_value=mock_service,
+        ), patch(
+            "src.api.routes.conversation.get_chat_service",
+            side_effect=RuntimeError("Chat service not initialized"),
+        ):
+            response = client.delete("/conversations/conv-001")
+
+        assert response.status_code == 200
+
+
+class TestGetConversationService:
+    """The conversation service is built once and reused."""
+
+    def test_service_reused_across_calls(self):
+        with patch("src.api.routes.conversation._conversation_service", None), patch(
+            "src.api.routes.conversation.ConversationRepository"
+        ) as mock_repo_cls:
+            first = conversation_routes.get_conversation_service()
+            second = conversation_routes.get_conversation_service()
+
+        assert first is second
+        mock_repo_cls.assert_called_once_with()
+
+
+class TestListConversationsCursor:
+    """Keyset pagination of GET /conversations."""
+
+    def test_full_page_returns_next_cursor(self, client, mock_conv_response):
+        mock_service = MagicMock()
+        mock_service.list_conversations.return_value = [mock_conv_response]
+
+        with patch(
+            "src.api.routes.conversation.get_conversation_service",
+            return_value=mock_service,
+        ):
+            first = client.get("/conversations?limit=1")
+            cursor = first.headers["X-Next-Cursor"]
+            client.get(f"/conversations?limit=1&cursor={cursor}")
+
+        mock_service.list_conversations.assert_called_with(
+            status=None, limit=1, offset=0, cursor=cursor
+        )
+
+    def test_partial_page_has_no_cursor(self, client, mock_conv_response):
+        mock_service = MagicMock()
+        mock_service.list_conversations.return_value = [mock_conv_response]
+
+        with patch(
+            "src.api.routes.conversation.get_conversation_service",
+            return_value=mock_service,
+        ):
+            response = client.get("/conversations?limit=5")
+
+        assert "X-Next-Cursor" not in response.headers
@@ -318,7 +318,7 @@ class TestGetInteractions:
         assert len(data) == 1
         assert data[0]["id"] == "int-123"
 
-        mock_feedback_service.get_recent_interactions.assert_called_once_with(limit=50, offset=0)
+        mock_feedback_service.get_recent_interactions.assert_called_once_with(limit=50, offset=0, cursor=None)
 
     def test_get_interactions_custom_pagination(self, test_client, mock_feedback_service):
         """Test getting interactions with custom limit and offset."""
@@ -327,7 +327,25 @@ class TestGetInteractions:
         response = test_client.get("/feedback/interactions?limit=10&offset=20")
 
         assert response.status_code == status.HTTP_200_OK
-        mock_feedback_service.get_recent_interactions.assert_called_once_with(limit=10, offset=20)
+        mock_feedback_service.get_recent_interactions.assert_called_once_with(limit=10, offset=20, cursor=None)
+
+    def test_get_interactions_next_cursor_header(self, test_client, mock_feedback_service, sample_interaction):
+        """Test a full page returns a cursor that is passed back for the next page."""
+        mock_feedback_service.get_recent_interactions.return_value = [sample_interaction]
+
+        response = test_client.get("/feedback/interactions?limit=1")
+        cursor = response.headers["X-Next-Cursor"]
+        test_client.get(f"/feedback/interactions?limit=1&cursor={cursor}")
+
+        mock_feedback_service.get_recent_interactions.assert_called_with(limit=1, offset=0, cursor=cursor)
+
+    def test_get_interactions_last_page_has_no_cursor(self, test_client, mock_feedback_service, sample_interaction):
+        """Test a partial page has no next cursor."""
+        mock_feedback_service.get_recent_interactions.return_value = [sample_interaction]
+
+        response = test_client.get("/feedback/interactions?limit=5")
+
+        assert "X-Next-Cursor" not in response.headers
 
     def test_get_interactions_limit_exceeds_max(self, test_client, mock_feedback_service):
         """Test getting interactions with limit exceeding max (100)."""
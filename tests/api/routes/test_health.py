@@ -2,15 +2,21 @@
 FILE: test_health.py
 STATUS: Active
 RESPONSIBILITY: Unit tests for health check endpoints
-LAST MAJOR UPDATE: 2026-02-11
+LAST MAJOR UPDATE: 2026-10-18
 MAINTAINER: Shahu
 """
 
 from unittest.mock import MagicMock, patch
 
 import pytest
+from fastapi import Response
 
-from src.api.routes.health import health_check, liveness_check, readiness_check
+from src.api.routes.health import (
+    health_check,
+    interaction_writer_stats,
+    liveness_check,
+    readiness_check,
+)
 
 
 class TestHealthCheck:
@@ -56,18 +62,61 @@ class TestReadinessCheck:
     async def test_ready_when_service_is_ready(self, mock_get_service):
         mock_service = MagicMock()
         mock_service.is_ready = True
+        mock_service.is_degraded = False
         mock_get_service.return_value = mock_service
 
-        result = await readiness_check()
-        assert result == {"ready": True}
+        response = Response()
+        result = await readiness_check(response)
+        assert result["ready"] is True
+        assert response.status_code == 200
 
     @pytest.mark.asyncio
     @patch("src.api.routes.health.get_chat_service")
     async def test_not_ready_when_service_fails(self, mock_get_service):
         mock_get_service.side_effect = RuntimeError("boom")
 
-        result = await readiness_check()
-        assert result == {"ready": False}
+        response = Response()
+        result = await readiness_check(response)
+        assert result["ready"] is False
+        assert response.status_code == 503
+
+    @pytest.mark.asyncio
+    @patch("src.api.routes.health.get_chat_service")
+    async def test_not_ready_until_warm_up_finishes(self, mock_get_service):
+        mock_service = MagicMock()
+        mock_service.is_ready = True
+        mock_service.is_warm = False
+        mock_service.is_degraded = False
+        mock_service.warm_up_report = {}
+        mock_get_service.return_value = mock_service
+
+        response = Response()
+        result = await readiness_check(response)
+        assert result == {"ready": False, "degraded": False, "warm_up": {}}
+        assert response.status_code == 503
+
+        mock_service.is_warm = True
+        mock_service.warm_up_report = {"agent": "ok (1200ms)"}
+        response = Response()
+        result = await readiness_check(response)
+        assert result == {"ready": True, "degraded": False, "warm_up": {"agent": "ok (1200ms)"}}
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    @patch("src.api.routes.health.get_chat_service")
+    async def test_degraded_warm_up_not_ready(self, mock_get_service):
+        mock_service = MagicMock()
+        mock_service.is_ready = True
+        mock_service.is_warm = True
+        mock_service.is_degraded = True
+        mock_service.warm_up_report = {"agent": "failed: LLMError: no key"}
+        mock_get_service.return_value = mock_service
+
+        response = Response()
+        result = await readiness_check(response)
+        assert result["ready"] is False
+        assert result["degraded"] is True
+        assert response.status_code == 503
 
 
 class TestLivenessCheck:
@@ -75,3 +124,15 @@ class TestLivenessCheck:
     async def test_always_returns_alive(self):
         result = await liveness_check()
         assert result == {"alive": True}
+
+
+class TestInteractionWriterStats:
+    @pytest.mark.asyncio
+    @patch("src.api.routes.health.get_chat_service")
+    async def test_returns_writer_stats(self, mock_get_service):
+        mock_service = MagicMock()
+        mock_service.interaction_writer.stats.return_value = {"queue_depth": 3, "dropped": 0}
+        mock_get_service.return_value = mock_service
+
+        result = await interaction_writer_stats()
+        assert result == {"queue_depth": 3, "dropped": 0}
@@ -0,0 +1,57 @@
+"""
+FILE: test_metrics.py
+STATUS: Active
+RESPONSIBILITY: Tests for the metrics API route (GET /metrics)
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes.metrics import router
+from src.core.metrics import CLASSIFICATIONS, QUEUE_DEPTH, REGISTRY
+
+
+@pytest.fixture
+def client():
+    """Create test client for an app with the metrics router."""
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Start each test from zeroed metrics."""
+    REGISTRY.reset()
+    yield
+    REGISTRY.reset()
+
+
+class TestMetricsEndpoint:
+    """Tests for GET /metrics."""
+
+    def test_returns_prometheus_text(self, client):
+        """Recorded metrics are rendered in the Prometheus text format."""
+        CLASSIFICATIONS.inc(path="heuristic", query_type="sql_only")
+        with patch("src.api.routes.metrics.get_chat_service", side_effect=RuntimeError("not initialized")):
+            response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE nba_query_classifications_total counter" in response.text
+        assert 'nba_query_classifications_total{path="heuristic",query_type="sql_only"} 1.0' in response.text
+
+    def test_samples_interaction_writer_queue_depth(self, client):
+        """The interaction writer's queue depth is sampled at scrape time."""
+        service = MagicMock()
+        service.interaction_writer.stats.return_value = {"queue_depth": 7}
+        with patch("src.api.routes.metrics.get_chat_service", return_value=service):
+            response = client.get("/metrics")
+
+        assert QUEUE_DEPTH.value(queue="interaction_writer") == 7
+        assert 'nba_queue_depth{queue="interaction_writer"} 7.0' in response.text
@@ -0,0 +1,74 @@
+"""
+FILE: test_visualization.py
+STATUS: Active
+RESPONSIBILITY: Tests for visualization API routes (GET /visualizations/{figure_id}, POST /visualizations)
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes.visualization import router
+
+
+@pytest.fixture
+def client():
+    """Create test client for an app with the visualization router."""
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+@pytest.fixture
+def mock_service():
+    """Create a mock ChatService exposing a visualization service."""
+    return MagicMock()
+
+
+class TestGetVisualizationHtml:
+    """Tests for GET /visualizations/{figure_id}."""
+
+    def test_returns_html(self, client, mock_service):
+        """A cached figure is returned as HTML."""
+        mock_service.visualization_service.render_html.return_value = "<div id=\"viz\"></div>"
+        with patch("src.api.routes.visualization.get_chat_service", return_value=mock_service):
+            response = client.get("/visualizations/abc123")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.text == "<div id=\"viz\"></div>"
+        mock_service.visualization_service.render_html.assert_called_once_with("abc123")
+
+    def test_unknown_figure_returns_404(self, client, mock_service):
+        """An unknown or evicted figure returns 404."""
+        mock_service.visualization_service.render_html.return_value = None
+        with patch("src.api.routes.visualization.get_chat_service", return_value=mock_service):
+            response = client.get("/visualizations/missing")
+
+        assert response.status_code == 404
+
+
+class TestRenderVisualizationHtml:
+    """Tests for POST /visualizations."""
+
+    def test_renders_posted_spec(self, client, mock_service):
+        """The posted spec is rendered without the figure cache."""
+        mock_service.visualization_service.render_spec_html.return_value = "<div id=\"viz\"></div>"
+        with patch("src.api.routes.visualization.get_chat_service", return_value=mock_service):
+            response = client.post("/visualizations", json={"plot_json": '{"data": []}'})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        mock_service.visualization_service.render_spec_html.assert_called_once_with('{"data": []}')
+        mock_service.visualization_service.render_html.assert_not_called()
+
+    def test_missing_spec_returns_422(self, client, mock_service):
+        """A body without plot_json is rejected."""
+        with patch("src.api.routes.visualization.get_chat_service", return_value=mock_service):
+            response = client.post("/visualizations", json={})
+
+        assert response.status_code == 422
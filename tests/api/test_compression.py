@@ -0,0 +1,44 @@
+"""
+FILE: test_compression.py
+STATUS: Active
+RESPONSIBILITY: Tests for response compression and its streaming bypass
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.api.compression import CompressionMiddleware
+
+
+def _make_client():
+    app = FastAPI()
+
+    @app.get("/api/v1/search")
+    async def search():
+        return PlainTextResponse("x" * 5000)
+
+    @app.post("/api/v1/chat/batch")
+    async def batch():
+        async def lines():
+            for i in range(3):
+                yield f'{{"index": {i}, "text": "{"x" * 2000}"}}\n'
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    app.add_middleware(CompressionMiddleware, minimum_size=1000)
+    return TestClient(app)
+
+
+class TestCompressionMiddleware:
+    def test_large_responses_compressed(self):
+        response = _make_client().get("/api/v1/search", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] in ("gzip", "br")
+        assert response.text == "x" * 5000
+
+    def test_ndjson_stream_not_compressed(self):
+        response = _make_client().post("/api/v1/chat/batch", headers={"Accept-Encoding": "gzip, br"})
+        assert "content-encoding" not in response.headers
+        assert len(response.text.splitlines()) == 3
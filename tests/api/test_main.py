@@ -2,7 +2,7 @@
 FILE: test_main.py
 STATUS: Active
 RESPONSIBILITY: Unit tests for FastAPI application creation and configuration
-LAST MAJOR UPDATE: 2026-02-11
+LAST MAJOR UPDATE: 2026-10-18
 MAINTAINER: Shahu
 """
 
@@ -18,6 +18,7 @@ class TestCreateApp:
     def test_create_app_returns_fastapi_instance(self, mock_settings, mock_chat_cls):
         mock_settings.app_title = "Test App"
         mock_settings.api_cors_origins = ["*"]
+        mock_settings.api_compression_min_size = 1000
 
         from src.api.main import create_app
 
@@ -30,6 +31,7 @@ class TestCreateApp:
     def test_create_app_includes_health_router(self, mock_settings, mock_chat_cls):
         mock_settings.app_title = "Test App"
         mock_settings.api_cors_origins = ["*"]
+        mock_settings.api_compression_min_size = 1000
 
         from src.api.main import create_app
 
@@ -42,6 +44,7 @@ class TestCreateApp:
     def test_create_app_includes_api_v1_prefix(self, mock_settings, mock_chat_cls):
         mock_settings.app_title = "Test App"
         mock_settings.api_cors_origins = ["*"]
+        mock_settings.api_compression_min_size = 1000
 
         from src.api.main import create_app
 
@@ -57,6 +60,7 @@ class TestExceptionHandlers:
     def test_generic_exception_returns_500(self, mock_settings, mock_chat_cls):
         mock_settings.app_title = "Test App"
         mock_settings.api_cors_origins = ["*"]
+        mock_settings.api_compression_min_size = 1000
 
         from src.api.main import create_app
 
@@ -71,3 +75,32 @@ class TestExceptionHandlers:
         assert response.status_code == 500
         data = response.json()
         assert data["error"]["code"] == "INTERNAL_ERROR"
+
+
+class TestCompression:
+    @patch("src.api.main.ChatService")
+    @patch("src.api.main.settings")
+    def test_large_responses_are_compressed(self, mock_settings, mock_chat_cls):
+        mock_settings.app_title = "Test App"
+        mock_settings.api_cors_origins = ["*"]
+        mock_settings.api_compression_min_size = 1000
+
+        from src.api.main import create_app
+
+        app = create_app()
+
+        @app.get("/test-large")
+        async def large():
+            return {"text": "x" * 5000}
+
+        @app.get("/test-small")
+        async def small():
+            return {"text": "x"}
+
+        client = TestClient(app)
+        large_response = client.get("/test-large", headers={"Accept-Encoding": "gzip"})
+        small_response = client.get("/test-small", headers={"Accept-Encoding": "gzip"})
+
+        assert large_response.headers["content-encoding"] == "gzip"
+        assert large_response.json() == {"text": "x" * 5000}
+        assert "content-encoding" not in small_response.headers
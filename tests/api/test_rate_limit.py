@@ -0,0 +1,234 @@
+"""
+FILE: test_rate_limit.py
+STATUS: Active
+RESPONSIBILITY: Tests for token-bucket stores and RateLimitMiddleware
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.rate_limit import (
+    MemoryBucketStore,
+    RateLimitMiddleware,
+    RouteLimit,
+    SQLiteBucketStore,
+    _digest,
+    client_key,
+)
+from src.core.exceptions import RateLimitError, ValidationError
+
+
+def _make_client(
+    store=None, route_limits=None, default=RouteLimit(100, 60), trusted_proxies=(), api_keys=()
+):
+    app = FastAPI()
+
+    @app.get("/ready")
+    async def ready():
+        return {"ok": True}
+
+    @app.post("/api/v1/chat")
+    async def chat():
+        return {"ok": True}
+
+    @app.get("/api/v1/search")
+    async def search():
+        return {"ok": True}
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        store=store or MemoryBucketStore(),
+        default_limit=default,
+        route_limits=route_limits if route_limits is not None else {"/api/v1/chat": 2},
+        enabled=True,
+        exempt_paths=["/ready"],
+        trusted_proxies=trusted_proxies,
+        api_keys=api_keys,
+    )
+    return TestClient(app)
+
+
+class TestMemoryBucketStore:
+    def test_allows_burst_then_rejects(self):
+        store = MemoryBucketStore()
+        limit = RouteLimit(3, 60)
+        assert [store.consume("c", limit)[0] for _ in range(4)] == [True, True, True, False]
+
+    def test_retry_after_reflects_refill_rate(self):
+        store = MemoryBucketStore()
+        limit = RouteLimit(1, 30)
+        store.consume("c", limit)
+        allowed, retry_after = store.consume("c", limit)
+        assert allowed is False
+        assert 1 <= retry_after <= 30
+
+    def test_refills_over_time(self):
+        store = MemoryBucketStore()
+        limit = RouteLimit(1, 10)
+        with patch("src.api.rate_limit.time.monotonic", side_effect=[100.0, 100.0, 111.0]):
+            assert store.consume("c", limit)[0] is True
+            assert store.consume("c", limit)[0] is False
+            assert store.consume("c", limit)[0] is True
+
+    def test_evicts_least_recent_bucket(self):
+        store = MemoryBucketStore(max_buckets=2)
+        limit = RouteLimit(1, 60)
+        for key in ("a", "b", "c"):
+            store.consume(key, limit)
+        # "a" was evicted, so it starts with a full bucket again
+        assert store.consume("a", limit)[0] is True
+        assert store.consume("c", limit)[0] is False
+
+
+class TestSQLiteBucketStore:
+    def test_buckets_shared_between_workers(self, tmp_path):
+        path = tmp_path / "rate_limits.db"
+        worker_a = SQLiteBucketStore(path)
+        worker_b = SQLiteBucketStore(path)
+        limit = RouteLimit(2, 60)
+        try:
+            assert worker_a.consume("c", limit)[0] is True
+            assert worker_b.consume("c", limit)[0] is True
+            allowed, retry_after = worker_a.consume("c", limit)
+            assert allowed is False
+            assert retry_after >= 1
+        finally:
+            worker_a.close()
+            worker_b.close()
+
+
+class TestClientKey:
+    def test_known_api_key_preferred_and_hashed(self):
+        scope = {"headers": [(b"x-api-key", b"secret-key")], "client": ("1.2.3.4", 1234)}
+        key = client_key(scope, api_keys={_digest(b"secret-key")})
+        assert key.startswith("key:")
+        assert "secret" not in key
+
+    def test_unknown_api_key_keyed_by_ip(self):
+        scope = {"headers": [(b"x-api-key", b"made-up")], "client": ("1.2.3.4", 1234)}
+        assert client_key(scope) == "ip:1.2.3.4"
+        assert client_key(scope, api_keys={_digest(b"secret-key")}) == "ip:1.2.3.4"
+
+    def test_falls_back_to_ip(self):
+        assert client_key({"headers": [], "client": ("1.2.3.4", 1234)}) == "ip:1.2.3.4"
+
+    def test_client_id_from_trusted_proxy(self):
+        scope = {"headers": [(b"x-client-id", b"session-1")], "client": ("127.0.0.1", 1234)}
+        other = {"headers": [(b"x-client-id", b"session-2")], "client": ("127.0.0.1", 1234)}
+        assert client_key(scope, ["127.0.0.1"]).startswith("client:")
+        assert client_key(scope, ["127.0.0.1"]) != client_key(other, ["127.0.0.1"])
+
+    def test_client_headers_ignored_from_untrusted_peer(self):
+        scope = {
+            "headers": [(b"x-client-id", b"spoofed"), (b"x-forwarded-for", b"9.9.9.9")],
+            "client": ("1.2.3.4", 1234),
+        }
+        assert client_key(scope, ["127.0.0.1"]) == "ip:1.2.3.4"
+
+    def test_forwarded_for_skips_trusted_hops(self):
+        scope = {"headers": [(b"x-forwarded-for", b"5.6.7.8, 10.0.0.2")], "client": ("10.0.0.1", 1234)}
+        assert client_key(scope, ["10.0.0.0/8"]) == "ip:5.6.7.8"
+
+
+class TestRateLimitMiddleware:
+    def test_returns_429_with_retry_after(self):
+        client = _make_client()
+        assert client.post("/api/v1/chat").status_code == 200
+        assert client.post("/api/v1/chat").status_code == 200
+
+        response = client.post("/api/v1/chat")
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+        assert response.json()["error"]["code"] == "RATE_LIMIT_ERROR"
+
+    def test_routes_have_separate_buckets(self):
+        client = _make_client()
+        for _ in range(3):
+            client.post("/api/v1/chat")
+        assert client.get("/api/v1/search").status_code == 200
+
+    def test_exempt_paths_and_preflight_not_limited(self):
+        client = _make_client(default=RouteLimit(1, 60))
+        assert all(client.get("/ready").status_code == 200 for _ in range(5))
+        assert all(client.options("/api/v1/chat").status_code != 429 for _ in range(5))
+
+    def test_ui_sessions_have_separate_buckets(self):
+        client = _make_client(trusted_proxies=["127.0.0.1"])
+        # TestClient connects as "testclient", not an IP: treat it as the local UI
+        with patch("src.api.rate_limit._is_trusted", return_value=True):
+            for _ in range(3):
+                client.post("/api/v1/chat", headers={"X-Client-Id": "busy"})
+            assert client.post("/api/v1/chat", headers={"X-Client-Id": "idle"}).status_code == 200
+
+    def test_sqlite_store_consumed_off_event_loop(self, tmp_path):
+        store = SQLiteBucketStore(tmp_path / "rate_limits.db")
+        try:
+            with patch("src.api.rate_limit.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+                assert _make_client(store=store).post("/api/v1/chat").status_code == 200
+            to_thread.assert_called_once()
+        finally:
+            store.close()
+
+    def test_rotating_unknown_api_keys_share_ip_bucket(self):
+        client = _make_client(api_keys=["noisy", "quiet"])
+        statuses = [
+            client.post("/api/v1/chat", headers={"X-API-Key": f"random-{i}"}).status_code
+            for i in range(3)
+        ]
+        assert statuses == [200, 200, 429]
+
+    def test_clients_have_separate_buckets(self):
+        client = _make_client(api_keys=["noisy", "quiet"])
+        for _ in range(3):
+            client.post("/api/v1/chat", headers={"X-API-Key": "noisy"})
+        assert client.post("/api/v1/chat", headers={"X-API-Key": "quiet"}).status_code == 200
+
+    def test_longest_prefix_wins(self):
+        middleware = RateLimitMiddleware(
+            app=None,
+            store=MemoryBucketStore(),
+            default_limit=RouteLimit(100, 60),
+            route_limits={"/api/v1": 50, "/api/v1/chat": 5},
+            enabled=True,
+        )
+        assert middleware.limit_for("/api/v1/chat") == ("/api/v1/chat", RouteLimit(5, 60))
+        assert middleware.limit_for("/api/v1/search") == ("/api/v1", RouteLimit(50, 60))
+        assert middleware.limit_for("/docs") == ("*", RouteLimit(100, 60))
+
+    def test_charge_consumes_cost_from_route_bucket(self):
+        middleware = RateLimitMiddleware(
+            app=None,
+            store=MemoryBucketStore(),
+            route_limits={"/api/v1/chat": 5},
+            enabled=True,
+        )
+        scope = {"type": "http", "client": ("10.0.0.1", 1234), "headers": []}
+
+        asyncio.run(middleware.charge(scope, "/api/v1/chat", 4))
+        with pytest.raises(RateLimitError) as exc:
+            asyncio.run(middleware.charge(scope, "/api/v1/chat", 2))
+        assert exc.value.retry_after >= 1
+        with pytest.raises(ValidationError):
+            asyncio.run(middleware.charge(scope, "/api/v1/chat", 6))
+
+    def test_disabled_passes_through(self):
+        app = FastAPI()
+
+        @app.post("/api/v1/chat")
+        async def chat():
+            return {"ok": True}
+
+        app.add_middleware(
+            RateLimitMiddleware,
+            store=MemoryBucketStore(),
+            route_limits={"/api/v1/chat": 1},
+            enabled=False,
+        )
+        client = TestClient(app)
+        assert all(client.post("/api/v1/chat").status_code == 200 for _ in range(3))
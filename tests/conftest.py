@@ -6,7 +6,7 @@ LAST MAJOR UPDATE: 2026-02-10
 MAINTAINER: Shahu
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -328,6 +328,7 @@ def mock_chat_service():
         processing_time_ms=100,
         model="gemini-2.0-flash-exp",
     )
+    service.achat = AsyncMock(return_value=service.chat.return_value)
     return service
 
 
@@ -127,6 +127,17 @@ class TestSettings:
         assert 10 <= settings.max_query_length <= 10000
 
 
+    def test_chat_batch_max_follows_chat_bucket(self):
+        """The batch ceiling is the /chat bucket size, or the schema cap without rate limiting."""
+        from src.core.config import Settings
+
+        kwargs = {"mistral_api_key": "test-key-1234567890"}
+        assert Settings(**kwargs).chat_batch_max_requests == 20
+        assert Settings(**kwargs, rate_limit_routes={"/api/v1": 50}).chat_batch_max_requests == 50
+        assert Settings(**kwargs, rate_limit_routes={}, rate_limit_requests=500).chat_batch_max_requests == 200
+        assert Settings(**kwargs, rate_limit_enabled=False).chat_batch_max_requests == 200
+
+
 class TestGetSettings:
     """Tests for get_settings function."""
 
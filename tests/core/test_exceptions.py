@@ -15,6 +15,7 @@ from src.core.exceptions import (
     EmbeddingError,
     IndexNotFoundError,
     LLMError,
+    QueryBudgetExceededError,
     RateLimitError,
     SearchError,
     ValidationError,
@@ -86,6 +87,15 @@ class TestRateLimitError:
         assert exc.details == {"retry_after": 120}
 
 
+class TestQueryBudgetExceededError:
+    def test_budget_details(self):
+        exc = QueryBudgetExceededError("too slow", budget="time", limit=2.0)
+        assert exc.code == "QUERY_BUDGET_EXCEEDED"
+        assert exc.budget == "time"
+        assert exc.details == {"budget": "time", "limit": 2.0}
+        assert isinstance(exc, AppException)
+
+
 class TestIndexNotFoundError:
     def test_default_message(self):
         exc = IndexNotFoundError()
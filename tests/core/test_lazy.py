@@ -0,0 +1,35 @@
+"""
+FILE: test_lazy.py
+STATUS: Active
+RESPONSIBILITY: Tests for lazily resolved package exports
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import sys
+import types
+
+import pytest
+
+from src.core.lazy import lazy_exports
+
+
+@pytest.fixture
+def package(monkeypatch):
+    module = types.ModuleType("lazy_pkg")
+    monkeypatch.setitem(sys.modules, "lazy_pkg", module)
+    module.__getattr__ = lazy_exports("lazy_pkg", {"dedent": "textwrap"})
+    return module
+
+
+class TestLazyExports:
+    def test_resolves_and_caches_export(self, package):
+        import textwrap
+
+        assert "dedent" not in vars(package)
+        assert package.dedent is textwrap.dedent
+        assert vars(package)["dedent"] is textwrap.dedent
+
+    def test_unknown_name_raises_attribute_error(self, package):
+        with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+            package.missing
@@ -0,0 +1,199 @@
+"""
+FILE: test_logging_config.py
+STATUS: Active
+RESPONSIBILITY: Tests for queued local logging (sampling, non-blocking handler, file routing)
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import json
+import logging
+import queue
+import threading
+
+import pytest
+
+from src.core.logging_config import (
+    LOG_RECORDS_DROPPED,
+    DebugSampler,
+    DrainingQueueListener,
+    LogFollower,
+    NonBlockingQueueHandler,
+    configure_local_logging,
+    get_recent_logs,
+    stop_local_logging,
+    tail_lines,
+)
+
+
+def _record(name: str, level: int, msg: str = "message", args: tuple | None = None) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+class TestDebugSampler:
+    def test_info_and_unmatched_loggers_always_pass(self):
+        sampler = DebugSampler({"src.agents": 0.0})
+        assert sampler.filter(_record("src.agents.react_agent", logging.INFO))
+        assert sampler.filter(_record("src.tools.sql_tool", logging.DEBUG))
+
+    def test_longest_prefix_wins(self):
+        sampler = DebugSampler({"src": 0.0, "src.agents": 1.0})
+        assert sampler.filter(_record("src.agents.react_agent", logging.DEBUG))
+        assert not sampler.filter(_record("src.tools.sql_tool", logging.DEBUG))
+
+    def test_prefix_matches_whole_name_segments(self):
+        sampler = DebugSampler({"src.agent": 0.0})
+        assert sampler.filter(_record("src.agents", logging.DEBUG))
+
+
+class TestNonBlockingQueueHandler:
+    def test_immutable_args_formatted_later(self):
+        log_queue = queue.Queue()
+        NonBlockingQueueHandler(log_queue).handle(_record("x", logging.INFO, "%s=%d", ("a", 1)))
+
+        record = log_queue.get_nowait()
+        assert record.args == ("a", 1)
+        assert record.getMessage() == "a=1"
+
+    def test_mutable_args_snapshotted(self):
+        log_queue = queue.Queue()
+        payload = {"k": 1}
+        NonBlockingQueueHandler(log_queue).handle(_record("x", logging.INFO, "%s", (payload,)))
+        payload["k"] = 2
+
+        assert log_queue.get_nowait().getMessage() == "{'k': 1}"
+
+    def test_full_queue_drops_and_counts(self):
+        log_queue = queue.Queue(maxsize=1)
+        handler = NonBlockingQueueHandler(log_queue)
+        dropped = LOG_RECORDS_DROPPED.value()
+
+        handler.handle(_record("x", logging.INFO))
+        handler.handle(_record("x", logging.INFO))
+
+        assert log_queue.qsize() == 1
+        assert LOG_RECORDS_DROPPED.value() == dropped + 1
+
+
+class TestDrainingQueueListener:
+    def test_stop_with_full_queue_writes_everything(self):
+        started, release = threading.Event(), threading.Event()
+        written = []
+
+        class SlowHandler(logging.Handler):
+            def emit(self, record):
+                started.set()
+                release.wait(5)
+                written.append(record.getMessage())
+
+        log_queue = queue.Queue(maxsize=2)
+        listener = DrainingQueueListener(log_queue, SlowHandler())
+        listener.start()
+        log_queue.put(_record("x", logging.INFO, "first"))
+        assert started.wait(5)  # Writer holds "first" in the slow handler
+        log_queue.put(_record("x", logging.INFO, "second"))
+        log_queue.put(_record("x", logging.INFO, "third"))
+
+        threading.Timer(0.1, release.set).start()
+        listener.stop()  # The stdlib listener raises queue.Full here
+
+        assert written == ["first", "second", "third"]
+
+
+class TestConfigureLocalLogging:
+    @pytest.fixture
+    def restore_root(self):
+        root = logging.getLogger()
+        handlers, level = root.handlers[:], root.level
+        yield
+        stop_local_logging()
+        root.handlers[:] = handlers
+        root.setLevel(level)
+
+    def test_records_routed_to_files_by_writer_thread(self, tmp_path, restore_root):
+        configure_local_logging(tmp_path)
+        root = logging.getLogger()
+        assert [type(h) for h in root.handlers] == [NonBlockingQueueHandler]
+
+        logging.getLogger("src.api.routes.chat").info("api line")
+        logging.getLogger("src.agents.react_agent").error("agent error")
+        stop_local_logging()  # drains the queue
+
+        def messages(name):
+            return [json.loads(line)["message"] for line in (tmp_path / name).read_text().splitlines()]
+
+        assert "api line" in messages("api.log")
+        assert "agent error" not in messages("api.log")
+        assert messages("agent.log") == ["agent error"]
+        assert messages("errors.log") == ["agent error"]
+        assert {"api line", "agent error"} <= set(messages("app.log"))
+
+
+def _entry(i: int, level: str = "INFO") -> str:
+    return json.dumps({"timestamp": f"2026-10-18T00:00:{i:02d}", "level": level, "message": f"m{i}"})
+
+
+class TestTailLines:
+    """Tests for the reverse-seeking tail reader."""
+
+    @pytest.mark.parametrize("block_size", [1, 7, 64 * 1024])
+    def test_last_lines(self, tmp_path, block_size):
+        """Returns the last N lines, whatever the block boundaries."""
+        path = tmp_path / "app.log"
+        path.write_text("".join(f"line {i}\n" for i in range(100)))
+
+        assert tail_lines(path, 3, block_size=block_size) == ["line 97", "line 98", "line 99"]
+        assert len(tail_lines(path, 500, block_size=block_size)) == 100
+
+    def test_empty_and_zero(self, tmp_path):
+        """Empty files and lines=0 return nothing."""
+        path = tmp_path / "app.log"
+        path.write_text("")
+
+        assert tail_lines(path, 10) == []
+        path.write_text("a\n")
+        assert tail_lines(path, 0) == []
+
+    def test_get_recent_logs_filters_tail(self, tmp_path):
+        """Filters apply to the last N lines; malformed lines are skipped."""
+        path = tmp_path / "app.log"
+        path.write_text(
+            "\n".join([_entry(0, "ERROR"), "not json", _entry(1), _entry(2, "ERROR")]) + "\n"
+        )
+
+        assert [e["message"] for e in get_recent_logs(path, lines=3, level="ERROR")] == ["m2"]
+        assert get_recent_logs(tmp_path / "missing.log") == []
+
+
+class TestLogFollower:
+    """Tests for incremental log following."""
+
+    def test_reads_only_new_entries(self, tmp_path):
+        """First read is the tail; later reads return appended entries only."""
+        path = tmp_path / "app.log"
+        path.write_text("".join(_entry(i) + "\n" for i in range(5)))
+        follower = LogFollower(path, initial_lines=2)
+
+        assert [e["message"] for e in follower.read()] == ["m3", "m4"]
+        assert follower.read() == []
+
+        with open(path, "a") as f:
+            f.write(_entry(5) + "\n" + _entry(6)[:10])
+        assert [e["message"] for e in follower.read()] == ["m5"]
+
+        # The partial line completes on the next write
+        with open(path, "a") as f:
+            f.write(_entry(6)[10:] + "\n")
+        assert [e["message"] for e in follower.read()] == ["m6"]
+
+    def test_rotation_restarts_at_new_file(self, tmp_path):
+        """A rotated (renamed and recreated) file is read from its start."""
+        path = tmp_path / "app.log"
+        path.write_text(_entry(0) + "\n")
+        follower = LogFollower(path)
+        follower.read()
+
+        path.rename(tmp_path / "app.log.1")
+        path.write_text(_entry(1) + "\n")
+
+        assert [e["message"] for e in follower.read()] == ["m1"]
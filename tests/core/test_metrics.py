@@ -0,0 +1,106 @@
+"""
+FILE: test_metrics.py
+STATUS: Active
+RESPONSIBILITY: Tests for the in-process metrics registry and Prometheus rendering
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import pytest
+
+from src.core.metrics import Counter, Gauge, Histogram, MetricsRegistry, _Metric
+
+
+@pytest.fixture
+def registry():
+    """Empty registry (keeps test metrics out of the application registry)."""
+    return MetricsRegistry()
+
+
+class TestCounter:
+    """Tests for Counter."""
+
+    def test_counts_per_label_set(self, registry):
+        """Each label set has its own count."""
+        counter = Counter("requests_total", "Requests", ("path",), registry=registry)
+        counter.inc(path="/a")
+        counter.inc(2, path="/a")
+        counter.inc(path="/b")
+
+        assert counter.value(path="/a") == 3
+        assert counter.value(path="/b") == 1
+        assert counter.value(path="/c") == 0
+
+    def test_rejects_negative_and_wrong_labels(self, registry):
+        """Counters only increase and require exactly their label names."""
+        counter = Counter("requests_total", "Requests", ("path",), registry=registry)
+        with pytest.raises(ValueError):
+            counter.inc(-1, path="/a")
+        with pytest.raises(ValueError):
+            counter.inc(route="/a")
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_observations_land_in_cumulative_buckets(self, registry):
+        """Rendered buckets are cumulative and end with +Inf, _sum and _count."""
+        histogram = Histogram("latency_seconds", "Latency", buckets=(0.1, 1.0), registry=registry)
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value)
+
+        text = registry.render()
+        assert 'latency_seconds_bucket{le="0.1"} 1.0' in text
+        assert 'latency_seconds_bucket{le="1.0"} 3.0' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 4.0' in text
+        assert "latency_seconds_sum 6.05" in text
+        assert "latency_seconds_count 4.0" in text
+
+    def test_time_observes_even_when_block_raises(self, registry):
+        """time() records the duration of failed blocks too."""
+        histogram = Histogram("latency_seconds", "Latency", ("stage",), registry=registry)
+        with histogram.time(stage="ok"):
+            pass
+        with pytest.raises(RuntimeError), histogram.time(stage="failed"):
+            raise RuntimeError("boom")
+
+        assert histogram.count(stage="ok") == 1
+        assert histogram.count(stage="failed") == 1
+
+
+class TestMetricBase:
+    def test_subclass_must_implement_samples_and_reset(self, registry):
+        class Incomplete(_Metric):
+            type_name = "gauge"
+
+        with pytest.raises(TypeError):
+            Incomplete("incomplete", "Missing samples() and reset()", registry=registry)
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry."""
+
+    def test_render_includes_help_type_and_escaped_labels(self, registry):
+        """Each metric has HELP/TYPE lines; label values are escaped."""
+        gauge = Gauge("queue_depth", "Queue depth", ("queue",), registry=registry)
+        gauge.set(3, queue='a"b')
+
+        text = registry.render()
+        assert "# HELP queue_depth Queue depth" in text
+        assert "# TYPE queue_depth gauge" in text
+        assert 'queue_depth{queue="a\\"b"} 3.0' in text
+
+    def test_duplicate_names_rejected(self, registry):
+        """Two metrics cannot share a name."""
+        Counter("requests_total", "Requests", registry=registry)
+        with pytest.raises(ValueError):
+            Gauge("requests_total", "Requests", registry=registry)
+
+    def test_reset_zeroes_metrics(self, registry):
+        """reset() clears recorded values but keeps the metrics registered."""
+        counter = Counter("requests_total", "Requests", registry=registry)
+        counter.inc()
+        registry.reset()
+
+        assert counter.value() == 0
+        assert registry.get("requests_total") is counter
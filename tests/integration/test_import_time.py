@@ -0,0 +1,85 @@
+"""
+FILE: test_import_time.py
+STATUS: Active
+RESPONSIBILITY: Cold-import budget for the API and evaluation entry points (python -X importtime)
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative cold-import budget per entry point: ~1.5x the measured time
+IMPORT_BUDGET_MS = {
+    "src.api.main": 1500,  # measured ~1.0s
+    "evaluation.evaluator": 1800,  # measured ~1.2s
+    "evaluation.validator": 700,  # measured ~0.45s
+}
+
+# Heavy stacks that must only load when a request (or script) actually uses them
+DEFERRED_PACKAGES = (
+    "langchain",
+    "langchain_community",
+    "langchain_google_genai",
+    "google.genai",
+    "mistralai",
+    "plotly",
+    "pandas",
+    "matplotlib",
+    "easyocr",
+    "rapidocr_onnxruntime",
+    "ragas",
+)
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def _cold_import(module: str) -> tuple[float, set[str]]:
+    """Import a module in a fresh interpreter.
+
+    Returns:
+        (cumulative import time of the module in ms, every module imported)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    cumulative_us = 0
+    imported = set()
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        _, cumulative, indent, name = match.groups()
+        imported.add(name)
+        if name == module and len(indent) == 1:
+            cumulative_us = int(cumulative)
+    return cumulative_us / 1000, imported
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGET_MS))
+def test_entry_point_import_budget(module):
+    """Cold import stays within budget and defers the heavy stacks."""
+    elapsed_ms, imported = _cold_import(module)
+
+    loaded = sorted(
+        name
+        for name in imported
+        if any(name == package or name.startswith(package + ".") for package in DEFERRED_PACKAGES)
+    )
+    assert not loaded, f"{module} imports deferred packages at import time: {loaded[:10]}"
+    assert elapsed_ms <= IMPORT_BUDGET_MS[module], (
+        f"Cold import of {module} took {elapsed_ms:.0f}ms (budget {IMPORT_BUDGET_MS[module]}ms)"
+    )
@@ -0,0 +1,121 @@
+"""
+FILE: test_chunk_store.py
+STATUS: Active
+RESPONSIBILITY: Tests for the memory-mapped columnar chunk store
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from src.models.document import DocumentChunk
+from src.repositories.chunk_store import ChunkStore
+
+
+@pytest.fixture
+def chunks():
+    """Chunks with non-ASCII text and mixed metadata types."""
+    return [
+        DocumentChunk(id="a", text="Nikola Jokić averaged a triple-double", metadata={"page": 1}),
+        DocumentChunk(id="b", text="Second chunk", metadata={"source": "x.pdf", "score": 0.5}),
+        DocumentChunk(id="c", text="Third", metadata={}),
+    ]
+
+
+class TestChunkStore:
+    """Tests for ChunkStore."""
+
+    def test_round_trip(self, tmp_path, chunks):
+        """Written chunks read back equal, by index, slice and iteration."""
+        ChunkStore.write(tmp_path / "store", chunks)
+        store = ChunkStore(tmp_path / "store")
+
+        assert len(store) == 3
+        assert store[1] == chunks[1]
+        assert store[-1] == chunks[2]
+        assert store[0:2] == chunks[0:2]
+        assert list(store) == chunks
+
+    def test_index_out_of_range(self, tmp_path, chunks):
+        """Out-of-range indexes raise IndexError."""
+        ChunkStore.write(tmp_path / "store", chunks)
+        store = ChunkStore(tmp_path / "store")
+
+        with pytest.raises(IndexError):
+            store[3]
+
+    def test_empty_store(self, tmp_path):
+        """A store with no chunks has length zero."""
+        ChunkStore.write(tmp_path / "store", [])
+        assert list(ChunkStore(tmp_path / "store")) == []
+
+    def test_columns_are_memory_mapped(self, tmp_path, chunks):
+        """Columns are opened as read-only memory maps."""
+        ChunkStore.write(tmp_path / "store", chunks)
+        store = ChunkStore(tmp_path / "store")
+
+        blob = store._blobs["text"]
+        assert blob.base is not None
+        assert not blob.flags.writeable
+
+    def test_write_replaces_existing_store(self, tmp_path, chunks):
+        """Rewriting a store replaces its contents and leaves no staging directories."""
+        ChunkStore.write(tmp_path / "store", chunks)
+        ChunkStore.write(tmp_path / "store", chunks[:1])
+
+        assert list(ChunkStore(tmp_path / "store")) == chunks[:1]
+        assert [p.name for p in tmp_path.iterdir()] == ["store"]
+
+    def test_is_current_tracks_source(self, tmp_path, chunks):
+        """is_current is False for a missing store or a changed source file."""
+        source = tmp_path / "chunks.pkl"
+        source.write_bytes(b"v1")
+        assert not ChunkStore.is_current(tmp_path / "store", source)
+
+        ChunkStore.write(tmp_path / "store", chunks, source=source)
+        assert ChunkStore.is_current(tmp_path / "store", source)
+
+        source.write_bytes(b"version 2")
+        assert not ChunkStore.is_current(tmp_path / "store", source)
+
+    def test_open_current_writes_once(self, tmp_path, chunks):
+        """Workers opening together write the store once; the rest open it."""
+        source = tmp_path / "chunks.pkl"
+        source.write_bytes(b"v1")
+        calls = []
+
+        def read_chunks():
+            calls.append(1)
+            return chunks
+
+        def open_store():
+            return ChunkStore.open_current(tmp_path / "store", source, read_chunks)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            stores = list(pool.map(lambda _: open_store(), range(4)))
+
+        assert len(calls) == 1
+        assert all(list(store) == chunks for store in stores)
+
+    def test_write_accepts_store_put_in_place_concurrently(self, tmp_path, chunks, monkeypatch):
+        """A current store appearing between rmtree and replace counts as written."""
+        source = tmp_path / "chunks.pkl"
+        source.write_bytes(b"v1")
+        directory = tmp_path / "store"
+        ChunkStore.write(directory, chunks, source=source)
+
+        real_rmtree = shutil.rmtree
+
+        def rmtree(path, *args, **kwargs):
+            if Path(path) != directory:  # Another process re-creates it right away
+                real_rmtree(path, *args, **kwargs)
+
+        monkeypatch.setattr("src.repositories.chunk_store.shutil.rmtree", rmtree)
+        ChunkStore.write(directory, chunks, source=source)
+
+        assert list(ChunkStore(directory)) == chunks
+        assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".")] == []
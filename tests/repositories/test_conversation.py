@@ -10,6 +10,7 @@ import json
 import time
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy import text
@@ -20,7 +21,10 @@ from src.models.conversation import (
     ConversationUpdate,
 )
 from src.models.feedback import ChatInteractionDB
+from src.core.exceptions import ValidationError
+from src.repositories.database import dispose_all_engines
 from src.repositories.conversation import ConversationRepository
+from src.repositories.pagination import encode_cursor
 
 
 @pytest.fixture
@@ -35,6 +39,7 @@ def repo(db_path):
     repository = ConversationRepository(db_path=db_path)
     yield repository
     repository.close()
+    dispose_all_engines()
 
 
 class TestConversationRepositoryInit:
@@ -200,11 +205,51 @@ class TestListConversations:
         assert len(archived_results) == 1
         assert archived_results[0].id == conv2.id
 
+    def test_list_conversations_keyset_pages(self, repo):
+        """Test cursor pages walk every conversation exactly once."""
+        created = [repo.create_conversation(ConversationCreate(title=f"Chat {i}")) for i in range(5)]
+
+        seen, cursor = [], None
+        while True:
+            page = repo.list_conversations(limit=2, cursor=cursor)
+            seen.extend(c.id for c in page)
+            if len(page) < 2:
+                break
+            cursor = encode_cursor(page[-1].updated_at, page[-1].id)
+
+        assert seen == [c.id for c in reversed(created)]
+
+    def test_list_conversations_invalid_cursor(self, repo):
+        """Test a malformed cursor is rejected."""
+        with pytest.raises(ValidationError, match="cursor"):
+            repo.list_conversations(cursor="not-a-cursor")
+
     def test_list_conversations_empty_database(self, repo):
         """Test listing conversations when database is empty."""
         results = repo.list_conversations()
         assert results == []
 
+    def test_list_conversations_includes_message_counts(self, repo):
+        """Test message counts are maintained on insert and delete."""
+        conv = repo.create_conversation(ConversationCreate(title="Chat"))
+        other = repo.create_conversation(ConversationCreate(title="Other"))
+        with repo.get_session() as session:
+            session.add_all(
+                ChatInteractionDB(
+                    query=f"Question {turn}",
+                    response=f"Answer {turn}",
+                    sources=json.dumps([]),
+                    conversation_id=conv.id,
+                    turn_number=turn,
+                )
+                for turn in range(1, 4)
+            )
+        with repo.get_session() as session:
+            session.execute(text("DELETE FROM chat_interactions WHERE turn_number = 3"))
+
+        counts = {c.id: c.message_count for c in repo.list_conversations()}
+        assert counts == {conv.id: 2, other.id: 0}
+
 
 class TestGetConversationWithMessages:
     """Tests for get_conversation_with_messages method."""
@@ -360,12 +405,13 @@ class TestDeleteConversation:
 class TestConversationRepositoryClose:
     """Tests for close method."""
 
-    def test_close_disposes_engine(self, db_path):
-        """Test that close disposes the SQLAlchemy engine."""
+    def test_close_keeps_shared_engine(self, db_path):
+        """Closing one repository leaves the engine shared with others usable."""
         repo = ConversationRepository(db_path=db_path)
-        repo.close()
+        other = ConversationRepository(db_path=db_path)
+        assert repo.engine is other.engine
 
-        # After close, engine should be disposed
-        # Attempting to use it should fail (but we won't test that to avoid errors)
-        # Just verify close doesn't raise
-        assert True
+        with patch.object(repo.engine, "dispose") as dispose:
+            repo.close()
+        dispose.assert_not_called()
+        assert other.list_conversations() == []
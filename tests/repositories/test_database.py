@@ -0,0 +1,103 @@
+"""
+FILE: test_database.py
+STATUS: Active
+RESPONSIBILITY: Tests for the shared interactions-database engine
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import sqlite3
+
+from sqlalchemy import inspect, text
+
+from src.repositories.conversation import ConversationRepository
+from src.repositories.database import dispose_all_engines, get_engine
+from src.repositories.feedback import FeedbackRepository
+
+
+class TestGetEngine:
+    """Tests for get_engine."""
+
+    def test_engine_shared_per_path(self, tmp_path):
+        db_path = tmp_path / "interactions.db"
+        try:
+            feedback = FeedbackRepository(db_path=db_path)
+            conversations = ConversationRepository(db_path=db_path)
+
+            assert feedback.engine is conversations.engine
+            assert get_engine(tmp_path / "other.db") is not feedback.engine
+        finally:
+            dispose_all_engines()
+
+    def test_connections_use_wal(self, tmp_path):
+        try:
+            engine = get_engine(tmp_path / "interactions.db")
+            with engine.connect() as conn:
+                assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        finally:
+            dispose_all_engines()
+
+    def test_schema_created_with_engine(self, tmp_path):
+        try:
+            engine = get_engine(tmp_path / "interactions.db")
+            inspector = inspect(engine)
+
+            assert {"conversations", "chat_interactions", "feedback"} <= set(inspector.get_table_names())
+            assert "ix_chat_interactions_conversation_turn" in {
+                index["name"] for index in inspector.get_indexes("chat_interactions")
+            }
+        finally:
+            dispose_all_engines()
+
+    def test_message_count_backfilled_on_existing_database(self, tmp_path):
+        db_path = tmp_path / "interactions.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            """
+            CREATE TABLE conversations (id VARCHAR(36) PRIMARY KEY, title VARCHAR(200),
+                created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL, status VARCHAR(8) NOT NULL);
+            CREATE TABLE chat_interactions (id VARCHAR(36) PRIMARY KEY, query TEXT NOT NULL,
+                response TEXT NOT NULL, sources TEXT, processing_time_ms INTEGER, created_at DATETIME,
+                conversation_id VARCHAR(36), turn_number INTEGER);
+            INSERT INTO conversations VALUES ('c1', 'Chat', '2026-01-01', '2026-01-01', 'ACTIVE');
+            INSERT INTO chat_interactions (id, query, response, conversation_id, turn_number)
+                VALUES ('m1', 'q', 'a', 'c1', 1), ('m2', 'q', 'a', 'c1', 2);
+            """
+        )
+        conn.commit()
+        conn.close()
+
+        try:
+            engine = get_engine(db_path)
+            with engine.begin() as conn:
+                assert conn.execute(text("SELECT message_count FROM conversations")).scalar() == 2
+                conn.execute(
+                    text(
+                        "INSERT INTO chat_interactions (id, query, response, conversation_id, turn_number) "
+                        "VALUES ('m3', 'q', 'a', 'c1', 3)"
+                    )
+                )
+                assert conn.execute(text("SELECT message_count FROM conversations")).scalar() == 3
+        finally:
+            dispose_all_engines()
+
+    def test_feedback_stats_seeded_from_existing_rows(self, tmp_path):
+        db_path = tmp_path / "interactions.db"
+        try:
+            engine = get_engine(db_path)
+            with engine.begin() as conn:
+                conn.execute(text("DELETE FROM feedback_stats"))
+                conn.execute(
+                    text(
+                        "INSERT INTO chat_interactions (id, query, response, created_at) "
+                        "VALUES ('m1', 'q', 'a', CURRENT_TIMESTAMP)"
+                    )
+                )
+            dispose_all_engines()
+
+            engine = get_engine(db_path)
+            with engine.connect() as conn:
+                assert conn.execute(text("SELECT total_interactions FROM feedback_stats")).scalar() == 1
+        finally:
+            dispose_all_engines()
@@ -10,13 +10,16 @@ import tempfile
 from pathlib import Path
 
 import pytest
+from sqlalchemy import text
 
 from src.models.feedback import (
     ChatInteractionCreate,
     FeedbackCreate,
     FeedbackRating,
 )
+from src.repositories.database import dispose_all_engines
 from src.repositories.feedback import FeedbackRepository
+from src.repositories.pagination import encode_cursor
 from src.services.feedback import FeedbackService
 
 
@@ -33,7 +36,8 @@ def repository(temp_db):
     """Create a FeedbackRepository with temporary database."""
     repo = FeedbackRepository(db_path=temp_db)
     yield repo
-    repo.close()  # Properly close to release file lock on Windows
+    repo.close()
+    dispose_all_engines()  # Release the file lock on Windows
 
 
 @pytest.fixture
@@ -109,6 +113,14 @@ class TestFeedbackRepository:
         assert saved.processing_time_ms == 150
         assert saved.created_at is not None
 
+    def test_save_interactions_batch(self, repository):
+        """Test saving several interactions in one call."""
+        interactions = [
+            ChatInteractionCreate(query=f"Query {i}", response=f"Response {i}") for i in range(3)
+        ]
+        assert repository.save_interactions(interactions) == 3
+        assert len(repository.get_recent_interactions(limit=10)) == 3
+
     def test_get_interaction(self, repository):
         """Test retrieving an interaction by ID."""
         interaction = ChatInteractionCreate(
@@ -206,6 +218,44 @@ class TestFeedbackRepository:
         recent = repository.get_recent_interactions(limit=3)
         assert len(recent) == 3
 
+    def test_get_recent_turns(self, repository):
+        """Test loading only the last turns before a given turn."""
+        for turn in range(1, 8):
+            repository.save_interaction(
+                ChatInteractionCreate(
+                    query=f"Query {turn}",
+                    response=f"Response {turn}",
+                    conversation_id="conv-1",
+                    turn_number=turn,
+                )
+            )
+        repository.save_interaction(
+            ChatInteractionCreate(query="Other", response="Other", conversation_id="conv-2", turn_number=1)
+        )
+
+        turns = repository.get_recent_turns("conv-1", before_turn=7, limit=3)
+        assert turns == [
+            (4, "Query 4", "Response 4"),
+            (5, "Query 5", "Response 5"),
+            (6, "Query 6", "Response 6"),
+        ]
+        assert repository.get_recent_turns("conv-3", before_turn=5, limit=3) == []
+
+    def test_get_recent_interactions_keyset_pages(self, repository):
+        """Test cursor pages continue after the previous page's last interaction."""
+        saved = [
+            repository.save_interaction(ChatInteractionCreate(query=f"Query {i}", response=f"Response {i}"))
+            for i in range(5)
+        ]
+
+        first = repository.get_recent_interactions(limit=3)
+        cursor = encode_cursor(first[-1].created_at, first[-1].id)
+        second = repository.get_recent_interactions(limit=3, cursor=cursor)
+
+        ids = [i.id for i in first + second]
+        assert len(second) == 2
+        assert sorted(ids) == sorted(i.id for i in saved)
+
     def test_get_stats(self, repository):
         """Test getting feedback statistics."""
         # Save interactions and feedback
@@ -230,6 +280,33 @@ class TestFeedbackRepository:
         assert stats.positive_count == 1
         assert stats.negative_count == 1
 
+    def test_stats_follow_rating_changes(self, repository):
+        """Test stats row tracks feedback updates without recounting."""
+        saved = repository.save_interaction(ChatInteractionCreate(query="Q", response="A"))
+        repository.save_feedback(FeedbackCreate(interaction_id=saved.id, rating=FeedbackRating.POSITIVE))
+        repository.update_feedback(saved.id, FeedbackRating.NEGATIVE)
+
+        stats = repository.get_stats()
+        assert stats.total_feedback == 1
+        assert stats.positive_count == 0
+        assert stats.negative_count == 1
+
+    def test_stats_count_batched_interactions(self, repository):
+        """Test stats row tracks interactions written in one batch."""
+        repository.save_interactions(
+            [ChatInteractionCreate(query=f"Q{i}", response=f"A{i}") for i in range(4)]
+        )
+        assert repository.get_stats().total_interactions == 4
+
+    def test_reconcile_stats_repairs_drift(self, repository):
+        """Test reconcile_stats recomputes the row from the tables."""
+        repository.save_interaction(ChatInteractionCreate(query="Q", response="A"))
+        with repository.get_session() as session:
+            session.execute(text("UPDATE feedback_stats SET total_interactions = 99"))
+
+        assert repository.get_stats().total_interactions == 99
+        assert repository.reconcile_stats().total_interactions == 1
+
 
 class TestFeedbackService:
     """Tests for FeedbackService."""
@@ -0,0 +1,95 @@
+"""
+FILE: test_log_index.py
+STATUS: Active
+RESPONSIBILITY: Tests for the SQLite FTS index over rotated JSON logs
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import json
+
+import pytest
+
+from src.repositories.log_index import LogSearchIndex
+
+
+def _write(path, entries, mode="a"):
+    with open(path, mode) as f:
+        for timestamp, level, message in entries:
+            f.write(json.dumps({"timestamp": timestamp, "level": level, "message": message}) + "\n")
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Index in a temporary database."""
+    index = LogSearchIndex(tmp_path / "log_index.db")
+    yield index
+    index.close()
+
+
+class TestLogSearchIndex:
+    """Tests for LogSearchIndex."""
+
+    def test_searches_across_backups(self, tmp_path, index):
+        """Text and level filters cover the active file and its backups, newest first."""
+        log_file = tmp_path / "app.log"
+        _write(tmp_path / "app.log.1", [("2026-10-18T01:00:00", "ERROR", "SQL query timed out")])
+        _write(log_file, [
+            ("2026-10-18T02:00:00", "INFO", "Query classified"),
+            ("2026-10-18T03:00:00", "ERROR", "Vector search timed out"),
+        ])
+
+        assert index.update(log_file) == 3
+        assert [e["message"] for e in index.search(text="timed out")] == [
+            "Vector search timed out",
+            "SQL query timed out",
+        ]
+        assert [e["message"] for e in index.search(level="INFO")] == ["Query classified"]
+        assert index.search(text="timed", level="INFO") == []
+        assert len(index.search(limit=2)) == 2
+
+    def test_incremental_update(self, tmp_path, index):
+        """Only appended lines are indexed; an unterminated line waits for its newline."""
+        log_file = tmp_path / "app.log"
+        _write(log_file, [("2026-10-18T01:00:00", "INFO", "first")])
+        assert index.update(log_file) == 1
+        assert index.update(log_file) == 0
+
+        with open(log_file, "a") as f:
+            f.write('{"timestamp": "2026-10-18T02:00:00", "level": "INFO", ')
+        assert index.update(log_file) == 0
+        with open(log_file, "a") as f:
+            f.write('"message": "second"}\n')
+        assert index.update(log_file) == 1
+        assert [e["message"] for e in index.search()] == ["second", "first"]
+
+    def test_rotation(self, tmp_path, index):
+        """Rotated files are not re-indexed, and deleted backups leave the index."""
+        log_file = tmp_path / "app.log"
+        _write(log_file, [("2026-10-18T01:00:00", "INFO", "old")])
+        index.update(log_file)
+
+        log_file.rename(tmp_path / "app.log.1")
+        _write(log_file, [("2026-10-18T02:00:00", "INFO", "new")])
+        assert index.update(log_file) == 1
+
+        (tmp_path / "app.log.1").unlink()
+        index.update(log_file)
+        assert [e["message"] for e in index.search()] == ["new"]
+
+    def test_search_scoped_to_log_file(self, tmp_path, index):
+        """log_file limits results to that file family."""
+        _write(tmp_path / "app.log", [("2026-10-18T01:00:00", "INFO", "app entry")])
+        _write(tmp_path / "api.log", [("2026-10-18T02:00:00", "INFO", "api entry")])
+        index.update(tmp_path / "app.log")
+        index.update(tmp_path / "api.log")
+
+        assert [e["message"] for e in index.search(log_file=tmp_path / "app.log")] == ["app entry"]
+        assert len(index.search()) == 2
+
+    def test_quotes_in_search_text(self, tmp_path, index):
+        """FTS syntax in the search text is matched literally, not parsed."""
+        _write(tmp_path / "app.log", [("2026-10-18T01:00:00", "INFO", 'say "hello" OR bye')])
+        index.update(tmp_path / "app.log")
+
+        assert len(index.search(text='"hello" OR')) == 1
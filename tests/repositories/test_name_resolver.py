@@ -0,0 +1,174 @@
+"""
+FILE: test_name_resolver.py
+STATUS: Active
+RESPONSIBILITY: Tests for the trigram name index, NameResolver and LIKE rewriting
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import sqlite3
+
+import pytest
+
+from src.repositories.name_resolver import NameResolver, normalize_name
+from src.repositories.nba_database import NBADatabase
+from src.repositories.sqlite_pool import close_all_pools
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Stats database with a built name index."""
+    path = tmp_path / "nba_stats.db"
+    db = NBADatabase(str(path))
+    db.create_tables()
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO teams (abbreviation, name) VALUES (?, ?)",
+        [("DEN", "Denver Nuggets"), ("LAL", "Los Angeles Lakers"), ("LAC", "Los Angeles Clippers")],
+    )
+    conn.executemany(
+        "INSERT INTO players (name, team_abbr, age) VALUES (?, ?, ?)",
+        [
+            ("Nikola Jokić", "DEN", 30),
+            ("LeBron James", "LAL", 40),
+            ("Shai Gilgeous-Alexander", "LAL", 26),
+            ("Bronny James", "LAL", 20),
+        ],
+    )
+    conn.commit()
+    conn.close()
+    db.build_name_index()
+    db.close()
+    yield path
+    close_all_pools()
+
+
+@pytest.fixture
+def resolver(db_path):
+    """Resolver over the indexed database."""
+    return NameResolver(db_path)
+
+
+class TestNormalizeName:
+    """Tests for normalize_name."""
+
+    def test_strips_accents_and_case(self):
+        """Test accents and case are folded."""
+        assert normalize_name("Nikola JOKIĆ") == "nikola jokic"
+
+    def test_collapses_punctuation(self):
+        """Test hyphens and dots become single spaces."""
+        assert normalize_name("Shai Gilgeous-Alexander") == "shai gilgeous alexander"
+        assert normalize_name("P.J.  Washington") == "p j washington"
+
+
+class TestNameResolver:
+    """Tests for NameResolver lookups."""
+
+    def test_resolve_player_without_accent(self, resolver):
+        """Test an unaccented query finds the accented name."""
+        assert resolver.resolve_player("jokic") == [1]
+
+    def test_resolve_player_partial_hyphenated(self, resolver):
+        """Test a hyphenated partial name resolves."""
+        assert resolver.resolve_player("Gilgeous-Alexander") == [3]
+
+    def test_resolve_player_several_matches(self, resolver):
+        """Test a shared substring returns every match."""
+        assert sorted(resolver.resolve_player("James")) == [2, 4]
+
+    def test_resolve_team(self, resolver):
+        """Test team nicknames resolve to abbreviations."""
+        assert resolver.resolve_team("lakers") == ["LAL"]
+        assert sorted(resolver.resolve_team("Los Angeles")) == ["LAC", "LAL"]
+
+    def test_short_query_not_resolved(self, resolver):
+        """Test queries below the trigram length are not looked up."""
+        assert resolver.resolve_player("Jo") == []
+
+    def test_index_tables(self, resolver):
+        """Test the FTS5 virtual and shadow tables are listed."""
+        tables = resolver.index_tables()
+        assert "name_index" in tables
+        assert all(t.startswith("name_index") for t in tables)
+        assert "players" not in tables
+
+    def test_entities_in_question(self, resolver):
+        """Test names in a question resolve to entity keys; other words add nothing."""
+        lebron = resolver.entities_in("How many points did LeBron score for the Nuggets?")
+        jokic = resolver.entities_in("How many points did Jokic score for the Nuggets?")
+
+        assert lebron != jokic
+        assert "team:DEN" in lebron and "team:DEN" in jokic
+        assert resolver.entities_in("how many points did lebron score for the nuggets") == lebron
+
+    def test_missing_index_unavailable(self, tmp_path):
+        """Test a database without the index disables the resolver."""
+        path = tmp_path / "plain.db"
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE players (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.close()
+        try:
+            resolver = NameResolver(path)
+            sql = "SELECT name FROM players WHERE name LIKE '%Jokic%'"
+            assert resolver.available is False
+            assert resolver.rewrite_sql(sql) == sql
+            assert resolver.index_tables() == []
+            assert resolver.entities_in("Who is Jokic?") == frozenset({"word:jokic"})
+        finally:
+            close_all_pools()
+
+
+class TestRewriteSQL:
+    """Tests for LIKE-to-id rewriting."""
+
+    def test_rewrites_aliased_player_like(self, resolver, db_path):
+        """Test an aliased player predicate becomes id equality with the same answer."""
+        sql = (
+            "SELECT p.name FROM players p JOIN player_stats ps ON p.id = ps.player_id "
+            "WHERE p.name LIKE '%Jokić%'"
+        )
+        rewritten = resolver.rewrite_sql(sql)
+
+        assert rewritten.endswith("WHERE p.id = 1")
+
+    def test_rewrite_fixes_accent_mismatch(self, resolver, db_path):
+        """Test an unaccented LIKE that SQLite would miss now finds the player."""
+        sql = "SELECT name FROM players WHERE name LIKE '%Jokic%'"
+        conn = sqlite3.connect(db_path)
+        try:
+            assert conn.execute(sql).fetchall() == []
+            assert conn.execute(resolver.rewrite_sql(sql)).fetchall() == [("Nikola Jokić",)]
+        finally:
+            conn.close()
+
+    def test_rewrites_to_in_list(self, resolver):
+        """Test several matches become an IN list."""
+        rewritten = resolver.rewrite_sql("SELECT p.name FROM players p WHERE p.name LIKE '%James%'")
+        assert "p.id IN (" in rewritten
+
+    def test_rewrites_team_name(self, resolver):
+        """Test team name predicates become abbreviation equality."""
+        rewritten = resolver.rewrite_sql("SELECT t.name FROM teams t WHERE t.name LIKE '%Lakers%'")
+        assert rewritten == "SELECT t.name FROM teams t WHERE t.abbreviation = 'LAL'"
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            # Ambiguous unqualified column across two tables
+            "SELECT t.name FROM teams t JOIN players p ON t.abbreviation = p.team_abbr WHERE name LIKE '%Lakers%'",
+            # Extra wildcards
+            "SELECT p.name FROM players p WHERE p.name LIKE '%Le%James%'",
+            # Prefix match, not substring
+            "SELECT p.name FROM players p WHERE p.name LIKE 'LeBron%'",
+            # NOT LIKE
+            "SELECT p.name FROM players p WHERE p.name NOT LIKE '%James%'",
+            # No match in the index
+            "SELECT p.name FROM players p WHERE p.name LIKE '%Wembanyama%'",
+            # Not a name column
+            "SELECT p.name FROM players p WHERE p.team_abbr LIKE '%LA%'",
+        ],
+    )
+    def test_leaves_other_predicates(self, resolver, sql):
+        """Test predicates that can't be safely rewritten are untouched."""
+        assert resolver.rewrite_sql(sql) == sql
@@ -10,6 +10,7 @@ import tempfile
 from pathlib import Path
 
 import pytest
+from sqlalchemy import text
 
 from src.repositories.nba_database import (
     Base,
@@ -149,3 +150,64 @@ class TestModelRepr:
         entry = DataDictionaryModel(abbreviation="PTS", column_name="pts")
         r = repr(entry)
         assert "PTS" in r
+
+
+def _stats(**overrides):
+    """Complete player_stats row with every non-nullable column set."""
+    stats = {c.name: 0 for c in PlayerStatsModel.__table__.columns if c.name not in ("id", "player_id")}
+    stats.update(overrides)
+    return stats
+
+
+class TestRefreshAggregates:
+    @pytest.fixture
+    def loaded_db(self, temp_db):
+        session = temp_db.get_session()
+        temp_db.add_team(session, "LAL", "Los Angeles Lakers")
+        temp_db.add_team(session, "BOS", "Boston Celtics")
+        temp_db.add_player(session, "LeBron James", "LAL", 40)
+        temp_db.add_player(session, "Anthony Davis", "LAL", 32)
+        temp_db.add_player(session, "Jayson Tatum", "BOS", 27)
+        session.commit()
+        temp_db.add_player_stats(session, 1, _stats(gp=70, pts=1708, reb=546, ast=574, fgm=620, fga=1209, fg_pct=51.3))
+        temp_db.add_player_stats(session, 2, _stats(gp=51, pts=1311, reb=606, ast=178, fgm=510, fga=981, fg_pct=None))
+        temp_db.add_player_stats(session, 3, _stats(gp=72, pts=1932, reb=626, ast=432, fgm=660, fga=1460, fg_pct=45.2))
+        session.commit()
+        session.close()
+        return temp_db
+
+    def test_refresh_counts(self, loaded_db):
+        counts = loaded_db.refresh_aggregates()
+        assert counts == {"player_per_game": 3, "team_totals": 2, "team_averages": 2}
+
+    def test_refresh_is_idempotent(self, loaded_db):
+        loaded_db.refresh_aggregates()
+        assert loaded_db.refresh_aggregates()["player_per_game"] == 3
+
+    def test_per_game_matches_join_query(self, loaded_db):
+        loaded_db.refresh_aggregates()
+        with loaded_db.engine.connect() as conn:
+            expected = conn.execute(text(
+                "SELECT p.name, ROUND(CAST(ps.pts AS FLOAT) / ps.gp, 1) AS ppg FROM players p "
+                "JOIN player_stats ps ON p.id = ps.player_id ORDER BY ppg DESC"
+            )).all()
+            actual = conn.execute(text(
+                "SELECT name, ROUND(ppg, 1) AS ppg FROM player_per_game ORDER BY ppg DESC"
+            )).all()
+        assert actual == expected
+
+    def test_team_aggregates_match_join_query(self, loaded_db):
+        loaded_db.refresh_aggregates()
+        with loaded_db.engine.connect() as conn:
+            expected = conn.execute(text(
+                "SELECT t.name, SUM(ps.pts), SUM(ps.reb), AVG(ps.fg_pct) FROM teams t "
+                "JOIN players p ON t.abbreviation = p.team_abbr JOIN player_stats ps ON p.id = ps.player_id "
+                "GROUP BY t.name ORDER BY t.name"
+            )).all()
+            actual = conn.execute(text(
+                "SELECT tt.team_name, tt.pts, tt.reb, ta.avg_fg_pct FROM team_totals tt "
+                "JOIN team_averages ta ON ta.team_abbr = tt.team_abbr ORDER BY tt.team_name"
+            )).all()
+            lal_fg_pct = conn.execute(text("SELECT fg_pct FROM team_totals WHERE team_abbr = 'LAL'")).scalar_one()
+        assert actual == expected
+        assert lal_fg_pct == pytest.approx(100.0 * (620 + 510) / (1209 + 981))
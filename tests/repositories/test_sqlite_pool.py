@@ -0,0 +1,90 @@
+"""
+FILE: test_sqlite_pool.py
+STATUS: Active
+RESPONSIBILITY: Tests for the read-only SQLite connection pool
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import gc
+import sqlite3
+import threading
+
+import pytest
+
+from src.repositories.sqlite_pool import ReadOnlySQLitePool, close_all_pools, get_read_only_pool
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Create a small stats database."""
+    path = tmp_path / "nba_stats.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE players (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany("INSERT INTO players (name) VALUES (?)", [("LeBron James",), ("Stephen Curry",)])
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def pool(db_path):
+    """Pool over the temp database."""
+    pool = ReadOnlySQLitePool(db_path, mmap_size=1024 * 1024, cache_size_kb=1024, cached_statements=16)
+    yield pool
+    pool.close()
+
+
+class TestReadOnlySQLitePool:
+    """Tests for ReadOnlySQLitePool."""
+
+    def test_execute_returns_rows(self, pool):
+        """Test a read query returns tuples."""
+        rows = pool.execute("SELECT name FROM players WHERE id = ?", (2,))
+        assert rows == [("Stephen Curry",)]
+
+    def test_pragmas_applied(self, pool):
+        """Test connection tuning pragmas."""
+        conn = pool.connection()
+        assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -1024
+
+    def test_writes_rejected(self, pool):
+        """Test the connection is read-only."""
+        with pytest.raises(sqlite3.OperationalError):
+            pool.execute("INSERT INTO players (name) VALUES ('Hacker')")
+
+    def test_connection_reused_per_thread(self, pool):
+        """Test each thread reuses its own connection."""
+        main_conn = pool.connection()
+        assert pool.connection() is main_conn
+
+        other = {}
+        thread = threading.Thread(target=lambda: other.setdefault("conn", pool.connection()))
+        thread.start()
+        thread.join()
+
+        assert other["conn"] is not main_conn
+
+    def test_discarded_connections_not_retained(self, pool):
+        """Test connections nobody references any more (e.g. discarded by the engine pool) are not kept."""
+        kept = pool.connection()
+        for _ in range(20):
+            pool.connect().close()
+        gc.collect()
+
+        assert list(pool._connections) == [kept]
+
+    def test_missing_database_raises(self, tmp_path):
+        """Test read-only mode never creates a missing database."""
+        pool = ReadOnlySQLitePool(tmp_path / "missing.db")
+        with pytest.raises(sqlite3.OperationalError):
+            pool.execute("SELECT 1")
+        assert not (tmp_path / "missing.db").exists()
+
+    def test_registry_shares_pool(self, db_path):
+        """Test get_read_only_pool returns one pool per file."""
+        try:
+            assert get_read_only_pool(db_path) is get_read_only_pool(str(db_path))
+        finally:
+            close_all_pools()
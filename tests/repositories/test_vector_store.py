@@ -343,6 +343,61 @@ class TestVectorStoreRepository:
             assert hasattr(chunk, 'text')
             assert hasattr(chunk, 'metadata')
 
+    def test_search_records_latency(self, repository, sample_chunks, sample_embeddings):
+        """Searches feed the vector search latency histogram, labelled by filtering."""
+        from src.core.metrics import VECTOR_SEARCH_SECONDS
+
+        repository.build_index(sample_chunks, sample_embeddings)
+        plain = VECTOR_SEARCH_SECONDS.count(filtered="false")
+        filtered = VECTOR_SEARCH_SECONDS.count(filtered="true")
+
+        repository.search(sample_embeddings[0], k=2)
+        repository.search(sample_embeddings[0], k=2, metadata_filters={"source": "nba.pdf"})
+
+        assert VECTOR_SEARCH_SECONDS.count(filtered="false") == plain + 1
+        assert VECTOR_SEARCH_SECONDS.count(filtered="true") == filtered + 1
+
+    def test_load_mmap_matches_in_memory(self, repository, sample_chunks, sample_embeddings, temp_paths):
+        """Memory-mapped and in-memory loads return the same chunks and search results."""
+        index_path, chunks_path = temp_paths
+        repository.build_index(sample_chunks, sample_embeddings)
+        repository.save()
+
+        mapped = VectorStoreRepository(index_path=index_path, chunks_path=chunks_path, mmap=True)
+        in_memory = VectorStoreRepository(index_path=index_path, chunks_path=chunks_path, mmap=False)
+        assert mapped.load() and in_memory.load()
+
+        assert mapped.chunks == in_memory.chunks == sample_chunks
+        query = sample_embeddings[1]
+        assert mapped.search(query, k=3) == in_memory.search(query, k=3)
+        assert mapped.search(query, k=3, metadata_filters={"source": "players.pdf"})[0][0].id == "doc1_0"
+
+    def test_load_mmap_rebuilds_stale_columns(self, repository, sample_chunks, sample_embeddings, temp_paths):
+        """Chunk columns are rebuilt when the pickle changed since they were written."""
+        index_path, chunks_path = temp_paths
+        repository.build_index(sample_chunks, sample_embeddings)
+        repository.save()
+
+        # Pickle rewritten without the columns (e.g. by an older pipeline)
+        import pickle
+
+        raw = [{"id": c.id, "text": c.text.upper(), "metadata": c.metadata} for c in sample_chunks]
+        chunks_path.write_bytes(pickle.dumps(raw))
+
+        new_repo = VectorStoreRepository(index_path=index_path, chunks_path=chunks_path, mmap=True)
+        assert new_repo.load()
+        assert new_repo.chunks[0].text == "THE LAKERS WON THE CHAMPIONSHIP."
+
+    def test_delete_files_removes_columns(self, repository, sample_chunks, sample_embeddings, temp_paths):
+        """delete_files also removes the chunk columns directory."""
+        _, chunks_path = temp_paths
+        repository.build_index(sample_chunks, sample_embeddings)
+        repository.save()
+        assert chunks_path.with_suffix(".columns").is_dir()
+
+        repository.delete_files()
+        assert not chunks_path.with_suffix(".columns").exists()
+
     def test_delete_files_when_files_dont_exist(self, repository):
         """Test delete_files handles non-existent files gracefully."""
         # Should not raise error even if files don't exist
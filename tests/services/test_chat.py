@@ -2,16 +2,24 @@
 FILE: test_chat.py
 STATUS: Active
 RESPONSIBILITY: Unit tests for ChatService RAG pipeline orchestration
-LAST MAJOR UPDATE: 2026-02-13
+LAST MAJOR UPDATE: 2026-10-18
 MAINTAINER: Shahu
 """
 
-from unittest.mock import MagicMock
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
 import pytest
 
-from src.core.exceptions import IndexNotFoundError, LLMError
+from src.core.exceptions import (
+    IndexNotFoundError,
+    LLMError,
+    RateLimitError,
+    ValidationError,
+)
 from src.models.chat import ChatRequest, ChatResponse, SearchResult
 from src.models.document import DocumentChunk
 from src.services.chat import ChatService
@@ -103,9 +111,6 @@ class TestChatServiceEnsureReady:
 # The following test classes were removed because they test methods that no
 # longer exist after the migration to ReAct agent architecture:
 #
-# - TestChatServiceSearch (6 tests) - search() method removed
-#   The agent now handles search internally via tool selection
-#
 # - TestChatServiceGenerateResponse (6 tests) - generate_response() removed
 #   The agent now generates responses via its own execution flow
 #
@@ -115,12 +120,349 @@ class TestChatServiceEnsureReady:
 # - TestGreetingHandling (4 tests) - Old greeting detection logic
 #   Greeting handling now managed by the agent's query classification
 #
-# Total: 20 tests removed for obsolete methods
+# Total: 14 tests removed for obsolete methods
 # Current ChatService uses ReAct agent for all query processing
 # ============================================================================
 
 
-# NOTE: TestChatServiceSearch removed - search() method no longer exists (see above)
+class TestChatServiceSearch:
+    """Retrieval-only search (no agent, no LLM)."""
+
+    @pytest.fixture
+    def search_service(self, chat_service, mock_vector_store):
+        chunk = DocumentChunk(id="c1", text="Nuggets defeated Heat", metadata={"source": "nba.pdf", "upvotes": 12})
+        mock_vector_store.search.return_value = [(chunk, 91.5)]
+        embedding_service = MagicMock()
+        embedding_service.embed_query.return_value = np.ones(4, dtype=np.float32)
+
+        async def aembed_query(query):
+            return np.ones(4, dtype=np.float32)
+
+        embedding_service.aembed_query.side_effect = aembed_query
+        chat_service._embedding_service = embedding_service
+        return chat_service
+
+    def test_search_returns_search_results(self, search_service, mock_vector_store):
+        results = search_service.search("Who won the title?", k=3, min_score=0.5)
+
+        assert results == [
+            SearchResult(text="Nuggets defeated Heat", score=91.5, source="nba.pdf",
+                         metadata={"source": "nba.pdf", "upvotes": 12})
+        ]
+        kwargs = mock_vector_store.search.call_args.kwargs
+        assert kwargs["k"] == 3
+        assert kwargs["min_score"] == 0.5
+        assert kwargs["query_text"] == "Who won the title?"
+
+    def test_search_skips_agent_and_llm(self, search_service, mock_client):
+        search_service.search("Who won the title?")
+
+        assert search_service._agent is None
+        mock_client.models.generate_content.assert_not_called()
+
+    async def test_asearch_awaits_embedding(self, search_service):
+        results = await search_service.asearch("Who won the title?", k=2)
+
+        assert results[0].source == "nba.pdf"
+        search_service.embedding_service.aembed_query.assert_called_once_with("Who won the title?")
+        search_service.embedding_service.embed_query.assert_not_called()
+
+    async def test_asearch_runs_vector_search_off_event_loop(self, search_service, mock_vector_store):
+        loop_thread = threading.get_ident()
+        search_threads = []
+        hits = mock_vector_store.search.return_value
+
+        def search(**kwargs):
+            search_threads.append(threading.get_ident())
+            return hits
+
+        mock_vector_store.search.side_effect = search
+
+        results = await search_service.asearch("Who won the title?")
+
+        assert results[0].source == "nba.pdf"
+        assert search_threads and search_threads[0] != loop_thread
+
+    def test_search_raises_when_no_index(self, search_service, mock_vector_store):
+        mock_vector_store.is_loaded = False
+        with pytest.raises(IndexNotFoundError):
+            search_service.search("anything")
+
+    def test_search_validates_k(self, search_service):
+        with pytest.raises(ValidationError):
+            search_service.search("anything", k=0)
+
+
+class TestChatServiceAchat:
+    """Async chat pipeline (ReActAgent.arun)."""
+
+    @pytest.fixture
+    def agent(self, chat_service):
+        agent = MagicMock()
+        agent.arun = AsyncMock(return_value={
+            "answer": "Jokic averaged 26.4 PPG.",
+            "tools_used": ["query_nba_database"],
+            "tool_results": {
+                "query_nba_database": {"sql": "SELECT 1", "results": [{"name": "Nikola Jokic", "ppg": 26.4}]},
+            },
+        })
+        chat_service._agent = agent
+        return agent
+
+    async def test_achat_awaits_arun(self, chat_service, agent):
+        response = await chat_service.achat(ChatRequest(query="Jokic PPG?"))
+
+        assert isinstance(response, ChatResponse)
+        assert response.answer == "Jokic averaged 26.4 PPG."
+        assert response.generated_sql == "SELECT 1"
+        assert response.tools_used == ["query_nba_database"]
+        agent.arun.assert_awaited_once_with(question="Jokic PPG?", conversation_history="")
+        agent.run.assert_not_called()
+
+    async def test_unbuilt_agent_resolved_off_event_loop(self, chat_service, agent):
+        import threading
+
+        chat_service._agent = None
+        built_on = []
+
+        def build(_service):
+            built_on.append(threading.current_thread())
+            return agent
+
+        with patch.object(type(chat_service), "agent", property(build)):
+            await chat_service.achat(ChatRequest(query="Jokic PPG?"))
+
+        assert built_on and built_on[0] is not threading.main_thread()
+
+    async def test_achat_wraps_agent_errors(self, chat_service, agent):
+        agent.arun.side_effect = RuntimeError("boom")
+        with pytest.raises(LLMError):
+            await chat_service.achat(ChatRequest(query="Jokic PPG?"))
+
+
+class TestChatServiceConversationContext:
+    """Conversation history from the ring buffer, falling back to a bounded DB read."""
+
+    def test_first_turn_has_no_history(self, chat_service, mock_feedback_repo):
+        assert chat_service._build_conversation_context("c1", 1) == ""
+        mock_feedback_repo.get_recent_turns.assert_not_called()
+
+    def test_buffer_miss_reads_limited_turns(self, chat_service, mock_feedback_repo):
+        mock_feedback_repo.get_recent_turns.return_value = [(6, "Q6", "A6"), (7, "Q7", "A7")]
+
+        context = chat_service._build_conversation_context("c1", 8)
+
+        mock_feedback_repo.get_recent_turns.assert_called_once_with("c1", 8, 5)
+        assert context == "User: Q6\nAssistant: A6\nUser: Q7\nAssistant: A7"
+
+    def test_recorded_turns_skip_database(self, chat_service, mock_feedback_repo):
+        agent = MagicMock()
+        agent.run.return_value = {"answer": "Jokic", "tool_results": {}}
+        chat_service._agent = agent
+
+        with patch.object(chat_service, "_save_interaction_async"):
+            chat_service.chat(ChatRequest(query="Who won MVP?", conversation_id="c1", turn_number=1))
+        context = chat_service._build_conversation_context("c1", 2)
+
+        assert context == "User: Who won MVP?\nAssistant: Jokic"
+        mock_feedback_repo.get_recent_turns.assert_not_called()
+
+    def test_database_error_gives_empty_history(self, chat_service, mock_feedback_repo):
+        mock_feedback_repo.get_recent_turns.side_effect = RuntimeError("db down")
+        assert chat_service._build_conversation_context("c1", 3) == ""
+
+
+class TestChatServiceSingleFlight:
+    """Identical in-flight requests share one agent run."""
+
+    @pytest.fixture
+    def agent(self, chat_service):
+        async def arun(question, conversation_history):
+            await asyncio.sleep(0.01)
+            return {"answer": f"A({question})", "tool_results": {}}
+
+        agent = MagicMock()
+        agent.arun = AsyncMock(side_effect=arun)
+        chat_service._agent = agent
+        return agent
+
+    async def test_identical_context_free_requests_coalesce(self, chat_service, agent):
+        responses = await asyncio.gather(
+            chat_service.achat(ChatRequest(query="Who leads in points?")),
+            chat_service.achat(ChatRequest(query="who leads in  POINTS?")),
+        )
+
+        assert agent.arun.await_count == 1
+        assert responses[0] is responses[1]
+
+    async def test_conversation_requests_keep_separate_keys(self, chat_service, agent, mock_feedback_repo):
+        mock_feedback_repo.get_recent_turns.return_value = []
+        await asyncio.gather(
+            chat_service.achat(ChatRequest(query="Who leads in points?")),
+            chat_service.achat(ChatRequest(query="Who leads in points?", conversation_id="c1")),
+            chat_service.achat(ChatRequest(query="Who leads in points?", conversation_id="c2")),
+        )
+
+        assert agent.arun.await_count == 3
+
+
+class TestChatServiceBatch:
+    """Batch chat: bounded concurrency, ordered conversation threads."""
+
+    @pytest.fixture
+    def agent(self, chat_service, mock_feedback_repo):
+        mock_feedback_repo.get_recent_turns.return_value = []
+        state = {"running": 0, "peak": 0}
+
+        async def arun(question, conversation_history):
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            await asyncio.sleep(0.01)
+            state["running"] -= 1
+            return {"answer": f"A({question})|{conversation_history}", "tool_results": {}}
+
+        agent = MagicMock()
+        agent.arun = AsyncMock(side_effect=arun)
+        agent.state = state
+        chat_service._agent = agent
+        return agent
+
+    async def _collect(self, chat_service, requests, max_concurrency, slot=None):
+        return [item async for item in chat_service.achat_batch(requests, max_concurrency, slot=slot)]
+
+    async def test_batch_bounds_concurrency(self, chat_service, agent):
+        requests = [ChatRequest(query=f"q{i}") for i in range(6)]
+        results = await self._collect(chat_service, requests, max_concurrency=2)
+
+        assert sorted(index for index, _ in results) == list(range(6))
+        assert all(isinstance(outcome, ChatResponse) for _, outcome in results)
+        assert agent.state["peak"] == 2
+
+    async def test_thread_runs_in_order_with_history(self, chat_service, agent):
+        requests = [
+            ChatRequest(query="Who leads in points?", conversation_id="c1", turn_number=1),
+            ChatRequest(query="Unrelated question"),
+            ChatRequest(query="What team is he on?", conversation_id="c1", turn_number=2),
+        ]
+        results = dict(await self._collect(chat_service, requests, max_concurrency=4))
+
+        assert results[0].answer == "A(Who leads in points?)|"
+        assert results[2].answer.endswith(
+            "|User: Who leads in points?\nAssistant: A(Who leads in points?)|"
+        )
+
+    async def test_admission_slot_held_per_request(self, chat_service, agent):
+        admitted = []
+
+        @asynccontextmanager
+        async def slot():
+            if len(admitted) == 2:
+                raise RateLimitError("queue full", retry_after=5)
+            admitted.append(True)
+            yield
+
+        requests = [ChatRequest(query=f"q{i}") for i in range(3)]
+        results = dict(await self._collect(chat_service, requests, max_concurrency=1, slot=slot))
+
+        assert sum(isinstance(outcome, ChatResponse) for outcome in results.values()) == 2
+        assert sum(isinstance(outcome, RateLimitError) for outcome in results.values()) == 1
+
+    async def test_failures_are_yielded_not_raised(self, chat_service, agent):
+        agent.arun.side_effect = RuntimeError("boom")
+        results = await self._collect(chat_service, [ChatRequest(query="q")], max_concurrency=1)
+
+        assert isinstance(results[0][1], LLMError)
+
+
+class TestChatServiceWarmUp:
+    """Startup warm-up and once-only construction of lazy components."""
+
+    @pytest.fixture
+    def warm_service(self, chat_service, mock_vector_store):
+        chat_service._agent = MagicMock()
+        chat_service._sql_tool = MagicMock()
+        chat_service._visualization_service = MagicMock()
+        chat_service._embedding_service = MagicMock()
+        chat_service._embedding_service.embed_query.return_value = np.zeros(4, dtype=np.float32)
+        mock_vector_store.search.return_value = []
+        return chat_service
+
+    def test_warm_up_runs_every_step(self, warm_service):
+        assert warm_service.is_warm is False
+
+        report = warm_service.warm_up()
+
+        assert set(report) == {"agent", "classification", "search", "sql", "visualization"}
+        assert all(result.startswith("ok") for result in report.values())
+        assert warm_service.is_warm is True
+        warm_service._agent.classifier.classify.assert_called_once()
+        warm_service._sql_tool.db.run.assert_called_once()
+
+    def test_failed_optional_step_does_not_degrade(self, warm_service):
+        warm_service._visualization_service.generate_chart.side_effect = RuntimeError("no kaleido")
+
+        report = warm_service.warm_up()
+
+        assert report["visualization"] == "failed: RuntimeError: no kaleido"
+        assert warm_service.is_warm is True
+        assert warm_service.is_degraded is False
+
+    def test_failed_essential_step_degrades(self, warm_service, tmp_path):
+        import sqlite3
+
+        from src.tools.sql_tool import SecureSQLDatabase
+
+        db_path = tmp_path / "nba_stats.db"
+        sqlite3.connect(db_path).execute("CREATE TABLE players (id INTEGER)").connection.commit()
+        db = SecureSQLDatabase.from_uri(f"sqlite:///{db_path}")
+        db._engine.dispose()
+        db_path.write_bytes(b"not a database" * 100)  # Corrupted after startup
+        warm_service._sql_tool.db = db
+
+        report = warm_service.warm_up()
+
+        assert report["sql"].startswith("failed: DatabaseError")
+        assert report["visualization"].startswith("ok")
+        assert warm_service.is_warm is True
+        assert warm_service.is_degraded is True
+
+    def test_search_skipped_without_index(self, warm_service, mock_vector_store):
+        mock_vector_store.is_loaded = False
+
+        report = warm_service.warm_up()
+
+        assert report["search"].startswith("skipped")
+        mock_vector_store.search.assert_not_called()
+
+    def test_start_warm_up_runs_in_background(self, warm_service):
+        warm_service.start_warm_up().join(timeout=5)
+
+        assert warm_service.is_warm is True
+
+    def test_concurrent_first_access_builds_agent_once(self, chat_service):
+        import threading
+        import time
+
+        chat_service._sql_tool = MagicMock()
+        chat_service._embedding_service = MagicMock()
+        chat_service._visualization_service = MagicMock()
+
+        def slow_agent(**kwargs):
+            time.sleep(0.05)
+            return MagicMock()
+
+        with patch("src.services.chat.NBAToolkit"), patch("src.services.chat.create_nba_tools"), \
+             patch("src.services.chat.ReActAgent", side_effect=slow_agent) as agent_cls:
+            agents = []
+            threads = [threading.Thread(target=lambda: agents.append(chat_service.agent)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert agent_cls.call_count == 1
+        assert all(agent is agents[0] for agent in agents)
+
 # NOTE: TestChatServiceGenerateResponse removed - generate_response() no longer exists (see above)
 # NOTE: TestChatServiceChat removed - Old RAG-based chat() replaced by agent orchestration (see above)
 # NOTE: TestGreetingHandling removed - Greeting logic now in agent's query classifier (see above)
@@ -13,6 +13,7 @@ from pathlib import Path
 import pytest
 
 from src.models.conversation import ConversationStatus
+from src.repositories.database import dispose_all_engines
 from src.repositories.conversation import ConversationRepository
 from src.services.conversation import ConversationService
 
@@ -30,7 +31,8 @@ def repository(temp_db):
     """Create a ConversationRepository with temporary database."""
     repo = ConversationRepository(db_path=temp_db)
     yield repo
-    repo.close()  # Properly close to release file lock on Windows
+    repo.close()
+    dispose_all_engines()  # Release the file lock on Windows
 
 
 @pytest.fixture
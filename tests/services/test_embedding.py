@@ -6,7 +6,7 @@ LAST MAJOR UPDATE: 2026-02-08
 MAINTAINER: Shahu
 """
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import numpy as np
 import pytest
@@ -408,3 +408,90 @@ class TestEmbedQuery:
             model=service._model,
             inputs=["Search query"],
         )
+
+
+class TestQueryEmbeddingCache:
+    """Test the LRU cache shared by embed_query and aembed_query."""
+
+    @pytest.fixture
+    def service(self):
+        with patch("src.services.embedding.Mistral") as mock_mistral_class:
+            mock_client = MagicMock()
+            mock_mistral_class.return_value = mock_client
+
+            def create(model, inputs):
+                response = Mock()
+                response.data = [Mock(embedding=[float(len(t)), 1.0]) for t in inputs]
+                return response
+
+            mock_client.embeddings.create.side_effect = create
+            mock_client.embeddings.create_async = AsyncMock(side_effect=create)
+            yield EmbeddingService(api_key="test_key", cache_size=2)
+
+    def test_repeated_query_hits_cache(self, service):
+        """Test the same query (modulo whitespace) is embedded once."""
+        first = service.embed_query("Who won?")
+        second = service.embed_query("  Who   won? ")
+
+        assert np.array_equal(first, second)
+        assert service.client.embeddings.create.call_count == 1
+
+    def test_cached_vector_is_a_copy(self, service):
+        """Test callers can't mutate the cached vector."""
+        service.embed_query("Who won?")[0] = -1.0
+        assert service.embed_query("Who won?")[0] == 8.0
+
+    def test_hits_and_misses_counted(self, service):
+        """Test cache lookups feed the cache metrics and misses time the API call."""
+        from src.core.metrics import CACHE_REQUESTS, EMBEDDING_SECONDS
+
+        hits = CACHE_REQUESTS.value(cache="embedding", result="hit")
+        misses = CACHE_REQUESTS.value(cache="embedding", result="miss")
+        calls = EMBEDDING_SECONDS.count(operation="query")
+
+        service.embed_query("Who won?")
+        service.embed_query("Who won?")
+
+        assert CACHE_REQUESTS.value(cache="embedding", result="hit") == hits + 1
+        assert CACHE_REQUESTS.value(cache="embedding", result="miss") == misses + 1
+        assert EMBEDDING_SECONDS.count(operation="query") == calls + 1
+
+    def test_lru_eviction(self, service):
+        """Test the least recently used query is evicted."""
+        service.embed_query("a1")
+        service.embed_query("b22")
+        service.embed_query("a1")
+        service.embed_query("c333")
+
+        service.embed_query("a1")
+        assert service.client.embeddings.create.call_count == 3
+        service.embed_query("b22")
+        assert service.client.embeddings.create.call_count == 4
+
+    def test_cache_disabled(self):
+        """Test cache_size=0 always calls the API."""
+        with patch("src.services.embedding.Mistral") as mock_mistral_class:
+            mock_client = MagicMock()
+            mock_mistral_class.return_value = mock_client
+            mock_client.embeddings.create.return_value = Mock(data=[Mock(embedding=[0.1])])
+            service = EmbeddingService(api_key="test_key", cache_size=0)
+
+            service.embed_query("q")
+            service.embed_query("q")
+
+            assert mock_client.embeddings.create.call_count == 2
+
+    async def test_aembed_query_shares_cache(self, service):
+        """Test the async path uses the API once and shares the cache."""
+        first = await service.aembed_query("Who won?")
+        second = service.embed_query("Who won?")
+
+        assert np.array_equal(first, second)
+        service.client.embeddings.create_async.assert_awaited_once_with(model=service._model, inputs=["Who won?"])
+        service.client.embeddings.create.assert_not_called()
+
+    async def test_aembed_query_error(self, service):
+        """Test async API failures raise EmbeddingError."""
+        service.client.embeddings.create_async.side_effect = RuntimeError("boom")
+        with pytest.raises(EmbeddingError, match="Embedding failed"):
+            await service.aembed_query("fail")
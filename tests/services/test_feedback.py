@@ -294,7 +294,7 @@ class TestGetRecentInteractions:
         assert len(results) == 1
         assert results[0].id == "int-123"
 
-        mock_repository.get_recent_interactions.assert_called_once_with(50, 0)
+        mock_repository.get_recent_interactions.assert_called_once_with(50, 0, None)
 
     def test_get_recent_interactions_custom_pagination(self, service, mock_repository):
         """Test getting recent interactions with custom limit and offset."""
@@ -303,7 +303,7 @@ class TestGetRecentInteractions:
         results = service.get_recent_interactions(limit=10, offset=20)
 
         assert results == []
-        mock_repository.get_recent_interactions.assert_called_once_with(10, 20)
+        mock_repository.get_recent_interactions.assert_called_once_with(10, 20, None)
 
     def test_get_recent_interactions_empty(self, service, mock_repository):
         """Test getting recent interactions when none exist."""
@@ -0,0 +1,63 @@
+"""
+FILE: test_history_buffer.py
+STATUS: Active
+RESPONSIBILITY: Tests for ConversationHistoryBuffer
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+from src.services.history_buffer import ConversationHistoryBuffer
+
+
+class TestConversationHistoryBuffer:
+    def test_recent_returns_preceding_turns(self):
+        buffer = ConversationHistoryBuffer(max_turns=5)
+        for turn in range(1, 4):
+            buffer.record("c1", turn, f"Q{turn}", f"A{turn}")
+
+        assert buffer.recent("c1", before_turn=4, count=2) == [("Q2", "A2"), ("Q3", "A3")]
+
+    def test_miss_when_a_turn_is_missing(self):
+        buffer = ConversationHistoryBuffer()
+        buffer.record("c1", 3, "Q3", "A3")
+
+        assert buffer.recent("c1", before_turn=4, count=2) is None
+        assert buffer.recent("unknown", before_turn=2, count=1) is None
+
+    def test_keeps_only_last_turns(self):
+        buffer = ConversationHistoryBuffer(max_turns=2)
+        for turn in range(1, 5):
+            buffer.record("c1", turn, f"Q{turn}", f"A{turn}")
+
+        assert buffer.recent("c1", before_turn=5, count=2) == [("Q3", "A3"), ("Q4", "A4")]
+        assert buffer.recent("c1", before_turn=5, count=3) is None
+
+    def test_regenerated_turn_replaces_previous_answer(self):
+        buffer = ConversationHistoryBuffer()
+        buffer.record("c1", 1, "Q1", "old")
+        buffer.record("c1", 1, "Q1", "new")
+
+        assert buffer.recent("c1", before_turn=2, count=1) == [("Q1", "new")]
+
+    def test_seed_accepts_stored_turns(self):
+        buffer = ConversationHistoryBuffer()
+        buffer.seed("c1", [(1, "Q1", "A1"), (2, "Q2", "A2")])
+
+        assert buffer.recent("c1", before_turn=3, count=2) == [("Q1", "A1"), ("Q2", "A2")]
+
+    def test_evicts_least_recent_conversation(self):
+        buffer = ConversationHistoryBuffer(max_conversations=2)
+        buffer.record("a", 1, "Q", "A")
+        buffer.record("b", 1, "Q", "A")
+        buffer.recent("a", before_turn=2, count=1)
+        buffer.record("c", 1, "Q", "A")
+
+        assert buffer.recent("b", before_turn=2, count=1) is None
+        assert buffer.recent("a", before_turn=2, count=1) == [("Q", "A")]
+
+    def test_forget(self):
+        buffer = ConversationHistoryBuffer()
+        buffer.record("c1", 1, "Q", "A")
+        buffer.forget("c1")
+
+        assert buffer.recent("c1", before_turn=2, count=1) is None
@@ -0,0 +1,108 @@
+"""
+FILE: test_interaction_writer.py
+STATUS: Active
+RESPONSIBILITY: Tests for the batched InteractionWriter
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.models.feedback import ChatInteractionCreate
+from src.repositories.database import dispose_all_engines
+from src.repositories.feedback import FeedbackRepository
+from src.services.interaction_writer import InteractionWriter
+
+
+def _interaction(turn: int) -> ChatInteractionCreate:
+    return ChatInteractionCreate(
+        query=f"Query {turn}", response=f"Response {turn}", conversation_id="conv-1", turn_number=turn
+    )
+
+
+@pytest.fixture
+def repository(tmp_path):
+    repo = FeedbackRepository(db_path=tmp_path / "interactions.db")
+    yield repo
+    repo.close()
+    dispose_all_engines()
+
+
+class TestInteractionWriter:
+    def test_batches_writes_into_one_transaction(self, repository):
+        writer = InteractionWriter(repository, batch_size=10, flush_interval=0.2)
+        for turn in range(1, 6):
+            assert writer.submit(_interaction(turn)) is True
+
+        assert writer.flush(timeout=5) is True
+        stats = writer.stats()
+        assert stats["written"] == 5
+        assert stats["batches"] == 1
+        assert stats["queue_depth"] == 0
+        assert len(repository.get_recent_turns("conv-1", before_turn=10, limit=10)) == 5
+        writer.close()
+
+    def test_close_writes_remaining_interactions(self, repository):
+        writer = InteractionWriter(repository, batch_size=100, flush_interval=30)
+        for turn in range(1, 4):
+            writer.submit(_interaction(turn))
+
+        writer.close(timeout=5)
+
+        assert writer.stats()["written"] == 3
+        assert writer.submit(_interaction(4)) is False
+
+    def test_drops_when_queue_full(self):
+        release = threading.Event()
+        repo = MagicMock()
+        repo.save_interactions.side_effect = lambda batch: release.wait(5) and len(batch)
+        writer = InteractionWriter(repo, batch_size=1, flush_interval=0.01, max_queue=1)
+
+        results = [writer.submit(_interaction(turn)) for turn in range(1, 6)]
+        release.set()
+        writer.close()
+
+        assert results.count(False) == writer.stats()["dropped"] >= 1
+
+    def test_close_with_full_queue_still_writes_everything(self):
+        started, release = threading.Event(), threading.Event()
+        repo = MagicMock()
+        repo.save_interactions.side_effect = (
+            lambda batch: started.set() or release.wait(5) and len(batch)
+        )
+        writer = InteractionWriter(repo, batch_size=1, flush_interval=0, max_queue=2)
+        writer.submit(_interaction(1))
+        assert started.wait(5)
+        assert writer.submit(_interaction(2)) and writer.submit(_interaction(3))
+
+        # The writer is stuck on the first batch, with the queue full, past close()'s timeout
+        thread = writer._thread
+        writer.close(timeout=0.1)
+        release.set()
+
+        # It still drains the queue and stops instead of waiting for a stop marker forever
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert writer.stats()["written"] == 3
+
+    def test_explicit_zero_flush_interval_kept(self):
+        writer = InteractionWriter(MagicMock(), flush_interval=0)
+        assert writer._flush_interval == 0
+
+    def test_failed_batch_retried_individually(self):
+        repo = MagicMock()
+        repo.save_interactions.side_effect = RuntimeError("constraint failed")
+        repo.save_interaction.side_effect = [None, RuntimeError("bad row")]
+        writer = InteractionWriter(repo, batch_size=2, flush_interval=1)
+
+        writer.submit(_interaction(1))
+        writer.submit(_interaction(2))
+        writer.flush(timeout=5)
+
+        stats = writer.stats()
+        assert stats["written"] == 1
+        assert stats["failed"] == 1
+        writer.close()
@@ -0,0 +1,104 @@
+"""
+FILE: test_single_flight.py
+STATUS: Active
+RESPONSIBILITY: Tests for SingleFlight request coalescing
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.services.single_flight import SingleFlight
+
+
+class TestSingleFlightSync:
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return "answer"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            leader = pool.submit(flight.do, "q", work)
+            started.wait(timeout=5)
+            followers = [pool.submit(flight.do, "q", work) for _ in range(3)]
+            while flight.coalesced < 3:
+                threading.Event().wait(0.01)
+            release.set()
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert results == ["answer"] * 4
+        assert len(calls) == 1
+        assert flight.in_flight() == 0
+
+    def test_exception_shared_and_key_released(self):
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            flight.do("q", fail)
+        assert flight.do("q", lambda: "retry") == "retry"
+
+    def test_sequential_calls_not_cached(self):
+        flight = SingleFlight()
+        assert flight.do("q", lambda: 1) == 1
+        assert flight.do("q", lambda: 2) == 2
+        assert flight.coalesced == 0
+
+
+class TestSingleFlightAsync:
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "answer"
+
+        results = await asyncio.gather(*(flight.ado("q", work) for _ in range(5)))
+
+        assert results == ["answer"] * 5
+        assert calls == 1
+        assert flight.coalesced == 4
+        assert flight.in_flight() == 0
+
+    async def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+
+        async def work(value):
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(flight.ado("a", lambda: work("a")), flight.ado("b", lambda: work("b")))
+        assert results == ["a", "b"]
+        assert flight.coalesced == 0
+
+    async def test_cancelled_caller_does_not_cancel_shared_work(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "answer"
+
+        first = asyncio.create_task(flight.ado("q", work))
+        second = asyncio.create_task(flight.ado("q", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "answer"
@@ -0,0 +1,101 @@
+"""
+FILE: test_visualization.py
+STATUS: Active
+RESPONSIBILITY: Tests for VisualizationService figure cache, compact specs and lazy HTML
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import json
+from unittest.mock import patch
+
+import plotly.io as pio
+import pytest
+
+from src.core.exceptions import ValidationError
+from src.services.visualization import CHART_TEMPLATE, VisualizationService
+
+DATA = [{"name": "Jokić", "pts": 2071}, {"name": "Tatum", "pts": 2046}]
+
+
+class TestGenerateChart:
+    """Tests for generate_chart output and caching."""
+
+    def test_returns_compact_spec_without_html(self):
+        """The spec references the template by name and carries no HTML."""
+        service = VisualizationService()
+        result = service.generate_chart("horizontal_bar", DATA, "Top Scorers")
+
+        spec = json.loads(result["plotly_json"])
+        assert spec["layout"]["template"] == CHART_TEMPLATE
+        assert spec["data"][0]["type"] == "bar"
+        assert "plotly_html" not in result
+        assert result["figure_id"]
+
+    def test_spec_loads_as_plotly_figure(self):
+        """Clients can rebuild the full figure from the compact spec."""
+        service = VisualizationService()
+        result = service.generate_chart("bar_chart", DATA, "Top Scorers")
+
+        fig = pio.from_json(result["plotly_json"])
+        assert list(fig.data[0].x) == ["Jokić", "Tatum"]
+        assert fig.layout.template.layout.paper_bgcolor is not None
+
+    def test_repeated_chart_is_served_from_cache(self):
+        """Same (chart_type, data, title) builds the figure once."""
+        service = VisualizationService()
+        with patch.object(service, "_build", wraps=service._build) as build:
+            first = service.generate_chart("horizontal_bar", DATA, "Top Scorers")
+            second = service.generate_chart("horizontal_bar", DATA, "Top Scorers")
+            service.generate_chart("horizontal_bar", DATA, "Other Title")
+
+        assert first == second
+        assert build.call_count == 2
+
+    def test_cache_is_bounded(self):
+        """Least recently used figures are evicted beyond cache_size."""
+        service = VisualizationService(cache_size=2)
+        ids = [
+            service.generate_chart("table", [{"name": "A", "pts": n}], "T")["figure_id"]
+            for n in range(3)
+        ]
+
+        assert service.render_html(ids[0]) is None
+        assert service.render_html(ids[2]) is not None
+
+    def test_empty_data_not_cached(self):
+        """No data returns an error and no figure ID."""
+        result = VisualizationService().generate_chart("bar_chart", [], "Empty")
+
+        assert result["figure_id"] is None
+        assert result["plotly_json"] is None
+
+
+class TestRenderHtml:
+    """Tests for lazy HTML rendering."""
+
+    def test_renders_once(self):
+        """HTML is rendered on first request and then reused."""
+        service = VisualizationService()
+        figure_id = service.generate_chart("horizontal_bar", DATA, "Top Scorers")["figure_id"]
+
+        html = service.render_html(figure_id)
+        assert 'id="viz"' in html
+        assert service.render_html(figure_id) is html
+
+    def test_unknown_figure(self):
+        """Unknown IDs return None."""
+        assert VisualizationService().render_html("missing") is None
+
+    def test_renders_spec_without_cache(self):
+        """A spec from another worker renders without a cache entry."""
+        spec = VisualizationService().generate_chart("horizontal_bar", DATA, "Top Scorers")["plotly_json"]
+
+        assert 'id="viz"' in VisualizationService().render_spec_html(spec)
+
+    def test_invalid_spec_rejected(self):
+        """Specs that are not Plotly figures raise ValidationError."""
+        with pytest.raises(ValidationError):
+            VisualizationService.render_spec_html("not json")
+        with pytest.raises(ValidationError):
+            VisualizationService.render_spec_html('{"data": [{"type": "bogus"}]}')
@@ -0,0 +1,243 @@
+"""
+FILE: test_sql_memo.py
+STATUS: Active
+RESPONSIBILITY: Unit tests for SQLMemoCache and NBAGSQLTool memo integration
+LAST MAJOR UPDATE: 2026-10-18
+MAINTAINER: Shahu
+"""
+
+import json
+import re
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.tools.sql_memo import SQLMemoCache, _numeric_signature
+from src.tools.sql_tool import NBAGSQLTool
+
+TOP_SCORER_SQL = (
+    "SELECT p.name, ps.pts FROM players p JOIN player_stats ps "
+    "ON p.id = ps.player_id ORDER BY ps.pts DESC LIMIT 1"
+)
+
+
+def _bag_of_words_embed(texts):
+    """Deterministic embedding: hashed bag of words (same words → same vector)."""
+    vectors = np.zeros((len(texts), 64), dtype=np.float32)
+    for i, text in enumerate(texts):
+        for word in re.findall(r"\w+", text.lower()):
+            vectors[i, hash(word) % 64] += 1.0
+    return vectors
+
+
+@pytest.fixture
+def memo(tmp_path):
+    """Memo cache with temp paths and a spy embedding function."""
+    embed_fn = MagicMock(side_effect=_bag_of_words_embed)
+    memo = SQLMemoCache(
+        embed_fn=embed_fn,
+        index_path=tmp_path / "memo.idx",
+        pairs_path=tmp_path / "memo.json",
+        threshold=0.95,
+    )
+    yield memo
+    memo.close()
+
+
+class TestSQLMemoCache:
+    """Tests for SQLMemoCache lookup, seeding and persistence."""
+
+    def test_empty_memo_skips_embedding(self, memo):
+        """Lookup on an empty memo returns None without an embedding call."""
+        assert memo.lookup("Who scored the most points?") is None
+        memo._embed_fn.assert_not_called()
+
+    def test_near_duplicate_hits(self, memo):
+        """A question with the same words reuses the memoized SQL."""
+        memo.add("Who scored the most points this season?", TOP_SCORER_SQL)
+
+        hit = memo.lookup("who scored the most points this season")
+
+        assert hit is not None
+        assert hit.entry.sql == TOP_SCORER_SQL
+        assert hit.similarity >= 0.95
+
+    def test_different_question_misses(self, memo):
+        """An unrelated question falls below the threshold."""
+        memo.add("Who scored the most points this season?", TOP_SCORER_SQL)
+
+        assert memo.lookup("Which team has the best defensive rating?") is None
+
+    def test_numeric_mismatch_misses(self, memo):
+        """'top 3' must never reuse the SQL memoized for 'top 5'."""
+        memo.add("Who are the top 5 rebounders?", "SELECT 1 LIMIT 5")
+
+        assert memo.lookup("Who are the top 3 rebounders?") is None
+
+    def test_numeric_signature_spelled_out(self):
+        """Spelled-out numbers normalize to digits."""
+        assert _numeric_signature("top five scorers") == _numeric_signature("top 5 scorers")
+
+    def test_add_duplicate_returns_false(self, memo):
+        """Adding the same question twice keeps a single entry."""
+        assert memo.add("Who scored the most points?", TOP_SCORER_SQL) is True
+        assert memo.add("  who SCORED the most points? ", TOP_SCORER_SQL) is False
+        assert len(memo) == 1
+
+    def test_seed_uses_single_batch(self, memo):
+        """Seeding embeds all new pairs in one call and dedups."""
+        added = memo.seed([
+            ("Who scored the most points?", TOP_SCORER_SQL),
+            ("Who scored the most points?", TOP_SCORER_SQL),
+            ("Who has the most assists?", "SELECT 1"),
+        ])
+
+        assert added == 2
+        assert memo._embed_fn.call_count == 1
+
+    def test_persistence_roundtrip(self, memo, tmp_path):
+        """Saved memo reloads with the same entries."""
+        memo.seed([("Who scored the most points?", TOP_SCORER_SQL)])
+
+        reloaded = SQLMemoCache(
+            embed_fn=_bag_of_words_embed,
+            index_path=tmp_path / "memo.idx",
+            pairs_path=tmp_path / "memo.json",
+        )
+
+        assert reloaded.load() is True
+        assert len(reloaded) == 1
+        assert reloaded.lookup("Who scored the most points?").entry.source == "ground_truth"
+
+    def test_load_missing_files(self, memo):
+        """Loading without files returns False."""
+        assert memo.load() is False
+
+    def test_entity_mismatch_misses(self, memo):
+        """A question about another player never reuses the memoized SQL."""
+        players = {"lebron": "player:2544", "curry": "player:201939"}
+        memo.entity_fn = lambda q: frozenset(v for k, v in players.items() if k in q.lower())
+        memo.add("How many points did LeBron score?", "SELECT 1")
+
+        assert memo.lookup("How many points did Curry score?") is None
+        assert memo.lookup("how many points did lebron score") is not None
+
+    def test_add_saves_in_background(self, memo, tmp_path):
+        """add() defers the disk write; close() writes pending entries."""
+        memo.add("Who scored the most points?", TOP_SCORER_SQL)
+        assert not (tmp_path / "memo.json").exists()
+
+        memo.close()
+
+        assert len(json.loads((tmp_path / "memo.json").read_text())) == 1
+
+    def test_save_merges_other_workers(self, memo, tmp_path):
+        """Two processes saving to the same files keep each other's entries."""
+        other = SQLMemoCache(
+            embed_fn=_bag_of_words_embed,
+            index_path=tmp_path / "memo.idx",
+            pairs_path=tmp_path / "memo.json",
+        )
+        memo.add("Who scored the most points?", TOP_SCORER_SQL)
+        other.add("Who has the most assists?", "SELECT 1")
+        memo.save()
+        other.save()
+
+        reloaded = SQLMemoCache(
+            embed_fn=_bag_of_words_embed,
+            index_path=tmp_path / "memo.idx",
+            pairs_path=tmp_path / "memo.json",
+        )
+        assert reloaded.load() is True
+        assert len(reloaded) == 2
+        assert reloaded.lookup("Who has the most assists?").entry.sql == "SELECT 1"
+
+    def test_save_without_merge_replaces_files(self, memo, tmp_path):
+        """save(merge=False) drops pairs saved earlier instead of merging them back."""
+        stale = SQLMemoCache(
+            embed_fn=_bag_of_words_embed,
+            index_path=tmp_path / "memo.idx",
+            pairs_path=tmp_path / "memo.json",
+        )
+        stale.add("Who has the most assists?", "SELECT bad")
+        stale.save()
+
+        memo.seed([("Who scored the most points?", TOP_SCORER_SQL)])
+        assert len(json.loads((tmp_path / "memo.json").read_text())) == 2
+        memo.save(merge=False)
+
+        reloaded = SQLMemoCache(
+            embed_fn=_bag_of_words_embed,
+            index_path=tmp_path / "memo.idx",
+            pairs_path=tmp_path / "memo.json",
+        )
+        assert reloaded.load() is True
+        assert len(reloaded) == 1
+        assert reloaded.lookup("Who has the most assists?") is None
+
+    def test_save_without_merge_on_empty_memo_removes_files(self, memo, tmp_path):
+        """Replacing with an empty memo leaves nothing to load."""
+        memo.seed([("Who scored the most points?", TOP_SCORER_SQL)])
+        empty = SQLMemoCache(
+            embed_fn=_bag_of_words_embed,
+            index_path=tmp_path / "memo.idx",
+            pairs_path=tmp_path / "memo.json",
+        )
+
+        empty.save(merge=False)
+
+        assert empty.load() is False
+        assert not (tmp_path / "memo.json").exists()
+
+
+class TestNBAGSQLToolMemo:
+    """Tests for NBAGSQLTool memo integration."""
+
+    @pytest.fixture
+    def tool(self, memo):
+        """NBAGSQLTool with mocked LangChain components and a real memo."""
+        with patch("src.tools.sql_tool._load_dictionary_from_db", return_value=[]), \
+             patch("src.tools.sql_tool.SecureSQLDatabase") as mock_db_class, \
+             patch("src.tools.sql_tool.ChatGoogleGenerativeAI"), \
+             patch("src.tools.sql_tool.create_sql_agent") as mock_agent:
+            mock_db_class.from_uri.return_value = MagicMock()
+            mock_agent.return_value = MagicMock()
+            yield NBAGSQLTool(db_path="test.db", sql_memo=memo)
+
+    def test_memo_hit_skips_agent(self, tool, memo):
+        """A memo hit executes the memoized SQL directly."""
+        memo.add("Who scored the most points this season?", TOP_SCORER_SQL)
+        tool.db.run.return_value = "[('Shai Gilgeous-Alexander', 2485)]"
+
+        result = tool.query("Who scored the most points this season?")
+
+        tool.agent_executor.invoke.assert_not_called()
+        tool.db.run.assert_called_once_with(TOP_SCORER_SQL)
+        assert result["sql"] == TOP_SCORER_SQL
+        assert result["results"] == {"name": "Shai Gilgeous-Alexander", "pts": 2485}
+        assert result["answer"] == "name: Shai Gilgeous-Alexander, pts: 2485"
+        assert result["error"] is None
+
+    def test_memo_failure_falls_back_to_agent(self, tool, memo):
+        """If the memoized SQL fails, the agent generates fresh SQL."""
+        memo.add("Who scored the most points this season?", TOP_SCORER_SQL)
+        tool.db.run.side_effect = ValueError("blocked")
+        tool.agent_executor.invoke.return_value = {"output": "", "intermediate_steps": []}
+
+        tool.query("Who scored the most points this season?")
+
+        tool.agent_executor.invoke.assert_called_once()
+
+    def test_successful_agent_run_is_memoized(self, tool, memo):
+        """SQL from a successful agent run is added to the memo."""
+        action = MagicMock(tool="sql_db_query", tool_input=TOP_SCORER_SQL)
+        tool.agent_executor.invoke.return_value = {
+            "output": "SGA",
+            "intermediate_steps": [(action, "[('Shai Gilgeous-Alexander', 2485)]")],
+        }
+
+        tool.query("Who scored the most points this season?")
+
+        assert len(memo) == 1
+        assert memo.lookup("Who scored the most points this season?").entry.source == "production"
@@ -12,7 +12,15 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from src.tools.sql_tool import NBAGSQLTool, SecureSQLDatabase, _build_abbreviations_block, _load_dictionary_from_db
+from src.core.exceptions import QueryBudgetExceededError
+from src.tools.sql_tool import (
+    NBAGSQLTool,
+    SecureSQLDatabase,
+    _build_abbreviations_block,
+    _build_sql_agent_prefix,
+    _load_dictionary_from_db,
+    _materialized_tables_available,
+)
 
 
 class TestNBAGSQLToolInit:
@@ -175,6 +183,25 @@ class TestQuery:
         # Check that input contains the question
         assert "input" in call_args[0][0] or "input" in call_args.kwargs
 
+    def test_latency_observed_before_memoizing(self, mock_tool):
+        """SQL_QUERY_SECONDS covers the agent run, not the memo write after it."""
+        action = MagicMock(tool="sql_db_query", tool_input="SELECT name FROM players")
+        mock_tool.agent_executor.invoke.return_value = {
+            "output": "LeBron",
+            "intermediate_steps": [(action, "[('LeBron',)]")],
+        }
+        mock_tool.sql_memo = MagicMock()
+        mock_tool.sql_memo.lookup.return_value = None
+        order = []
+
+        with patch.object(mock_tool, "_parse_observation", return_value=[{"name": "LeBron"}]), \
+             patch.object(mock_tool, "_remember", side_effect=lambda *a: order.append("remember")), \
+             patch("src.tools.sql_tool.SQL_QUERY_SECONDS") as seconds:
+            seconds.observe.side_effect = lambda *a, **kw: order.append("observe")
+            mock_tool.query("Who scored the most points?")
+
+        assert order == ["observe", "remember"]
+
 
 class TestFormatResults:
     """Test result formatting."""
@@ -257,12 +284,10 @@ class TestLoadDictionaryFromDB:
 
     def test_load_dictionary_empty_db(self):
         """Test loading from database without data_dictionary table."""
-        with patch("src.tools.sql_tool.sqlite3.connect") as mock_connect:
-            mock_conn = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.execute.side_effect = sqlite3.OperationalError("no such table: data_dictionary")
-            mock_conn.cursor.return_value = mock_cursor
-            mock_connect.return_value = mock_conn
+        with patch("src.tools.sql_tool.get_read_only_pool") as mock_get_pool:
+            mock_pool = MagicMock()
+            mock_pool.execute.side_effect = sqlite3.OperationalError("no such table: data_dictionary")
+            mock_get_pool.return_value = mock_pool
 
             result = _load_dictionary_from_db("test.db")
 
@@ -270,18 +295,17 @@ class TestLoadDictionaryFromDB:
 
     def test_load_dictionary_with_entries(self):
         """Test loading dictionary entries from database."""
-        with patch("src.tools.sql_tool.sqlite3.connect") as mock_connect:
-            mock_conn = MagicMock()
-            mock_cursor = MagicMock()
-            mock_cursor.fetchall.return_value = [
+        with patch("src.tools.sql_tool.get_read_only_pool") as mock_get_pool:
+            mock_pool = MagicMock()
+            mock_pool.execute.return_value = [
                 ('PTS', 'Points', 'pts', 'player_stats'),
                 ('AST', 'Assists', 'ast', 'player_stats'),
             ]
-            mock_conn.cursor.return_value = mock_cursor
-            mock_connect.return_value = mock_conn
+            mock_get_pool.return_value = mock_pool
 
             result = _load_dictionary_from_db("test.db")
 
+            mock_get_pool.assert_called_once_with("test.db")
             assert len(result) == 2
             assert result[0] == {
                 'abbreviation': 'PTS',
@@ -343,6 +367,40 @@ class TestBuildAbbreviationsBlock:
         assert "PTS = Points -> pts" in block
 
 
+class TestMaterializedPrompt:
+    """Test prompt steering towards materialized aggregate tables."""
+
+    def test_prefix_without_materialized_tables(self):
+        """Test the join-based patterns are used when tables are absent."""
+        prefix = _build_sql_agent_prefix("KEY ABBREVIATIONS:")
+
+        assert "player_per_game" not in prefix
+        assert "ROUND(CAST(ps.column AS FLOAT) / ps.gp, 1)" in prefix
+
+    def test_prefix_with_materialized_tables(self):
+        """Test per-game and team questions are steered to single-table lookups."""
+        prefix = _build_sql_agent_prefix("KEY ABBREVIATIONS:", materialized=True)
+
+        assert "TABLE: player_per_game" in prefix
+        assert "TABLE: team_totals" in prefix
+        assert "TABLE: team_averages" in prefix
+        assert "FROM team_totals WHERE team_abbr = 'LAL'" in prefix
+        assert "{" not in prefix.split("Begin!")[0].replace("{input}", "")
+
+    def test_materialized_tables_available(self):
+        """Test detection requires all three tables to be populated."""
+        with patch("src.tools.sql_tool.get_read_only_pool") as mock_get_pool:
+            mock_get_pool.return_value.execute.return_value = [(1,)]
+            assert _materialized_tables_available("test.db") is True
+
+            mock_get_pool.return_value.execute.side_effect = [[(1,)], [], [(1,)]]
+            assert _materialized_tables_available("test.db") is False
+
+    def test_materialized_tables_missing_db(self, tmp_path):
+        """Test a missing database reports no materialized tables."""
+        assert _materialized_tables_available(str(tmp_path / "missing.db")) is False
+
+
 class TestSQLSecurity:
     """Test SQL security validation."""
 
@@ -380,3 +438,70 @@ class TestSQLSecurity:
         """Test that SELECT statements are allowed."""
         # Should not raise
         NBAGSQLTool._validate_sql_security("SELECT * FROM players LIMIT 10")
+
+
+class TestSecureSQLDatabaseNameResolver:
+    """Test SecureSQLDatabase name predicate rewriting."""
+
+    def test_name_predicate_rewritten_before_execution(self):
+        """Test the name resolver rewrites validated SQL before it runs."""
+        resolver = MagicMock()
+        resolver.rewrite_sql.return_value = "SELECT 'Nikola Jokić'"
+        db = SecureSQLDatabase.from_uri("sqlite://", name_resolver=resolver)
+
+        result = db.run("SELECT p.name FROM players p WHERE p.name LIKE '%Jokic%'")
+
+        resolver.rewrite_sql.assert_called_once_with("SELECT p.name FROM players p WHERE p.name LIKE '%Jokic%'")
+        assert result == "[('Nikola Jokić',)]"
+
+
+class TestSecureSQLDatabaseBudget:
+    """Test per-query time, VM-step and row budgets."""
+
+    RUNAWAY_SQL = "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) SELECT COUNT(*) FROM c"
+    TEN_ROWS_SQL = "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c LIMIT 10) SELECT x FROM c"
+
+    def test_time_budget_aborts_runaway_query(self):
+        """Test an endless statement is interrupted by the time budget."""
+        db = SecureSQLDatabase.from_uri("sqlite://", max_query_seconds=0.05, max_vm_steps=0)
+
+        with pytest.raises(QueryBudgetExceededError) as exc_info:
+            db.run(self.RUNAWAY_SQL)
+
+        assert exc_info.value.budget == "time"
+        assert exc_info.value.code == "QUERY_BUDGET_EXCEEDED"
+
+    def test_vm_step_budget_aborts_runaway_query(self):
+        """Test an endless statement is interrupted by the VM-step budget."""
+        db = SecureSQLDatabase.from_uri("sqlite://", max_query_seconds=30.0, max_vm_steps=10_000)
+
+        with pytest.raises(QueryBudgetExceededError) as exc_info:
+            db.run(self.RUNAWAY_SQL)
+
+        assert exc_info.value.budget == "vm_steps"
+
+    def test_row_budget(self):
+        """Test results over the row cap are rejected."""
+        db = SecureSQLDatabase.from_uri("sqlite://", max_rows=5)
+
+        with pytest.raises(QueryBudgetExceededError) as exc_info:
+            db.run(self.TEN_ROWS_SQL)
+
+        assert exc_info.value.budget == "rows"
+        assert SecureSQLDatabase.from_uri("sqlite://", max_rows=10).run(self.TEN_ROWS_SQL).startswith("[(1,)")
+
+    def test_agent_gets_structured_error(self):
+        """Test run_no_throw (used by the agent's query tool) returns an error string."""
+        db = SecureSQLDatabase.from_uri("sqlite://", max_query_seconds=0.05, max_vm_steps=0)
+
+        result = db.run_no_throw(self.RUNAWAY_SQL)
+
+        assert result.startswith("Error: [QUERY_BUDGET_EXCEEDED] Query too expensive")
+
+    def test_connection_usable_after_abort(self):
+        """Test the progress handler is removed after an aborted query."""
+        db = SecureSQLDatabase.from_uri("sqlite://", max_query_seconds=30.0, max_vm_steps=10_000)
+        with pytest.raises(QueryBudgetExceededError):
+            db.run(self.RUNAWAY_SQL)
+
+        assert db.run("SELECT 1 + 1") == "[(2,)]"
@@ -111,3 +111,32 @@ class TestAPIClient:
         call_args = mock_request.call_args
         assert call_args[0][0] == "POST"
         assert call_args[0][1] == "http://localhost:8000/api/v1/chat"
+
+    @patch("src.ui.api_client.requests.request")
+    def test_list_conversations_page_returns_next_cursor(self, mock_request):
+        """Test list_conversations_page() passes the cursor and returns the next one."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = [{"id": "conv-1"}]
+        mock_response.headers = {"X-Next-Cursor": "abc"}
+        mock_request.return_value = mock_response
+
+        client = APIClient()
+        items, next_cursor = client.list_conversations_page(limit=1, cursor="prev")
+
+        assert items == [{"id": "conv-1"}]
+        assert next_cursor == "abc"
+        assert mock_request.call_args.kwargs["params"] == {"limit": 1, "cursor": "prev"}
+
+    @patch("src.ui.api_client.requests.request")
+    def test_get_recent_interactions_page_last_page(self, mock_request):
+        """Test get_recent_interactions_page() returns no cursor on the last page."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = []
+        mock_response.headers = {}
+        mock_request.return_value = mock_response
+
+        items, next_cursor = APIClient().get_recent_interactions_page(limit=10)
+
+        assert items == []
+        assert next_cursor is None
+        assert mock_request.call_args.kwargs["params"] == {"limit": 10}